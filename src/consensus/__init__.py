@@ -5,6 +5,12 @@ Provides mechanisms for multi-model consensus and result synthesis.
 """
 
 from .engine import ConsensusEngine
-from .types import ConsensusRequest, VoteStrategy
+from .types import ConsensusRequest, ConsensusResult, SynthesisLevel, VoteStrategy
 
-__all__ = ["ConsensusEngine", "ConsensusRequest", "VoteStrategy"]
+__all__ = [
+    "ConsensusEngine",
+    "ConsensusRequest",
+    "ConsensusResult",
+    "SynthesisLevel",
+    "VoteStrategy",
+]
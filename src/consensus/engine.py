@@ -2,14 +2,38 @@
 Core logic for the Consensus Engine.
 """
 
+import asyncio
 import logging
+import time
 from typing import Any
 
-from .templates import SYNTHESIS_TEMPLATE
-from .types import ConsensusRequest
+from .templates import PARTIAL_SYNTHESIS_TEMPLATE, SYNTHESIS_TEMPLATE
+from .types import ConsensusRequest, ConsensusResult, SynthesisLevel, VoteStrategy
 
 logger = logging.getLogger(__name__)
 
+# Rough characters-per-token ratio used to size synthesis groups without a tokenizer
+CHARS_PER_TOKEN = 4
+# Context window assumed when neither the request nor the registry provides one
+DEFAULT_CONTEXT_WINDOW = 8000
+# Fraction of the synthesizer's context window kept free for its output
+OUTPUT_RESERVE = 0.25
+TRUNCATION_MARKER = "\n[... truncated to fit synthesis context ...]"
+
+
+def estimate_tokens(text: str) -> int:
+    """Cheap token estimate for sizing prompts."""
+    return len(text) // CHARS_PER_TOKEN + 1
+
+
+def _format_candidates(candidates: list[str]) -> str:
+    return "\n\n".join([f"--- Candidate {i+1} ---\n{c}" for i, c in enumerate(candidates)])
+
+
+def _response_cost(response: Any) -> float:
+    usage = getattr(response, "usage", None)
+    return getattr(usage, "cost", None) or 0.0
+
 
 class ConsensusEngine:
     """
@@ -29,6 +53,9 @@ class ConsensusEngine:
         """
         Consolidate multiple candidate responses into a single answer.
 
+        Uses hierarchical (map-reduce) synthesis when the strategy is HIERARCHICAL
+        or when the candidates do not fit in the synthesizer's context window.
+
         Args:
             request: ConsensusRequest object containing task, candidates, etc.
 
@@ -40,17 +67,12 @@ class ConsensusEngine:
             f"{request.strategy} strategy with stance='{request.stance}'"
         )
 
-        # 1. Prepare Prompt
-        formatted_candidates = "\n\n".join(
-            [f"--- Candidate {i+1} ---\n{c}" for i, c in enumerate(request.candidates)]
-        )
+        if self.orchestrator and self._needs_hierarchy(request):
+            result = await self.consolidate_hierarchical(request)
+            return result.content
 
-        prompt = SYNTHESIS_TEMPLATE.format(
-            task=request.task,
-            context=request.context or "None",
-            stance=request.stance or "Neutral/Objective",
-            candidates=formatted_candidates,
-        )
+        # 1. Prepare Prompt
+        formatted_candidates = _format_candidates(request.candidates)
 
         # 2. Execute Consensus Logic
         # (Stub implementation for PR #5 - in full implementation, this calls the orchestrator)
@@ -64,29 +86,171 @@ class ConsensusEngine:
         )
 
         if self.orchestrator:
-            current_context = f"{request.context or ''}\n\nTask: {request.task}"
-
-            # Multi-round debate loop
-            for round_num in range(request.rounds):
-                logger.info(f"Consensus Round {round_num + 1}/{request.rounds}")
-
-                # 1. Update candidates based on previous round (if not first)
-                # In a full agentic implementation, we would re-query models here with the current synthesis
-                # For now, we simulate convergence by appending the synthesis to context
-
-                # 2. Synthesize
-                prompt = SYNTHESIS_TEMPLATE.format(
-                    task=request.task,
-                    context=current_context,
-                    stance=f"{request.stance} ({request.strength.value} strength)",
-                    candidates=formatted_candidates,
+            msg, _ = await self._synthesize_rounds(request, formatted_candidates)
+
+        return msg
+
+    async def consolidate_hierarchical(self, request: ConsensusRequest) -> ConsensusResult:
+        """
+        Synthesize candidates as a tournament of parallel partial syntheses.
+
+        Candidates are packed into groups of at most ``request.fan_in`` that fit the
+        synthesizer's context window. Each level synthesizes its groups in parallel
+        and feeds the partial results to the next level until a single group
+        remains, which receives the final (multi-round) synthesis.
+
+        Args:
+            request: ConsensusRequest object containing task, candidates, etc.
+
+        Returns:
+            ConsensusResult with the final answer and cost/latency per level.
+        """
+        if not self.orchestrator:
+            raise RuntimeError("Hierarchical synthesis requires an orchestrator")
+
+        budget = self._candidate_token_budget(request)
+        fan_in = max(2, request.fan_in)
+        stance = f"{request.stance} ({request.strength.value} strength)"
+        items = list(request.candidates)
+        levels: list[SynthesisLevel] = []
+
+        groups = self._group_candidates(items, budget, fan_in)
+        while len(groups) > 1:
+            logger.info(
+                f"Hierarchical synthesis level {len(levels) + 1}: "
+                f"{len(items)} inputs in {len(groups)} groups"
+            )
+            start = time.perf_counter()
+            responses = await asyncio.gather(
+                *(
+                    self._route(
+                        PARTIAL_SYNTHESIS_TEMPLATE.format(
+                            task=request.task,
+                            stance=stance,
+                            candidates=_format_candidates(group),
+                        ),
+                        request,
+                    )
+                    for group in groups
+                )
+            )
+            levels.append(
+                SynthesisLevel(
+                    level=len(levels) + 1,
+                    inputs=len(items),
+                    groups=len(groups),
+                    cost=sum(_response_cost(r) for r in responses),
+                    latency_ms=(time.perf_counter() - start) * 1000,
                 )
+            )
+            items = [r.content for r in responses]
+            groups = self._group_candidates(items, budget, fan_in)
 
-                response = await self.orchestrator.route_request(prompt)
-                result = response.content
+        start = time.perf_counter()
+        content, responses = await self._synthesize_rounds(
+            request, _format_candidates(groups[0] if groups else [])
+        )
+        levels.append(
+            SynthesisLevel(
+                level=len(levels) + 1,
+                inputs=len(items),
+                groups=1,
+                cost=sum(_response_cost(r) for r in responses),
+                latency_ms=(time.perf_counter() - start) * 1000,
+            )
+        )
+        return ConsensusResult(content=content, levels=levels)
 
-                # Update context for next round
-                current_context += f"\n\nRound {round_num + 1} Synthesis:\n{result}"
-                msg = result  # Final result is last round
+    async def _synthesize_rounds(
+        self, request: ConsensusRequest, formatted_candidates: str
+    ) -> tuple[str, list[Any]]:
+        """Run the final synthesis, including multi-round debate; returns (content, responses)."""
+        current_context = f"{request.context or ''}\n\nTask: {request.task}"
+        result = ""
+        responses = []
 
-        return msg
+        # Multi-round debate loop
+        for round_num in range(request.rounds):
+            logger.info(f"Consensus Round {round_num + 1}/{request.rounds}")
+
+            # 1. Update candidates based on previous round (if not first)
+            # In a full agentic implementation, we would re-query models here with the current synthesis
+            # For now, we simulate convergence by appending the synthesis to context
+
+            # 2. Synthesize
+            prompt = SYNTHESIS_TEMPLATE.format(
+                task=request.task,
+                context=current_context,
+                stance=f"{request.stance} ({request.strength.value} strength)",
+                candidates=formatted_candidates,
+            )
+
+            response = await self._route(prompt, request)
+            responses.append(response)
+            result = response.content
+
+            # Update context for next round
+            current_context += f"\n\nRound {round_num + 1} Synthesis:\n{result}"
+
+        return result, responses
+
+    async def _route(self, prompt: str, request: ConsensusRequest) -> Any:
+        if request.synthesizer_model:
+            return await self.orchestrator.route_request(prompt, model_id=request.synthesizer_model)
+        return await self.orchestrator.route_request(prompt)
+
+    def _needs_hierarchy(self, request: ConsensusRequest) -> bool:
+        if request.strategy == VoteStrategy.HIERARCHICAL:
+            return True
+        candidate_tokens = sum(estimate_tokens(c) for c in request.candidates)
+        return candidate_tokens > self._candidate_token_budget(request)
+
+    def _context_window(self, request: ConsensusRequest) -> int:
+        """Context window of the synthesizer, from the request or the orchestrator registry."""
+        if request.context_window:
+            return request.context_window
+        registry = getattr(self.orchestrator, "registry", None)
+        if request.synthesizer_model and registry is not None:
+            model = registry.get_model(request.synthesizer_model)
+            window = getattr(model, "context_window", None)
+            if isinstance(window, int) and window > 0:
+                return window
+        return DEFAULT_CONTEXT_WINDOW
+
+    def _candidate_token_budget(self, request: ConsensusRequest) -> int:
+        """Tokens available for candidates in one synthesis prompt."""
+        overhead = estimate_tokens(
+            SYNTHESIS_TEMPLATE.format(
+                task=request.task,
+                context=f"{request.context or ''}\n\nTask: {request.task}",
+                stance=f"{request.stance} ({request.strength.value} strength)",
+                candidates="",
+            )
+        )
+        usable = int(self._context_window(request) * (1 - OUTPUT_RESERVE)) - overhead
+        # Always leave room for at least a couple of short candidates
+        return max(usable, 256)
+
+    @staticmethod
+    def _group_candidates(items: list[str], budget: int, fan_in: int) -> list[list[str]]:
+        """Pack items in order into groups of at most ``fan_in`` that fit ``budget`` tokens.
+
+        Each item is truncated to half the budget so that every group except the
+        last holds at least two items, guaranteeing each level shrinks the set.
+        """
+        max_item_chars = (budget // 2 - 1) * CHARS_PER_TOKEN
+        groups: list[list[str]] = []
+        current: list[str] = []
+        current_tokens = 0
+        for item in items:
+            if len(item) > max_item_chars:
+                item = item[: max_item_chars - len(TRUNCATION_MARKER)] + TRUNCATION_MARKER
+            tokens = estimate_tokens(item)
+            if current and (len(current) >= fan_in or current_tokens + tokens > budget):
+                groups.append(current)
+                current, current_tokens = [], 0
+            current.append(item)
+            current_tokens += tokens
+        if current:
+            groups.append(current)
+        return groups
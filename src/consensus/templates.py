@@ -26,3 +26,23 @@ You are a master arbiter responsible for synthesizing a single, high-quality ans
 
 **Unified Response:**
 """
+
+PARTIAL_SYNTHESIS_TEMPLATE = """
+You are merging a subset of candidate responses as one step of a larger synthesis.
+
+**Task:**
+{task}
+
+**Stance/Perspective:**
+{stance}
+
+**Candidate Responses:**
+{candidates}
+
+**Instructions:**
+1. Merge the candidates into one response that keeps every distinct point, fact and recommendation.
+2. Where candidates disagree, keep both positions and state the disagreement explicitly.
+3. Remove repetition, but do not drop information that a later merge step might need.
+
+**Merged Response:**
+"""
@@ -36,3 +36,30 @@ class ConsensusRequest:
     strategy: VoteStrategy = VoteStrategy.MAJORITY
     rounds: int = 1  # Multi-round debate support
     strength: StanceStrength = StanceStrength.MODERATE
+    # Hierarchical (map-reduce) synthesis settings
+    fan_in: int = 8  # Max candidates merged by one partial synthesis call
+    synthesizer_model: str | None = None  # Model used for every synthesis call
+    context_window: int | None = None  # Token budget override; defaults to the model's window
+
+
+@dataclass
+class SynthesisLevel:
+    """Accounting for one level of a hierarchical synthesis."""
+
+    level: int
+    inputs: int  # Candidates or partial syntheses consumed at this level
+    groups: int  # Synthesis calls made (in parallel) at this level
+    cost: float = 0.0
+    latency_ms: float = 0.0
+
+
+@dataclass
+class ConsensusResult:
+    """Synthesized answer together with per-level cost accounting."""
+
+    content: str
+    levels: list[SynthesisLevel] = field(default_factory=list)
+
+    @property
+    def total_cost(self) -> float:
+        return sum(level.cost for level in self.levels)
@@ -10,7 +10,21 @@ Usage:
     response = await orchestrator.route_request(prompt)
 """
 
+import importlib
 from pathlib import Path
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from lattice_lock import types
+    from lattice_lock.orchestrator import (
+        APIResponse,
+        ModelOrchestrator,
+        ModelProvider,
+        ModelRegistry,
+        ModelScorer,
+        TaskAnalyzer,
+        TaskType,
+    )
 
 # Read version from version.txt
 _version_file = Path(__file__).parent / "version.txt"
@@ -24,18 +38,17 @@ else:
     else:
         __version__ = "2.1.0"
 
-# Core orchestrator exports
-# Types module
-from lattice_lock import types
-from lattice_lock.orchestrator import (
-    APIResponse,
-    ModelOrchestrator,
-    ModelProvider,
-    ModelRegistry,
-    ModelScorer,
-    TaskAnalyzer,
-    TaskType,
-)
+# Core orchestrator exports are resolved lazily (PEP 562) so that importing
+# lattice_lock (e.g. for __version__ in the CLI) does not load the orchestrator.
+_LAZY_EXPORTS = {
+    "ModelOrchestrator": "lattice_lock.orchestrator",
+    "TaskType": "lattice_lock.orchestrator",
+    "ModelProvider": "lattice_lock.orchestrator",
+    "APIResponse": "lattice_lock.orchestrator",
+    "ModelRegistry": "lattice_lock.orchestrator",
+    "ModelScorer": "lattice_lock.orchestrator",
+    "TaskAnalyzer": "lattice_lock.orchestrator",
+}
 
 __all__ = [
     "__version__",
@@ -48,3 +61,18 @@ __all__ = [
     "TaskAnalyzer",
     "types",
 ]
+
+
+def __getattr__(name: str):
+    if name == "types":
+        return importlib.import_module("lattice_lock.types")
+    module_name = _LAZY_EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(__all__))
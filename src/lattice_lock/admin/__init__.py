@@ -93,6 +93,7 @@ from lattice_lock.admin.schemas import (
 from lattice_lock.admin.services import (
     add_rollback_checkpoint,
     record_project_error,
+    record_project_errors,
     update_validation_status,
 )
 
@@ -161,5 +162,6 @@ __all__ = [
     # Helper Functions (Services)
     "add_rollback_checkpoint",
     "record_project_error",
+    "record_project_errors",
     "update_validation_status",
 ]
@@ -14,14 +14,21 @@ from typing import Any
 from fastapi import FastAPI, Request, status
 from fastapi.exceptions import RequestValidationError
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
+from fastapi.responses import JSONResponse, PlainTextResponse
 
 from lattice_lock.admin.routes import API_VERSION, router
 from lattice_lock.logging_config import set_trace_id
+from lattice_lock.metrics import CONTENT_TYPE, get_metrics_registry
 
 # Configure logging
 logger = logging.getLogger("lattice_lock.admin")
 
+_REQUEST_SECONDS = get_metrics_registry().histogram(
+    "lattice_admin_request_duration_seconds",
+    "Admin API request duration by method and status code.",
+    ["method", "status"],
+)
+
 
 @asynccontextmanager
 async def lifespan(app: FastAPI) -> AsyncIterator[None]:
@@ -132,6 +139,7 @@ All errors follow the Lattice Lock error code format:
 
         # Log response
         duration = time.time() - start_time
+        _REQUEST_SECONDS.labels(request.method, response.status_code).observe(duration)
         logger.info(
             f"{request.method} {request.url.path} - {response.status_code} ({duration:.3f}s)"
         )
@@ -219,8 +227,14 @@ All errors follow the Lattice Lock error code format:
             "version": API_VERSION,
             "docs": "/docs",
             "health": "/api/v1/health",
+            "metrics": "/metrics",
         }
 
+    @app.get("/metrics", include_in_schema=False)
+    async def metrics() -> PlainTextResponse:
+        """Process metrics in the Prometheus text format."""
+        return PlainTextResponse(get_metrics_registry().render(), media_type=CONTENT_TYPE)
+
     return app
 
 
@@ -1,10 +1,13 @@
 from .api_keys import (
     clear_api_keys,
     generate_api_key,
+    generate_api_key_async,
     list_api_keys,
     revoke_api_key,
     rotate_api_key,
+    rotate_api_key_async,
     verify_api_key,
+    verify_api_key_async,
 )
 from .config import AuthConfig, get_config, reset_config
 from .dependencies import (
@@ -18,17 +21,32 @@ from .dependencies import (
     require_viewer,
 )
 from .models import APIKeyInfo, Role, TokenData, TokenResponse, User
-from .passwords import get_password_hash, verify_password
+from .passwords import (
+    get_password_hash,
+    get_password_hash_async,
+    verify_password,
+    verify_password_async,
+)
 from .service import configure, login_for_access_token, refresh_access_token
 from .tokens import (
     clear_revoked_tokens,
+    clear_token_cache,
     create_access_token,
     create_refresh_token,
     is_token_revoked,
     revoke_token,
     verify_token,
+    verify_token_async,
+)
+from .users import (
+    authenticate_user,
+    authenticate_user_async,
+    clear_users,
+    create_user,
+    delete_user,
+    get_user,
 )
-from .users import authenticate_user, clear_users, create_user, delete_user, get_user
+from .workers import AuthWorkerPool, get_auth_pool, reset_auth_pool, run_auth_task
 
 # Backward compatibility alias
 hash_password = get_password_hash
@@ -49,18 +67,25 @@ __all__ = [
     "get_password_hash",
     "verify_password",
     "hash_password",
+    "get_password_hash_async",
+    "verify_password_async",
     # Tokens
     "create_access_token",
     "create_refresh_token",
     "verify_token",
+    "verify_token_async",
     "revoke_token",
     "is_token_revoked",
     "clear_revoked_tokens",
+    "clear_token_cache",
     # API Keys
     "generate_api_key",
+    "generate_api_key_async",
     "verify_api_key",
+    "verify_api_key_async",
     "revoke_api_key",
     "rotate_api_key",
+    "rotate_api_key_async",
     "list_api_keys",
     "clear_api_keys",
     # Users
@@ -69,6 +94,7 @@ __all__ = [
     "delete_user",
     "clear_users",
     "authenticate_user",
+    "authenticate_user_async",
     # Dependencies
     "get_current_user",
     "require_roles",
@@ -81,4 +107,9 @@ __all__ = [
     # Service
     "login_for_access_token",
     "refresh_access_token",
+    # Worker pool
+    "AuthWorkerPool",
+    "get_auth_pool",
+    "reset_auth_pool",
+    "run_auth_task",
 ]
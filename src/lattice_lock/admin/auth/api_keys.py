@@ -1,4 +1,8 @@
+import hashlib
 import secrets
+import threading
+import time
+from collections import OrderedDict
 from datetime import datetime, timezone
 
 import bcrypt
@@ -7,9 +11,18 @@ from fastapi import HTTPException, status
 from .config import get_config
 from .models import APIKeyInfo, Role
 from .storage import MemoryAuthStorage
+from .workers import run_auth_task
 
 # Constants
 BCRYPT_ROUNDS = 12
+# Seconds a verified API key is accepted without another bcrypt check
+VERIFIED_KEY_TTL_SECONDS = 60
+# Verified API keys remembered at most; the least recently used are evicted
+VERIFIED_KEY_CACHE_SIZE = 1024
+
+# sha256(api_key) -> (key_id, expires_at); the plaintext key is never kept
+_verified_keys: OrderedDict[bytes, tuple[str, float]] = OrderedDict()
+_verified_lock = threading.Lock()
 
 
 def generate_api_key(
@@ -19,88 +32,199 @@ def generate_api_key(
 ) -> tuple[str, str]:
     """
     Generate a new API key for a user.
+
+    Keys have the form ``<prefix><key_id>_<secret>``; the key ID is public
+    and selects the stored hash to check the key against.
     Returns (api_key, key_id).
     """
-    config = get_config()
+    api_key, key_id = _new_api_key()
+    _store_api_key(api_key, key_id, _hash_api_key(api_key), username, role, name)
+    return api_key, key_id
+
 
-    key_id = secrets.token_urlsafe(8)
+async def generate_api_key_async(
+    username: str,
+    role: Role,
+    name: str = "",
+) -> tuple[str, str]:
+    """generate_api_key with the bcrypt hash run on the auth worker pool."""
+    api_key, key_id = _new_api_key()
+    api_key_hash = await run_auth_task(_hash_api_key, api_key)
+    _store_api_key(api_key, key_id, api_key_hash, username, role, name)
+    return api_key, key_id
+
+
+def _new_api_key() -> tuple[str, str]:
+    """A fresh (api_key, key_id) pair."""
+    key_id = secrets.token_hex(8)
     key_secret = secrets.token_urlsafe(32)
-    api_key = f"{config.api_key_prefix}{key_secret}"
+    return f"{get_config().api_key_prefix}{key_id}_{key_secret}", key_id
+
+
+def _hash_api_key(api_key: str) -> str:
+    return bcrypt.hashpw(api_key.encode(), bcrypt.gensalt(rounds=BCRYPT_ROUNDS)).decode()
 
-    api_key_hash = bcrypt.hashpw(api_key.encode(), bcrypt.gensalt(rounds=BCRYPT_ROUNDS)).decode()
 
+def _store_api_key(
+    api_key: str, key_id: str, api_key_hash: str, username: str, role: Role, name: str
+) -> None:
     metadata = APIKeyInfo(
         key_id=key_id,
         created_at=datetime.now(timezone.utc),
         name=name,
     )
-
     MemoryAuthStorage.save_api_key(api_key_hash, username, role, key_id, metadata)
-    return api_key, key_id
+
+
+def _invalid_api_key() -> HTTPException:
+    return HTTPException(
+        status_code=status.HTTP_401_UNAUTHORIZED,
+        detail="Invalid API key",
+    )
+
+
+def _parse_key_id(api_key: str) -> str | None:
+    """Extract the key ID from ``<prefix><key_id>_<secret>``."""
+    prefix = get_config().api_key_prefix
+    if not api_key.startswith(prefix):
+        return None
+    key_id, sep, secret = api_key[len(prefix) :].partition("_")
+    if not sep or not key_id or not secret:
+        return None
+    return key_id
+
+
+def _verified_key_id(digest: bytes) -> str | None:
+    """Key ID of a recently verified key, if its cache entry is still fresh."""
+    with _verified_lock:
+        entry = _verified_keys.get(digest)
+        if entry is None:
+            return None
+        if entry[1] <= time.monotonic():
+            del _verified_keys[digest]
+            return None
+        _verified_keys.move_to_end(digest)
+        return entry[0]
+
+
+def _remember_verified(digest: bytes, key_id: str) -> None:
+    with _verified_lock:
+        _verified_keys[digest] = (key_id, time.monotonic() + VERIFIED_KEY_TTL_SECONDS)
+        _verified_keys.move_to_end(digest)
+        while len(_verified_keys) > VERIFIED_KEY_CACHE_SIZE:
+            _verified_keys.popitem(last=False)
+
+
+def _forget_verified(key_id: str) -> None:
+    with _verified_lock:
+        for digest in [d for d, (kid, _) in _verified_keys.items() if kid == key_id]:
+            del _verified_keys[digest]
+
+
+def _check_api_key(api_key: str, digest: bytes) -> str:
+    """Check a key against its stored hash (one bcrypt call); returns the key ID."""
+    key_id = _parse_key_id(api_key)
+    if key_id is None:
+        raise _invalid_api_key()
+    record = MemoryAuthStorage.get_api_key(key_id)
+    if record is None:
+        raise _invalid_api_key()
+    try:
+        valid = bcrypt.checkpw(api_key.encode(), record[0].encode())
+    except ValueError:
+        valid = False
+    if not valid:
+        raise _invalid_api_key()
+    _remember_verified(digest, key_id)
+    return key_id
+
+
+def _key_owner(key_id: str) -> tuple[str, Role]:
+    """(username, role) of a verified key; fails if it was revoked meanwhile."""
+    record = MemoryAuthStorage.get_api_key(key_id)
+    if record is None:
+        raise _invalid_api_key()
+    meta = MemoryAuthStorage.get_api_key_metadata(key_id)
+    if meta:
+        meta.last_used = datetime.now(timezone.utc)
+    _, username, role = record
+    return username, role
 
 
 def verify_api_key(api_key: str) -> tuple[str, Role]:
     """
     Verify an API key and return associated user info.
+
+    Looks up the stored hash by the key's ID and runs a single bcrypt check;
+    keys verified in the last VERIFIED_KEY_TTL_SECONDS skip bcrypt.
     Returns (username, role).
     """
-    all_keys = MemoryAuthStorage.get_all_api_keys()
-
-    for stored_hash, (username, role, key_id) in all_keys.items():
-        try:
-            if bcrypt.checkpw(api_key.encode(), stored_hash.encode()):
-                # Update last used
-                meta = MemoryAuthStorage.get_api_key_metadata(key_id)
-                if meta:
-                    meta.last_used = datetime.now(timezone.utc)
-                return username, role
-        except ValueError:
-            continue
-
-    raise HTTPException(
-        status_code=status.HTTP_401_UNAUTHORIZED,
-        detail="Invalid API key",
-    )
+    digest = hashlib.sha256(api_key.encode()).digest()
+    key_id = _verified_key_id(digest) or _check_api_key(api_key, digest)
+    return _key_owner(key_id)
+
+
+async def verify_api_key_async(api_key: str) -> tuple[str, Role]:
+    """Verify an API key without blocking the event loop on bcrypt."""
+    digest = hashlib.sha256(api_key.encode()).digest()
+    key_id = _verified_key_id(digest)
+    if key_id is None:
+        key_id = await run_auth_task(_check_api_key, api_key, digest)
+    return _key_owner(key_id)
 
 
 def revoke_api_key(key_id: str) -> bool:
     """Revoke an API key by its ID."""
-    all_keys = MemoryAuthStorage.get_all_api_keys()
-    keys_to_remove = [k for k, (_, _, kid) in all_keys.items() if kid == key_id]
-
-    if not keys_to_remove:
+    if not MemoryAuthStorage.delete_api_key(key_id):
         return False
 
-    for k in keys_to_remove:
-        MemoryAuthStorage.delete_api_key(k)
-
     MemoryAuthStorage.delete_api_key_metadata(key_id)
+    _forget_verified(key_id)
     return True
 
 
-def rotate_api_key(key_id: str, name: str = "") -> tuple[str, str] | None:
-    """Rotate an API key."""
-    all_keys = MemoryAuthStorage.get_all_api_keys()
-    username = None
-    role = None
-
-    for _, (u, r, kid) in all_keys.items():
-        if kid == key_id:
-            username = u
-            role = r
-            break
-
-    if username is None:
+def _rotation_target(key_id: str, name: str) -> tuple[str, Role, str] | None:
+    """(username, role, name) for the replacement of ``key_id``, if it exists."""
+    record = MemoryAuthStorage.get_api_key(key_id)
+    if record is None:
         return None
+    _, username, role = record
 
     # Preserve name if not provided
     if not name:
         meta = MemoryAuthStorage.get_api_key_metadata(key_id)
         if meta:
             name = meta.name
+    return username, role, name
+
+
+def rotate_api_key(key_id: str, name: str = "") -> tuple[str, str] | None:
+    """Rotate an API key."""
+    target = _rotation_target(key_id, name)
+    if target is None:
+        return None
 
     revoke_api_key(key_id)
-    return generate_api_key(username, role, name)
+    return generate_api_key(*target)
+
+
+async def rotate_api_key_async(key_id: str, name: str = "") -> tuple[str, str] | None:
+    """
+    rotate_api_key with the bcrypt hash run on the auth worker pool.
+
+    The old key stays valid until the new one is hashed, so a rejected or
+    cancelled rotation does not leave the caller without a key.
+    """
+    target = _rotation_target(key_id, name)
+    if target is None:
+        return None
+
+    api_key, new_key_id = await generate_api_key_async(*target)
+    if not revoke_api_key(key_id):
+        # Revoked while the new key was being hashed
+        revoke_api_key(new_key_id)
+        return None
+    return api_key, new_key_id
 
 
 def list_api_keys(username: str) -> list[APIKeyInfo]:
@@ -116,3 +240,5 @@ def clear_api_keys() -> None:
     # Since I control storage.py, I'll just assume MemoryAuthStorage has _api_keys
     MemoryAuthStorage._api_keys.clear()
     MemoryAuthStorage._api_key_metadata.clear()
+    with _verified_lock:
+        _verified_keys.clear()
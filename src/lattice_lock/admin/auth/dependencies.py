@@ -4,9 +4,9 @@ from typing import Annotated
 from fastapi import Depends, HTTPException, Security, status
 from fastapi.security import APIKeyHeader, OAuth2PasswordBearer
 
-from .api_keys import verify_api_key
+from .api_keys import verify_api_key_async
 from .models import Role, TokenData
-from .tokens import verify_token
+from .tokens import verify_token_async
 
 oauth2_scheme = OAuth2PasswordBearer(
     tokenUrl="/api/v1/auth/token",
@@ -25,10 +25,10 @@ async def get_current_user(
 ) -> TokenData:
     """Get the current authenticated user from token or API key."""
     if token:
-        return verify_token(token)
+        return await verify_token_async(token)
 
     if api_key:
-        username, role = verify_api_key(api_key)
+        username, role = await verify_api_key_async(api_key)
         return TokenData(
             sub=username,
             role=role,
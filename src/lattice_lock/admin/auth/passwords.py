@@ -1,5 +1,7 @@
 import bcrypt
 
+from .workers import run_auth_task
+
 
 def verify_password(plain_password: str, hashed_password: str) -> bool:
     """
@@ -29,3 +31,13 @@ def get_password_hash(password: str) -> str:
     # gensalt() generates a salt
     hashed = bcrypt.hashpw(password.encode("utf-8"), bcrypt.gensalt())
     return hashed.decode("utf-8")
+
+
+async def verify_password_async(plain_password: str, hashed_password: str) -> bool:
+    """verify_password on the auth worker pool, for use from async code."""
+    return await run_auth_task(verify_password, plain_password, hashed_password)
+
+
+async def get_password_hash_async(password: str) -> str:
+    """get_password_hash on the auth worker pool, for use from async code."""
+    return await run_auth_task(get_password_hash, password)
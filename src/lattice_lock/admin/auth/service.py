@@ -9,8 +9,8 @@ from fastapi.security import OAuth2PasswordRequestForm
 
 from .config import AuthConfig, get_config
 from .models import TokenResponse
-from .tokens import create_access_token, create_refresh_token, verify_token
-from .users import authenticate_user
+from .tokens import create_access_token, create_refresh_token, verify_token_async
+from .users import authenticate_user_async
 
 logger = logging.getLogger("lattice_lock.admin.auth.service")
 
@@ -45,7 +45,7 @@ async def login_for_access_token(form_data: OAuth2PasswordRequestForm) -> TokenR
     Raises:
         HTTPException 401: If credentials are invalid
     """
-    user = authenticate_user(form_data.username, form_data.password)
+    user = await authenticate_user_async(form_data.username, form_data.password)
 
     if not user:
         raise HTTPException(
@@ -80,7 +80,7 @@ async def refresh_access_token(refresh_token: str) -> TokenResponse:
         HTTPException 401: If refresh token is invalid or expired
     """
     try:
-        token_data = verify_token(refresh_token, expected_type="refresh")
+        token_data = await verify_token_async(refresh_token, expected_type="refresh")
     except HTTPException:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
@@ -6,7 +6,7 @@ class MemoryAuthStorage:
 
     _users: dict[str, User] = {}
     _revoked_tokens: set[str] = set()
-    _api_keys: dict[str, tuple[str, Role, str]] = {}  # hash -> (username, role, key_id)
+    _api_keys: dict[str, tuple[str, str, Role]] = {}  # key_id -> (hash, username, role)
     _api_key_metadata: dict[str, APIKeyInfo] = {}  # key_id -> metadata
 
     @classmethod
@@ -40,11 +40,16 @@ class MemoryAuthStorage:
     def save_api_key(
         cls, key_hash: str, username: str, role: Role, key_id: str, metadata: APIKeyInfo
     ):
-        cls._api_keys[key_hash] = (username, role, key_id)
+        cls._api_keys[key_id] = (key_hash, username, role)
         cls._api_key_metadata[key_id] = metadata
 
     @classmethod
-    def get_all_api_keys(cls) -> dict[str, tuple[str, Role, str]]:
+    def get_api_key(cls, key_id: str) -> tuple[str, str, Role] | None:
+        """Get (hash, username, role) for an API key ID."""
+        return cls._api_keys.get(key_id)
+
+    @classmethod
+    def get_all_api_keys(cls) -> dict[str, tuple[str, str, Role]]:
         return cls._api_keys
 
     @classmethod
@@ -52,9 +57,8 @@ class MemoryAuthStorage:
         return cls._api_key_metadata.get(key_id)
 
     @classmethod
-    def delete_api_key(cls, key_hash: str) -> None:
-        if key_hash in cls._api_keys:
-            del cls._api_keys[key_hash]
+    def delete_api_key(cls, key_id: str) -> bool:
+        return cls._api_keys.pop(key_id, None) is not None
 
     @classmethod
     def delete_api_key_metadata(cls, key_id: str) -> None:
@@ -64,7 +68,7 @@ class MemoryAuthStorage:
     @classmethod
     def list_api_keys(cls, username: str) -> list[APIKeyInfo]:
         """List all API keys for a user."""
-        key_ids = [key_id for _, (user, _, key_id) in cls._api_keys.items() if user == username]
+        key_ids = [key_id for key_id, (_, user, _) in cls._api_keys.items() if user == username]
         return [cls._api_key_metadata[kid] for kid in key_ids if kid in cls._api_key_metadata]
 
     @classmethod
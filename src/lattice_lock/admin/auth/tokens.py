@@ -1,12 +1,23 @@
+import hashlib
 import secrets
+import threading
+from collections import OrderedDict
 from datetime import datetime, timedelta, timezone
 
 import jwt
 from fastapi import HTTPException, status
 
-from .config import get_config
+from .config import AuthConfig, get_config
 from .models import Role, TokenData
 from .storage import MemoryAuthStorage
+from .workers import run_auth_task
+
+# Validated access tokens remembered at most; the least recently used are evicted
+TOKEN_CACHE_SIZE = 4096
+
+# sha256(token) -> (claims, config the signature was checked with)
+_validated_tokens: OrderedDict[bytes, tuple[TokenData, AuthConfig]] = OrderedDict()
+_token_cache_lock = threading.Lock()
 
 
 def create_access_token(username: str, role: Role, expires_delta: timedelta | None = None) -> str:
@@ -51,9 +62,65 @@ def create_refresh_token(username: str, role: Role, expires_delta: timedelta | N
     return jwt.encode(payload, config.secret_key.get_secret_value(), algorithm=config.algorithm)
 
 
+def _cached_token(digest: bytes, expected_type: str, config: AuthConfig) -> TokenData | None:
+    """Claims of a recently validated token that is unexpired and not revoked."""
+    with _token_cache_lock:
+        entry = _validated_tokens.get(digest)
+        if entry is None:
+            return None
+        token_data, validated_with = entry
+        if validated_with is not config or token_data.exp <= datetime.now(timezone.utc):
+            del _validated_tokens[digest]
+            return None
+        _validated_tokens.move_to_end(digest)
+    # Revocation is checked on every hit; a miss re-runs full verification
+    if token_data.token_type != expected_type or MemoryAuthStorage.is_token_revoked(token_data.jti):
+        return None
+    return token_data
+
+
+def _remember_token(digest: bytes, token_data: TokenData, config: AuthConfig) -> None:
+    with _token_cache_lock:
+        _validated_tokens[digest] = (token_data, config)
+        _validated_tokens.move_to_end(digest)
+        while len(_validated_tokens) > TOKEN_CACHE_SIZE:
+            _validated_tokens.popitem(last=False)
+
+
 def verify_token(token: str, expected_type: str = "access") -> TokenData:
-    """Verify and decode a JWT token."""
+    """Verify and decode a JWT token.
+
+    Access tokens validated before are served from an LRU until they expire,
+    skipping the signature check; revocation is still checked every time.
+    """
+    config = get_config()
+    digest = hashlib.sha256(token.encode()).digest()
+    cached = _cached_token(digest, expected_type, config)
+    if cached is not None:
+        return cached
+
+    token_data = _decode_token(token, expected_type, config)
+    if token_data.token_type == "access":
+        _remember_token(digest, token_data, config)
+    return token_data
+
+
+async def verify_token_async(token: str, expected_type: str = "access") -> TokenData:
+    """verify_token for async callers.
+
+    HMAC signatures take microseconds and are checked inline; asymmetric
+    ones (RS*/ES*/PS*) are checked on the auth worker pool.
+    """
     config = get_config()
+    if config.algorithm.startswith("HS"):
+        return verify_token(token, expected_type)
+    cached = _cached_token(hashlib.sha256(token.encode()).digest(), expected_type, config)
+    if cached is not None:
+        return cached
+    return await run_auth_task(verify_token, token, expected_type)
+
+
+def _decode_token(token: str, expected_type: str, config: AuthConfig) -> TokenData:
     credentials_exception = HTTPException(
         status_code=status.HTTP_401_UNAUTHORIZED,
         detail="Could not validate credentials",
@@ -116,3 +183,9 @@ def is_token_revoked(jti: str) -> bool:
 def clear_revoked_tokens() -> None:
     """Clear revoked tokens (test utility)."""
     MemoryAuthStorage.clear_revoked_tokens()
+
+
+def clear_token_cache() -> None:
+    """Forget validated tokens (test utility)."""
+    with _token_cache_lock:
+        _validated_tokens.clear()
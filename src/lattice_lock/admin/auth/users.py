@@ -2,11 +2,14 @@ import logging
 
 from .config import get_config
 from .models import Role, User
-from .passwords import get_password_hash, verify_password
+from .passwords import get_password_hash, verify_password, verify_password_async
 from .storage import MemoryAuthStorage
 
 logger = logging.getLogger("lattice_lock.admin.auth.users")
 
+# Checked for unknown users so that they take as long as known ones
+_DUMMY_HASH = "$2b$12$LQv3c1yqBWVHxkd0LHAkCOYz6TtxMQJqhN8/X4.VTtYA/ICNVu5xO"
+
 
 def create_user(username: str, password: str, role: Role = Role.VIEWER) -> User:
     """Create a new user."""
@@ -47,8 +50,7 @@ def authenticate_user(username: str, password: str) -> User | None:
     user = get_user(username)
 
     # Constant time dummy check to prevent timing attacks
-    dummy_hash = "$2b$12$LQv3c1yqBWVHxkd0LHAkCOYz6TtxMQJqhN8/X4.VTtYA/ICNVu5xO"
-    hash_to_verify = user.hashed_password if user else dummy_hash
+    hash_to_verify = user.hashed_password if user else _DUMMY_HASH
 
     password_valid = verify_password(password, hash_to_verify)
 
@@ -56,3 +58,16 @@ def authenticate_user(username: str, password: str) -> User | None:
         return None
 
     return user
+
+
+async def authenticate_user_async(username: str, password: str) -> User | None:
+    """Authenticate a user, checking the password on the auth worker pool."""
+    user = get_user(username)
+    hash_to_verify = user.hashed_password if user else _DUMMY_HASH
+
+    password_valid = await verify_password_async(password, hash_to_verify)
+
+    if user is None or user.disabled or not password_valid:
+        return None
+
+    return user
@@ -0,0 +1,141 @@
+"""
+Worker pool for CPU-bound authentication work.
+
+A bcrypt check takes 100-300 ms of CPU. Run on the event loop it stalls every
+other admin and dashboard request, so password and API key checks run on a
+small dedicated thread pool instead (bcrypt releases the GIL while hashing).
+The pool is separate from the loop's default executor so a login burst cannot
+starve other blocking calls, and jobs beyond ``max_pending`` are rejected
+with 503 instead of queueing without bound.
+"""
+
+import asyncio
+import functools
+import os
+import threading
+from collections.abc import Callable
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, TypeVar
+
+from fastapi import HTTPException, status
+
+from lattice_lock.metrics import MetricFamily, get_metrics_registry
+
+T = TypeVar("T")
+
+# Threads running bcrypt concurrently (override with LATTICE_AUTH_WORKERS)
+DEFAULT_AUTH_WORKERS = min(4, os.cpu_count() or 1)
+# Auth jobs running or waiting before new ones are rejected
+DEFAULT_AUTH_MAX_PENDING = 256
+
+
+class AuthWorkerPool:
+    """Bounded thread pool for password hashing and other CPU-bound auth work."""
+
+    def __init__(
+        self,
+        max_workers: int = DEFAULT_AUTH_WORKERS,
+        max_pending: int = DEFAULT_AUTH_MAX_PENDING,
+    ):
+        self.max_workers = max_workers
+        self.max_pending = max_pending
+        self._executor: ThreadPoolExecutor | None = None
+        self._lock = threading.Lock()
+        self._pending = 0
+        self.completed = 0
+        self.rejected = 0
+
+    @property
+    def pending(self) -> int:
+        """Jobs running or waiting for a worker."""
+        return self._pending
+
+    def _get_executor(self) -> ThreadPoolExecutor:
+        with self._lock:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(
+                    max_workers=self.max_workers, thread_name_prefix="lattice-auth"
+                )
+            return self._executor
+
+    async def run(self, func: Callable[..., T], *args: Any, **kwargs: Any) -> T:
+        """
+        Run ``func`` on the pool and await its result.
+
+        Raises:
+            HTTPException: 503 if ``max_pending`` jobs are already queued.
+        """
+        with self._lock:
+            if self._pending >= self.max_pending:
+                self.rejected += 1
+                raise HTTPException(
+                    status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+                    detail="Authentication service busy",
+                    headers={"Retry-After": "1"},
+                )
+            self._pending += 1
+        try:
+            future = self._get_executor().submit(functools.partial(func, *args, **kwargs))
+        except BaseException:
+            self._job_done()
+            raise
+        # Released when the thread finishes, not when the caller stops waiting:
+        # a cancelled request still occupies a worker until bcrypt returns
+        future.add_done_callback(self._job_done)
+        return await asyncio.wrap_future(future)
+
+    def _job_done(self, _future: Future | None = None) -> None:
+        with self._lock:
+            self._pending -= 1
+            self.completed += 1
+
+    def shutdown(self, wait: bool = True) -> None:
+        with self._lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=wait)
+        get_metrics_registry().unregister_collector(self._collect_metrics)
+
+    def _collect_metrics(self) -> list[MetricFamily]:
+        """Report pool state to the metrics registry."""
+        return [
+            MetricFamily(
+                "lattice_auth_pool_pending", "gauge", "Auth jobs running or waiting for a worker."
+            ).add(self._pending),
+            MetricFamily(
+                "lattice_auth_pool_completed_total", "counter", "Auth jobs run on the pool."
+            ).add(self.completed),
+            MetricFamily(
+                "lattice_auth_pool_rejected_total",
+                "counter",
+                "Auth jobs rejected because the pool was saturated.",
+            ).add(self.rejected),
+        ]
+
+
+_auth_pool: AuthWorkerPool | None = None
+
+
+def get_auth_pool() -> AuthWorkerPool:
+    """Get the global auth worker pool."""
+    global _auth_pool
+    if _auth_pool is None:
+        _auth_pool = AuthWorkerPool(
+            max_workers=int(os.getenv("LATTICE_AUTH_WORKERS", DEFAULT_AUTH_WORKERS))
+        )
+        # Only the global pool reports metrics, so the series exist once
+        get_metrics_registry().register_collector(_auth_pool._collect_metrics)
+    return _auth_pool
+
+
+def reset_auth_pool() -> None:
+    """Shut down and discard the global auth worker pool (useful for testing)."""
+    global _auth_pool
+    if _auth_pool is not None:
+        _auth_pool.shutdown(wait=False)
+    _auth_pool = None
+
+
+async def run_auth_task(func: Callable[..., T], *args: Any, **kwargs: Any) -> T:
+    """Run CPU-bound auth work on the global auth worker pool."""
+    return await get_auth_pool().run(func, *args, **kwargs)
@@ -21,7 +21,7 @@ from lattice_lock.admin.auth import (
     Role,
     TokenData,
     TokenResponse,
-    generate_api_key,
+    generate_api_key_async,
     get_current_user,
     list_api_keys,
     login_for_access_token,
@@ -29,7 +29,7 @@ from lattice_lock.admin.auth import (
     require_roles,
     revoke_api_key,
     revoke_token,
-    rotate_api_key,
+    rotate_api_key_async,
 )
 
 router = APIRouter(prefix="/auth", tags=["authentication"])
@@ -208,7 +208,7 @@ async def create_api_key(
     Returns:
         The new API key and its metadata
     """
-    api_key, key_id = generate_api_key(
+    api_key, key_id = await generate_api_key_async(
         username=current_user.sub,
         role=request.role,
         name=request.name,
@@ -324,7 +324,7 @@ async def rotate_key(
             detail="Cannot rotate keys you don't own",
         )
 
-    result = rotate_api_key(key_id, request.name)
+    result = await rotate_api_key_async(key_id, request.name)
 
     if result is None:
         raise HTTPException(
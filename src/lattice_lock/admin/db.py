@@ -1,6 +1,8 @@
 import logging
 import os
 
+from lattice_lock.metrics import get_metrics_registry
+
 logger = logging.getLogger("lattice_lock.admin.db")
 
 # Default to SQLite for development, can be overridden by LATTICE_DATABASE_URL
@@ -45,6 +47,18 @@ def get_async_session():
     return _async_session
 
 
+def _collect_pool_metrics():
+    """Report the admin engine's connection pool to the metrics registry."""
+    if _engine is None:
+        return []
+    from lattice_lock.database.connection import pool_metric_families
+
+    return pool_metric_families({"admin": _engine.sync_engine})
+
+
+get_metrics_registry().register_collector(_collect_pool_metrics)
+
+
 # For backwards compatibility - these are now functions, not direct references
 def engine():
     return get_engine()
@@ -8,12 +8,13 @@ Used by routes and internal systems (like Sheriff/Gauntlet) to update project st
 import logging
 import time
 import uuid
+from collections.abc import Sequence
 from typing import Any
 
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from .models import Project, ProjectError, RollbackCheckpoint, ValidationStatus
+from .models import Project, ProjectError, ProjectStatus, RollbackCheckpoint, ValidationStatus
 
 logger = logging.getLogger(__name__)
 
@@ -72,6 +73,64 @@ async def record_project_error(
     return True
 
 
+async def record_project_errors(db: AsyncSession, errors: Sequence[dict[str, Any]]) -> int:
+    """
+    Record a batch of project errors in one transaction.
+
+    Each entry holds the arguments of record_project_error, plus an optional
+    ``timestamp`` of when the error occurred. Entries for unknown projects
+    are skipped.
+
+    Args:
+        db: Database session
+        errors: Error entries (project_id, error_code, message, severity,
+            category, details, timestamp)
+
+    Returns:
+        int: Number of errors recorded
+    """
+    project_ids = {e["project_id"] for e in errors}
+    if not project_ids:
+        return 0
+    result = await db.execute(select(Project).where(Project.id.in_(project_ids)))
+    projects = {project.id: project for project in result.scalars()}
+
+    now = time.time()
+    rows = []
+    for entry in errors:
+        project = projects.get(entry["project_id"])
+        if project is None:
+            continue
+        severity = entry["severity"]
+        rows.append(
+            ProjectError(
+                id=f"err_{uuid.uuid4().hex[:8]}",
+                project_id=project.id,
+                error_code=entry["error_code"],
+                message=entry["message"],
+                severity=severity,
+                category=entry["category"],
+                timestamp=entry.get("timestamp", now),
+                details=entry.get("details") or {},
+            )
+        )
+        if severity == "critical":
+            project.status = ProjectStatus.ERROR
+        elif severity == "high" and project.status != ProjectStatus.ERROR:
+            project.status = ProjectStatus.WARNING
+        project.last_activity = now
+
+    missing = project_ids - projects.keys()
+    if missing:
+        logger.warning(f"Attempted to record errors for non-existent projects: {sorted(missing)}")
+    if not rows:
+        return 0
+    db.add_all(rows)
+    await db.commit()
+    logger.info(f"Recorded {len(rows)} errors for {len(projects)} projects")
+    return len(rows)
+
+
 async def add_rollback_checkpoint(
     db: AsyncSession,
     project_id: str,
@@ -0,0 +1,39 @@
+"""
+Lattice Lock Benchmarks
+
+Offline performance tooling: a mock OpenAI-compatible provider, a load
+generator for the orchestrator, and the hot-path benchmark suite behind
+``lattice bench``.
+"""
+
+import importlib
+
+# Exports are resolved lazily (PEP 562) so that the benchmark suite can be used
+# without importing the mock provider's web server stack.
+_LAZY_EXPORTS = {
+    "LoadGenerator": "lattice_lock.benchmarks.load",
+    "LoadReport": "lattice_lock.benchmarks.load",
+    "run_mock_load": "lattice_lock.benchmarks.load",
+    "MockProviderConfig": "lattice_lock.benchmarks.mock_provider",
+    "MockProviderServer": "lattice_lock.benchmarks.mock_provider",
+    "create_mock_app": "lattice_lock.benchmarks.mock_provider",
+    "BenchmarkResult": "lattice_lock.benchmarks.suite",
+    "BenchmarkRun": "lattice_lock.benchmarks.suite",
+    "compare_to_baseline": "lattice_lock.benchmarks.suite",
+    "run_suite": "lattice_lock.benchmarks.suite",
+}
+
+__all__ = list(_LAZY_EXPORTS)
+
+
+def __getattr__(name: str):
+    module_name = _LAZY_EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(__all__))
@@ -0,0 +1,164 @@
+"""
+Synthetic inputs for benchmarks.
+
+Every generator is deterministic for a given seed, so runs compared against a
+stored baseline measure the same work.
+"""
+
+import random
+import time
+from pathlib import Path
+from typing import Any
+
+from lattice_lock.rollback.state import RollbackState
+
+# Prompt fragments combined into synthetic prompts of mixed task types
+_PROMPT_TASKS = (
+    "Write a Python function that {verb} a {noun}",
+    "Debug this traceback raised when the service {verb} the {noun}",
+    "Explain step by step why the {noun} {verb} incorrectly",
+    "Design a scalable architecture that {verb} every {noun}",
+    "Review this pull request which {verb} the {noun} and suggest improvements",
+    "Translate the documentation that {verb} the {noun} into French",
+    "Summarize the incident report about how the system {verb} the {noun}",
+    "Write unit tests for the class that {verb} the {noun}",
+)
+_VERBS = ("parses", "caches", "validates", "serializes", "merges", "indexes", "streams")
+_NOUNS = ("order", "invoice", "config file", "user session", "payment", "audit log", "schema")
+
+# Field types used for synthetic lattice.yaml entities
+_FIELD_TYPES = ("int", "str", "bool", "decimal", "uuid")
+
+
+def generate_prompts(count: int, seed: int = 0, padding: int = 0) -> list[str]:
+    """Generate ``count`` distinct prompts, each padded with ``padding`` filler sentences."""
+    rng = random.Random(seed)
+    prompts = []
+    for i in range(count):
+        template = rng.choice(_PROMPT_TASKS)
+        prompt = template.format(verb=rng.choice(_VERBS), noun=rng.choice(_NOUNS))
+        filler = " ".join(
+            f"Context line {j} mentions the {rng.choice(_NOUNS)}." for j in range(padding)
+        )
+        # The index keeps prompts unique so analyzer caches do not hide the work
+        prompts.append(f"{prompt} (case {i}). {filler}".strip())
+    return prompts
+
+
+def generate_python_source(functions: int, seed: int = 0) -> str:
+    """Generate a Python module with imports, classes and ``functions`` functions."""
+    rng = random.Random(seed)
+    lines = ["import os", "import json", "from typing import Any", ""]
+    for i in range(functions):
+        if i % 10 == 0:
+            lines += [f"class Service{i}:", f'    """Service {i}."""', ""]
+        indent = "    " if i % 10 else ""
+        typed = rng.random() < 0.8
+        signature = (
+            f"def handler_{i}(value: int, name: str = 'x') -> dict[str, Any]:"
+            if typed
+            else f"def handler_{i}(value, name='x'):"
+        )
+        if indent:
+            signature = signature.replace("(value", "(self, value", 1)
+        lines += [
+            f"{indent}{signature}",
+            f"{indent}    result = {{'value': value * {i}, 'name': name}}",
+            f"{indent}    if value > {rng.randint(0, 100)}:",
+            f"{indent}        result['path'] = os.path.join(name, str(value))",
+            f"{indent}    return json.loads(json.dumps(result))",
+            "",
+        ]
+    return "\n".join(lines)
+
+
+def generate_repository(root: str | Path, files: int, functions_per_file: int = 20, seed: int = 0):
+    """Write a synthetic Python package of ``files`` modules under ``root``."""
+    root = Path(root)
+    for i in range(files):
+        package = root / f"pkg_{i // 50}"
+        package.mkdir(parents=True, exist_ok=True)
+        (package / f"module_{i}.py").write_text(
+            generate_python_source(functions_per_file, seed=seed + i)
+        )
+    return root
+
+
+def generate_config(agents: int, seed: int = 0) -> dict[str, Any]:
+    """Generate an agent configuration in the shape JSONNormalizer expects."""
+    rng = random.Random(seed)
+    return {
+        "version": "2.1",
+        "settings": {
+            "logging": {"level": "INFO", "handlers": {"console": {"enabled": True}}},
+            "limits": {"max_tokens": 4096, "timeout": 30},
+        },
+        "agents": [
+            {
+                "name": f"agent_{i}",
+                "role": rng.choice(("engineer", "reviewer", "architect", "analyst")),
+                "tools": [f"tool_{j}" for j in range(rng.randint(1, 6))],
+                "provider_preferences": [
+                    {"provider": p, "model": f"{p}-model-{j}", "weight": rng.random()}
+                    for j, p in enumerate(rng.sample(("openai", "anthropic", "google", "xai"), 3))
+                ],
+                "subagents": [f"agent_{rng.randrange(agents)}" for _ in range(rng.randint(0, 3))],
+                "settings": {"temperature": round(rng.random(), 2), "retries": rng.randint(0, 5)},
+            }
+            for i in range(agents)
+        ],
+    }
+
+
+def generate_config_override(base: dict[str, Any], seed: int = 0) -> dict[str, Any]:
+    """Generate an override for ``base`` that exercises nested merges and list directives."""
+    rng = random.Random(seed)
+    agents = base.get("agents", [])
+    removed = [{"name": a["name"]} for a in rng.sample(agents, min(len(agents) // 10, len(agents)))]
+    return {
+        "settings": {"logging": {"level": "DEBUG"}, "limits": {"timeout": 60}},
+        "agents": {
+            "+remove": removed,
+            "+append": [{"name": f"extra_{i}", "role": "engineer"} for i in range(len(removed))],
+        },
+        "features": {f"flag_{i}": rng.random() < 0.5 for i in range(50)},
+    }
+
+
+def generate_lattice_schema(entities: int, fields_per_entity: int = 12, seed: int = 0):
+    """Generate lattice.yaml schema data with ``entities`` entities."""
+    rng = random.Random(seed)
+    schema: dict[str, Any] = {
+        "version": "v2.1",
+        "generated_module": "bench_types",
+        "entities": {},
+    }
+    for i in range(entities):
+        fields: dict[str, Any] = {"id": {"type": "int", "primary_key": True}}
+        for j in range(fields_per_entity - 1):
+            field_type = rng.choice(_FIELD_TYPES)
+            field_def: dict[str, Any] = {"type": field_type}
+            if field_type == "int" and rng.random() < 0.3:
+                field_def["gte"] = 0
+            if rng.random() < 0.2:
+                field_def["nullable"] = True
+            fields[f"field_{j}"] = field_def
+        fields["status"] = {"enum": ["active", "archived", "deleted"], "default": "active"}
+        schema["entities"][f"Entity{i}"] = {"description": f"Entity {i}", "fields": fields}
+    return schema
+
+
+def generate_rollback_state(files: int, config_keys: int = 100, seed: int = 0) -> RollbackState:
+    """Generate a RollbackState tracking ``files`` file hashes."""
+    rng = random.Random(seed)
+    return RollbackState(
+        timestamp=time.time(),
+        files={
+            f"src/pkg_{i // 50}/module_{i}.py": f"{rng.getrandbits(256):064x}" for i in range(files)
+        },
+        config={
+            f"key_{i}": {"value": rng.random(), "enabled": i % 2 == 0} for i in range(config_keys)
+        },
+        schema_version="2.1",
+        description="Synthetic benchmark checkpoint",
+    )
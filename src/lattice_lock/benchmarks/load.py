@@ -0,0 +1,277 @@
+"""
+Load generator for ModelOrchestrator.route_request.
+
+Requests are issued open-loop at a target rate (new requests do not wait for
+earlier ones to finish), so queueing inside the orchestrator shows up in the
+measured latency instead of silently lowering the offered load. The report
+covers throughput, end-to-end latency percentiles, errors by type and the time
+spent in each route_request stage, from which the orchestrator's own overhead
+(everything except the provider call) is derived.
+
+Run against the bundled mock provider, entirely offline::
+
+    python -m lattice_lock.benchmarks.load --rate 100 --duration 10 --latency-ms 40
+"""
+
+import argparse
+import asyncio
+import json
+import logging
+import math
+import time
+from collections.abc import Callable
+from dataclasses import dataclass, field
+from typing import Any
+
+from lattice_lock.tracing import PerformanceMetrics, performance_metrics_scope
+
+from .mock_provider import LATENCY_DISTRIBUTIONS, MockProviderConfig, MockProviderServer
+
+logger = logging.getLogger(__name__)
+
+# route_request stages recorded in PerformanceMetrics as "route_request.<stage>";
+# a run collects them in its own unbounded PerformanceMetrics, so the global
+# instance (and its 1000-sample window) is left untouched
+STAGES = ("analyze", "select", "queue", "provider", "total")
+
+DEFAULT_PROMPT = "Summarize the main trade-offs of optimistic locking in two sentences."
+
+
+def percentile(values: list[float], pct: float) -> float | None:
+    """Nearest-rank percentile of ``values`` (None if empty)."""
+    if not values:
+        return None
+    ordered = sorted(values)
+    index = max(0, min(len(ordered) - 1, math.ceil(pct / 100 * len(ordered)) - 1))
+    return ordered[index]
+
+
+@dataclass
+class LoadReport:
+    """Outcome of a load run."""
+
+    target_rps: float
+    duration_s: float
+    requests: int = 0
+    succeeded: int = 0
+    errors: dict[str, int] = field(default_factory=dict)
+    latencies_ms: list[float] = field(default_factory=list)
+    stages: dict[str, dict[str, Any]] = field(default_factory=dict)
+
+    @property
+    def throughput_rps(self) -> float:
+        return self.succeeded / self.duration_s if self.duration_s else 0.0
+
+    @property
+    def overhead_ms(self) -> dict[str, float | None]:
+        """Orchestrator time per request outside the provider call, at p50/p95."""
+        total = self.stages.get("total")
+        provider = self.stages.get("provider")
+        if not total or not provider:
+            return {"p50": None, "p95": None}
+        return {
+            "p50": total["p50_ms"] - provider["p50_ms"],
+            "p95": total["p95_ms"] - provider["p95_ms"],
+        }
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "target_rps": self.target_rps,
+            "duration_s": self.duration_s,
+            "requests": self.requests,
+            "succeeded": self.succeeded,
+            "errors": dict(self.errors),
+            "throughput_rps": self.throughput_rps,
+            "latency_ms": {
+                "p50": percentile(self.latencies_ms, 50),
+                "p95": percentile(self.latencies_ms, 95),
+                "p99": percentile(self.latencies_ms, 99),
+            },
+            "overhead_ms": self.overhead_ms,
+            "stages": self.stages,
+        }
+
+    def format(self) -> str:
+        data = self.to_dict()
+        lat = data["latency_ms"]
+        lines = [
+            f"Requests: {self.requests} ({self.succeeded} ok) in {self.duration_s:.2f}s "
+            f"at target {self.target_rps:g} rps",
+            f"Throughput: {self.throughput_rps:.1f} rps",
+            "Latency: " + ", ".join(f"{k}={_fmt_ms(v)}" for k, v in lat.items()),
+            "Orchestrator overhead: "
+            + ", ".join(f"{k}={_fmt_ms(v)}" for k, v in self.overhead_ms.items()),
+        ]
+        for stage in STAGES:
+            summary = self.stages.get(stage)
+            if summary:
+                lines.append(
+                    f"  {stage:<9} p50={_fmt_ms(summary['p50_ms'])} "
+                    f"p95={_fmt_ms(summary['p95_ms'])} p99={_fmt_ms(summary['p99_ms'])}"
+                )
+        if self.errors:
+            lines.append("Errors: " + ", ".join(f"{k}={v}" for k, v in sorted(self.errors.items())))
+        return "\n".join(lines)
+
+
+def _fmt_ms(value: float | None) -> str:
+    return "-" if value is None else f"{value:.2f}ms"
+
+
+class LoadGenerator:
+    """Drives a route_request-compatible coroutine at a target request rate."""
+
+    def __init__(
+        self,
+        route: Callable[..., Any],
+        rate: float,
+        prompt_factory: Callable[[int], str] | None = None,
+        max_in_flight: int = 1000,
+        **route_kwargs,
+    ):
+        """
+        Args:
+            route: Usually ``ModelOrchestrator.route_request``.
+            rate: Target requests per second.
+            prompt_factory: Prompt for the i-th request (a fixed prompt by default).
+            max_in_flight: Safety cap on outstanding requests; arrivals beyond it
+                are counted as ``ClientBackpressure`` errors instead of being sent.
+            **route_kwargs: Passed to every ``route`` call (e.g. model_id).
+        """
+        if rate <= 0:
+            raise ValueError(f"Rate must be positive, got {rate}")
+        self.route = route
+        self.rate = rate
+        self.prompt_factory = prompt_factory or (lambda _i: DEFAULT_PROMPT)
+        self.max_in_flight = max_in_flight
+        self.route_kwargs = route_kwargs
+
+    async def run(self, duration_s: float | None = None, requests: int | None = None) -> LoadReport:
+        """Issue requests for ``duration_s`` seconds or until ``requests`` were sent."""
+        if requests is not None and duration_s is None:
+            total = requests
+        elif duration_s is not None and requests is None:
+            total = int(duration_s * self.rate)
+        else:
+            raise ValueError("Exactly one of duration_s or requests is required")
+
+        report = LoadReport(target_rps=self.rate, duration_s=0.0)
+        metrics = PerformanceMetrics(max_samples=None)
+        in_flight: set[asyncio.Task] = set()
+        start = time.perf_counter()
+
+        async def one(i: int) -> None:
+            sent = time.perf_counter()
+            try:
+                response = await self.route(self.prompt_factory(i), **self.route_kwargs)
+            except Exception as e:
+                name = type(e).__name__
+                report.errors[name] = report.errors.get(name, 0) + 1
+                return
+            if getattr(response, "error", None):
+                report.errors["ResponseError"] = report.errors.get("ResponseError", 0) + 1
+                return
+            report.succeeded += 1
+            report.latencies_ms.append((time.perf_counter() - sent) * 1000)
+
+        with performance_metrics_scope(metrics):
+            for i in range(total):
+                delay = start + i / self.rate - time.perf_counter()
+                if delay > 0:
+                    await asyncio.sleep(delay)
+                report.requests += 1
+                if len(in_flight) >= self.max_in_flight:
+                    report.errors["ClientBackpressure"] = (
+                        report.errors.get("ClientBackpressure", 0) + 1
+                    )
+                    continue
+                task = asyncio.create_task(one(i))
+                in_flight.add(task)
+                task.add_done_callback(in_flight.discard)
+
+        if in_flight:
+            await asyncio.gather(*in_flight)
+        report.duration_s = time.perf_counter() - start
+
+        for stage in STAGES:
+            summary = metrics.get_summary(f"route_request.{stage}")
+            if summary:
+                report.stages[stage] = summary
+        return report
+
+
+def build_mock_orchestrator(base_url: str):
+    """
+    A ModelOrchestrator whose provider traffic all goes to a mock provider at ``base_url``.
+
+    Task analysis uses local heuristics only, so no request leaves the machine.
+
+    Returns:
+        Tuple of (orchestrator, model_id of an OpenAI model to route to).
+    """
+    from lattice_lock.config import get_config
+    from lattice_lock.orchestrator.analysis import TaskAnalyzer
+    from lattice_lock.orchestrator.core import ModelOrchestrator
+    from lattice_lock.orchestrator.providers import OpenAIAPIClient
+    from lattice_lock.orchestrator.types import ModelProvider
+
+    orchestrator = ModelOrchestrator()
+    orchestrator.analyzer = TaskAnalyzer()
+    # Every provider (including fallbacks) is served by the mock, so nothing leaves the machine
+    client = OpenAIAPIClient(get_config(), api_key="mock", base_url=base_url)
+    for provider in ModelProvider:
+        orchestrator.client_pool.register_client(provider.value, client)
+    model = next(
+        m for m in orchestrator.registry.get_all_models() if m.provider == ModelProvider.OPENAI
+    )
+    return orchestrator, model.api_name
+
+
+async def run_mock_load(
+    rate: float,
+    duration_s: float | None = None,
+    requests: int | None = None,
+    provider_config: MockProviderConfig | None = None,
+    **route_kwargs,
+) -> LoadReport:
+    """Start a mock provider, drive route_request against it and return the report."""
+    async with MockProviderServer(provider_config) as server:
+        orchestrator, model_id = build_mock_orchestrator(server.base_url)
+        route_kwargs.setdefault("model_id", model_id)
+        try:
+            generator = LoadGenerator(orchestrator.route_request, rate, **route_kwargs)
+            return await generator.run(duration_s=duration_s, requests=requests)
+        finally:
+            await orchestrator.client_pool.close_all()
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description="Load-test route_request against a mock provider")
+    parser.add_argument("--rate", type=float, default=50.0, help="Target requests per second")
+    parser.add_argument("--duration", type=float, default=10.0, help="Seconds to run")
+    parser.add_argument("--latency-ms", type=float, default=50.0, help="Median provider latency")
+    parser.add_argument(
+        "--latency-distribution", choices=LATENCY_DISTRIBUTIONS, default="lognormal"
+    )
+    parser.add_argument("--error-rate", type=float, default=0.0, help="Fraction of HTTP 500s")
+    parser.add_argument("--rate-limit-rate", type=float, default=0.0, help="Fraction of HTTP 429s")
+    parser.add_argument("--seed", type=int, default=None)
+    parser.add_argument("--json", action="store_true", help="Print the report as JSON")
+    args = parser.parse_args(argv)
+
+    provider_config = MockProviderConfig(
+        latency_ms=args.latency_ms,
+        latency_distribution=args.latency_distribution,
+        error_rate=args.error_rate,
+        rate_limit_rate=args.rate_limit_rate,
+        seed=args.seed,
+    )
+    report = asyncio.run(
+        run_mock_load(args.rate, duration_s=args.duration, provider_config=provider_config)
+    )
+    print(json.dumps(report.to_dict(), indent=2) if args.json else report.format())
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,215 @@
+"""
+Local OpenAI-compatible mock provider for offline load tests.
+
+The server answers ``/v1/chat/completions`` and ``/v1/models`` like the OpenAI
+API, with a configurable latency distribution, error rate, rate limiting (HTTP
+429) and streaming (server-sent events). It runs in-process on an ephemeral
+port, so benchmarks and CI never touch the network.
+"""
+
+import asyncio
+import json
+import logging
+import random
+import time
+import uuid
+from collections.abc import AsyncIterator
+from dataclasses import dataclass, field
+from typing import Any
+
+import uvicorn
+from fastapi import FastAPI, Request
+from fastapi.responses import JSONResponse, StreamingResponse
+
+logger = logging.getLogger(__name__)
+
+LATENCY_DISTRIBUTIONS = ("constant", "uniform", "lognormal")
+
+
+@dataclass
+class MockProviderConfig:
+    """Behaviour of the mock provider."""
+
+    latency_ms: float = 50.0  # median service time
+    latency_distribution: str = "lognormal"  # constant | uniform | lognormal
+    latency_spread: float = 0.5  # lognormal sigma, or +/- fraction for uniform
+    error_rate: float = 0.0  # fraction of requests answered with HTTP 500
+    rate_limit_rate: float = 0.0  # fraction of requests answered with HTTP 429
+    completion_tokens: int = 32
+    stream_chunk_ms: float = 5.0  # delay between streamed chunks
+    seed: int | None = None
+
+    def __post_init__(self):
+        if self.latency_distribution not in LATENCY_DISTRIBUTIONS:
+            raise ValueError(
+                f"Unknown latency distribution '{self.latency_distribution}'. "
+                f"Use one of: {', '.join(LATENCY_DISTRIBUTIONS)}"
+            )
+
+
+@dataclass
+class MockProviderStats:
+    """Requests served by the mock provider."""
+
+    requests: int = 0
+    errors: int = 0
+    rate_limited: int = 0
+    streamed: int = 0
+    service_ms: list[float] = field(default_factory=list)
+
+
+def create_mock_app(
+    config: MockProviderConfig | None = None, stats: MockProviderStats | None = None
+) -> FastAPI:
+    """Create the FastAPI app of a mock OpenAI-compatible provider."""
+    config = config or MockProviderConfig()
+    stats = stats if stats is not None else MockProviderStats()
+    rng = random.Random(config.seed)
+    app = FastAPI(title="Lattice Lock mock provider", docs_url=None, redoc_url=None)
+    app.state.config = config
+    app.state.stats = stats
+
+    def sample_latency() -> float:
+        if config.latency_distribution == "constant":
+            return config.latency_ms
+        if config.latency_distribution == "uniform":
+            spread = config.latency_ms * config.latency_spread
+            return max(0.0, rng.uniform(config.latency_ms - spread, config.latency_ms + spread))
+        return config.latency_ms * rng.lognormvariate(0.0, config.latency_spread)
+
+    @app.get("/v1/models")
+    async def list_models() -> dict[str, Any]:
+        return {"object": "list", "data": [{"id": "mock-model", "object": "model"}]}
+
+    @app.post("/v1/chat/completions")
+    async def chat_completions(request: Request):
+        start = time.perf_counter()
+        body = await request.json()
+        stats.requests += 1
+        model = body.get("model", "mock-model")
+
+        roll = rng.random()
+        if roll < config.rate_limit_rate:
+            stats.rate_limited += 1
+            return JSONResponse(
+                {"error": {"message": "Rate limit exceeded", "type": "rate_limit_error"}},
+                status_code=429,
+                headers={"Retry-After": "1"},
+            )
+        if roll < config.rate_limit_rate + config.error_rate:
+            stats.errors += 1
+            return JSONResponse(
+                {"error": {"message": "Mock provider error", "type": "server_error"}},
+                status_code=500,
+            )
+
+        await asyncio.sleep(sample_latency() / 1000)
+        prompt_tokens = sum(len(str(m.get("content", ""))) for m in body.get("messages", [])) // 4
+        content = " ".join(["token"] * config.completion_tokens)
+
+        if body.get("stream"):
+            stats.streamed += 1
+            return StreamingResponse(
+                _stream_chunks(model, config, content), media_type="text/event-stream"
+            )
+
+        stats.service_ms.append((time.perf_counter() - start) * 1000)
+        return {
+            "id": f"chatcmpl-{uuid.uuid4().hex[:12]}",
+            "object": "chat.completion",
+            "created": int(time.time()),
+            "model": model,
+            "choices": [
+                {
+                    "index": 0,
+                    "message": {"role": "assistant", "content": content},
+                    "finish_reason": "stop",
+                }
+            ],
+            "usage": {
+                "prompt_tokens": prompt_tokens,
+                "completion_tokens": config.completion_tokens,
+                "total_tokens": prompt_tokens + config.completion_tokens,
+            },
+        }
+
+    return app
+
+
+async def _stream_chunks(
+    model: str, config: MockProviderConfig, content: str
+) -> AsyncIterator[str]:
+    chunk_id = f"chatcmpl-{uuid.uuid4().hex[:12]}"
+    for i, word in enumerate(content.split(" ")):
+        delta = {"content": word if i == 0 else f" {word}"}
+        chunk = {
+            "id": chunk_id,
+            "object": "chat.completion.chunk",
+            "model": model,
+            "choices": [{"index": 0, "delta": delta, "finish_reason": None}],
+        }
+        yield f"data: {json.dumps(chunk)}\n\n"
+        await asyncio.sleep(config.stream_chunk_ms / 1000)
+    final = {
+        "id": chunk_id,
+        "object": "chat.completion.chunk",
+        "model": model,
+        "choices": [{"index": 0, "delta": {}, "finish_reason": "stop"}],
+    }
+    yield f"data: {json.dumps(final)}\n\n"
+    yield "data: [DONE]\n\n"
+
+
+class MockProviderServer:
+    """
+    Runs the mock provider on localhost in the current event loop.
+
+    Example:
+        async with MockProviderServer(MockProviderConfig(latency_ms=20)) as server:
+            client = OpenAIAPIClient(config, api_key="mock", base_url=server.base_url)
+    """
+
+    def __init__(
+        self, config: MockProviderConfig | None = None, host: str = "127.0.0.1", port: int = 0
+    ):
+        self.config = config or MockProviderConfig()
+        self.stats = MockProviderStats()
+        self.host = host
+        self.port = port
+        self._server: uvicorn.Server | None = None
+        self._task: asyncio.Task | None = None
+
+    @property
+    def base_url(self) -> str:
+        return f"http://{self.host}:{self.port}/v1"
+
+    async def start(self) -> None:
+        app = create_mock_app(self.config, self.stats)
+        uv_config = uvicorn.Config(
+            app, host=self.host, port=self.port, log_level="warning", lifespan="off"
+        )
+        self._server = uvicorn.Server(uv_config)
+        self._task = asyncio.create_task(self._server.serve())
+        while not self._server.started:
+            if self._task.done():
+                # Startup failed (e.g. port in use): surface the error
+                self._task.result()
+                raise RuntimeError("Mock provider server stopped during startup")
+            await asyncio.sleep(0.01)
+        if self.port == 0:
+            self.port = self._server.servers[0].sockets[0].getsockname()[1]
+        logger.info(f"Mock provider listening on {self.base_url}")
+
+    async def stop(self) -> None:
+        if self._server:
+            self._server.should_exit = True
+        if self._task:
+            await self._task
+        self._server = self._task = None
+
+    async def __aenter__(self) -> "MockProviderServer":
+        await self.start()
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        await self.stop()
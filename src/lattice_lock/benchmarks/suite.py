@@ -0,0 +1,653 @@
+"""
+Benchmark suite for Lattice Lock hot paths.
+
+Benchmarks are registered in groups (analyzer, scorer, sheriff, compiler,
+config, checkpoint, logging, auth) and run on synthetic inputs from
+:mod:`lattice_lock.benchmarks.generators`. Results can be saved as a baseline
+and later runs compared against it; a benchmark whose median time grew by more
+than the configured percentage counts as a regression.
+"""
+
+import copy
+import json
+import logging
+import platform
+import queue
+import statistics
+import tempfile
+import time
+from collections.abc import Callable
+from dataclasses import asdict, dataclass, field
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any
+
+from . import generators
+
+# Input size multipliers for the synthetic generators
+SCALES = {"small": 1, "medium": 4, "large": 16}
+# Timed rounds per benchmark unless configured otherwise
+DEFAULT_ROUNDS = 5
+# Untimed rounds run first to warm caches and lazy imports
+DEFAULT_WARMUP = 1
+# Allowed growth of a benchmark's median over the baseline before it fails
+DEFAULT_THRESHOLD_PCT = 20.0
+# Where `lattice bench` keeps its baseline, relative to the project directory
+DEFAULT_BASELINE_PATH = ".lattice-lock/benchmarks/baseline.json"
+BASELINE_FORMAT_VERSION = 1
+
+
+@dataclass
+class BenchContext:
+    """What a benchmark's setup gets to build its inputs."""
+
+    scale: int
+    rounds: int
+    workdir: Path
+    # Called after the benchmark's last round, e.g. to stop background threads
+    cleanups: list[Callable[[], None]] = field(default_factory=list)
+
+
+@dataclass
+class BenchmarkCase:
+    """A registered benchmark; ``setup`` returns the callable that is timed."""
+
+    name: str
+    group: str
+    description: str
+    setup: Callable[[BenchContext], Callable[[], Any]]
+
+
+@dataclass
+class BenchmarkResult:
+    """Timing of one benchmark."""
+
+    name: str
+    group: str
+    rounds: int
+    median_ms: float
+    mean_ms: float
+    min_ms: float
+    max_ms: float
+    stdev_ms: float
+
+    def to_dict(self) -> dict[str, Any]:
+        return asdict(self)
+
+
+@dataclass
+class Comparison:
+    """A benchmark result compared with its baseline."""
+
+    name: str
+    baseline_ms: float | None
+    current_ms: float
+    threshold_pct: float
+    change_pct: float | None = None
+    regressed: bool = False
+
+    def to_dict(self) -> dict[str, Any]:
+        return asdict(self)
+
+
+@dataclass
+class BenchmarkRun:
+    """Results of a suite run and their comparison with a baseline."""
+
+    scale: str
+    results: list[BenchmarkResult] = field(default_factory=list)
+    comparisons: list[Comparison] = field(default_factory=list)
+
+    @property
+    def regressions(self) -> list[Comparison]:
+        return [c for c in self.comparisons if c.regressed]
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "scale": self.scale,
+            "results": [r.to_dict() for r in self.results],
+            "comparisons": [c.to_dict() for c in self.comparisons],
+            "regressions": [c.name for c in self.regressions],
+        }
+
+
+BENCHMARKS: dict[str, BenchmarkCase] = {}
+
+
+def benchmark(group: str, name: str, description: str):
+    """Register a benchmark setup function as ``<group>.<name>``."""
+
+    def decorator(setup: Callable[[BenchContext], Callable[[], Any]]):
+        full_name = f"{group}.{name}"
+        BENCHMARKS[full_name] = BenchmarkCase(full_name, group, description, setup)
+        return setup
+
+    return decorator
+
+
+def list_groups() -> list[str]:
+    return sorted({case.group for case in BENCHMARKS.values()})
+
+
+def select_benchmarks(selectors: list[str] | None = None) -> list[BenchmarkCase]:
+    """
+    Benchmarks matching ``selectors`` (group names or full benchmark names).
+
+    Raises:
+        ValueError: If a selector matches nothing.
+    """
+    if not selectors:
+        return list(BENCHMARKS.values())
+    selected: dict[str, BenchmarkCase] = {}
+    for selector in selectors:
+        matches = [c for c in BENCHMARKS.values() if selector in (c.group, c.name)]
+        if not matches:
+            raise ValueError(
+                f"Unknown benchmark or group '{selector}'. Groups: {', '.join(list_groups())}"
+            )
+        selected.update((c.name, c) for c in matches)
+    return list(selected.values())
+
+
+def run_benchmark(
+    case: BenchmarkCase,
+    scale: int = 1,
+    rounds: int = DEFAULT_ROUNDS,
+    warmup: int = DEFAULT_WARMUP,
+    workdir: Path | None = None,
+) -> BenchmarkResult:
+    """Time ``rounds`` calls of one benchmark after ``warmup`` untimed calls."""
+    if rounds < 1:
+        raise ValueError(f"Rounds must be at least 1, got {rounds}")
+    with tempfile.TemporaryDirectory(prefix="lattice-bench-") as tmp:
+        context = BenchContext(scale=scale, rounds=rounds + warmup, workdir=Path(workdir or tmp))
+        try:
+            fn = case.setup(context)
+            for _ in range(warmup):
+                fn()
+            timings = []
+            for _ in range(rounds):
+                start = time.perf_counter()
+                fn()
+                timings.append((time.perf_counter() - start) * 1000)
+        finally:
+            for cleanup in reversed(context.cleanups):
+                cleanup()
+    return BenchmarkResult(
+        name=case.name,
+        group=case.group,
+        rounds=rounds,
+        median_ms=statistics.median(timings),
+        mean_ms=statistics.fmean(timings),
+        min_ms=min(timings),
+        max_ms=max(timings),
+        stdev_ms=statistics.stdev(timings) if len(timings) > 1 else 0.0,
+    )
+
+
+def run_suite(
+    selectors: list[str] | None = None,
+    scale: str = "small",
+    rounds: int = DEFAULT_ROUNDS,
+    warmup: int = DEFAULT_WARMUP,
+    on_result: Callable[[BenchmarkResult], None] | None = None,
+) -> BenchmarkRun:
+    """Run the selected benchmarks at the given input scale."""
+    if scale not in SCALES:
+        raise ValueError(f"Unknown scale '{scale}'. Use one of: {', '.join(SCALES)}")
+    run = BenchmarkRun(scale=scale)
+    for case in select_benchmarks(selectors):
+        result = run_benchmark(case, scale=SCALES[scale], rounds=rounds, warmup=warmup)
+        run.results.append(result)
+        if on_result:
+            on_result(result)
+    return run
+
+
+def load_baseline(path: str | Path) -> dict[str, Any] | None:
+    """Load a baseline file, or None if it does not exist."""
+    path = Path(path)
+    if not path.exists():
+        return None
+    with open(path) as f:
+        return json.load(f)
+
+
+def save_baseline(path: str | Path, run: BenchmarkRun, previous: dict[str, Any] | None = None):
+    """
+    Write the run's results as the new baseline.
+
+    Results for benchmarks that were not part of this run, and any per-benchmark
+    thresholds, are carried over from ``previous``.
+    """
+    path = Path(path)
+    baseline = copy.deepcopy(previous) if previous and previous.get("scale") == run.scale else {}
+    baseline.update(
+        {
+            "version": BASELINE_FORMAT_VERSION,
+            "scale": run.scale,
+            "created_at": datetime.now(timezone.utc).isoformat(),
+            "python": platform.python_version(),
+            "machine": platform.machine(),
+        }
+    )
+    baseline.setdefault("threshold_pct", DEFAULT_THRESHOLD_PCT)
+    baseline.setdefault("thresholds", {})
+    baseline.setdefault("results", {}).update({r.name: r.to_dict() for r in run.results})
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with open(path, "w") as f:
+        json.dump(baseline, f, indent=2, sort_keys=True)
+    return baseline
+
+
+def compare_to_baseline(
+    run: BenchmarkRun, baseline: dict[str, Any], threshold_pct: float | None = None
+) -> list[Comparison]:
+    """
+    Compare the run's medians with the baseline and record the comparisons on ``run``.
+
+    A per-benchmark entry in the baseline's ``thresholds`` wins over
+    ``threshold_pct``, which wins over the baseline's own ``threshold_pct``.
+
+    Raises:
+        ValueError: If the baseline was recorded at a different scale.
+    """
+    if baseline.get("scale") != run.scale:
+        raise ValueError(
+            f"Baseline was recorded at scale '{baseline.get('scale')}', "
+            f"this run used '{run.scale}'"
+        )
+    default = (
+        threshold_pct
+        if threshold_pct is not None
+        else baseline.get("threshold_pct", DEFAULT_THRESHOLD_PCT)
+    )
+    overrides = baseline.get("thresholds", {})
+    recorded = baseline.get("results", {})
+
+    run.comparisons = []
+    for result in run.results:
+        threshold = overrides.get(result.name, default)
+        previous = recorded.get(result.name)
+        comparison = Comparison(
+            name=result.name,
+            baseline_ms=previous["median_ms"] if previous else None,
+            current_ms=result.median_ms,
+            threshold_pct=threshold,
+        )
+        if comparison.baseline_ms:
+            comparison.change_pct = (result.median_ms / comparison.baseline_ms - 1) * 100
+            comparison.regressed = comparison.change_pct > threshold
+        run.comparisons.append(comparison)
+    return run.comparisons
+
+
+# ---------------------------------------------------------------------------
+# Benchmarks
+# ---------------------------------------------------------------------------
+
+
+@benchmark("analyzer", "analyze_uncached", "TaskAnalyzer heuristics over 200 prompts")
+def _analyzer_uncached(ctx: BenchContext):
+    from lattice_lock.orchestrator.analysis import TaskAnalyzer
+
+    analyzer = TaskAnalyzer()
+    prompts = generators.generate_prompts(200 * ctx.scale, padding=5)
+    # Bypass the LRU so every round does the classification work
+    return lambda: [analyzer._analyze_uncached(p) for p in prompts]
+
+
+@benchmark("analyzer", "analyze_cached", "TaskAnalyzer.analyze_full on a warm cache")
+def _analyzer_cached(ctx: BenchContext):
+    from lattice_lock.orchestrator.analysis import TaskAnalyzer
+
+    analyzer = TaskAnalyzer()
+    prompts = generators.generate_prompts(200 * ctx.scale, padding=5)
+    for prompt in prompts:
+        analyzer.analyze_full(prompt)
+    return lambda: [analyzer.analyze_full(p) for p in prompts]
+
+
+@benchmark("scorer", "score_all_models", "ModelScorer.score for every model and 50 tasks")
+def _scorer(ctx: BenchContext):
+    from lattice_lock.orchestrator.analysis import TaskAnalyzer
+    from lattice_lock.orchestrator.registry import ModelRegistry
+    from lattice_lock.orchestrator.scoring import ModelScorer
+
+    scorer = ModelScorer()
+    models = ModelRegistry().get_all_models()
+    analyzer = TaskAnalyzer()
+    requirements = [analyzer.analyze(p) for p in generators.generate_prompts(50 * ctx.scale)]
+    return lambda: [scorer.score(m, r) for r in requirements for m in models]
+
+
+@benchmark("scorer", "score_with_analysis", "ModelScorer.score_with_analysis for every model")
+def _scorer_analysis(ctx: BenchContext):
+    from lattice_lock.orchestrator.analysis import TaskAnalyzer
+    from lattice_lock.orchestrator.registry import ModelRegistry
+    from lattice_lock.orchestrator.scoring import ModelScorer
+
+    scorer = ModelScorer()
+    models = ModelRegistry().get_all_models()
+    analyzer = TaskAnalyzer()
+    analyses = [analyzer.analyze_full(p) for p in generators.generate_prompts(50 * ctx.scale)]
+    return lambda: [scorer.score_with_analysis(m, a) for a in analyses for m in models]
+
+
+@benchmark("sheriff", "visit_module", "Parse and visit a 500-function module")
+def _sheriff_visit(ctx: BenchContext):
+    import ast
+
+    from lattice_lock.sheriff.ast_visitor import SheriffVisitor
+    from lattice_lock.sheriff.config import SheriffConfig
+
+    config = SheriffConfig(forbidden_imports=["os"])
+    source = generators.generate_python_source(500 * ctx.scale)
+
+    def run():
+        visitor = SheriffVisitor("bench.py", config, source)
+        visitor.visit(ast.parse(source))
+        return visitor.get_violations()
+
+    return run
+
+
+@benchmark("sheriff", "validate_repository", "Sheriff over a synthetic 100-module repository")
+def _sheriff_repository(ctx: BenchContext):
+    from lattice_lock.sheriff.config import SheriffConfig
+    from lattice_lock.sheriff.sheriff import validate_path_with_audit
+
+    root = generators.generate_repository(ctx.workdir / "repo", files=100 * ctx.scale)
+    config = SheriffConfig(forbidden_imports=["os"])
+    return lambda: validate_path_with_audit(root, config)
+
+
+@benchmark("compiler", "compile_lattice", "compile_lattice for a 20-entity schema")
+def _compile_lattice(ctx: BenchContext):
+    import yaml
+
+    from lattice_lock.compile import compile_lattice
+
+    schema_path = ctx.workdir / "lattice.yaml"
+    schema_path.write_text(yaml.safe_dump(generators.generate_lattice_schema(20 * ctx.scale)))
+    output_dir = ctx.workdir / "generated"
+
+    def run():
+        result = compile_lattice(schema_path, output_dir, generate_sqlmodel=True)
+        if not result.success:
+            raise RuntimeError(f"Benchmark schema failed to compile: {result.errors}")
+        return result
+
+    return run
+
+
+@benchmark("config", "deep_merge", "InheritanceResolver.deep_merge of a 500-agent config")
+def _deep_merge(ctx: BenchContext):
+    from lattice_lock.config.inheritance import InheritanceResolver
+
+    resolver = InheritanceResolver()
+    base = generators.generate_config(500 * ctx.scale)
+    override = generators.generate_config_override(base)
+    return lambda: resolver.deep_merge(base, override)
+
+
+@benchmark("config", "normalize", "JSONNormalizer.normalize of a 500-agent config")
+def _normalize(ctx: BenchContext):
+    from lattice_lock.config.normalizer import JSONNormalizer
+
+    normalizer = JSONNormalizer()
+    config = generators.generate_config(500 * ctx.scale)
+    # normalize() rewrites agents in place, so every round gets its own copy
+    copies = iter([copy.deepcopy(config) for _ in range(ctx.rounds)])
+    return lambda: normalizer.normalize(next(copies))
+
+
+@benchmark("checkpoint", "save_load", "CheckpointStorage save and load of a 2000-file state")
+def _checkpoint(ctx: BenchContext):
+    from lattice_lock.rollback.storage import CheckpointStorage
+
+    storage = CheckpointStorage(str(ctx.workdir / "checkpoints"))
+    state = generators.generate_rollback_state(2000 * ctx.scale)
+
+    def run():
+        return storage.load_state(storage.save_state(state))
+
+    return run
+
+
+def _bench_logger(ctx: BenchContext, name: str, use_queue: bool) -> logging.Logger:
+    """A private logger wired like setup_logging's JSON file logging."""
+    from logging.handlers import QueueListener
+
+    from lattice_lock.logging_config import (
+        JSONFormatter,
+        LogQueueHandler,
+        SensitiveDataFilter,
+        TraceIdFilter,
+    )
+
+    handler = logging.FileHandler(ctx.workdir / f"{name}.log")
+    handler.setFormatter(JSONFormatter())
+    handler.addFilter(SensitiveDataFilter())
+    logger = logging.getLogger(f"lattice_lock.benchmarks.{name}")
+    logger.propagate = False
+    logger.setLevel(logging.INFO)
+    logger.handlers.clear()
+    ctx.cleanups.append(handler.close)
+    ctx.cleanups.append(logger.handlers.clear)
+
+    if use_queue:
+        queue_handler = LogQueueHandler(queue.Queue(maxsize=100_000))
+        queue_handler.addFilter(TraceIdFilter())
+        listener = QueueListener(queue_handler.queue, handler, respect_handler_level=True)
+        listener.start()
+        ctx.cleanups.append(listener.stop)
+        logger.addHandler(queue_handler)
+    else:
+        handler.addFilter(TraceIdFilter())
+        logger.addHandler(handler)
+    return logger
+
+
+def _log_burst(logger: logging.Logger, count: int) -> Callable[[], None]:
+    def run():
+        for i in range(count):
+            logger.info(
+                "Selected model %s for task %d with auth: %s",
+                "gpt-4o",
+                i,
+                "ok",
+                extra={"provider": "openai"},
+            )
+
+    return run
+
+
+@benchmark("logging", "sync_json", "1000 INFO records formatted as JSON on the calling thread")
+def _logging_sync(ctx: BenchContext):
+    return _log_burst(_bench_logger(ctx, "sync_json", use_queue=False), 1000 * ctx.scale)
+
+
+@benchmark("logging", "queued_json", "Caller-side cost of 1000 INFO records through the log queue")
+def _logging_queued(ctx: BenchContext):
+    return _log_burst(_bench_logger(ctx, "queued_json", use_queue=True), 1000 * ctx.scale)
+
+
+@benchmark("logging", "redact", "SensitiveDataFilter over 1000 messages, a third with secrets")
+def _logging_redact(ctx: BenchContext):
+    from lattice_lock.logging_config import SensitiveDataFilter
+
+    redaction = SensitiveDataFilter()
+    messages = [
+        "Analyzed task: CODE_GENERATION, Priority: balanced",
+        "Selected model: gpt-4o (openai)",
+        "Retrying with api_key=sk-abc123 and Authorization: Bearer xyz",
+    ] * (333 * ctx.scale)
+    return lambda: [redaction._redact_message(m) for m in messages]
+
+
+def _issue_bench_api_keys(ctx: BenchContext, count: int) -> list[str]:
+    """Register ``count`` API keys sharing one low-cost hash; returns the keys."""
+    import bcrypt
+
+    from lattice_lock.admin.auth.api_keys import clear_api_keys
+    from lattice_lock.admin.auth.config import get_config
+    from lattice_lock.admin.auth.models import APIKeyInfo, Role
+    from lattice_lock.admin.auth.storage import MemoryAuthStorage
+
+    # Hashing 10k keys at production cost would dominate the setup; the
+    # verification path is the same for any bcrypt cost
+    secret = "bench-secret"
+    prefix = get_config().api_key_prefix
+    keys = []
+    key_hashes = {}
+    for i in range(count):
+        key_id = f"{i:016x}"
+        api_key = f"{prefix}{key_id}_{secret}"
+        if i < ctx.rounds * 20:
+            key_hashes[key_id] = bcrypt.hashpw(api_key.encode(), bcrypt.gensalt(rounds=4)).decode()
+        MemoryAuthStorage.save_api_key(
+            key_hashes.get(key_id, "unused"),
+            f"user{i}",
+            Role.VIEWER,
+            key_id,
+            APIKeyInfo(key_id=key_id, created_at=datetime.now(timezone.utc)),
+        )
+        keys.append(api_key)
+    ctx.cleanups.append(clear_api_keys)
+    return keys
+
+
+@benchmark("auth", "verify_api_key", "20 uncached API key verifications among 10k issued keys")
+def _verify_api_key(ctx: BenchContext):
+    from lattice_lock.admin.auth.api_keys import verify_api_key
+
+    keys = iter(_issue_bench_api_keys(ctx, 10_000 * ctx.scale)[: ctx.rounds * 20])
+
+    def run():
+        for _ in range(20):
+            verify_api_key(next(keys))
+
+    return run
+
+
+@benchmark("auth", "verify_api_key_cached", "1000 cached API key verifications")
+def _verify_api_key_cached(ctx: BenchContext):
+    from lattice_lock.admin.auth.api_keys import verify_api_key
+
+    keys = _issue_bench_api_keys(ctx, 10_000 * ctx.scale)[:10]
+    for api_key in keys:
+        verify_api_key(api_key)
+
+    def run():
+        for i in range(1000):
+            verify_api_key(keys[i % len(keys)])
+
+    return run
+
+
+def _auth_bench_app(ctx: BenchContext):
+    """The auth routes plus a trivial endpoint, and a user to log in as."""
+    import bcrypt
+    from fastapi import FastAPI
+
+    from lattice_lock.admin.auth.models import User
+    from lattice_lock.admin.auth.storage import MemoryAuthStorage
+    from lattice_lock.admin.auth.users import delete_user
+    from lattice_lock.admin.auth_routes import router
+
+    # Cost 10 (~60 ms per check) keeps a round short while still dwarfing
+    # the request handling around it
+    form = {"username": "bench-user", "password": "bench-password"}
+    hashed = bcrypt.hashpw(form["password"].encode(), bcrypt.gensalt(rounds=10)).decode()
+    MemoryAuthStorage.save_user(User(username=form["username"], hashed_password=hashed))
+    ctx.cleanups.append(lambda: delete_user(form["username"]))
+
+    app = FastAPI()
+    app.include_router(router, prefix="/api/v1")
+
+    @app.get("/ping")
+    async def ping():
+        return {"status": "ok"}
+
+    return app, form
+
+
+def _auth_bench_client(app):
+    import httpx
+
+    return httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url="http://bench")
+
+
+async def _login_burst(client, form: dict[str, str], count: int) -> None:
+    import asyncio
+
+    responses = await asyncio.gather(
+        *(client.post("/api/v1/auth/token", data=form) for _ in range(count))
+    )
+    failed = [r.status_code for r in responses if r.status_code != 200]
+    if failed:
+        raise RuntimeError(f"Logins failed with status {failed}")
+
+
+async def _ping(client, count: int) -> None:
+    for _ in range(count):
+        (await client.get("/ping")).raise_for_status()
+
+
+@benchmark("auth", "login_burst", "16 concurrent password logins through the auth routes")
+def _auth_login_burst(ctx: BenchContext):
+    import asyncio
+
+    app, form = _auth_bench_app(ctx)
+
+    async def run():
+        async with _auth_bench_client(app) as client:
+            await _login_burst(client, form, 16)
+
+    return lambda: asyncio.run(run())
+
+
+def _ping_on_loop(ctx: BenchContext, logins_in_flight: int) -> Callable[[], None]:
+    """Time 50 requests to another endpoint while logins run on the same event loop."""
+    import asyncio
+    import threading
+
+    app, form = _auth_bench_app(ctx)
+    client = _auth_bench_client(app)
+    loop = asyncio.new_event_loop()
+    thread = threading.Thread(target=loop.run_forever, name="bench-auth-loop", daemon=True)
+    thread.start()
+    stopping = threading.Event()
+
+    async def keep_logging_in():
+        while not stopping.is_set():
+            await _login_burst(client, form, logins_in_flight)
+
+    logins = asyncio.run_coroutine_threadsafe(keep_logging_in(), loop) if logins_in_flight else None
+
+    def stop():
+        stopping.set()
+        if logins is not None:
+            logins.result()
+        asyncio.run_coroutine_threadsafe(client.aclose(), loop).result()
+        loop.call_soon_threadsafe(loop.stop)
+        thread.join()
+        loop.close()
+
+    ctx.cleanups.append(stop)
+    return lambda: asyncio.run_coroutine_threadsafe(_ping(client, 50), loop).result()
+
+
+@benchmark("auth", "requests_idle", "50 sequential requests to another endpoint, no logins")
+def _auth_requests_idle(ctx: BenchContext):
+    return _ping_on_loop(ctx, logins_in_flight=0)
+
+
+@benchmark(
+    "auth",
+    "requests_during_login_burst",
+    "50 sequential requests to another endpoint while 8 logins are in flight",
+)
+def _auth_requests_during_login_burst(ctx: BenchContext):
+    return _ping_on_loop(ctx, logins_in_flight=8)
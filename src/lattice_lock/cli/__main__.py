@@ -1,7 +1,9 @@
 """
 Lattice Lock CLI - Command-line interface for the Lattice Lock Framework.
 
-This module provides the main entry point for the CLI.
+This module provides the main entry point for the CLI. Subcommands are
+registered lazily by import path so that only the invoked command's
+dependencies are imported.
 """
 
 import logging
@@ -9,24 +11,7 @@ import logging
 import click
 
 from lattice_lock import __version__
-
-# Import existing commands
-from lattice_lock.cli.commands.ask import ask_command
-from lattice_lock.cli.commands.chain import chain_group
-from lattice_lock.cli.commands.compile import compile_command
-from lattice_lock.cli.commands.doctor import doctor_command
-from lattice_lock.cli.commands.feedback import feedback
-from lattice_lock.cli.commands.gauntlet import gauntlet_command
-from lattice_lock.cli.commands.handoff import handoff_group
-from lattice_lock.cli.commands.init import init_command
-from lattice_lock.cli.commands.mcp import mcp_command
-from lattice_lock.cli.commands.sheriff import sheriff_command
-from lattice_lock.cli.commands.validate import validate_command
-from lattice_lock.cli.groups.admin import admin_group
-
-# Import command groups
-from lattice_lock.cli.groups.orchestrator import orchestrator_group
-from lattice_lock.cli.utils.console import get_console
+from lattice_lock.cli.lazy_group import LazyCommand, LazyGroup
 from lattice_lock.logging_config import get_logger, set_trace_id, setup_logging
 
 # Initialize centralized logging with simple format for CLI
@@ -34,7 +19,70 @@ setup_logging(level=logging.INFO, simple_format=True)
 logger = get_logger("cli")
 
 
-@click.group()
+# Subcommand name -> (import path, short help shown by ``lattice --help``)
+LAZY_SUBCOMMANDS: dict[str, LazyCommand] = {
+    # Core commands
+    "init": LazyCommand(
+        "lattice_lock.cli.commands.init:init_command", "Initialize a new Lattice Lock project."
+    ),
+    "ask": LazyCommand(
+        "lattice_lock.cli.commands.ask:ask_command",
+        "Universal query: Ask any question and get routed to the best model.",
+    ),
+    "chain": LazyCommand(
+        "lattice_lock.cli.commands.chain:chain_group", "Manage and execute model pipelines."
+    ),
+    "validate": LazyCommand(
+        "lattice_lock.cli.commands.validate:validate_command", "Validate a Lattice Lock project."
+    ),
+    "compile": LazyCommand(
+        "lattice_lock.cli.commands.compile:compile_command",
+        "Compile a lattice.yaml schema into enforcement artifacts.",
+    ),
+    "doctor": LazyCommand(
+        "lattice_lock.cli.commands.doctor:doctor_command",
+        "Check environment health for Lattice Lock.",
+    ),
+    "feedback": LazyCommand(
+        "lattice_lock.cli.commands.feedback:feedback", "Submit feedback about Lattice Lock."
+    ),
+    "mcp": LazyCommand(
+        "lattice_lock.cli.commands.mcp:mcp_command",
+        "Start the Model Context Protocol (MCP) server.",
+    ),
+    # Alias commands for better UX; "gauntlet" is kept for backward compatibility
+    "test": LazyCommand(
+        "lattice_lock.cli.commands.gauntlet:gauntlet_command",
+        "Gauntlet: Generate and run semantic tests from lattice.yaml.",
+    ),
+    "gauntlet": LazyCommand(
+        "lattice_lock.cli.commands.gauntlet:gauntlet_command",
+        "Gauntlet: Generate and run semantic tests from lattice.yaml.",
+    ),
+    "sheriff": LazyCommand(
+        "lattice_lock.cli.commands.sheriff:sheriff_command",
+        "Validates Python files for import discipline and type hints.",
+    ),
+    "bench": LazyCommand(
+        "lattice_lock.cli.commands.bench:bench_command",
+        "Run performance benchmarks and compare them with the baseline.",
+    ),
+    # Groups
+    "orchestrator": LazyCommand(
+        "lattice_lock.cli.groups.orchestrator:orchestrator_group",
+        "Manage AI Model Orchestration.",
+    ),
+    "admin": LazyCommand(
+        "lattice_lock.cli.groups.admin:admin_group", "Administrative tools and dashboard."
+    ),
+    "handoff": LazyCommand(
+        "lattice_lock.cli.commands.handoff:handoff_group",
+        "Manage context handoffs between tools or sessions.",
+    ),
+}
+
+
+@click.group(cls=LazyGroup, lazy_subcommands=LAZY_SUBCOMMANDS)
 @click.option("--verbose", "-v", is_flag=True, help="Enable verbose logging")
 @click.option("--json", is_flag=True, help="Output results as JSON")
 @click.option(
@@ -44,9 +92,22 @@ logger = get_logger("cli")
     default=".",
     help="Target project directory (default: current)",
 )
+@click.option(
+    "--profile",
+    is_flag=True,
+    help="Profile the command: write cProfile and collapsed-stack files, print stage timings",
+)
+@click.option(
+    "--profile-output",
+    type=click.Path(dir_okay=False),
+    default=None,
+    help="Path prefix for profile files (default: .lattice-lock/profiles/<command>-<time>)",
+)
 @click.version_option(version=__version__, prog_name="lattice-lock")
 @click.pass_context
-def cli(ctx, verbose: bool, json: bool, project_dir: str):
+def cli(
+    ctx, verbose: bool, json: bool, project_dir: str, profile: bool, profile_output: str | None
+):
     """Lattice Lock Framework CLI - Governance for AI Engineering."""
     # Generate trace ID for this CLI invocation
     trace_id = set_trace_id()
@@ -58,31 +119,74 @@ def cli(ctx, verbose: bool, json: bool, project_dir: str):
     ctx.obj["TRACE_ID"] = trace_id
 
     if verbose:
+        from lattice_lock.cli.utils.console import get_console
+
         setup_logging(level=logging.DEBUG, simple_format=True)
         get_console().print("[info]Verbose mode enabled[/info]")
 
-
-# Register Core Commands
-cli.add_command(init_command, name="init")
-cli.add_command(ask_command, name="ask")
-cli.add_command(chain_group)
-cli.add_command(validate_command, name="validate")
-cli.add_command(compile_command, name="compile")
-cli.add_command(doctor_command, name="doctor")
-cli.add_command(feedback, name="feedback")
-cli.add_command(mcp_command, name="mcp")
-
-# Alias commands for better UX
-cli.add_command(gauntlet_command, name="test")
-cli.add_command(gauntlet_command, name="gauntlet")  # Alias for backward compatibility
-cli.add_command(
-    sheriff_command, name="sheriff"
-)  # Keep sheriff available directly or via validate? Design says 'validate' runs sheriff.
-
-# Register Groups
-cli.add_command(orchestrator_group)
-cli.add_command(admin_group)
-cli.add_command(handoff_group, name="handoff")
+    if profile:
+        _start_profiling(ctx, project_dir, profile_output)
+
+
+def _start_profiling(ctx, project_dir: str, profile_output: str | None) -> None:
+    """Profile the invoked subcommand and report when the CLI context closes."""
+    import os
+    import sys
+    import time
+
+    from lattice_lock.profiling import DEFAULT_PROFILE_DIR, Profiler
+
+    command = ctx.invoked_subcommand or "lattice"
+    if profile_output is None:
+        stamp = time.strftime("%Y%m%d-%H%M%S")
+        profile_output = os.path.join(project_dir, DEFAULT_PROFILE_DIR, f"{command}-{stamp}")
+    profiler = Profiler(command).start()
+
+    def finish():
+        # Runs on normal exit and on sys.exit() inside the command
+        profiler.stop()
+        try:
+            report = profiler.report(*profiler.write(profile_output))
+        except OSError as e:
+            click.echo(f"Could not write profile: {e}", err=True)
+            report = profiler.report()
+        _print_profile_report(report, as_json=ctx.obj["JSON"])
+        sys.stderr.flush()
+
+    ctx.call_on_close(finish)
+
+
+def _print_profile_report(report, as_json: bool) -> None:
+    """Print the profile summary to stderr so command output stays parseable."""
+    if as_json:
+        import json as json_lib
+
+        click.echo(json_lib.dumps({"profile": report.to_dict()}, indent=2), err=True)
+        return
+
+    from rich.console import Console
+    from rich.table import Table
+
+    table = Table(title=f"Profile: {report.command}")
+    table.add_column("Stage")
+    table.add_column("Calls", justify="right")
+    table.add_column("Total (ms)", justify="right")
+    table.add_column("Self (ms)", justify="right")
+    for timing in report.stages:
+        table.add_row(
+            timing.name,
+            str(timing.calls),
+            f"{timing.total_ms:.1f}",
+            f"{timing.self_ms:.1f}",
+        )
+    console = Console(stderr=True)
+    console.print(table)
+    console.print(f"Wall time: {report.wall_ms:.1f} ms")
+    if report.peak_memory_bytes is not None:
+        console.print(f"Peak memory: {report.peak_memory_bytes / 1024 / 1024:.2f} MiB")
+    if report.profile_path:
+        console.print(f"cProfile: {report.profile_path}")
+        console.print(f"Collapsed stacks: {report.collapsed_path} ({report.samples} samples)")
 
 
 def main():
@@ -0,0 +1,167 @@
+"""
+Lattice Lock CLI Bench Command
+
+Runs the hot-path benchmark suite, compares it with a stored baseline and
+fails when a benchmark regresses beyond the allowed percentage.
+"""
+
+import json
+import sys
+from pathlib import Path
+
+import click
+from rich.table import Table
+
+from lattice_lock.benchmarks.suite import (
+    BENCHMARKS,
+    DEFAULT_BASELINE_PATH,
+    DEFAULT_ROUNDS,
+    DEFAULT_WARMUP,
+    SCALES,
+    BenchmarkRun,
+    compare_to_baseline,
+    list_groups,
+    load_baseline,
+    run_suite,
+    save_baseline,
+)
+from lattice_lock.cli.utils.console import get_console
+
+console = get_console()
+
+
+def _print_run(run: BenchmarkRun) -> None:
+    comparisons = {c.name: c for c in run.comparisons}
+    table = Table(title=f"Benchmarks ({run.scale})", box=None, show_header=True)
+    table.add_column("Benchmark", style="cyan")
+    table.add_column("Median", justify="right")
+    table.add_column("Min", justify="right")
+    table.add_column("Stdev", justify="right")
+    table.add_column("Baseline", justify="right")
+    table.add_column("Change", justify="right")
+
+    for result in run.results:
+        comparison = comparisons.get(result.name)
+        baseline = change = "-"
+        if comparison and comparison.baseline_ms is not None:
+            baseline = f"{comparison.baseline_ms:.2f}ms"
+            style = "red" if comparison.regressed else "green" if comparison.change_pct < 0 else ""
+            change = f"{comparison.change_pct:+.1f}%"
+            if style:
+                change = f"[{style}]{change}[/{style}]"
+        table.add_row(
+            result.name,
+            f"{result.median_ms:.2f}ms",
+            f"{result.min_ms:.2f}ms",
+            f"{result.stdev_ms:.2f}ms",
+            baseline,
+            change,
+        )
+    console.print(table)
+
+
+@click.command("bench")
+@click.argument("selectors", nargs=-1)
+@click.option("--list", "list_only", is_flag=True, help="List available benchmarks and exit.")
+@click.option(
+    "--scale",
+    type=click.Choice(list(SCALES)),
+    default="small",
+    help="Size of the synthetic inputs (default: small).",
+)
+@click.option("--rounds", type=click.IntRange(min=1), default=DEFAULT_ROUNDS, help="Timed rounds.")
+@click.option(
+    "--warmup", type=click.IntRange(min=0), default=DEFAULT_WARMUP, help="Untimed rounds."
+)
+@click.option(
+    "--baseline",
+    "baseline_path",
+    type=click.Path(dir_okay=False, path_type=Path),
+    default=None,
+    help=f"Baseline file (default: <project>/{DEFAULT_BASELINE_PATH}).",
+)
+@click.option(
+    "--save-baseline", "update_baseline", is_flag=True, help="Store this run as the new baseline."
+)
+@click.option(
+    "--threshold",
+    type=float,
+    default=None,
+    help="Allowed median slowdown in percent before a benchmark fails "
+    "(default: the baseline's threshold_pct).",
+)
+@click.option("--json", "json_output", is_flag=True, help="Output results as JSON.")
+@click.pass_context
+def bench_command(
+    ctx: click.Context,
+    selectors: tuple[str, ...],
+    list_only: bool,
+    scale: str,
+    rounds: int,
+    warmup: int,
+    baseline_path: Path | None,
+    update_baseline: bool,
+    threshold: float | None,
+    json_output: bool,
+) -> None:
+    """Run performance benchmarks and compare them with the baseline.
+
+    SELECTORS are group names ({groups}) or full benchmark names;
+    all benchmarks run by default.
+    Exits with status 1 if any benchmark's median regressed beyond the threshold.
+    """
+    json_output = json_output or (ctx.obj.get("JSON", False) if ctx.obj else False)
+
+    if list_only:
+        if json_output:
+            click.echo(json.dumps({n: c.description for n, c in BENCHMARKS.items()}, indent=2))
+        else:
+            for name, case in BENCHMARKS.items():
+                click.echo(f"{name:<32} {case.description}")
+        return
+
+    if baseline_path is None:
+        project_dir = Path(ctx.obj.get("PROJECT_DIR", ".") if ctx.obj else ".")
+        baseline_path = project_dir / DEFAULT_BASELINE_PATH
+
+    def on_result(result):
+        if not json_output:
+            console.print(f"[muted]{result.name}: {result.median_ms:.2f}ms[/]")
+
+    try:
+        run = run_suite(
+            list(selectors) or None, scale=scale, rounds=rounds, warmup=warmup, on_result=on_result
+        )
+    except ValueError as e:
+        raise click.UsageError(str(e)) from e
+
+    baseline = load_baseline(baseline_path)
+    if baseline is not None:
+        try:
+            compare_to_baseline(run, baseline, threshold)
+        except ValueError as e:
+            if not update_baseline:
+                raise click.UsageError(f"{e}. Re-run with --scale {baseline.get('scale')}.") from e
+
+    if json_output:
+        click.echo(json.dumps(run.to_dict(), indent=2))
+    else:
+        _print_run(run)
+        if baseline is None and not update_baseline:
+            console.info(f"No baseline at {baseline_path}; run with --save-baseline to create one.")
+        for regression in run.regressions:
+            console.warning(
+                f"{regression.name} regressed {regression.change_pct:+.1f}% "
+                f"(threshold {regression.threshold_pct:g}%)"
+            )
+
+    if update_baseline:
+        save_baseline(baseline_path, run, baseline)
+        if not json_output:
+            console.success(f"Baseline saved to {baseline_path}")
+    elif run.regressions:
+        sys.exit(1)
+
+
+# Group names come from the registered suite so the help text cannot go stale
+bench_command.help = (bench_command.help or "").format(groups=", ".join(list_groups()))
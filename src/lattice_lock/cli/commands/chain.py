@@ -1,6 +1,7 @@
 import asyncio
 import json
 import logging
+from datetime import timedelta
 
 import click
 from rich.console import Console
@@ -8,6 +9,7 @@ from rich.panel import Panel
 from rich.table import Table
 
 from lattice_lock.orchestrator.chain import ChainOrchestrator
+from lattice_lock.orchestrator.checkpoints import CheckpointStore
 
 logger = logging.getLogger(__name__)
 
@@ -22,10 +24,34 @@ def chain_group():
 @click.argument("pipeline_yaml", type=click.Path(exists=True))
 @click.option("--input", "-i", multiple=True, help="Input as key=value pairs")
 @click.option("--input-json", "-j", help="Path to a JSON file containing inputs")
-def run_command(pipeline_yaml: str, input: list[str], input_json: str | None):
+@click.option(
+    "--max-concurrency",
+    type=click.IntRange(min=1),
+    default=None,
+    help="Maximum number of independent steps to run at once",
+)
+@click.option(
+    "--no-checkpoints",
+    is_flag=True,
+    help="Neither reuse nor store step outputs in the checkpoint store",
+)
+def run_command(
+    pipeline_yaml: str,
+    input: list[str],
+    input_json: str | None,
+    max_concurrency: int | None,
+    no_checkpoints: bool,
+):
     """Execute a new pipeline run."""
     inputs = _parse_inputs(input, input_json)
-    asyncio.run(_chain_async(pipeline_yaml, inputs))
+    asyncio.run(
+        _chain_async(
+            pipeline_yaml,
+            inputs,
+            max_concurrency=max_concurrency,
+            checkpoints=not no_checkpoints,
+        )
+    )
 
 
 @chain_group.command(name="resume")
@@ -37,13 +63,24 @@ def run_command(pipeline_yaml: str, input: list[str], input_json: str | None):
     help="Original pipeline YAML (optional if ID known)",
 )
 @click.option("--input", "-i", multiple=True, help="New input overrides as key=value pairs")
-def resume_command(pipeline_id: str | None, pipeline_yaml: str | None, input: list[str]):
-    """Resume a failed or paused pipeline."""
+@click.option("--from-step", help="Skip earlier steps, reusing their stored outputs")
+def resume_command(
+    pipeline_id: str | None, pipeline_yaml: str | None, input: list[str], from_step: str | None
+):
+    """Resume a failed or paused pipeline.
+
+    Steps whose rendered prompt, model and params are unchanged reuse their
+    checkpointed output, so only failed or affected steps call a model again.
+    """
     if not pipeline_id and not pipeline_yaml:
         raise click.UsageError("Must provide --id or --yaml to resume.")
 
     inputs = _parse_inputs(input, None)
-    asyncio.run(_chain_async(pipeline_yaml, inputs, resume=True, pipeline_id=pipeline_id))
+    asyncio.run(
+        _chain_async(
+            pipeline_yaml, inputs, resume=True, pipeline_id=pipeline_id, start_step=from_step
+        )
+    )
 
 
 @chain_group.command(name="history")
@@ -53,20 +90,87 @@ def history_command(limit: int):
     console = Console()
     console.print(f"[bold]Pipeline History (Last {limit})[/bold]")
 
-    # Stub implementation - persistent storage not yet connected
     table = Table()
     table.add_column("Run ID", style="cyan")
     table.add_column("Pipeline", style="green")
     table.add_column("Status", style="yellow")
-    table.add_column("Started", style="blue")
+    table.add_column("Steps", justify="right")
+    table.add_column("Updated", style="blue")
 
-    # Mock data
-    table.add_row("run_chk92...", "research_flow.yaml", "COMPLETED", "2024-01-01 12:00:00")
-    table.add_row("run_8j29s...", "deploy_prod.yaml", "FAILED", "2024-01-01 14:30:00")
+    store = CheckpointStore()
+    for run in store.list_runs(limit):
+        full = store.get_run(run.pipeline_id)
+        table.add_row(
+            run.pipeline_id,
+            run.pipeline_name,
+            run.status.upper(),
+            str(len(full.steps) if full else 0),
+            run.updated_at[:19].replace("T", " "),
+        )
 
     console.print(table)
 
 
+@chain_group.group(name="checkpoints")
+def checkpoints_group():
+    """Inspect and prune stored step outputs."""
+    pass
+
+
+@checkpoints_group.command(name="list")
+@click.option("--pipeline", "pipeline_name", help="Only show checkpoints for this pipeline")
+@click.option("--limit", default=20, help="Number of checkpoints to show")
+def checkpoints_list_command(pipeline_name: str | None, limit: int):
+    """List stored step outputs, most recently used first."""
+    console = Console()
+    store = CheckpointStore()
+    stats = store.stats()
+    console.print(
+        f"[bold]Checkpoint store:[/bold] {store.db_path}\n"
+        f"{stats['checkpoints']} step outputs, {stats['runs']} runs, "
+        f"{stats['hits']} reuses, {stats['content_bytes']} bytes of content"
+    )
+
+    table = Table()
+    table.add_column("Key", style="cyan")
+    table.add_column("Pipeline", style="green")
+    table.add_column("Step")
+    table.add_column("Model", style="yellow")
+    table.add_column("Reuses", justify="right")
+    table.add_column("Last Used", style="blue")
+    for checkpoint in store.list_checkpoints(pipeline_name, limit):
+        table.add_row(
+            checkpoint.key[:12],
+            checkpoint.pipeline_name,
+            checkpoint.step_name,
+            checkpoint.model,
+            str(checkpoint.hits),
+            checkpoint.last_used_at[:19].replace("T", " "),
+        )
+    console.print(table)
+
+
+@checkpoints_group.command(name="prune")
+@click.option(
+    "--older-than",
+    type=click.IntRange(min=0),
+    help="Delete step outputs not used in this many days",
+)
+@click.option("--pipeline", "pipeline_name", help="Only delete checkpoints for this pipeline")
+@click.option("--all", "prune_all", is_flag=True, help="Delete every stored step output")
+def checkpoints_prune_command(older_than: int | None, pipeline_name: str | None, prune_all: bool):
+    """Delete stored step outputs."""
+    if older_than is None and not pipeline_name and not prune_all:
+        raise click.UsageError("Specify --older-than, --pipeline or --all.")
+
+    store = CheckpointStore()
+    deleted = store.prune(
+        older_than=timedelta(days=older_than) if older_than is not None else None,
+        pipeline_name=pipeline_name,
+    )
+    Console().print(f"[green]Deleted {deleted} checkpoint(s).[/green]")
+
+
 def _parse_inputs(input_list: list[str], input_json: str | None) -> dict:
     inputs = {}
     for item in input_list:
@@ -81,27 +185,37 @@ def _parse_inputs(input_list: list[str], input_json: str | None) -> dict:
 
 
 async def _chain_async(
-    pipeline_yaml: str | None, inputs: dict, resume: bool = False, pipeline_id: str | None = None
+    pipeline_yaml: str | None,
+    inputs: dict,
+    resume: bool = False,
+    pipeline_id: str | None = None,
+    max_concurrency: int | None = None,
+    checkpoints: bool = True,
+    start_step: str | None = None,
 ):
     console = Console()
 
     try:
-        orchestrator = ChainOrchestrator()
+        store = CheckpointStore() if checkpoints else None
+        orchestrator = ChainOrchestrator(checkpoint_store=store)
 
         pipeline = None
-        start_step = None
 
         if resume:
             console.print(
                 f"\n[bold cyan]Resuming Pipeline: {pipeline_id or 'Unknown ID'}[/bold cyan]"
             )
+            run = store.get_run(pipeline_id) if store and pipeline_id else None
+            if run:
+                # Replay the original inputs, with any overrides applied on top
+                inputs = {**run.inputs, **inputs}
+                pipeline_yaml = pipeline_yaml or run.source
             if pipeline_yaml:
                 pipeline = orchestrator.from_yaml(pipeline_yaml)
             else:
                 console.print(
-                    "[yellow]Warning: Resuming without YAML. Assuming specific ID recovery supported by backend.[/yellow]"
+                    "[red]Error: Unknown run ID and no --yaml given; cannot load pipeline.[/red]"
                 )
-                # In real implementation, persistence would load the definition
                 return
         else:
             if not pipeline_yaml:
@@ -118,10 +232,15 @@ async def _chain_async(
             console.print()
 
         result = await orchestrator.run_pipeline(
-            pipeline, inputs, start_from_step=start_step, pipeline_id=pipeline_id
+            pipeline,
+            inputs,
+            start_from_step=start_step,
+            pipeline_id=pipeline_id,
+            max_concurrency=max_concurrency,
         )
 
-        console.print("[bold green]Pipeline Completed Successfully![/bold green]\n")
+        console.print("[bold green]Pipeline Completed Successfully![/bold green]")
+        console.print(f"[dim]Run ID: {result['pipeline_id']}[/dim]\n")
 
         # Show summary table
         table = Table(title="Pipeline Execution Summary")
@@ -131,12 +250,21 @@ async def _chain_async(
 
         total_cost = 0.0
         for step_name, step_result in result["step_results"].items():
-            cost = step_result["usage"].cost if hasattr(step_result["usage"], "cost") else 0.0
+            if step_result.get("cached"):
+                table.add_row(step_name, step_result["model"], "[dim]reused[/dim]")
+                continue
+            cost = getattr(step_result["usage"], "cost", None) or 0.0
             total_cost += cost
             table.add_row(step_name, step_result["model"], f"${cost:.4f}")
 
         console.print(table)
-        console.print(f"\n[bold]Total Pipeline Cost:[/bold] ${total_cost:.4f}\n")
+        console.print(f"\n[bold]Total Pipeline Cost:[/bold] ${total_cost:.4f}")
+        timing = result["timing"]
+        console.print(
+            f"[bold]Wall Time:[/bold] {timing['wall_ms'] / 1000:.2f}s "
+            f"[dim](critical path {timing['critical_path_ms'] / 1000:.2f}s, "
+            f"sequential {timing['sequential_ms'] / 1000:.2f}s)[/dim]\n"
+        )
 
         # Display final outputs
         for step_name, step_result in result["step_results"].items():
@@ -14,6 +14,7 @@ from pathlib import Path
 
 import click
 
+from lattice_lock.profiling import stage
 from lattice_lock.sheriff.cache import SheriffCache, get_config_hash
 from lattice_lock.sheriff.config import SheriffConfig
 from lattice_lock.sheriff.formatters import OutputFormatter, get_formatter
@@ -148,10 +149,11 @@ def sheriff_command(
         config_hash = get_config_hash(sheriff_config)
         cache = SheriffCache(cache_dir=cache_dir, config_hash=config_hash)
 
-        if clear_cache:
-            cache.clear()
-        else:
-            cache.load()
+        with stage("cache"):
+            if clear_cache:
+                cache.clear()
+            else:
+                cache.load()
 
     # Run validation with caching and audit
     violations, ignored_violations = _validate_with_cache(
@@ -160,7 +162,8 @@ def sheriff_command(
 
     # Save cache if used
     if cache:
-        cache.save()
+        with stage("cache"):
+            cache.save()
 
     # Output results based on format
     formatter: OutputFormatter = get_formatter(output_format)
@@ -241,36 +244,39 @@ def _validate_with_cache(
         ignored_violations.extend(iv)
     elif path.is_dir():
         # Walk directory and validate each file with caching
-        for root, _, files in os.walk(path):
-            current_dir = Path(root)
-
-            # Apply directory-level ignore patterns
-            ignored_by_dir = False
-            for pattern in ignore_patterns:
-                relative_dir = current_dir.relative_to(path) if current_dir != path else Path(".")
-                if relative_dir.match(pattern):
-                    ignored_by_dir = True
-                    break
-            if ignored_by_dir:
-                continue
-
-            for file in files:
-                file_path = current_dir / file
-                if file_path.suffix == ".py":
-                    # Apply file-level ignore patterns
-                    ignored_by_file = False
-                    for pattern in ignore_patterns:
-                        if file_path.match(pattern):
-                            ignored_by_file = True
-                            break
-                    if ignored_by_file:
-                        continue
-
-                    v, iv = _validate_file_with_cache(
-                        file_path, config, cache
-                    )  # ignore_patterns handled by ast_visitor
-                    violations.extend(v)
-                    ignored_violations.extend(iv)
+        with stage("discovery"):
+            for root, _, files in os.walk(path):
+                current_dir = Path(root)
+
+                # Apply directory-level ignore patterns
+                ignored_by_dir = False
+                for pattern in ignore_patterns:
+                    relative_dir = (
+                        current_dir.relative_to(path) if current_dir != path else Path(".")
+                    )
+                    if relative_dir.match(pattern):
+                        ignored_by_dir = True
+                        break
+                if ignored_by_dir:
+                    continue
+
+                for file in files:
+                    file_path = current_dir / file
+                    if file_path.suffix == ".py":
+                        # Apply file-level ignore patterns
+                        ignored_by_file = False
+                        for pattern in ignore_patterns:
+                            if file_path.match(pattern):
+                                ignored_by_file = True
+                                break
+                        if ignored_by_file:
+                            continue
+
+                        v, iv = _validate_file_with_cache(
+                            file_path, config, cache
+                        )  # ignore_patterns handled by ast_visitor
+                        violations.extend(v)
+                        ignored_violations.extend(iv)
 
     return violations, ignored_violations
 
@@ -10,6 +10,7 @@ from pathlib import Path
 
 import click
 
+from lattice_lock.profiling import stage
 from lattice_lock.validator import (
     ValidationResult,
     validate_agent_manifest,
@@ -102,15 +103,16 @@ def _apply_fixes(path: Path, verbose: bool = False) -> int:
 def _find_files(path: Path, patterns: list[str]) -> list[Path]:
     """Find files matching patterns in path."""
     files = []
-    for pattern in patterns:
-        if path.is_dir():
-            for p in path.glob(f"**/{pattern}"):
-                # Skip agent_templates directory
-                if "agent_templates" in p.parts:
-                    continue
-                files.append(p)
-        elif path.match(pattern):
-            files.append(path)
+    with stage("discovery"):
+        for pattern in patterns:
+            if path.is_dir():
+                for p in path.glob(f"**/{pattern}"):
+                    # Skip agent_templates directory
+                    if "agent_templates" in p.parts:
+                        continue
+                    files.append(p)
+            elif path.match(pattern):
+                files.append(path)
     return files
 
 
@@ -193,7 +195,8 @@ def validate_command(
             click.echo(click.style("  ⚠ No lattice.yaml found", fg="yellow"))
         else:
             for lattice_file in lattice_files:
-                result = validate_lattice_schema(str(lattice_file))
+                with stage("validate"):
+                    result = validate_lattice_schema(str(lattice_file))
                 all_results.append(result)
                 _print_result(str(lattice_file.relative_to(path)), result, verbose)
         click.echo()
@@ -206,7 +209,8 @@ def validate_command(
             click.echo(click.style("  ⚠ No .env file found", fg="yellow"))
         else:
             for env_file in env_files:
-                result = validate_env_file(str(env_file))
+                with stage("validate"):
+                    result = validate_env_file(str(env_file))
                 all_results.append(result)
                 _print_result(str(env_file.relative_to(path)), result, verbose)
         click.echo()
@@ -219,7 +223,8 @@ def validate_command(
             click.echo(click.style("  ⚠ No agent definitions found", fg="yellow"))
         else:
             for agent_file in agent_files:
-                result = validate_agent_manifest(str(agent_file))
+                with stage("validate"):
+                    result = validate_agent_manifest(str(agent_file))
                 all_results.append(result)
                 _print_result(str(agent_file.relative_to(path)), result, verbose)
         click.echo()
@@ -227,7 +232,8 @@ def validate_command(
     # Structure validation
     if run_structure:
         click.echo("Structure Validation:")
-        result = validate_repository_structure(str(path))
+        with stage("validate"):
+            result = validate_repository_structure(str(path))
         all_results.append(result)
         _print_result("Repository structure", result, verbose)
         click.echo()
@@ -0,0 +1,82 @@
+"""
+Lazy-loading Click group for the Lattice Lock CLI.
+
+Subcommands are registered by import path and only imported when they are
+invoked (or when their own ``--help`` is requested), so ``lattice --help`` and
+lightweight commands such as ``lattice sheriff`` do not pay for the FastAPI,
+SQLAlchemy, MCP and orchestrator dependency trees.
+"""
+
+import importlib
+from dataclasses import dataclass
+
+import click
+
+
+@dataclass(frozen=True)
+class LazyCommand:
+    """A subcommand that is resolved from ``import_path`` on first use.
+
+    Attributes:
+        import_path: ``"package.module:attribute"`` locating the Click command.
+        short_help: Text shown in the parent group's command listing, so that
+            ``--help`` can be rendered without importing the command module.
+    """
+
+    import_path: str
+    short_help: str = ""
+
+
+class LazyGroup(click.Group):
+    """Click group that defers importing subcommand modules until needed."""
+
+    def __init__(self, *args, lazy_subcommands: dict[str, LazyCommand] | None = None, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.lazy_subcommands: dict[str, LazyCommand] = dict(lazy_subcommands or {})
+
+    def add_lazy_command(self, name: str, import_path: str, short_help: str = "") -> None:
+        """Register a subcommand by import path without importing it."""
+        self.lazy_subcommands[name] = LazyCommand(import_path, short_help)
+
+    def list_commands(self, ctx: click.Context) -> list[str]:
+        return sorted(set(super().list_commands(ctx)) | set(self.lazy_subcommands))
+
+    def get_command(self, ctx: click.Context, cmd_name: str) -> click.Command | None:
+        if cmd_name in self.commands:
+            return self.commands[cmd_name]
+        lazy = self.lazy_subcommands.get(cmd_name)
+        if lazy is None:
+            return None
+        command = self._load(cmd_name, lazy)
+        # Cache the resolved command so subsequent lookups skip the import machinery.
+        self.commands[cmd_name] = command
+        return command
+
+    def format_commands(self, ctx: click.Context, formatter: click.HelpFormatter) -> None:
+        """List subcommands using registered help text instead of importing them."""
+        rows = []
+        limit = formatter.width - 6 - max((len(n) for n in self.list_commands(ctx)), default=0)
+        for name in self.list_commands(ctx):
+            if name in self.commands:
+                command = self.commands[name]
+                if command.hidden:
+                    continue
+                rows.append((name, command.get_short_help_str(limit)))
+            else:
+                rows.append((name, self.lazy_subcommands[name].short_help))
+
+        if rows:
+            with formatter.section("Commands"):
+                formatter.write_dl(rows)
+
+    @staticmethod
+    def _load(cmd_name: str, lazy: LazyCommand) -> click.Command:
+        module_name, _, attr = lazy.import_path.partition(":")
+        module = importlib.import_module(module_name)
+        command = getattr(module, attr)
+        if not isinstance(command, click.Command):
+            raise TypeError(
+                f"Lazy command '{cmd_name}' resolved to {type(command).__name__}, "
+                f"expected a click.Command ({lazy.import_path})"
+            )
+        return command
@@ -11,6 +11,7 @@ from pathlib import Path
 
 import yaml
 
+from lattice_lock.profiling import stage
 from lattice_lock.validator.schema import ValidationResult, validate_lattice_schema
 
 
@@ -99,7 +100,8 @@ def compile_lattice(
         return result
 
     # Step 2: Validate schema
-    validation_result = validate_lattice_schema(str(schema_path))
+    with stage("validate"):
+        validation_result = validate_lattice_schema(str(schema_path))
     result.validation_result = validation_result
 
     if not validation_result.valid:
@@ -113,7 +115,7 @@ def compile_lattice(
 
     # Step 3: Load schema data
     try:
-        with open(schema_path) as f:
+        with stage("parse"), open(schema_path) as f:
             schema_data = yaml.safe_load(f)
     except yaml.YAMLError as e:
         result.add_error(f"Failed to parse YAML: {e}")
@@ -134,7 +136,8 @@ def compile_lattice(
     # Step 4: Generate Pydantic models (if requested)
     if generate_pydantic:
         try:
-            pydantic_path = _generate_pydantic_models(schema_data, output_dir, module_name)
+            with stage("generate"):
+                pydantic_path = _generate_pydantic_models(schema_data, output_dir, module_name)
             if pydantic_path:
                 result.add_generated_file(pydantic_path, "pydantic")
         except Exception as e:
@@ -143,7 +146,8 @@ def compile_lattice(
     # Step 5: Generate SQLModel ORM classes (if requested)
     if generate_sqlmodel:
         try:
-            sqlmodel_path = _generate_sqlmodel_classes(schema_data, output_dir, module_name)
+            with stage("generate"):
+                sqlmodel_path = _generate_sqlmodel_classes(schema_data, output_dir, module_name)
             if sqlmodel_path:
                 result.add_generated_file(sqlmodel_path, "sqlmodel")
         except Exception as e:
@@ -236,7 +240,7 @@ def _generate_pydantic_models(schema_data: dict, output_dir: Path, module_name:
         lines.append("")
         lines.append("")
 
-    with open(output_path, "w") as f:
+    with stage("write"), open(output_path, "w") as f:
         f.write("\n".join(lines))
 
     return output_path
@@ -353,7 +357,7 @@ def _generate_sqlmodel_classes(
         lines.append("")
         lines.append("")
 
-    with open(output_path, "w") as f:
+    with stage("write"), open(output_path, "w") as f:
         f.write("\n".join(lines))
 
     return output_path
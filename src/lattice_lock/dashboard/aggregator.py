@@ -3,6 +3,9 @@ Lattice Lock Dashboard Data Aggregator
 
 Collects and aggregates validation status from all projects,
 calculates health scores, and caches results for performance.
+
+Summary statistics are maintained incrementally as projects change, so reading
+them does not depend on the number of projects.
 """
 
 import threading
@@ -10,6 +13,8 @@ import time
 from dataclasses import asdict, dataclass, field
 from typing import Any
 
+from lattice_lock.metrics import MetricFamily
+
 from .metrics import MetricsCollector, MetricsSnapshot, ProjectHealthTrend
 
 
@@ -106,6 +111,9 @@ class DataAggregator:
     # Status values that indicate an error state
     ERROR_STATUSES = {"error", "failing", "critical"}
 
+    # Cache key of the sorted project list, the only view invalidated per update
+    ALL_PROJECTS_CACHE_KEY = "all_projects"
+
     def __init__(self, cache_ttl: float = 5.0):
         """
         Initialize the data aggregator.
@@ -119,6 +127,27 @@ class DataAggregator:
         self._cache = Cache(ttl_seconds=cache_ttl)
         self._lock = threading.Lock()
 
+        # Running totals over self.projects, kept in step by _track/_untrack
+        self._status_counts = {"healthy": 0, "at_risk": 0, "error": 0}
+        self._health_score_sum = 0
+
+    def _status_bucket(self, status: str) -> str:
+        if status in self.HEALTHY_STATUSES:
+            return "healthy"
+        if status in self.ERROR_STATUSES:
+            return "error"
+        return "at_risk"
+
+    def _track(self, project: ProjectInfo) -> None:
+        """Add a project's contribution to the running totals."""
+        self._status_counts[self._status_bucket(project.status)] += 1
+        self._health_score_sum += project.health_score
+
+    def _untrack(self, project: ProjectInfo) -> None:
+        """Remove a project's contribution from the running totals."""
+        self._status_counts[self._status_bucket(project.status)] -= 1
+        self._health_score_sum -= project.health_score
+
     def register_project(
         self,
         project_id: str,
@@ -142,6 +171,8 @@ class DataAggregator:
             if project_id in self.projects:
                 # Update existing project
                 project = self.projects[project_id]
+                if not name and not details:
+                    return project
                 if name:
                     project.name = name
                 if details:
@@ -156,8 +187,9 @@ class DataAggregator:
                     details=details or {},
                 )
                 self.projects[project_id] = project
+                self._track(project)
 
-            self._cache.invalidate()
+            self._cache.invalidate(self.ALL_PROJECTS_CACHE_KEY)
             return project
 
     def update_project_status(
@@ -189,9 +221,10 @@ class DataAggregator:
                     last_updated=time.time(),
                     details=details or {},
                 )
+            else:
+                self._untrack(self.projects[project_id])
 
             project = self.projects[project_id]
-            _old_status = project.status  # Reserved for status change tracking
             project.status = status
             project.last_updated = time.time()
 
@@ -208,6 +241,7 @@ class DataAggregator:
 
             # Calculate health score
             project.health_score = self._calculate_health_score(project)
+            self._track(project)
 
             self._last_update = time.time()
 
@@ -221,8 +255,8 @@ class DataAggregator:
                 project_id=project_id,
             )
 
-            # Invalidate cache on status change
-            self._cache.invalidate()
+            # Only the project list depends on per-project fields
+            self._cache.invalidate(self.ALL_PROJECTS_CACHE_KEY)
 
             return project
 
@@ -260,39 +294,28 @@ class DataAggregator:
         """
         Get a summary of all projects.
 
-        Returns cached result if available and fresh.
+        Built from the running totals in constant time, so it is not cached.
         """
-        cache_key = "project_summary"
-        cached = self._cache.get(cache_key)
-        if cached:
-            return cached
-
         with self._lock:
             total = len(self.projects)
-            healthy = sum(1 for p in self.projects.values() if p.status in self.HEALTHY_STATUSES)
-            error = sum(1 for p in self.projects.values() if p.status in self.ERROR_STATUSES)
-            at_risk = total - healthy - error
+            avg_health = self._health_score_sum / total if total else 0.0
 
-            avg_health = 0.0
-            if self.projects:
-                avg_health = sum(p.health_score for p in self.projects.values()) / total
-
-            metrics = self.metrics.get_snapshot()
+            validations = self.metrics.validation_count
+            success_rate = (
+                self.metrics.success_count / validations * 100 if validations > 0 else 100.0
+            )
 
-            summary = DashboardSummary(
+            return DashboardSummary(
                 total_projects=total,
-                healthy_projects=healthy,
-                at_risk_projects=at_risk,
-                error_projects=error,
+                healthy_projects=self._status_counts["healthy"],
+                at_risk_projects=self._status_counts["at_risk"],
+                error_projects=self._status_counts["error"],
                 avg_health_score=round(avg_health, 2),
-                total_validations=metrics.total_validations,
-                overall_success_rate=metrics.success_rate,
+                total_validations=validations,
+                overall_success_rate=round(success_rate, 2),
                 last_update=self._last_update,
             )
 
-            self._cache.set(cache_key, summary)
-            return summary
-
     def get_all_projects(self) -> list[dict[str, Any]]:
         """
         Get all projects as a list of dictionaries.
@@ -300,7 +323,7 @@ class DataAggregator:
         Returns:
             List of project dictionaries sorted by last_updated (newest first)
         """
-        cache_key = "all_projects"
+        cache_key = self.ALL_PROJECTS_CACHE_KEY
         cached = self._cache.get(cache_key)
         if cached:
             return cached
@@ -329,7 +352,21 @@ class DataAggregator:
         Returns:
             Dictionary mapping error types to counts
         """
-        return self.metrics.get_snapshot().error_counts.copy()
+        return self.metrics.error_counts.copy()
+
+    def collect_metrics(self) -> list[MetricFamily]:
+        """Project and validation metrics for the Prometheus-style /metrics endpoint."""
+        with self._lock:
+            projects = MetricFamily(
+                "lattice_dashboard_projects", "gauge", "Registered projects by status."
+            )
+            for bucket, count in self._status_counts.items():
+                projects.add(count, status=bucket)
+            total = len(self.projects)
+            health = MetricFamily(
+                "lattice_dashboard_avg_health_score", "gauge", "Average project health score."
+            ).add(self._health_score_sum / total if total else 0.0)
+            return [projects, health, *self.metrics.collect_metrics()]
 
     def remove_project(self, project_id: str) -> bool:
         """
@@ -343,8 +380,8 @@ class DataAggregator:
         """
         with self._lock:
             if project_id in self.projects:
-                del self.projects[project_id]
-                self._cache.invalidate()
+                self._untrack(self.projects.pop(project_id))
+                self._cache.invalidate(self.ALL_PROJECTS_CACHE_KEY)
                 return True
             return False
 
@@ -352,6 +389,8 @@ class DataAggregator:
         """Clear all project data and metrics."""
         with self._lock:
             self.projects.clear()
+            self._status_counts = dict.fromkeys(self._status_counts, 0)
+            self._health_score_sum = 0
             self.metrics.reset()
             self._cache.invalidate()
             self._last_update = 0.0
@@ -13,8 +13,11 @@ from typing import Any
 
 from fastapi import APIRouter, FastAPI, HTTPException, WebSocket, status
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import PlainTextResponse
 from pydantic import BaseModel, Field
 
+from lattice_lock.metrics import CONTENT_TYPE, get_metrics_registry
+
 from .aggregator import DataAggregator
 from .mock_data import mock_data_updater
 from .websocket import WebSocketManager
@@ -449,6 +452,15 @@ ws.onmessage = (event) => {
             "dashboard": "/dashboard/summary",
         }
 
+    @app.get("/metrics", include_in_schema=False)
+    async def metrics(request: Request) -> PlainTextResponse:
+        """Process and dashboard metrics in the Prometheus text format."""
+        state = request.app.state
+        body = get_metrics_registry().render(
+            [state.aggregator.collect_metrics, state.ws_manager.collect_metrics]
+        )
+        return PlainTextResponse(body, media_type=CONTENT_TYPE)
+
     return app
 
 
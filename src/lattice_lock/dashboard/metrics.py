@@ -9,6 +9,10 @@ import statistics
 import time
 from collections import deque
 from dataclasses import dataclass
+from typing import Any
+
+from lattice_lock.metrics import MetricFamily
+from lattice_lock.utils.quantiles import QuantileSketch, WindowedQuantileSketch
 
 
 @dataclass
@@ -46,10 +50,16 @@ class MetricsCollector:
 
     Tracks validation success/failure rates, error frequency by type,
     response time percentiles, and project health trends.
+
+    Response times are recorded into quantile sketches (globally, per project
+    and per error type), rolled up per minute. Snapshots of several dashboard
+    workers can be combined with ``merge_sketches(other.export_sketches())``.
     """
 
-    # Maximum number of response times to keep for percentile calculation
-    MAX_RESPONSE_TIMES = 1000
+    # Length of one response time rollup interval in seconds
+    SKETCH_INTERVAL_SECONDS = 60
+    # Rollup intervals kept; percentiles cover at most this many intervals
+    SKETCH_RETENTION_INTERVALS = 60
     # Maximum health history entries per project
     MAX_HEALTH_HISTORY = 100
 
@@ -57,7 +67,10 @@ class MetricsCollector:
         self.validation_count = 0
         self.success_count = 0
         self.error_counts: dict[str, int] = {}
-        self.response_times: deque = deque(maxlen=self.MAX_RESPONSE_TIMES)
+        self._response_times = self._new_sketch()
+        self._response_time_sum = 0.0
+        self._project_response_times: dict[str, WindowedQuantileSketch] = {}
+        self._error_response_times: dict[str, WindowedQuantileSketch] = {}
         self._start_time = time.time()
 
         # Validation timestamps for rate calculation
@@ -95,10 +108,14 @@ class MetricsCollector:
         if error_type:
             self.error_counts[error_type] = self.error_counts.get(error_type, 0) + 1
 
-        self.response_times.append(duration)
+        self._response_times.add(duration, current_time)
+        self._response_time_sum += duration
+        if error_type:
+            self._sketch_for(self._error_response_times, error_type).add(duration, current_time)
 
         # Update project-specific metrics
         if project_id:
+            self._sketch_for(self._project_response_times, project_id).add(duration, current_time)
             self._project_validations[project_id] = self._project_validations.get(project_id, 0) + 1
             if success:
                 self._project_successes[project_id] = self._project_successes.get(project_id, 0) + 1
@@ -109,6 +126,20 @@ class MetricsCollector:
                 self._project_health_history[project_id] = deque(maxlen=self.MAX_HEALTH_HISTORY)
             self._project_health_history[project_id].append((current_time, health))
 
+    def _new_sketch(self) -> WindowedQuantileSketch:
+        return WindowedQuantileSketch(
+            interval_seconds=self.SKETCH_INTERVAL_SECONDS,
+            retention_intervals=self.SKETCH_RETENTION_INTERVALS,
+        )
+
+    def _sketch_for(
+        self, sketches: dict[str, WindowedQuantileSketch], key: str
+    ) -> WindowedQuantileSketch:
+        sketch = sketches.get(key)
+        if sketch is None:
+            sketch = sketches[key] = self._new_sketch()
+        return sketch
+
     def _calculate_project_health(self, project_id: str) -> float:
         """Calculate health score for a specific project."""
         validations = self._project_validations.get(project_id, 0)
@@ -121,23 +152,79 @@ class MetricsCollector:
         # Health is primarily based on success rate
         return min(100.0, max(0.0, success_rate))
 
-    def get_percentile(self, percentile: float) -> float:
+    def get_response_time_sketch(
+        self,
+        project_id: str | None = None,
+        error_type: str | None = None,
+        window_seconds: float | None = None,
+    ) -> QuantileSketch:
+        """
+        Get the merged response time sketch for a scope and time window.
+
+        Args:
+            project_id: Restrict to one project
+            error_type: Restrict to validations that failed with this error type
+            window_seconds: Only include the most recent rollup intervals covering
+                this many seconds (default: everything retained)
+
+        Returns:
+            QuantileSketch (empty if nothing was recorded for the scope)
+        """
+        if project_id is not None:
+            windowed = self._project_response_times.get(project_id)
+        elif error_type is not None:
+            windowed = self._error_response_times.get(error_type)
+        else:
+            windowed = self._response_times
+        if windowed is None:
+            return QuantileSketch()
+        return windowed.merged(window_seconds)
+
+    def get_percentile(
+        self,
+        percentile: float,
+        project_id: str | None = None,
+        error_type: str | None = None,
+        window_seconds: float | None = None,
+    ) -> float:
         """
         Calculate response time percentile.
 
         Args:
             percentile: Percentile to calculate (0-100)
+            project_id: Restrict to one project
+            error_type: Restrict to one error type
+            window_seconds: Restrict to the most recent seconds
 
         Returns:
-            Response time at the given percentile
+            Response time at the given percentile (within 1% relative error)
         """
-        if not self.response_times:
-            return 0.0
+        sketch = self.get_response_time_sketch(project_id, error_type, window_seconds)
+        value = sketch.percentile(percentile)
+        return value if value is not None else 0.0
+
+    def export_sketches(self) -> dict[str, Any]:
+        """Export the response time sketches in a JSON-serializable form."""
+        return {
+            "global": self._response_times.to_dict(),
+            "projects": {k: v.to_dict() for k, v in self._project_response_times.items()},
+            "errors": {k: v.to_dict() for k, v in self._error_response_times.items()},
+        }
+
+    def merge_sketches(self, data: dict[str, Any]) -> None:
+        """
+        Merge response time sketches exported by another collector.
 
-        sorted_times = sorted(self.response_times)
-        index = int((percentile / 100.0) * len(sorted_times))
-        index = min(index, len(sorted_times) - 1)
-        return sorted_times[index]
+        Args:
+            data: Output of another worker's ``export_sketches()``
+        """
+        self._response_times.merge(WindowedQuantileSketch.from_dict(data["global"]))
+        for scoped, sketches in (
+            (data.get("projects", {}), self._project_response_times),
+            (data.get("errors", {}), self._error_response_times),
+        ):
+            for key, windowed in scoped.items():
+                self._sketch_for(sketches, key).merge(WindowedQuantileSketch.from_dict(windowed))
 
     def get_validations_per_minute(self) -> float:
         """Calculate the current validation rate per minute."""
@@ -208,9 +295,8 @@ class MetricsCollector:
             else 100.0
         )
 
-        avg_time = (
-            sum(self.response_times) / len(self.response_times) if self.response_times else 0.0
-        )
+        response_times = self._response_times.merged()
+        avg_time = response_times.mean
 
         # Calculate health score (0-100)
         # Base 100, deduct for failures and high latency
@@ -237,19 +323,49 @@ class MetricsCollector:
             error_counts=self.error_counts.copy(),
             health_score=health,
             timestamp=time.time(),
-            response_time_p50=round(self.get_percentile(50), 4),
-            response_time_p95=round(self.get_percentile(95), 4),
-            response_time_p99=round(self.get_percentile(99), 4),
+            response_time_p50=round(response_times.percentile(50) or 0.0, 4),
+            response_time_p95=round(response_times.percentile(95) or 0.0, 4),
+            response_time_p99=round(response_times.percentile(99) or 0.0, 4),
             validations_per_minute=round(self.get_validations_per_minute(), 2),
             error_rate=round(error_rate, 2),
         )
 
+    def collect_metrics(self) -> list[MetricFamily]:
+        """Validation metrics for the Prometheus-style /metrics endpoint."""
+        validations = MetricFamily(
+            "lattice_dashboard_validations_total", "counter", "Validations recorded."
+        ).add(self.validation_count)
+        failures = MetricFamily(
+            "lattice_dashboard_validation_failures_total", "counter", "Failed validations."
+        ).add(self.validation_count - self.success_count)
+        errors = MetricFamily(
+            "lattice_dashboard_errors_total", "counter", "Validation errors by error type."
+        )
+        for error_type, count in self.error_counts.items():
+            errors.add(count, error_type=error_type)
+
+        # Quantiles cover the retained rollup intervals; sum and count are cumulative
+        response_times = MetricFamily(
+            "lattice_dashboard_response_time_seconds", "summary", "Validation response time."
+        )
+        sketch = self._response_times.merged()
+        for quantile in (0.5, 0.95, 0.99):
+            value = sketch.quantile(quantile)
+            if value is not None:
+                response_times.add(value, quantile=quantile)
+        response_times.add(self._response_time_sum, suffix="_sum")
+        response_times.add(self.validation_count, suffix="_count")
+        return [validations, failures, errors, response_times]
+
     def reset(self) -> None:
         """Reset all metrics to initial state."""
         self.validation_count = 0
         self.success_count = 0
         self.error_counts.clear()
-        self.response_times.clear()
+        self._response_times.clear()
+        self._response_time_sum = 0.0
+        self._project_response_times.clear()
+        self._error_response_times.clear()
         self._start_time = time.time()
         self._validation_timestamps.clear()
         self._project_validations.clear()
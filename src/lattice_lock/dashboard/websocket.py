@@ -3,20 +3,38 @@ Lattice Lock Dashboard WebSocket Manager
 
 Provides real-time updates to connected dashboard clients via WebSocket.
 Supports event broadcasting, connection management, and heartbeat/keepalive.
+
+Broadcasts are serialized once and queued per connection; each connection has
+its own sender task, so a slow client only delays (and eventually loses) its
+own updates.
 """
 
 import asyncio
+import itertools
 import json
 import logging
 import time
-from dataclasses import dataclass
+from collections import OrderedDict
+from dataclasses import dataclass, field
 from typing import Any
 
 from fastapi import WebSocket, WebSocketDisconnect
 
+from lattice_lock.metrics import MetricFamily
+
 logger = logging.getLogger(__name__)
 
 
+@dataclass
+class OutgoingFrame:
+    """A serialized message waiting in a connection's send queue."""
+
+    text: str
+    enqueued_at: float
+    # Coalescing topic this frame updates, if any
+    topic: str | None = None
+
+
 @dataclass
 class ConnectionInfo:
     """Information about a WebSocket connection."""
@@ -25,6 +43,19 @@ class ConnectionInfo:
     connected_at: float
     last_activity: float
     client_id: str | None = None
+    # Whether the client asked for delta updates (see WebSocketManager.broadcast_event)
+    accepts_deltas: bool = False
+    # Frames waiting to be sent, keyed by coalescing key (oldest first)
+    pending: OrderedDict[str, OutgoingFrame] = field(default_factory=OrderedDict)
+    wakeup: asyncio.Event = field(default_factory=asyncio.Event)
+    sender_task: asyncio.Task | None = None
+    # Topics whose latest full state this client has (so deltas can be applied)
+    synced_topics: set[str] = field(default_factory=set)
+    sent_count: int = 0
+    dropped_count: int = 0
+    coalesced_count: int = 0
+    last_lag_ms: float = 0.0
+    max_lag_ms: float = 0.0
 
 
 class WebSocketManager:
@@ -36,18 +67,26 @@ class WebSocketManager:
     - Connection lifecycle management
     - Heartbeat/keepalive support
     - Automatic cleanup of dead connections
+    - Bounded per-connection send queues that coalesce stale updates
+    - Delta updates for clients that opt in
     """
 
     # Heartbeat interval in seconds
     HEARTBEAT_INTERVAL = 30
     # Connection timeout in seconds (no activity)
     CONNECTION_TIMEOUT = 120
+    # Frames queued per connection before the oldest are dropped
+    SEND_QUEUE_SIZE = 100
 
     def __init__(self):
         """Initialize the WebSocket manager."""
         self._connections: dict[int, ConnectionInfo] = {}
         self._heartbeat_task: asyncio.Task | None = None
         self._running = False
+        # Last full data broadcast per topic, used to compute deltas
+        self._topic_state: dict[str, dict[str, Any]] = {}
+        # Keys for frames that must never be coalesced
+        self._frame_ids = itertools.count()
 
     @property
     def active_connections(self) -> list[WebSocket]:
@@ -72,12 +111,13 @@ class WebSocketManager:
         conn_id = id(websocket)
         current_time = time.time()
 
-        self._connections[conn_id] = ConnectionInfo(
+        info = ConnectionInfo(
             websocket=websocket,
             connected_at=current_time,
             last_activity=current_time,
             client_id=client_id,
         )
+        self._connections[conn_id] = info
 
         logger.info(
             "WebSocket connection established: %s (client=%s, total=%d)",
@@ -95,6 +135,7 @@ class WebSocketManager:
                 "timestamp": current_time,
             },
         )
+        info.sender_task = asyncio.create_task(self._drain(conn_id, info))
 
     def disconnect(self, websocket: WebSocket) -> None:
         """
@@ -106,6 +147,8 @@ class WebSocketManager:
         conn_id = id(websocket)
         if conn_id in self._connections:
             info = self._connections.pop(conn_id)
+            if info.sender_task is not None:
+                info.sender_task.cancel()
             logger.info(
                 "WebSocket disconnected: %s (client=%s, duration=%.1fs, remaining=%d)",
                 conn_id,
@@ -190,9 +233,16 @@ class WebSocketManager:
                 )
             elif msg_type == "subscribe":
                 # Future: Handle subscription to specific event types
+                info = self._connections.get(id(websocket))
+                if info is not None and "deltas" in message:
+                    info.accepts_deltas = bool(message["deltas"])
                 await self._send_to_connection(
                     websocket,
-                    {"type": "subscribed", "topics": message.get("topics", [])},
+                    {
+                        "type": "subscribed",
+                        "topics": message.get("topics", []),
+                        "deltas": info.accepts_deltas if info else False,
+                    },
                 )
             else:
                 # Unknown message type, acknowledge receipt
@@ -240,15 +290,61 @@ class WebSocketManager:
             logger.error("Failed to send to WebSocket: %s", e)
             return False
 
-    async def broadcast(self, message: dict[str, Any]) -> int:
+    @staticmethod
+    def _serialize(message: dict[str, Any]) -> str:
+        # Same encoding as WebSocket.send_json
+        return json.dumps(message, separators=(",", ":"), ensure_ascii=False)
+
+    def _enqueue(self, info: ConnectionInfo, key: str, frame: OutgoingFrame) -> None:
+        """Queue a frame for a connection, coalescing or dropping stale frames."""
+        if key in info.pending:
+            # The queued update was never sent, so the newer one replaces it
+            info.pending[key] = frame
+            info.coalesced_count += 1
+        else:
+            while len(info.pending) >= self.SEND_QUEUE_SIZE:
+                _, dropped = info.pending.popitem(last=False)
+                info.dropped_count += 1
+                if dropped.topic is not None:
+                    # The client missed a state change; resend full state next time
+                    info.synced_topics.discard(dropped.topic)
+            info.pending[key] = frame
+        info.wakeup.set()
+
+    async def _drain(self, conn_id: int, info: ConnectionInfo) -> None:
+        """Send a connection's queued frames until it disconnects."""
+        try:
+            while True:
+                await info.wakeup.wait()
+                info.wakeup.clear()
+                while info.pending:
+                    _, frame = info.pending.popitem(last=False)
+                    await info.websocket.send_text(frame.text)
+                    lag_ms = (time.monotonic() - frame.enqueued_at) * 1000
+                    info.sent_count += 1
+                    info.last_lag_ms = lag_ms
+                    info.max_lag_ms = max(info.max_lag_ms, lag_ms)
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            logger.warning("Failed to send to %s, removing connection: %s", conn_id, e)
+            if self._connections.get(conn_id) is info:
+                del self._connections[conn_id]
+
+    async def broadcast(self, message: dict[str, Any], coalesce_key: str | None = None) -> int:
         """
         Broadcast a message to all connected clients.
 
+        The message is serialized once and queued for every connection; it is
+        sent by the connection's sender task.
+
         Args:
             message: Message dictionary to broadcast
+            coalesce_key: Messages with the same key replace each other while
+                still queued for a connection, so slow clients only get the latest
 
         Returns:
-            Number of clients that received the message
+            Number of clients the message was queued for
         """
         if not self._connections:
             return 0
@@ -257,29 +353,11 @@ class WebSocketManager:
         if "timestamp" not in message:
             message["timestamp"] = time.time()
 
-        sent_count = 0
-        dead_connections: list[int] = []
-
-        for conn_id, info in list(self._connections.items()):
-            try:
-                await info.websocket.send_json(message)
-                sent_count += 1
-            except Exception as e:
-                logger.warning("Failed to broadcast to %s: %s", conn_id, e)
-                dead_connections.append(conn_id)
-
-        # Clean up dead connections
-        for conn_id in dead_connections:
-            if conn_id in self._connections:
-                del self._connections[conn_id]
-
-        if dead_connections:
-            logger.info(
-                "Removed %d dead connections during broadcast",
-                len(dead_connections),
-            )
-
-        return sent_count
+        frame = OutgoingFrame(text=self._serialize(message), enqueued_at=time.monotonic())
+        key = coalesce_key if coalesce_key is not None else f"#{next(self._frame_ids)}"
+        for info in self._connections.values():
+            self._enqueue(info, key, frame)
+        return len(self._connections)
 
     async def broadcast_event(
         self,
@@ -290,24 +368,47 @@ class WebSocketManager:
         """
         Broadcast a typed event to all clients.
 
+        Events for the same type and project coalesce in the send queues of
+        slow clients. Clients that subscribed with ``"deltas": true`` receive
+        only the changed keys of ``data`` (with ``"delta": true``) once they
+        have the full state of that event type and project.
+
         Args:
             event_type: Type of event (e.g., "project_update", "metrics_update")
             data: Event data
             project_id: Optional project ID this event relates to
 
         Returns:
-            Number of clients that received the event
+            Number of clients the event was queued for
         """
-        message = {
+        topic = f"{event_type}:{project_id or ''}"
+        previous = self._topic_state.get(topic)
+        self._topic_state[topic] = dict(data)
+        if not self._connections:
+            return 0
+
+        message: dict[str, Any] = {
             "type": event_type,
             "data": data,
             "timestamp": time.time(),
         }
-
         if project_id:
             message["project_id"] = project_id
 
-        return await self.broadcast(message)
+        enqueued_at = time.monotonic()
+        full = OutgoingFrame(self._serialize(message), enqueued_at, topic)
+        delta = None
+        if previous is not None and previous.keys() <= data.keys():
+            changed = {k: v for k, v in data.items() if k not in previous or previous[k] != v}
+            delta_message = {**message, "data": changed, "delta": True}
+            delta = OutgoingFrame(self._serialize(delta_message), enqueued_at, topic)
+
+        for info in self._connections.values():
+            synced = topic in info.synced_topics and topic not in info.pending
+            frame = delta if delta is not None and info.accepts_deltas and synced else full
+            self._enqueue(info, topic, frame)
+            info.synced_topics.add(topic)
+        return len(self._connections)
 
     async def send_to_client(
         self,
@@ -322,11 +423,15 @@ class WebSocketManager:
             message: Message to send
 
         Returns:
-            True if sent, False if client not found or send failed
+            True if queued for the client, False if client not found
         """
         for info in self._connections.values():
             if info.client_id == client_id:
-                return await self._send_to_connection(info.websocket, message)
+                if "timestamp" not in message:
+                    message["timestamp"] = time.time()
+                frame = OutgoingFrame(self._serialize(message), time.monotonic())
+                self._enqueue(info, f"#{next(self._frame_ids)}", frame)
+                return True
 
         logger.warning("Client not found: %s", client_id)
         return False
@@ -336,24 +441,65 @@ class WebSocketManager:
         Get statistics about current connections.
 
         Returns:
-            Dictionary with connection statistics
+            Dictionary with connection statistics, including per-connection
+            send queue depth, dropped/coalesced frames and send lag
         """
         current_time = time.time()
-        return {
-            "total_connections": self.connection_count,
-            "connections": [
+        now = time.monotonic()
+        connections = []
+        for info in self._connections.values():
+            oldest = next(iter(info.pending.values()), None)
+            connections.append(
                 {
                     "client_id": info.client_id,
                     "connected_duration": current_time - info.connected_at,
                     "last_activity": current_time - info.last_activity,
+                    "queue_depth": len(info.pending),
+                    # Age of the oldest unsent frame: how far behind the client is now
+                    "queue_lag_ms": (now - oldest.enqueued_at) * 1000 if oldest else 0.0,
+                    "last_lag_ms": info.last_lag_ms,
+                    "max_lag_ms": info.max_lag_ms,
+                    "sent": info.sent_count,
+                    "dropped": info.dropped_count,
+                    "coalesced": info.coalesced_count,
                 }
-                for info in self._connections.values()
-            ],
+            )
+        return {
+            "total_connections": self.connection_count,
+            "connections": connections,
         }
 
+    def collect_metrics(self) -> list[MetricFamily]:
+        """Connection and send queue metrics for the Prometheus-style /metrics endpoint."""
+        now = time.monotonic()
+        queued = 0
+        max_lag = 0.0
+        for info in list(self._connections.values()):
+            queued += len(info.pending)
+            oldest = next(iter(info.pending.values()), None)
+            if oldest is not None:
+                max_lag = max(max_lag, now - oldest.enqueued_at)
+        return [
+            MetricFamily(
+                "lattice_dashboard_websocket_connections", "gauge", "Open WebSocket connections."
+            ).add(self.connection_count),
+            MetricFamily(
+                "lattice_dashboard_websocket_queued_frames",
+                "gauge",
+                "Frames waiting in WebSocket send queues.",
+            ).add(queued),
+            MetricFamily(
+                "lattice_dashboard_websocket_max_queue_lag_seconds",
+                "gauge",
+                "Age of the oldest unsent frame across connections.",
+            ).add(max_lag),
+        ]
+
     async def close_all(self) -> None:
         """Close all active WebSocket connections."""
         for info in list(self._connections.values()):
+            if info.sender_task is not None:
+                info.sender_task.cancel()
             try:
                 await info.websocket.close()
             except Exception as e:
@@ -21,6 +21,7 @@ from sqlalchemy.orm import Session, sessionmaker
 from sqlalchemy.pool import QueuePool
 
 from lattice_lock.database.models.base import Base
+from lattice_lock.metrics import MetricFamily, get_metrics_registry
 
 
 # Environment-based configuration
@@ -153,6 +154,40 @@ def _get_sync_session_factory() -> sessionmaker[Session]:
     return _sync_session_factory
 
 
+def pool_metric_families(engines: dict[str, Engine | None]) -> list[MetricFamily]:
+    """Connection pool usage of the given sync engines, labelled by engine name."""
+    families = {
+        "size": MetricFamily("lattice_db_pool_size", "gauge", "Configured connection pool size."),
+        "checkedout": MetricFamily(
+            "lattice_db_pool_checked_out", "gauge", "Connections currently checked out."
+        ),
+        "overflow": MetricFamily(
+            "lattice_db_pool_overflow", "gauge", "Connections opened beyond the pool size."
+        ),
+    }
+    for name, engine in engines.items():
+        if engine is None:
+            continue
+        for attr, family in families.items():
+            # Only QueuePool-style pools report these
+            stat = getattr(engine.pool, attr, None)
+            if stat is not None:
+                family.add(stat(), engine=name)
+    return list(families.values())
+
+
+def _collect_pool_metrics() -> list[MetricFamily]:
+    return pool_metric_families(
+        {
+            "async": _async_engine.sync_engine if _async_engine is not None else None,
+            "sync": _sync_engine,
+        }
+    )
+
+
+get_metrics_registry().register_collector(_collect_pool_metrics)
+
+
 # Public API
 
 
@@ -36,11 +36,15 @@ from lattice_lock.errors.classification import (
 from lattice_lock.errors.middleware import (
     ErrorHandler,
     ErrorMetrics,
+    ErrorPersistenceBuffer,
     RetryConfig,
+    SlidingWindowCounter,
     error_boundary,
     format_error_report,
+    get_error_persistence,
     get_metrics,
     handle_errors,
+    reset_error_persistence,
     reset_metrics,
     with_graceful_degradation,
 )
@@ -77,6 +81,8 @@ __all__ = [
     "get_remediation",
     "format_remediation",
     "ErrorMetrics",
+    "ErrorPersistenceBuffer",
+    "SlidingWindowCounter",
     "RetryConfig",
     "ErrorHandler",
     "error_boundary",
@@ -84,5 +90,7 @@ __all__ = [
     "with_graceful_degradation",
     "get_metrics",
     "reset_metrics",
+    "get_error_persistence",
+    "reset_error_persistence",
     "format_error_report",
 ]
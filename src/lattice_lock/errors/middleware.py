@@ -10,17 +10,72 @@ import functools
 import inspect
 import logging
 import time
+from collections import deque
 from collections.abc import Awaitable, Callable
 from dataclasses import dataclass, field
 from typing import Any, ParamSpec, TypeVar
 
 from lattice_lock.errors.classification import ErrorContext, classify_error
+from lattice_lock.metrics import MetricFamily, get_metrics_registry
 
 P = ParamSpec("P")
 R = TypeVar("R")
 
 logger = logging.getLogger("lattice_lock.errors")
 
+_ERRORS = get_metrics_registry().counter(
+    "lattice_errors_total", "Errors recorded by the error middleware.", ["error_type"]
+)
+
+# Length of the trailing window behind ErrorMetrics.error_rates, in seconds
+RATE_WINDOW_SECONDS = 60
+# Buckets per rate window; expired errors leave the rate one bucket (5 s) at a time
+RATE_WINDOW_BUCKETS = 12
+# Errors buffered for persistence before new ones are dropped
+PERSISTENCE_MAX_PENDING = 10_000
+# Errors written per database transaction
+PERSISTENCE_BATCH_SIZE = 500
+# Seconds the flusher waits for a batch to accumulate
+PERSISTENCE_FLUSH_INTERVAL = 0.5
+
+
+class SlidingWindowCounter:
+    """Count of events over a trailing window, kept in fixed time buckets.
+
+    Recording and reading touch a fixed number of slots and allocate nothing.
+    The window start is rounded down to a bucket boundary.
+    """
+
+    __slots__ = ("bucket_seconds", "_counts", "_epochs")
+
+    def __init__(
+        self, window_seconds: float = RATE_WINDOW_SECONDS, buckets: int = RATE_WINDOW_BUCKETS
+    ):
+        self.bucket_seconds = window_seconds / buckets
+        self._counts = [0] * buckets
+        # Absolute bucket number (timestamp // bucket_seconds) held by each slot
+        self._epochs = [-1] * buckets
+
+    def add(self, timestamp: float, count: int = 1) -> None:
+        epoch = int(timestamp // self.bucket_seconds)
+        slot = epoch % len(self._counts)
+        if self._epochs[slot] != epoch:
+            if epoch < self._epochs[slot]:
+                # Older than the window already recorded in this slot
+                return
+            self._epochs[slot] = epoch
+            self._counts[slot] = 0
+        self._counts[slot] += count
+
+    def count(self, now: float) -> int:
+        epoch = int(now // self.bucket_seconds)
+        oldest = epoch - len(self._counts) + 1
+        return sum(
+            count
+            for count, bucket in zip(self._counts, self._epochs, strict=True)
+            if oldest <= bucket <= epoch
+        )
+
 
 @dataclass
 class ErrorMetrics:
@@ -28,14 +83,14 @@ class ErrorMetrics:
 
     Attributes:
         error_counts: Count of errors by type
-        error_rates: Error rate per minute by type
-        last_errors: Timestamps of recent errors for rate calculation
+        error_rates: Errors in the last minute by type
+        rate_windows: Sliding window counters behind error_rates
         alert_thresholds: Thresholds for alerting
     """
 
     error_counts: dict[str, int] = field(default_factory=dict)
     error_rates: dict[str, float] = field(default_factory=dict)
-    last_errors: dict[str, list[float]] = field(default_factory=dict)
+    rate_windows: dict[str, SlidingWindowCounter] = field(default_factory=dict)
     alert_thresholds: dict[str, int] = field(
         default_factory=lambda: {
             "critical": 1,
@@ -51,52 +106,21 @@ class ErrorMetrics:
         current_time = time.time()
 
         self.error_counts[error_type] = self.error_counts.get(error_type, 0) + 1
+        _ERRORS.labels(error_type).inc()
 
-        if error_type not in self.last_errors:
-            self.last_errors[error_type] = []
-        self.last_errors[error_type].append(current_time)
-
-        cutoff = current_time - 60
-        self.last_errors[error_type] = [t for t in self.last_errors[error_type] if t > cutoff]
-        self.error_rates[error_type] = len(self.last_errors[error_type])
+        window = self.rate_windows.get(error_type)
+        if window is None:
+            window = self.rate_windows[error_type] = SlidingWindowCounter()
+        window.add(current_time)
+        self.error_rates[error_type] = window.count(current_time)
 
         # Improvement 7: Persistent Observability
         if project_id:
             self._enqueue_persistence(context, project_id)
 
     def _enqueue_persistence(self, context: ErrorContext, project_id: str) -> None:
-        """Enqueue error persistence as background task."""
-        from lattice_lock.utils.async_compat import get_background_queue
-
-        queue = get_background_queue()
-        try:
-            task = queue.enqueue(self._persist_error(context, project_id))
-            if task is None:
-                logger.debug("No event loop for error persistence")
-        except RuntimeError as e:
-            logger.warning(f"Could not enqueue persistence: {e}")
-
-    async def _persist_error(self, context: ErrorContext, project_id: str) -> None:
-        """Persist error to database."""
-        try:
-            from lattice_lock.admin.db import get_async_session
-            from lattice_lock.admin.services import record_project_error
-
-            session_maker = get_async_session()
-            async with session_maker() as db:
-                await record_project_error(
-                    db,
-                    project_id,
-                    context.error_code,
-                    context.message,
-                    str(context.severity),
-                    str(context.category),
-                    context.details,
-                )
-        except ImportError:
-            logger.info("Database module unavailable, skipping error persistence")
-        except Exception as e:
-            logger.warning(f"Error persistence failed: {e}")
+        """Buffer the error for batched persistence."""
+        get_error_persistence().add(context, project_id)
 
     def should_alert(self, context: ErrorContext) -> bool:
         """Check if an alert should be triggered based on thresholds."""
@@ -107,6 +131,9 @@ class ErrorMetrics:
 
     def get_summary(self) -> dict[str, Any]:
         """Get a summary of error metrics."""
+        now = time.time()
+        for error_type, window in self.rate_windows.items():
+            self.error_rates[error_type] = window.count(now)
         return {
             "total_errors": sum(self.error_counts.values()),
             "error_counts": dict(self.error_counts),
@@ -114,6 +141,130 @@ class ErrorMetrics:
         }
 
 
+class ErrorPersistenceBuffer:
+    """Persists project errors in batches, off the error path.
+
+    Errors are buffered in memory (at most ``max_pending``; further errors
+    are dropped and counted) and written by a flusher task, many rows per
+    transaction. The flusher starts with the first buffered error and exits
+    once the buffer is empty, so the background task queue drains it on
+    shutdown.
+    """
+
+    def __init__(
+        self,
+        max_pending: int = PERSISTENCE_MAX_PENDING,
+        batch_size: int = PERSISTENCE_BATCH_SIZE,
+        flush_interval: float = PERSISTENCE_FLUSH_INTERVAL,
+    ):
+        self.max_pending = max_pending
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self._pending: deque[dict[str, Any]] = deque()
+        self._flusher: asyncio.Task | None = None
+        self._dropped_since_flush = 0
+        self.persisted = 0
+        self.dropped = 0
+        self.failed = 0
+        get_metrics_registry().register_collector(self._collect_metrics)
+
+    @property
+    def pending_count(self) -> int:
+        return len(self._pending)
+
+    def add(self, context: ErrorContext, project_id: str) -> bool:
+        """Buffer an error; returns False if it was dropped because the buffer is full."""
+        if len(self._pending) >= self.max_pending:
+            self.dropped += 1
+            self._dropped_since_flush += 1
+            return False
+        self._pending.append(
+            {
+                "project_id": project_id,
+                "error_code": context.error_code,
+                "message": context.message,
+                "severity": str(context.severity),
+                "category": str(context.category),
+                "details": context.details,
+                "timestamp": time.time(),
+            }
+        )
+        self._ensure_flusher()
+        return True
+
+    def _ensure_flusher(self) -> None:
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            # Flushed by the next error recorded on an event loop
+            logger.debug("No event loop for error persistence")
+            return
+        flusher = self._flusher
+        if flusher is not None and not flusher.done() and flusher.get_loop() is loop:
+            return
+
+        from lattice_lock.utils.async_compat import get_background_queue
+
+        try:
+            self._flusher = get_background_queue().enqueue(self._flush_later())
+        except RuntimeError as e:
+            logger.warning(f"Could not enqueue persistence: {e}")
+
+    async def _flush_later(self) -> None:
+        await asyncio.sleep(self.flush_interval)
+        await self.flush()
+
+    async def flush(self) -> None:
+        """Write every buffered error, ``batch_size`` rows per transaction."""
+        while self._pending:
+            batch = [
+                self._pending.popleft() for _ in range(min(self.batch_size, len(self._pending)))
+            ]
+            await self._write(batch)
+        if self._dropped_since_flush:
+            logger.warning(
+                f"Dropped {self._dropped_since_flush} errors: persistence buffer full "
+                f"({self.max_pending} pending)"
+            )
+            self._dropped_since_flush = 0
+
+    async def _write(self, batch: list[dict[str, Any]]) -> None:
+        try:
+            from lattice_lock.admin.db import get_async_session
+            from lattice_lock.admin.services import record_project_errors
+
+            session_maker = get_async_session()
+            async with session_maker() as db:
+                self.persisted += await record_project_errors(db, batch)
+        except ImportError:
+            self.failed += len(batch)
+            logger.info("Database module unavailable, skipping error persistence")
+        except Exception as e:
+            self.failed += len(batch)
+            logger.warning(f"Error persistence failed for {len(batch)} errors: {e}")
+
+    def _collect_metrics(self) -> list[MetricFamily]:
+        """Report buffer state to the metrics registry."""
+        return [
+            MetricFamily(
+                "lattice_error_persistence_pending", "gauge", "Errors waiting to be persisted."
+            ).add(len(self._pending)),
+            MetricFamily(
+                "lattice_error_persistence_persisted_total", "counter", "Errors persisted."
+            ).add(self.persisted),
+            MetricFamily(
+                "lattice_error_persistence_dropped_total",
+                "counter",
+                "Errors dropped because the persistence buffer was full.",
+            ).add(self.dropped),
+            MetricFamily(
+                "lattice_error_persistence_failed_total",
+                "counter",
+                "Errors lost to failed persistence writes.",
+            ).add(self.failed),
+        ]
+
+
 _global_metrics = ErrorMetrics()
 
 
@@ -128,6 +279,20 @@ def reset_metrics() -> None:
     _global_metrics = ErrorMetrics()
 
 
+_global_persistence = ErrorPersistenceBuffer()
+
+
+def get_error_persistence() -> ErrorPersistenceBuffer:
+    """Get the global error persistence buffer."""
+    return _global_persistence
+
+
+def reset_error_persistence() -> None:
+    """Reset the global error persistence buffer (useful for testing)."""
+    global _global_persistence
+    _global_persistence = ErrorPersistenceBuffer()
+
+
 @dataclass
 class RetryConfig:
     """Configuration for retry behavior.
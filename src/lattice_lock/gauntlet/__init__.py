@@ -3,5 +3,6 @@ Lattice Lock Gauntlet Module
 """
 
 from .generator import GauntletGenerator
+from .runner import GauntletRunSummary, run_gauntlet_async
 
-__all__ = ["GauntletGenerator"]
+__all__ = ["GauntletGenerator", "GauntletRunSummary", "run_gauntlet_async"]
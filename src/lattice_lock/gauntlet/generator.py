@@ -4,6 +4,7 @@ from pathlib import Path
 from jinja2 import FileSystemLoader
 
 from lattice_lock.config.feature_flags import Feature, is_feature_enabled
+from lattice_lock.profiling import stage
 from lattice_lock.utils.jinja import get_code_environment
 
 from .parser import EnsuresClause, EntityDefinition, LatticeParser
@@ -35,15 +36,17 @@ class GauntletGenerator:
             )
             return
 
-        entities = self.parser.parse()
+        with stage("parse"):
+            entities = self.parser.parse()
         self.output_dir.mkdir(parents=True, exist_ok=True)
 
         template = self.env.get_template("test_contract.py.j2")
 
         for entity in entities:
-            test_file_content = self._generate_test_file(entity, template)
+            with stage("generate"):
+                test_file_content = self._generate_test_file(entity, template)
             output_file = self.output_dir / f"test_contract_{entity.name}.py"
-            with open(output_file, "w") as f:
+            with stage("write"), open(output_file, "w") as f:
                 f.write(test_file_content)
 
     def _generate_test_file(self, entity: EntityDefinition, template) -> str:
@@ -1,6 +1,7 @@
 import json
 import logging
 import os
+import sys
 import time
 from pathlib import Path
 from typing import Any
@@ -9,6 +10,11 @@ from lattice_lock.utils.safe_path import resolve_under_root
 
 logger = logging.getLogger("lattice_lock.gauntlet")
 
+# Prefix for per-test progress events written to stderr when GAUNTLET_STREAM_EVENTS=true.
+# Consumed by lattice_lock.gauntlet.runner to stream progress from a pytest subprocess.
+EVENT_PREFIX = "GAUNTLET_EVENT "
+DEFAULT_REPORT_PATH = "gauntlet_report.json"
+
 
 class GauntletPlugin:
     """
@@ -19,6 +25,8 @@ class GauntletPlugin:
     Attributes:
         json_report (bool): Whether to generate a JSON report.
         github_report (bool): Whether to generate a GitHub Summary.
+        stream_events (bool): Whether to write a JSON event line to stderr per test.
+        report_path (str): Where the JSON report is written.
         results (List[Dict]): List of test results.
         start_time (float): Session start time.
     """
@@ -27,6 +35,8 @@ class GauntletPlugin:
         # Allow configuration via init args OR environment variables
         self.json_report = json_report or os.environ.get("GAUNTLET_JSON_REPORT") == "true"
         self.github_report = github_report or os.environ.get("GAUNTLET_GITHUB_REPORT") == "true"
+        self.stream_events = os.environ.get("GAUNTLET_STREAM_EVENTS") == "true"
+        self.report_path = os.environ.get("GAUNTLET_REPORT_PATH", DEFAULT_REPORT_PATH)
         self.results: list[dict[str, Any]] = []
         self.start_time = 0.0
 
@@ -36,7 +46,8 @@ class GauntletPlugin:
 
     def pytest_runtest_logreport(self, report):
         """Hook called for each test report."""
-        if report.when == "call":
+        # Skips and setup errors are only reported in the setup phase
+        if report.when == "call" or (report.when == "setup" and not report.passed):
             # Collect result for JSON report
             result = {
                 "nodeid": report.nodeid,
@@ -50,6 +61,11 @@ class GauntletPlugin:
 
             self.results.append(result)
 
+            if self.stream_events:
+                event = {"nodeid": report.nodeid, "outcome": report.outcome}
+                sys.stderr.write(f"{EVENT_PREFIX}{json.dumps(event)}\n")
+                sys.stderr.flush()
+
             # GitHub Annotations
             if self.github_report and report.failed:
                 # Format: ::error file={name},line={line},endLine={endLine},title={title}::{message}
@@ -81,7 +97,7 @@ class GauntletPlugin:
                     "skipped": len([r for r in self.results if r["outcome"] == "skipped"]),
                 },
             }
-            with open("gauntlet_report.json", "w") as f:
+            with open(self.report_path, "w") as f:
                 json.dump(report_data, f, indent=2)
 
         if self.github_report:
@@ -123,3 +139,9 @@ class GauntletPlugin:
 
                 with open(summary_path, "a") as f:
                     f.write(markdown)
+
+
+def pytest_configure(config):
+    """Register a GauntletPlugin instance when loaded with ``-p lattice_lock.gauntlet.plugin``."""
+    if not config.pluginmanager.has_plugin("gauntlet-reporter"):
+        config.pluginmanager.register(GauntletPlugin(), "gauntlet-reporter")
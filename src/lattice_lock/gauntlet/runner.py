@@ -0,0 +1,256 @@
+"""
+Asynchronous Gauntlet test runner.
+
+Runs pytest in one or more subprocesses without blocking the event loop,
+streams per-test progress as it happens, supports cancellation, and builds a
+structured summary from the JSON reports written by GauntletPlugin.
+"""
+
+import asyncio
+import contextlib
+import inspect
+import json
+import logging
+import os
+import sys
+import tempfile
+from collections import deque
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any
+
+from .plugin import EVENT_PREFIX
+
+logger = logging.getLogger("lattice_lock.gauntlet")
+
+# Called with (event, completed_count) for every test result as it is reported.
+ProgressCallback = Callable[[dict[str, Any], int], Awaitable[None] | None]
+
+# Seconds to wait for pytest to exit after SIGTERM before killing it on cancellation
+TERMINATE_GRACE_PERIOD = 5.0
+
+
+@dataclass
+class GauntletRunSummary:
+    """Structured result of an asynchronous Gauntlet run."""
+
+    exitcode: int = 0
+    duration: float = 0.0
+    total: int = 0
+    passed: int = 0
+    failed: int = 0
+    skipped: int = 0
+    shards: int = 1
+    failures: list[dict[str, Any]] = field(default_factory=list)
+    output_tail: str = ""
+
+    @property
+    def success(self) -> bool:
+        return self.exitcode == 0
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "success": self.success,
+            "exitcode": self.exitcode,
+            "duration": self.duration,
+            "shards": self.shards,
+            "summary": {
+                "total": self.total,
+                "passed": self.passed,
+                "failed": self.failed,
+                "skipped": self.skipped,
+            },
+            "failures": self.failures,
+            "output_tail": self.output_tail,
+        }
+
+
+def shard_test_files(test_dir: Path, shards: int) -> list[list[Path]]:
+    """Split the test files under ``test_dir`` into at most ``shards`` balanced groups.
+
+    Files are assigned largest-first to the currently smallest shard, using file
+    size as a cheap proxy for test count.
+    """
+    files = sorted(test_dir.rglob("test_*.py"), key=lambda p: p.stat().st_size, reverse=True)
+    shards = max(1, min(shards, len(files)))
+    groups: list[list[Path]] = [[] for _ in range(shards)]
+    sizes = [0] * shards
+    for path in files:
+        idx = sizes.index(min(sizes))
+        groups[idx].append(path)
+        sizes[idx] += path.stat().st_size
+    return [sorted(g) for g in groups if g]
+
+
+async def run_gauntlet_async(
+    test_dir: str | Path,
+    shards: int = 1,
+    on_progress: ProgressCallback | None = None,
+    extra_args: list[str] | None = None,
+    output_tail_lines: int = 40,
+) -> GauntletRunSummary:
+    """Run the Gauntlet tests in ``test_dir`` as asynchronous pytest subprocesses.
+
+    Args:
+        test_dir: Directory containing generated Gauntlet tests.
+        shards: Number of pytest processes to run in parallel.
+        on_progress: Optional callback (sync or async) invoked per test result.
+        extra_args: Additional pytest arguments passed to every shard.
+        output_tail_lines: Number of trailing stdout lines kept per shard.
+
+    Returns:
+        GauntletRunSummary merged across all shards.
+
+    Raises:
+        asyncio.CancelledError: If the run is cancelled; all pytest processes are
+            terminated before the error propagates.
+    """
+    test_dir = Path(test_dir)
+    if not test_dir.exists():
+        raise FileNotFoundError(f"Test directory {test_dir} does not exist")
+
+    groups = shard_test_files(test_dir, shards) if shards > 1 else [[test_dir]]
+    loop = asyncio.get_running_loop()
+    start = loop.time()
+    completed = 0
+
+    async def _report(event: dict[str, Any]) -> None:
+        nonlocal completed
+        completed += 1
+        if on_progress is not None:
+            result = on_progress(event, completed)
+            if inspect.isawaitable(result):
+                await result
+
+    with tempfile.TemporaryDirectory(prefix="gauntlet-") as report_dir:
+        tasks = [
+            asyncio.create_task(
+                _run_shard(
+                    targets,
+                    Path(report_dir) / f"shard-{i}.json",
+                    _report,
+                    extra_args or [],
+                    output_tail_lines,
+                )
+            )
+            for i, targets in enumerate(groups)
+        ]
+        try:
+            shard_results = await asyncio.gather(*tasks)
+        except BaseException:
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+            raise
+
+    summary = _merge_reports(shard_results)
+    summary.shards = len(groups)
+    summary.duration = loop.time() - start
+    return summary
+
+
+async def _run_shard(
+    targets: list[Path],
+    report_path: Path,
+    report_event: Callable[[dict[str, Any]], Awaitable[None]],
+    extra_args: list[str],
+    output_tail_lines: int,
+) -> tuple[int, dict[str, Any] | None, str]:
+    """Run one pytest process; returns (exitcode, json report or None, stdout tail)."""
+    env = dict(os.environ)
+    env.update(
+        {
+            "GAUNTLET_JSON_REPORT": "true",
+            "GAUNTLET_STREAM_EVENTS": "true",
+            "GAUNTLET_REPORT_PATH": str(report_path),
+        }
+    )
+    cmd = [
+        sys.executable,
+        "-m",
+        "pytest",
+        *[str(t) for t in targets],
+        "-p",
+        "lattice_lock.gauntlet.plugin",
+        "--tb=short",
+        "-q",
+        *extra_args,
+    ]
+    process = await asyncio.create_subprocess_exec(
+        *cmd, stdout=asyncio.subprocess.PIPE, stderr=asyncio.subprocess.PIPE, env=env
+    )
+    stdout, stderr = process.stdout, process.stderr
+    if stdout is None or stderr is None:
+        raise RuntimeError("Gauntlet subprocess was started without output pipes")
+
+    async def _read_events() -> None:
+        async for raw in stderr:
+            line = raw.decode(errors="replace").rstrip("\n")
+            if line.startswith(EVENT_PREFIX):
+                try:
+                    await report_event(json.loads(line[len(EVENT_PREFIX) :]))
+                except json.JSONDecodeError:
+                    logger.debug(f"Malformed gauntlet event: {line}")
+
+    async def _read_output() -> str:
+        tail: deque[str] = deque(maxlen=output_tail_lines)
+        async for raw in stdout:
+            tail.append(raw.decode(errors="replace").rstrip("\n"))
+        return "\n".join(tail)
+
+    try:
+        _, output_tail, exitcode = await asyncio.gather(
+            _read_events(), _read_output(), process.wait()
+        )
+    except asyncio.CancelledError:
+        await _terminate(process)
+        raise
+
+    report = None
+    if report_path.exists():
+        try:
+            report = json.loads(report_path.read_text())
+        except json.JSONDecodeError as e:
+            logger.warning(f"Could not parse gauntlet report {report_path}: {e}")
+    return exitcode, report, output_tail
+
+
+async def _terminate(process: asyncio.subprocess.Process) -> None:
+    """Stop a pytest subprocess, escalating to SIGKILL after the grace period."""
+    if process.returncode is not None:
+        return
+    with contextlib.suppress(ProcessLookupError):
+        process.terminate()
+    try:
+        await asyncio.wait_for(process.wait(), timeout=TERMINATE_GRACE_PERIOD)
+    except asyncio.TimeoutError:
+        with contextlib.suppress(ProcessLookupError):
+            process.kill()
+        await process.wait()
+
+
+def _merge_reports(
+    shard_results: list[tuple[int, dict[str, Any] | None, str]],
+) -> GauntletRunSummary:
+    summary = GauntletRunSummary()
+    tails = []
+    for exitcode, report, tail in shard_results:
+        # pytest exit code 5 means "no tests collected" for this shard, which is not a failure
+        if exitcode not in (0, 5) and summary.exitcode == 0:
+            summary.exitcode = exitcode
+        tails.append(tail)
+        if report is None:
+            continue
+        counts = report.get("summary", {})
+        summary.total += counts.get("total", 0)
+        summary.passed += counts.get("passed", 0)
+        summary.failed += counts.get("failed", 0)
+        summary.skipped += counts.get("skipped", 0)
+        summary.failures.extend(
+            {"nodeid": t["nodeid"], "error": t.get("error")}
+            for t in report.get("tests", [])
+            if t.get("outcome") == "failed"
+        )
+    summary.output_tail = "\n".join(t for t in tails if t)
+    return summary
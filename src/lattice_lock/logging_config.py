@@ -6,16 +6,22 @@ Provides consistent logging setup across all modules with support for:
 - JSON formatting for production environments
 - Trace ID propagation for request tracking
 - Sensitive data redaction
+- Queue-based logging that moves formatting and I/O off the calling thread
 """
 
+import atexit
+import copy
+import functools
 import json
 import logging
 import os
+import queue
+import re
 import sys
 import uuid
 from contextvars import ContextVar
-from datetime import datetime, timedelta
-from logging.handlers import RotatingFileHandler
+from datetime import datetime, timedelta, timezone
+from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler
 from pathlib import Path
 from typing import Any
 
@@ -49,6 +55,18 @@ class TraceIdFilter(logging.Filter):
         return True
 
 
+@functools.lru_cache(maxsize=8)
+def _compile_redaction(keys: frozenset[str]) -> re.Pattern[str]:
+    """One case-insensitive pattern matching ``key=value``/``key: value`` for any key."""
+    # Longest keys first so "authorization" wins over "auth"; values that are already
+    # redacted are skipped, since the filter runs once per handler on the same record
+    alternatives = "|".join(re.escape(k) for k in sorted(keys, key=len, reverse=True))
+    return re.compile(
+        rf"""({alternatives})(["']?(?:=|: ?)["']?)(?!\[REDACTED\])((?:bearer\s+)?[^\s,}}\]"']+)""",
+        re.IGNORECASE,
+    )
+
+
 class SensitiveDataFilter(logging.Filter):
     """Filter that redacts sensitive data from log messages."""
 
@@ -65,32 +83,81 @@ class SensitiveDataFilter(logging.Filter):
         "bearer",
     }
 
+    def __init__(self, name: str = "") -> None:
+        super().__init__(name)
+        self._keys = tuple(k.lower() for k in self.SENSITIVE_PATTERNS)
+        self._pattern = _compile_redaction(frozenset(self._keys))
+
     def filter(self, record: logging.LogRecord) -> bool:
-        if hasattr(record, "msg") and isinstance(record.msg, str):
-            record.msg = self._redact_message(record.msg)
+        if isinstance(getattr(record, "msg", None), str):
+            if record.args:
+                # Values usually arrive as arguments ("token=%s"), so redact the merged message
+                if self._mentions_key(record.msg):
+                    try:
+                        message = record.getMessage()
+                    except (TypeError, ValueError):
+                        # Bad format arguments: leave them for Handler.handleError to report
+                        record.msg = self._redact_message(record.msg)
+                        return True
+                    redacted = self._redact_message(message)
+                    if redacted != message:
+                        record.msg, record.args = redacted, None
+            else:
+                record.msg = self._redact_message(record.msg)
         return True
 
-    def _redact_message(self, message: str) -> str:
-        """Redact sensitive patterns from message."""
+    def _mentions_key(self, message: str) -> bool:
+        # Substring checks are far cheaper than running the pattern over every message
         lower_msg = message.lower()
-        for pattern in self.SENSITIVE_PATTERNS:
-            if pattern in lower_msg:
-                # Simple redaction - replace values after sensitive keys
-                import re
+        return any(key in lower_msg for key in self._keys)
 
-                # Match patterns like key=value, key: value, "key": "value"
-                for sep in ["=", ":", ": "]:
-                    regex = rf'({pattern}){sep}([^\s,}}\]"\']+)'
-                    message = re.sub(regex, rf"\1{sep}[REDACTED]", message, flags=re.IGNORECASE)
-        return message
+    def _redact_message(self, message: str) -> str:
+        """Redact values after sensitive keys (key=value, key: value, "key": "value")."""
+        if not self._mentions_key(message):
+            return message
+        return self._pattern.sub(r"\1\2[REDACTED]", message)
+
+
+# LogRecord attributes that are not user-supplied ``extra`` fields
+_RECORD_ATTRIBUTES = frozenset(
+    {
+        "name",
+        "msg",
+        "args",
+        "asctime",
+        "created",
+        "filename",
+        "funcName",
+        "levelname",
+        "levelno",
+        "lineno",
+        "module",
+        "msecs",
+        "pathname",
+        "process",
+        "processName",
+        "relativeCreated",
+        "stack_info",
+        "exc_info",
+        "exc_text",
+        "thread",
+        "threadName",
+        "trace_id",
+        "message",
+        "taskName",
+    }
+)
 
 
 class JSONFormatter(logging.Formatter):
     """JSON formatter for structured logging in production environments."""
 
     def format(self, record: logging.LogRecord) -> str:
+        # Use the time the record was created, which may be well before it is
+        # formatted when logging through a queue
+        timestamp = datetime.fromtimestamp(record.created, timezone.utc).replace(tzinfo=None)
         log_data: dict[str, Any] = {
-            "timestamp": datetime.utcnow().isoformat() + "Z",
+            "timestamp": timestamp.isoformat() + "Z",
             "level": record.levelname,
             "logger": record.name,
             "message": record.getMessage(),
@@ -108,42 +175,59 @@ class JSONFormatter(logging.Formatter):
         # Add exception info if present
         if record.exc_info:
             log_data["exception"] = self.formatException(record.exc_info)
+        elif record.exc_text:
+            log_data["exception"] = record.exc_text
 
         # Add extra fields
-        extra_fields = {
-            k: v
-            for k, v in record.__dict__.items()
-            if k
-            not in {
-                "name",
-                "msg",
-                "args",
-                "created",
-                "filename",
-                "funcName",
-                "levelname",
-                "levelno",
-                "lineno",
-                "module",
-                "msecs",
-                "pathname",
-                "process",
-                "processName",
-                "relativeCreated",
-                "stack_info",
-                "exc_info",
-                "exc_text",
-                "thread",
-                "threadName",
-                "trace_id",
-                "message",
-                "taskName",
-            }
-        }
+        extra_fields = {k: v for k, v in record.__dict__.items() if k not in _RECORD_ATTRIBUTES}
         if extra_fields:
             log_data["extra"] = extra_fields
 
-        return json.dumps(log_data)
+        return json.dumps(log_data, default=str)
+
+
+class LogQueueHandler(QueueHandler):
+    """
+    Hands records to a QueueListener thread instead of formatting and writing them.
+
+    Only the message arguments are merged on the calling thread (they may be
+    mutated after the call returns); formatting, redaction and I/O happen in
+    the listener. When the queue is full, records are dropped and counted
+    rather than blocking the caller.
+    """
+
+    def __init__(self, log_queue: queue.Queue) -> None:
+        super().__init__(log_queue)
+        self.dropped = 0
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        record = copy.copy(record)
+        record.msg = record.getMessage()
+        record.args = None
+        return record
+
+    def enqueue(self, record: logging.LogRecord) -> None:
+        try:
+            self.queue.put_nowait(record)
+        except queue.Full:
+            self.dropped += 1
+
+
+# Records buffered for the listener thread before new ones are dropped
+DEFAULT_LOG_QUEUE_SIZE = 10000
+
+_queue_listener: QueueListener | None = None
+
+
+def shutdown_logging() -> None:
+    """Flush queued records and stop the listener thread started by setup_logging."""
+    global _queue_listener
+    if _queue_listener is not None:
+        _queue_listener.stop()
+        _queue_listener = None
+
+
+atexit.register(shutdown_logging)
 
 
 class ConsoleFormatter(logging.Formatter):
@@ -173,6 +257,8 @@ def setup_logging(
     log_file_backup_count: int = 5,
     include_trace_id: bool = True,
     simple_format: bool = False,
+    use_queue: bool = False,
+    queue_size: int = DEFAULT_LOG_QUEUE_SIZE,
 ) -> logging.Logger:
     """
     Configure logging for the Lattice Lock framework.
@@ -185,6 +271,9 @@ def setup_logging(
         log_file_backup_count: Number of backup files to keep
         include_trace_id: Include trace ID in log messages
         simple_format: Use simple message-only format (for CLI)
+        use_queue: Log through a queue so formatting, redaction and I/O run on
+            a background listener thread instead of the calling thread
+        queue_size: Records buffered for the listener before new ones are dropped
 
     Returns:
         The root lattice_lock logger
@@ -198,11 +287,13 @@ def setup_logging(
     root_logger.setLevel(level)
 
     # Clear existing handlers
+    shutdown_logging()
     root_logger.handlers.clear()
 
     # Create filters
     trace_filter = TraceIdFilter()
     sensitive_filter = SensitiveDataFilter()
+    handlers: list[logging.Handler] = []
 
     # Console handler
     console_handler = logging.StreamHandler(sys.stderr)
@@ -214,10 +305,7 @@ def setup_logging(
         console_handler.setFormatter(JSONFormatter())
     else:
         console_handler.setFormatter(ConsoleFormatter(include_trace_id=include_trace_id))
-
-    console_handler.addFilter(trace_filter)
-    console_handler.addFilter(sensitive_filter)
-    root_logger.addHandler(console_handler)
+    handlers.append(console_handler)
 
     # File handler (if specified)
     if log_file:
@@ -235,9 +323,24 @@ def setup_logging(
 
         # Always use JSON format for file logging
         file_handler.setFormatter(JSONFormatter())
-        file_handler.addFilter(trace_filter)
-        file_handler.addFilter(sensitive_filter)
-        root_logger.addHandler(file_handler)
+        handlers.append(file_handler)
+
+    for handler in handlers:
+        handler.addFilter(sensitive_filter)
+
+    if use_queue:
+        global _queue_listener
+        # The trace ID lives in a context variable, so it is read on the calling thread
+        queue_handler = LogQueueHandler(queue.Queue(maxsize=queue_size))
+        queue_handler.setLevel(level)
+        queue_handler.addFilter(trace_filter)
+        root_logger.addHandler(queue_handler)
+        _queue_listener = QueueListener(queue_handler.queue, *handlers, respect_handler_level=True)
+        _queue_listener.start()
+    else:
+        for handler in handlers:
+            handler.addFilter(trace_filter)
+            root_logger.addHandler(handler)
 
     # Prevent propagation to root logger
     root_logger.propagate = False
@@ -270,17 +373,20 @@ def configure_from_environment() -> logging.Logger:
         LATTICE_LOG_JSON: Enable JSON format (default: false)
         LATTICE_LOG_FILE: Log file path (optional)
         LATTICE_LOG_SIMPLE: Use simple format for CLI (default: false)
+        LATTICE_LOG_ASYNC: Log through a background queue listener (default: false)
     """
     level = os.environ.get("LATTICE_LOG_LEVEL", "INFO")
     json_format = os.environ.get("LATTICE_LOG_JSON", "").lower() in ("true", "1", "yes")
     log_file = os.environ.get("LATTICE_LOG_FILE")
     simple_format = os.environ.get("LATTICE_LOG_SIMPLE", "").lower() in ("true", "1", "yes")
+    use_queue = os.environ.get("LATTICE_LOG_ASYNC", "").lower() in ("true", "1", "yes")
 
     return setup_logging(
         level=level,
         json_format=json_format,
         log_file=log_file,
         simple_format=simple_format,
+        use_queue=use_queue,
     )
 
 
@@ -2,6 +2,7 @@
 Lattice Lock MCP Server module.
 """
 
+from .runtime import ToolRuntime
 from .server import LatticeMCPServer
 
-__all__ = ["LatticeMCPServer"]
+__all__ = ["LatticeMCPServer", "ToolRuntime"]
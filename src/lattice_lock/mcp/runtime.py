@@ -0,0 +1,105 @@
+"""
+Long-lived resources shared by MCP tool calls.
+
+The MCP server keeps one ToolRuntime for its lifetime so that tool calls reuse
+a single ModelOrchestrator (registry, client pool and analyzer cache) and a
+warm Sheriff cache, and run CPU-bound work in a bounded worker pool instead of
+on the event loop.
+"""
+
+import asyncio
+import functools
+import logging
+import os
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Any, TypeVar
+
+from lattice_lock.orchestrator.core import ModelOrchestrator
+from lattice_lock.sheriff.cache import SheriffCache, get_config_hash
+from lattice_lock.sheriff.config import SheriffConfig
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+DEFAULT_MAX_WORKERS = min(4, os.cpu_count() or 1)
+
+
+class ToolRuntime:
+    """
+    Shared state for MCP tool handlers.
+
+    Resources are created lazily on first use and released by shutdown().
+    """
+
+    def __init__(
+        self,
+        max_workers: int = DEFAULT_MAX_WORKERS,
+        sheriff_cache_dir: Path = Path(".sheriff_cache"),
+        orchestrator_factory: Callable[[], ModelOrchestrator] = ModelOrchestrator,
+    ):
+        self.max_workers = max_workers
+        self.sheriff_cache_dir = sheriff_cache_dir
+        self._orchestrator_factory = orchestrator_factory
+        self._orchestrator: ModelOrchestrator | None = None
+        self._sheriff_cache: SheriffCache | None = None
+        self._executor: ThreadPoolExecutor | None = None
+        self._closed = False
+
+    @property
+    def orchestrator(self) -> ModelOrchestrator:
+        """The shared orchestrator, created on first access."""
+        self._check_open()
+        if self._orchestrator is None:
+            self._orchestrator = self._orchestrator_factory()
+        return self._orchestrator
+
+    @property
+    def sheriff_cache(self) -> SheriffCache:
+        """Sheriff cache for the default configuration, loaded from disk on first access."""
+        self._check_open()
+        if self._sheriff_cache is None:
+            cache = SheriffCache(
+                cache_dir=self.sheriff_cache_dir, config_hash=get_config_hash(SheriffConfig())
+            )
+            cache.load()
+            self._sheriff_cache = cache
+        return self._sheriff_cache
+
+    async def run_in_worker(self, func: Callable[..., T], *args: Any, **kwargs: Any) -> T:
+        """Run a blocking or CPU-bound callable in the worker pool."""
+        self._check_open()
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(
+                max_workers=self.max_workers, thread_name_prefix="lattice-mcp"
+            )
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._executor, functools.partial(func, *args, **kwargs))
+
+    async def shutdown(self) -> None:
+        """Close pooled clients, drain the worker pool and persist the Sheriff cache."""
+        if self._closed:
+            return
+        self._closed = True
+
+        if self._orchestrator is not None:
+            try:
+                await self._orchestrator.shutdown()
+            except Exception as e:
+                logger.warning(f"Error shutting down orchestrator: {e}")
+            self._orchestrator = None
+
+        if self._executor is not None:
+            # Wait for in-flight validations so the cache is not mutated while saving.
+            await asyncio.to_thread(self._executor.shutdown, wait=True)
+            self._executor = None
+
+        if self._sheriff_cache is not None:
+            self._sheriff_cache.save()
+            self._sheriff_cache = None
+
+    def _check_open(self) -> None:
+        if self._closed:
+            raise RuntimeError("ToolRuntime has been shut down")
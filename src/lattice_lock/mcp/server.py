@@ -10,6 +10,7 @@ from mcp.server.stdio import stdio_server
 from mcp.types import EmbeddedResource, GetPromptResult, ImageContent, Prompt, TextContent, Tool
 
 from lattice_lock.config.feature_flags import Feature, is_feature_enabled
+from lattice_lock.mcp.runtime import ToolRuntime
 from lattice_lock.mcp.templates import GOVERNANCE_CHECK_PROMPT, MCP_PROMPTS
 from lattice_lock.mcp.tools import get_tools, handle_tool_call
 
@@ -22,8 +23,10 @@ class LatticeMCPServer:
     Exposes Sheriff, Gauntlet, and Orchestrator as tools.
     """
 
-    def __init__(self, name: str = "lattice-lock"):
+    def __init__(self, name: str = "lattice-lock", runtime: ToolRuntime | None = None):
         self.server = Server(name)
+        # One orchestrator, Sheriff cache and worker pool for the server's lifetime
+        self.runtime = runtime or ToolRuntime()
         self._setup_handlers()
 
     def _setup_handlers(self):
@@ -37,7 +40,9 @@ class LatticeMCPServer:
         async def call_tool(
             name: str, arguments: dict[str, Any]
         ) -> list[TextContent | ImageContent | EmbeddedResource]:
-            return await handle_tool_call(name, arguments)
+            return await handle_tool_call(
+                name, arguments, runtime=self.runtime, on_progress=self._progress_reporter()
+            )
 
         @self.server.list_prompts()
         async def list_prompts() -> list[Prompt]:
@@ -60,15 +65,45 @@ class LatticeMCPServer:
             # Fallback for others (stub)
             return GetPromptResult(description="Prompt template", messages=[])
 
+    def _progress_reporter(self):
+        """Build a callback that forwards tool progress as MCP progress notifications.
+
+        Returns None when the client did not supply a progress token for the request.
+        """
+        try:
+            ctx = self.server.request_context
+        except LookupError:
+            return None
+        token = ctx.meta.progressToken if ctx.meta else None
+        if token is None:
+            return None
+
+        async def report(event: dict[str, Any], completed: int) -> None:
+            await ctx.session.send_progress_notification(
+                token,
+                completed,
+                message=f"{event.get('outcome', '?')}: {event.get('nodeid', '')}",
+                related_request_id=str(ctx.request_id),
+            )
+
+        return report
+
     async def run_stdio(self):
         """Run the server using stdio transport."""
         if not is_feature_enabled(Feature.MCP):
             logger.error("MCP feature is disabled. Check LATTICE_DISABLED_FEATURES.")
             return
 
-        async with stdio_server() as (read_stream, write_stream):
-            await self.server.run(
-                read_stream,
-                write_stream,
-                self.server.create_initialization_options(),
-            )
+        try:
+            async with stdio_server() as (read_stream, write_stream):
+                await self.server.run(
+                    read_stream,
+                    write_stream,
+                    self.server.create_initialization_options(),
+                )
+        finally:
+            await self.shutdown()
+
+    async def shutdown(self):
+        """Release pooled clients and worker threads held by the tool runtime."""
+        await self.runtime.shutdown()
@@ -4,18 +4,29 @@ Tool definitions for Lattice Lock MCP Server.
 
 import json
 import logging
-import subprocess
 from pathlib import Path
 from typing import Any
 
 from mcp.types import EmbeddedResource, ImageContent, TextContent, Tool
 
 from lattice_lock.gauntlet.generator import GauntletGenerator
-from lattice_lock.orchestrator.core import ModelOrchestrator
+from lattice_lock.gauntlet.runner import ProgressCallback, run_gauntlet_async
+from lattice_lock.mcp.runtime import ToolRuntime
 from lattice_lock.sheriff.sheriff import run_sheriff
 
 logger = logging.getLogger(__name__)
 
+# Runtime used when handle_tool_call is invoked without one (e.g. outside LatticeMCPServer)
+_default_runtime: ToolRuntime | None = None
+
+
+def get_default_runtime() -> ToolRuntime:
+    """Return the process-wide ToolRuntime, creating it on first use."""
+    global _default_runtime
+    if _default_runtime is None:
+        _default_runtime = ToolRuntime()
+    return _default_runtime
+
 
 def get_tools() -> list[Tool]:
     """Return list of available MCP tools."""
@@ -51,7 +62,10 @@ def get_tools() -> list[Tool]:
         ),
         Tool(
             name="run_tests",
-            description="Run Gauntlet tests (generates them first if needed).",
+            description=(
+                "Run Gauntlet tests (generates them first if needed). "
+                "Streams per-test progress notifications and returns a JSON summary."
+            ),
             inputSchema={
                 "type": "object",
                 "properties": {
@@ -63,6 +77,11 @@ def get_tools() -> list[Tool]:
                         "type": "string",
                         "description": "Path to lattice.yaml (default: lattice.yaml)",
                     },
+                    "shards": {
+                        "type": "integer",
+                        "minimum": 1,
+                        "description": "Number of parallel pytest processes (default: 1)",
+                    },
                 },
             },
         ),
@@ -84,15 +103,30 @@ def _validate_safe_path(path_str: str) -> Path:
 
 
 async def handle_tool_call(
-    name: str, arguments: dict[str, Any]
+    name: str,
+    arguments: dict[str, Any],
+    runtime: ToolRuntime | None = None,
+    on_progress: ProgressCallback | None = None,
 ) -> list[TextContent | ImageContent | EmbeddedResource]:
-    """Handle execution of tool calls."""
+    """Handle execution of tool calls.
+
+    Args:
+        name: Tool name.
+        arguments: Tool arguments.
+        runtime: Shared resources (orchestrator, Sheriff cache, worker pool).
+            Defaults to the process-wide runtime.
+        on_progress: Optional callback for long-running tools (run_tests), called
+            with (event, completed_count) as results arrive.
+    """
+    runtime = runtime or get_default_runtime()
 
     if name == "validate_code":
         raw_path = arguments.get("path", ".")
         try:
             safe_path = _validate_safe_path(raw_path)
-            result = run_sheriff(str(safe_path), json_output=True)
+            result = await runtime.run_in_worker(
+                run_sheriff, str(safe_path), json_output=True, cache=runtime.sheriff_cache
+            )
             # Serialize result
             json_str = json.dumps(result.to_dict(), indent=2)
             return [TextContent(type="text", text=json_str)]
@@ -104,8 +138,7 @@ async def handle_tool_call(
         model_id = arguments.get("model_id")
 
         try:
-            orchestrator = ModelOrchestrator()
-            response = await orchestrator.route_request(prompt, model_id=model_id)
+            response = await runtime.orchestrator.route_request(prompt, model_id=model_id)
             return [TextContent(type="text", text=response.content)]
         except Exception as e:
             return [TextContent(type="text", text=f"Error processing request: {e}")]
@@ -118,20 +151,19 @@ async def handle_tool_call(
             safe_output_dir = _validate_safe_path(raw_output_dir)
             safe_lattice_file = _validate_safe_path(raw_lattice_file)
 
-            # 1. Generate
+            shards = max(1, int(arguments.get("shards", 1)))
+
+            # 1. Generate (file I/O and templating, kept off the event loop)
             generator = GauntletGenerator(
                 lattice_file=str(safe_lattice_file), output_dir=str(safe_output_dir)
             )
-            generator.generate()
-
-            # 2. Run via pytest (subprocess to capture output)
-            cmd = ["pytest", str(safe_output_dir), "--tb=short"]
-            result = subprocess.run(cmd, capture_output=True, text=True)
+            await runtime.run_in_worker(generator.generate)
 
-            output = (
-                f"Test Generation: Complete\n\nPytest Output:\n{result.stdout}\n{result.stderr}"
+            # 2. Run pytest asynchronously; cancellation terminates the subprocesses
+            summary = await run_gauntlet_async(
+                safe_output_dir, shards=shards, on_progress=on_progress
             )
-            return [TextContent(type="text", text=output)]
+            return [TextContent(type="text", text=json.dumps(summary.to_dict(), indent=2))]
         except Exception as e:
             return [TextContent(type="text", text=f"Error running tests: {e}")]
 
@@ -0,0 +1,390 @@
+"""
+Lattice Lock Metrics Registry
+
+Process-wide counters, gauges and histograms, rendered in the Prometheus text
+exposition format and served at ``/metrics`` by the admin API and the dashboard.
+
+Hot paths record through label children bound once (``counter.labels(...)``),
+which costs a lock and an addition per call. Components that already keep
+their own statistics register a collector instead; collectors are only called
+when the metrics are scraped.
+"""
+
+import bisect
+import logging
+import math
+import re
+import threading
+import weakref
+from abc import ABC, abstractmethod
+from collections.abc import Callable, Iterable, Sequence
+from dataclasses import dataclass, field
+from typing import Any, TypeVar
+
+logger = logging.getLogger(__name__)
+
+# Content type of the text exposition format served at /metrics
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+# Histogram bucket upper bounds in seconds (the Prometheus client defaults)
+DEFAULT_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+_NAME_RE = re.compile(r"^[a-zA-Z_:][a-zA-Z0-9_:]*$")
+_LABEL_RE = re.compile(r"^[a-zA-Z_][a-zA-Z0-9_]*$")
+
+
+def _format_value(value: float) -> str:
+    if value == math.inf:
+        return "+Inf"
+    if value == -math.inf:
+        return "-Inf"
+    if math.isnan(value):
+        return "NaN"
+    if float(value).is_integer() and abs(value) < 1e15:
+        return str(int(value))
+    return repr(float(value))
+
+
+def _escape_label(value: str) -> str:
+    return value.replace("\\", r"\\").replace("\n", r"\n").replace('"', r"\"")
+
+
+def _format_labels(labels: dict[str, str]) -> str:
+    if not labels:
+        return ""
+    pairs = ",".join(f'{k}="{_escape_label(str(v))}"' for k, v in labels.items())
+    return "{" + pairs + "}"
+
+
+class CounterChild:
+    """A counter for one combination of label values."""
+
+    __slots__ = ("_lock", "value")
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.value = 0.0
+
+    def inc(self, amount: float = 1) -> None:
+        if amount < 0:
+            raise ValueError("Counters can only increase")
+        with self._lock:
+            self.value += amount
+
+    def _reset(self) -> None:
+        self.value = 0.0
+
+
+class GaugeChild:
+    """A gauge for one combination of label values."""
+
+    __slots__ = ("_lock", "value")
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.value = 0.0
+
+    def set(self, value: float) -> None:
+        self.value = value
+
+    def inc(self, amount: float = 1) -> None:
+        with self._lock:
+            self.value += amount
+
+    def dec(self, amount: float = 1) -> None:
+        with self._lock:
+            self.value -= amount
+
+    def _reset(self) -> None:
+        self.value = 0.0
+
+
+class HistogramChild:
+    """A histogram for one combination of label values."""
+
+    __slots__ = ("_lock", "_bounds", "bucket_counts", "sum", "count")
+
+    def __init__(self, bounds: tuple[float, ...]):
+        self._lock = threading.Lock()
+        self._bounds = bounds
+        # Non-cumulative counts; the last slot is the +Inf bucket
+        self.bucket_counts = [0] * (len(bounds) + 1)
+        self.sum = 0.0
+        self.count = 0
+
+    def observe(self, value: float) -> None:
+        index = bisect.bisect_left(self._bounds, value)
+        with self._lock:
+            self.bucket_counts[index] += 1
+            self.sum += value
+            self.count += 1
+
+    def _reset(self) -> None:
+        self.bucket_counts = [0] * (len(self._bounds) + 1)
+        self.sum = 0.0
+        self.count = 0
+
+
+class _Metric(ABC):
+    """Base class for registered metrics: a family of label children."""
+
+    type = "untyped"
+
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str] = ()):
+        if not _NAME_RE.match(name):
+            raise ValueError(f"Invalid metric name: {name!r}")
+        for label in labelnames:
+            if not _LABEL_RE.match(label) or label.startswith("__"):
+                raise ValueError(f"Invalid label name: {label!r}")
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self._children: dict[tuple[str, ...], Any] = {}
+        self._lock = threading.Lock()
+
+    @abstractmethod
+    def _new_child(self) -> Any:
+        """Create the value holder for one combination of label values."""
+
+    def labels(self, *values: Any, **labels: Any):
+        """
+        Get the child for a combination of label values.
+
+        Bind the child once (e.g. at module level) on hot paths instead of
+        calling this per event.
+        """
+        if not labels:
+            # Fast path for string label values that were seen before
+            child = self._children.get(values)
+            if child is not None:
+                return child
+        else:
+            if values:
+                raise ValueError("Pass label values either by position or by name")
+            try:
+                values = tuple(labels[name] for name in self.labelnames)
+            except KeyError as e:
+                raise ValueError(f"Missing label {e} for {self.name}") from None
+        if len(values) != len(self.labelnames):
+            raise ValueError(f"{self.name} expects labels {self.labelnames}, got {values}")
+        key = tuple(str(v) for v in values)
+        child = self._children.get(key)
+        if child is None:
+            with self._lock:
+                child = self._children.setdefault(key, self._new_child())
+        return child
+
+    def _unlabelled(self):
+        if self.labelnames:
+            raise ValueError(f"{self.name} has labels {self.labelnames}; use .labels()")
+        return self.labels()
+
+    def reset(self) -> None:
+        """Zero every child (children stay bound, so module-level references keep working)."""
+        for child in list(self._children.values()):
+            child._reset()
+
+    def _samples(self) -> Iterable[tuple[str, dict[str, str], float]]:
+        for key, child in list(self._children.items()):
+            yield "", dict(zip(self.labelnames, key, strict=True)), child.value
+
+
+class Counter(_Metric):
+    """A monotonically increasing count."""
+
+    type = "counter"
+
+    def _new_child(self) -> CounterChild:
+        return CounterChild()
+
+    def inc(self, amount: float = 1) -> None:
+        self._unlabelled().inc(amount)
+
+
+class Gauge(_Metric):
+    """A value that can go up and down."""
+
+    type = "gauge"
+
+    def _new_child(self) -> GaugeChild:
+        return GaugeChild()
+
+    def set(self, value: float) -> None:
+        self._unlabelled().set(value)
+
+    def inc(self, amount: float = 1) -> None:
+        self._unlabelled().inc(amount)
+
+    def dec(self, amount: float = 1) -> None:
+        self._unlabelled().dec(amount)
+
+
+class Histogram(_Metric):
+    """Observations counted into cumulative buckets."""
+
+    type = "histogram"
+
+    def __init__(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: Sequence[str] = (),
+        buckets: Sequence[float] = DEFAULT_BUCKETS,
+    ):
+        if "le" in labelnames:
+            raise ValueError("'le' is reserved for histogram buckets")
+        super().__init__(name, documentation, labelnames)
+        bounds = sorted(float(b) for b in buckets if b != math.inf)
+        if not bounds:
+            raise ValueError("Histograms need at least one finite bucket")
+        self.buckets = tuple(bounds)
+
+    def _new_child(self) -> HistogramChild:
+        return HistogramChild(self.buckets)
+
+    def observe(self, value: float) -> None:
+        self._unlabelled().observe(value)
+
+    def _samples(self) -> Iterable[tuple[str, dict[str, str], float]]:
+        for key, child in list(self._children.items()):
+            labels = dict(zip(self.labelnames, key, strict=True))
+            cumulative = 0
+            for bound, count in zip((*self.buckets, math.inf), child.bucket_counts, strict=True):
+                cumulative += count
+                yield "_bucket", {**labels, "le": _format_value(bound)}, cumulative
+            yield "_sum", labels, child.sum
+            yield "_count", labels, child.count
+
+
+@dataclass
+class MetricFamily:
+    """Samples produced by a collector at scrape time."""
+
+    name: str
+    type: str  # "counter", "gauge", "summary", "histogram" or "untyped"
+    documentation: str
+    samples: list[tuple[str, dict[str, str], float]] = field(default_factory=list)
+
+    def add(self, value: float, suffix: str = "", **labels: Any) -> "MetricFamily":
+        """Add a sample; ``suffix`` is appended to the name (e.g. ``_sum``)."""
+        self.samples.append((suffix, {k: str(v) for k, v in labels.items()}, value))
+        return self
+
+
+Collector = Callable[[], Iterable[MetricFamily]]
+
+
+MetricT = TypeVar("MetricT", bound=_Metric)
+
+
+class MetricsRegistry:
+    """Registry of metrics and collectors rendered together at scrape time."""
+
+    def __init__(self):
+        self._metrics: dict[str, _Metric] = {}
+        self._collectors: list[Any] = []
+        self._lock = threading.Lock()
+
+    def _get_or_create(
+        self,
+        cls: type[MetricT],
+        name: str,
+        documentation: str,
+        labelnames: Sequence[str],
+        **kwargs: Any,
+    ) -> MetricT:
+        with self._lock:
+            metric = self._metrics.get(name)
+            if metric is None:
+                created = self._metrics[name] = cls(name, documentation, labelnames, **kwargs)
+                return created
+            if type(metric) is not cls or metric.labelnames != tuple(labelnames):
+                raise ValueError(f"Metric {name} is already registered with a different shape")
+            return metric
+
+    def counter(self, name: str, documentation: str, labelnames: Sequence[str] = ()) -> Counter:
+        """Get or create a counter."""
+        return self._get_or_create(Counter, name, documentation, labelnames)
+
+    def gauge(self, name: str, documentation: str, labelnames: Sequence[str] = ()) -> Gauge:
+        """Get or create a gauge."""
+        return self._get_or_create(Gauge, name, documentation, labelnames)
+
+    def histogram(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: Sequence[str] = (),
+        buckets: Sequence[float] = DEFAULT_BUCKETS,
+    ) -> Histogram:
+        """Get or create a histogram."""
+        return self._get_or_create(Histogram, name, documentation, labelnames, buckets=buckets)
+
+    def register_collector(self, collector: Collector) -> None:
+        """
+        Register a callable returning MetricFamily objects at scrape time.
+
+        Bound methods are held weakly, so an instance reporting its own
+        statistics does not outlive its owner because of the registry.
+        """
+        ref = weakref.WeakMethod(collector) if hasattr(collector, "__self__") else collector
+        with self._lock:
+            self._collectors.append(ref)
+
+    def unregister_collector(self, collector: Collector) -> None:
+        with self._lock:
+            self._collectors = [c for c in self._collectors if self._resolve(c) != collector]
+
+    @staticmethod
+    def _resolve(ref: Any) -> Collector | None:
+        return ref() if isinstance(ref, weakref.WeakMethod) else ref
+
+    def collect(self, extra_collectors: Iterable[Collector] = ()) -> list[MetricFamily]:
+        """Gather all metrics and collector output, merging families with the same name."""
+        families: dict[str, MetricFamily] = {}
+        for metric in list(self._metrics.values()):
+            families[metric.name] = MetricFamily(
+                metric.name, metric.type, metric.documentation, list(metric._samples())
+            )
+
+        with self._lock:
+            self._collectors = [c for c in self._collectors if self._resolve(c) is not None]
+            collectors = [self._resolve(c) for c in self._collectors]
+        for collector in [*collectors, *extra_collectors]:
+            if collector is None:
+                continue
+            try:
+                for family in collector():
+                    existing = families.get(family.name)
+                    if existing is None:
+                        families[family.name] = family
+                    else:
+                        existing.samples.extend(family.samples)
+            except Exception as e:
+                logger.warning(f"Metrics collector {collector!r} failed: {e}")
+        return list(families.values())
+
+    def render(self, extra_collectors: Iterable[Collector] = ()) -> str:
+        """Render all metrics in the Prometheus text exposition format."""
+        lines = []
+        for family in self.collect(extra_collectors):
+            doc = family.documentation.replace("\\", r"\\").replace("\n", r"\n")
+            lines.append(f"# HELP {family.name} {doc}")
+            lines.append(f"# TYPE {family.name} {family.type}")
+            for suffix, labels, value in family.samples:
+                lines.append(
+                    f"{family.name}{suffix}{_format_labels(labels)} {_format_value(value)}"
+                )
+        return "\n".join(lines) + "\n"
+
+    def reset(self) -> None:
+        """Zero all metrics, keeping registrations (useful for testing)."""
+        for metric in list(self._metrics.values()):
+            metric.reset()
+
+
+_global_registry = MetricsRegistry()
+
+
+def get_metrics_registry() -> MetricsRegistry:
+    """Get the process-wide metrics registry."""
+    return _global_registry
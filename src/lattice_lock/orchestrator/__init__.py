@@ -7,6 +7,7 @@ Intelligent model routing across 63 AI models from 8 providers.
 from pathlib import Path
 
 from .chain import ChainOrchestrator
+from .checkpoints import CheckpointStore
 from .consensus import ConsensusEngine, ConsensusOrchestrator
 from .core import ModelOrchestrator
 from .registry import ModelRegistry
@@ -40,4 +41,5 @@ __all__ = [
     "ConsensusEngine",
     "ConsensusOrchestrator",
     "ChainOrchestrator",
+    "CheckpointStore",
 ]
@@ -13,6 +13,7 @@ from pathlib import Path
 from typing import Any
 
 from lattice_lock.config import AppConfig
+from lattice_lock.metrics import get_metrics_registry
 
 from ..types import TaskRequirements, TaskType
 from .semantic_router import SemanticRouter
@@ -20,6 +21,12 @@ from .types import TaskAnalysis
 
 logger = logging.getLogger(__name__)
 
+_CACHE_REQUESTS = get_metrics_registry().counter(
+    "lattice_cache_requests_total", "Cache lookups by cache and result.", ["cache", "result"]
+)
+_CACHE_HITS = _CACHE_REQUESTS.labels("task_analyzer", "hit")
+_CACHE_MISSES = _CACHE_REQUESTS.labels("task_analyzer", "miss")
+
 
 def _hash_prompt(prompt: str) -> str:
     """Create a SHA-256 hash of the prompt for cache key."""
@@ -142,10 +149,12 @@ class TaskAnalyzer:
 
         if prompt_hash in self._cache:
             self._cache_hits += 1
+            _CACHE_HITS.inc()
             self._cache.move_to_end(prompt_hash)
             return self._cache[prompt_hash]
 
         self._cache_misses += 1
+        _CACHE_MISSES.inc()
         analysis = self._analyze_uncached(prompt)
 
         self._cache[prompt_hash] = analysis
@@ -164,10 +173,12 @@ class TaskAnalyzer:
 
         if prompt_hash in self._cache:
             self._cache_hits += 1
+            _CACHE_HITS.inc()
             self._cache.move_to_end(prompt_hash)
             return self._cache[prompt_hash]
 
         self._cache_misses += 1
+        _CACHE_MISSES.inc()
         analysis = await self._analyze_uncached_async(prompt)
 
         self._cache[prompt_hash] = analysis
@@ -1,14 +1,23 @@
+import asyncio
 import logging
+import time
 import uuid
 from typing import Any
 
 import yaml
-from jinja2 import Template
+from jinja2 import Environment, Template, meta
 
+from lattice_lock.orchestrator.checkpoints import CheckpointStore, step_cache_key
 from lattice_lock.orchestrator.core import ModelOrchestrator
+from lattice_lock.orchestrator.types import APIResponse
 
 logger = logging.getLogger(__name__)
 
+# Default number of pipeline steps allowed to call models at the same time
+DEFAULT_MAX_CONCURRENCY = 4
+
+_TEMPLATE_ENV = Environment()
+
 
 class PipelineStep:
     def __init__(
@@ -17,17 +26,81 @@ class PipelineStep:
         prompt: str,
         model_id: str | None = None,
         output_key: str | None = None,
+        depends_on: list[str] | None = None,
+        params: dict[str, Any] | None = None,
     ):
         self.name = name
         self.prompt = prompt
         self.model_id = model_id
         self.output_key = output_key or f"{name.lower().replace(' ', '_')}_output"
+        self.depends_on = list(depends_on or [])
+        # Extra request parameters (e.g. temperature) passed through to route_request
+        self.params = dict(params or {})
+        self._template: Template | None = None
+        self._variables: frozenset[str] | None = None
+
+    @property
+    def template(self) -> Template:
+        """The compiled prompt template, compiled on first use."""
+        if self._template is None:
+            self._template = _TEMPLATE_ENV.from_string(self.prompt)
+        return self._template
+
+    @property
+    def variables(self) -> frozenset[str]:
+        """Context variables referenced by the prompt template."""
+        if self._variables is None:
+            ast = _TEMPLATE_ENV.parse(self.prompt)
+            self._variables = frozenset(meta.find_undeclared_variables(ast))
+        return self._variables
 
 
 class Pipeline:
-    def __init__(self, name: str, steps: list[PipelineStep]):
+    def __init__(
+        self,
+        name: str,
+        steps: list[PipelineStep],
+        max_concurrency: int | None = None,
+        source: str | None = None,
+    ):
         self.name = name
         self.steps = steps
+        self.max_concurrency = max_concurrency
+        self.source = source
+        self.dependencies = self._build_dependencies()
+        # Compile every prompt once up front so runs only pay for rendering
+        for step in steps:
+            _ = step.template
+
+    def _build_dependencies(self) -> dict[str, set[str]]:
+        """
+        Map each step name to the names of the steps it must wait for.
+
+        A step depends on the most recent earlier step producing each output_key its
+        template references, plus any steps (or output keys) listed in depends_on.
+        Dependencies only point backwards, so the declared order stays a valid
+        topological order and results match sequential execution.
+        """
+        names = {step.name for step in self.steps}
+        if len(names) != len(self.steps):
+            raise ValueError(f"Pipeline {self.name} has duplicate step names")
+
+        dependencies: dict[str, set[str]] = {}
+        producers: dict[str, str] = {}
+        for step in self.steps:
+            deps = {producers[var] for var in step.variables if var in producers}
+            for ref in step.depends_on:
+                if ref in dependencies:
+                    deps.add(ref)
+                elif ref in producers:
+                    deps.add(producers[ref])
+                elif ref in names:
+                    raise ValueError(f"Step '{step.name}' depends on '{ref}', which runs after it")
+                else:
+                    raise ValueError(f"Step '{step.name}' depends on unknown step '{ref}'")
+            dependencies[step.name] = deps
+            producers[step.output_key] = step.name
+        return dependencies
 
 
 class ChainOrchestrator:
@@ -35,8 +108,23 @@ class ChainOrchestrator:
     Orchestrates the execution of a multi-step pipeline (chain).
     """
 
-    def __init__(self, orchestrator: ModelOrchestrator | None = None):
+    def __init__(
+        self,
+        orchestrator: ModelOrchestrator | None = None,
+        max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+        checkpoint_store: CheckpointStore | None = None,
+    ):
+        """
+        Args:
+            orchestrator: ModelOrchestrator used for step model calls.
+            max_concurrency: Default cap on steps running at once.
+            checkpoint_store: Optional store for step outputs. When set, each step's
+                output is persisted as it completes and reused by later runs whose
+                rendered prompt, model and params are unchanged.
+        """
         self.orchestrator = orchestrator or ModelOrchestrator()
+        self.max_concurrency = max_concurrency
+        self.checkpoint_store = checkpoint_store
 
     @classmethod
     def from_yaml(cls, yaml_path: str) -> "Pipeline":
@@ -49,16 +137,23 @@ class ChainOrchestrator:
 
         steps = []
         for s in steps_data:
+            depends_on = s.get("depends_on") or []
+            if isinstance(depends_on, str):
+                depends_on = [depends_on]
             steps.append(
                 PipelineStep(
                     name=s["name"],
                     prompt=s["prompt"],
                     model_id=s.get("model_id"),
                     output_key=s.get("output_key"),
+                    depends_on=depends_on,
+                    params=s.get("params"),
                 )
             )
 
-        return Pipeline(name, steps)
+        return Pipeline(
+            name, steps, max_concurrency=data.get("max_concurrency"), source=str(yaml_path)
+        )
 
     async def run_pipeline(
         self,
@@ -66,22 +161,27 @@ class ChainOrchestrator:
         initial_inputs: dict[str, Any],
         start_from_step: str | None = None,
         pipeline_id: str | None = None,
+        max_concurrency: int | None = None,
     ) -> dict[str, Any]:
         """
-        Execute the pipeline steps sequentially.
+        Execute the pipeline, running steps concurrently once their dependencies finish.
 
         Args:
             pipeline: The Pipeline definition to run.
             initial_inputs: Dictionary of initial variables.
-            start_from_step: Name of step to resume from (skips previous steps).
+            start_from_step: Name of step to resume from. Earlier steps are skipped and
+                their outputs loaded from the run's checkpoints (or initial_inputs).
             pipeline_id: Optional ID for this execution (generated if None).
+            max_concurrency: Maximum steps in flight at once. Defaults to the
+                pipeline's own limit, then the orchestrator's.
 
         Returns:
-            Dict containing pipeline results and final context.
+            Dict containing pipeline results, final context and timing.
         """
         pipeline_id = pipeline_id or str(uuid.uuid4())
-        context = initial_inputs.copy()
-        results = {}
+        limit = max_concurrency or pipeline.max_concurrency or self.max_concurrency
+        if limit < 1:
+            raise ValueError(f"max_concurrency must be at least 1, got {limit}")
 
         # 1. Determine starting point
         steps_to_run = pipeline.steps
@@ -92,61 +192,188 @@ class ChainOrchestrator:
                     i for i, s in enumerate(pipeline.steps) if s.name == start_from_step
                 )
                 steps_to_run = pipeline.steps[start_index:]
-                # Note: In a real resumption scenario, we would need to load the
-                # context from the checkpoint associated with pipeline_id.
-                # For now, we assume initial_inputs contains necessary history.
             except StopIteration:
                 raise ValueError(f"Step '{start_from_step}' not found in pipeline")
 
-        # 2. Execute Steps
-        for step in steps_to_run:
-            step_id = str(uuid.uuid4())
-            logger.info(f"Running step: {step.name} (ID: {step_id})")
+        order = {step.name: i for i, step in enumerate(pipeline.steps)}
+        skipped = {step.name for step in pipeline.steps} - {step.name for step in steps_to_run}
+        # Skipped steps use the run's stored outputs, falling back to initial_inputs
+        outputs: dict[str, str] = {
+            name: content
+            for name, content in (await self._load_checkpoint(pipeline_id)).items()
+            if name in skipped
+        }
+        if self.checkpoint_store:
+            await self.checkpoint_store.start_run_async(
+                pipeline_id, pipeline.name, initial_inputs, pipeline.source
+            )
 
-            # Robust template rendering with Jinja2
-            rendered_prompt = Template(step.prompt).render(**context)
+        # 2. Execute steps as their dependencies complete
+        pending = list(steps_to_run)
+        running: dict[asyncio.Task, PipelineStep] = {}
+        results: dict[str, dict[str, Any]] = {}
+        durations: dict[str, float] = {}
+        semaphore = asyncio.Semaphore(limit)
+        start = time.perf_counter()
+        status = "failed"
 
-            try:
-                response = await self.orchestrator.route_request(
-                    prompt=rendered_prompt, model_id=step.model_id
-                )
+        try:
+            while pending or running:
+                for step in [
+                    s for s in pending if pipeline.dependencies[s.name] <= skipped | outputs.keys()
+                ]:
+                    pending.remove(step)
+                    context = initial_inputs.copy()
+                    for dep in sorted(pipeline.dependencies[step.name], key=order.__getitem__):
+                        if dep in outputs:
+                            context[pipeline.steps[order[dep]].output_key] = outputs[dep]
+                    task = asyncio.create_task(
+                        self._run_step(step, step.template.render(**context), semaphore)
+                    )
+                    running[task] = step
 
-                context[step.output_key] = response.content
+                done, _ = await asyncio.wait(running, return_when=asyncio.FIRST_COMPLETED)
+                for task in sorted(done, key=lambda t: order[running[t].name]):
+                    step = running.pop(task)
+                    try:
+                        step_id, response, elapsed_ms, key, cached = task.result()
+                    except Exception as e:
+                        logger.error(f"Step {step.name} failed: {e}")
+                        raise RuntimeError(
+                            f"Pipeline {pipeline.name} failed at step {step.name}: {e}"
+                        ) from e
 
-                results[step.name] = {
-                    "step_id": step_id,
-                    "content": response.content,
-                    "model": response.model,
-                    "usage": response.usage,
-                }
+                    outputs[step.name] = response.content
+                    durations[step.name] = elapsed_ms
+                    results[step.name] = {
+                        "step_id": step_id,
+                        "content": response.content,
+                        "model": response.model,
+                        "usage": response.usage,
+                        "cached": cached,
+                    }
 
-                # 3. Persist State (Stub)
-                self._save_checkpoint(pipeline_id, step.name, context)
+                    # 3. Persist State
+                    await self._save_checkpoint(pipeline_id, pipeline, step, key, response, cached)
+            status = "completed"
+        finally:
+            for task in running:
+                task.cancel()
+            if running:
+                await asyncio.gather(*running, return_exceptions=True)
+            if self.checkpoint_store:
+                await self.checkpoint_store.finish_run_async(pipeline_id, status)
 
-            except Exception as e:
-                logger.error(f"Step {step.name} failed: {e}")
-                raise RuntimeError(f"Pipeline {pipeline.name} failed at step {step.name}: {e}")
+        timing = self._timing(pipeline, durations, (time.perf_counter() - start) * 1000, limit)
+        logger.info(
+            f"Pipeline {pipeline.name} finished in {timing['wall_ms']:.0f}ms "
+            f"(critical path {timing['critical_path_ms']:.0f}ms, "
+            f"sequential {timing['sequential_ms']:.0f}ms)"
+        )
 
         return {
             "pipeline_name": pipeline.name,
             "pipeline_id": pipeline_id,
-            "final_context": context,
-            "step_results": results,
+            "final_context": self._merge_outputs(pipeline, initial_inputs, outputs),
+            "step_results": {s.name: results[s.name] for s in steps_to_run},
+            "timing": timing,
         }
 
-    def _save_checkpoint(self, pipeline_id: str, step_name: str, context: dict[str, Any]):
+    async def _run_step(
+        self, step: PipelineStep, prompt: str, semaphore: asyncio.Semaphore
+    ) -> tuple[str, Any, float, str, bool]:
+        """
+        Run one step's model call, or reuse a stored output for identical inputs.
+
+        Returns:
+            Tuple of (step_id, response, elapsed_ms, checkpoint key, cached).
+        """
+        step_id = str(uuid.uuid4())
+        key = step_cache_key(prompt, step.model_id, step.params)
+        start = time.perf_counter()
+        if self.checkpoint_store and (checkpoint := await self.checkpoint_store.get_async(key)):
+            logger.info(f"Reusing checkpointed output for step: {step.name} (ID: {step_id})")
+            response = APIResponse(
+                content=checkpoint.content,
+                model=checkpoint.model,
+                provider=checkpoint.provider,
+                usage=checkpoint.usage,
+                latency_ms=0,
+            )
+            return step_id, response, (time.perf_counter() - start) * 1000, key, True
+
+        async with semaphore:
+            logger.info(f"Running step: {step.name} (ID: {step_id})")
+            start = time.perf_counter()
+            response = await self.orchestrator.route_request(
+                prompt=prompt, model_id=step.model_id, **step.params
+            )
+            return step_id, response, (time.perf_counter() - start) * 1000, key, False
+
+    @staticmethod
+    def _merge_outputs(
+        pipeline: Pipeline, initial_inputs: dict[str, Any], outputs: dict[str, str]
+    ) -> dict[str, Any]:
+        """Apply step outputs to the inputs in declared order, as sequential execution would."""
+        context = initial_inputs.copy()
+        for step in pipeline.steps:
+            if step.name in outputs:
+                context[step.output_key] = outputs[step.name]
+        return context
+
+    @staticmethod
+    def _timing(
+        pipeline: Pipeline, durations: dict[str, float], wall_ms: float, max_concurrency: int
+    ) -> dict[str, Any]:
+        """Compare the critical path through the step graph with the sequential total."""
+        finish: dict[str, float] = {}
+        previous: dict[str, str | None] = {}
+        for step in pipeline.steps:
+            if step.name not in durations:
+                continue
+            deps = [d for d in pipeline.dependencies[step.name] if d in finish]
+            slowest = max(deps, key=finish.__getitem__, default=None)
+            previous[step.name] = slowest
+            finish[step.name] = durations[step.name] + (finish[slowest] if slowest else 0.0)
+
+        path: list[str] = []
+        node = max(finish, key=finish.__getitem__, default=None)
+        while node is not None:
+            path.append(node)
+            node = previous[node]
+
+        return {
+            "wall_ms": wall_ms,
+            "sequential_ms": sum(durations.values()),
+            "critical_path_ms": max(finish.values(), default=0.0),
+            "critical_path": path[::-1],
+            "max_concurrency": max_concurrency,
+        }
+
+    async def _save_checkpoint(
+        self,
+        pipeline_id: str,
+        pipeline: Pipeline,
+        step: PipelineStep,
+        key: str,
+        response: Any,
+        cached: bool,
+    ):
         """
-        Save the current execution state to allow for resumption.
-        (Stub implementation)
+        Persist a completed step's output and record it against this run.
         """
-        # In the future, this will write to a local DB or file.
-        # For now, we just log it.
-        logger.debug(f"Checkpoint saved for {pipeline_id} at {step_name}")
+        if not self.checkpoint_store:
+            return
+        if not cached:
+            await self.checkpoint_store.put_async(key, pipeline.name, step.name, response)
+        await self.checkpoint_store.record_step_async(pipeline_id, step.name, key)
+        logger.debug(f"Checkpoint saved for {pipeline_id} at {step.name}")
 
-    def _load_checkpoint(self, pipeline_id: str) -> dict[str, Any]:
+    async def _load_checkpoint(self, pipeline_id: str) -> dict[str, Any]:
         """
-        Load execution state for a given pipeline ID.
-        (Stub implementation)
+        Load the stored step outputs of a run, keyed by step name.
         """
-        # In the future, this will read from DB.
-        return {}
+        if not self.checkpoint_store:
+            return {}
+        stored = await self.checkpoint_store.load_run_outputs_async(pipeline_id)
+        return {name: checkpoint.content for name, checkpoint in stored.items()}
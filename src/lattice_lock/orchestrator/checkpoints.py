@@ -0,0 +1,386 @@
+"""
+Durable checkpoints for chain pipelines.
+
+Step outputs are stored in SQLite keyed by a hash of the rendered prompt, the
+model and the request parameters, so re-running or resuming a pipeline reuses
+the output of any step whose inputs have not changed instead of paying for the
+model call again.
+
+Every method opens its own connection, so the ``*_async`` variants simply run
+the blocking call on a worker thread; concurrent pipeline steps then do not
+stall each other on SQLite commits.
+"""
+
+import asyncio
+import hashlib
+import json
+import logging
+import os
+import sqlite3
+from dataclasses import asdict, dataclass, field, is_dataclass
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Any
+
+from .types import TokenUsage
+
+logger = logging.getLogger(__name__)
+
+
+def step_cache_key(prompt: str, model_id: str | None, params: dict[str, Any] | None) -> str:
+    """Hash the inputs that determine a step's output."""
+    payload = json.dumps(
+        {"prompt": prompt, "model_id": model_id, "params": params or {}},
+        sort_keys=True,
+        default=str,
+    )
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+@dataclass
+class StepCheckpoint:
+    """A stored step output."""
+
+    key: str
+    pipeline_name: str
+    step_name: str
+    model: str
+    provider: str
+    content: str
+    usage: TokenUsage | dict[str, Any] | None
+    created_at: str
+    last_used_at: str
+    hits: int = 0
+
+
+@dataclass
+class PipelineRun:
+    """A recorded pipeline execution."""
+
+    pipeline_id: str
+    pipeline_name: str
+    status: str
+    inputs: dict[str, Any]
+    started_at: str
+    updated_at: str
+    source: str | None = None  # pipeline YAML path, when loaded from a file
+    steps: dict[str, str] = field(default_factory=dict)  # step name -> checkpoint key
+
+
+def _usage_to_json(usage: Any) -> str | None:
+    if usage is None:
+        return None
+    if is_dataclass(usage) and not isinstance(usage, type):
+        usage = asdict(usage)
+    try:
+        return json.dumps(usage)
+    except TypeError:
+        return None
+
+
+def _usage_from_json(raw: str | None) -> TokenUsage | dict[str, Any] | None:
+    if not raw:
+        return None
+    data = json.loads(raw)
+    try:
+        return TokenUsage(**data)
+    except TypeError:
+        return data
+
+
+class CheckpointStore:
+    """SQLite-based storage for pipeline step checkpoints."""
+
+    def __init__(self, db_path: str | Path | None = None):
+        if db_path:
+            self.db_path = Path(db_path)
+        elif env_path := os.getenv("LATTICE_CHECKPOINT_DB"):
+            self.db_path = Path(env_path)
+        else:
+            # Default to .lattice/checkpoints.db in the user's home, next to cost.db
+            self.db_path = Path.home() / ".lattice" / "checkpoints.db"
+
+        self._ensure_db()
+
+    def _connect(self) -> sqlite3.Connection:
+        conn = sqlite3.connect(self.db_path)
+        conn.row_factory = sqlite3.Row
+        return conn
+
+    def _ensure_db(self):
+        """Ensure database directory and tables exist."""
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+
+        with self._connect() as conn:
+            conn.execute(
+                """
+                CREATE TABLE IF NOT EXISTS step_outputs (
+                    key TEXT PRIMARY KEY,
+                    pipeline_name TEXT NOT NULL,
+                    step_name TEXT NOT NULL,
+                    model TEXT NOT NULL,
+                    provider TEXT NOT NULL,
+                    content TEXT NOT NULL,
+                    usage TEXT,
+                    created_at TEXT NOT NULL,
+                    last_used_at TEXT NOT NULL,
+                    hits INTEGER DEFAULT 0
+                )
+            """
+            )
+            conn.execute(
+                """
+                CREATE TABLE IF NOT EXISTS pipeline_runs (
+                    pipeline_id TEXT PRIMARY KEY,
+                    pipeline_name TEXT NOT NULL,
+                    status TEXT NOT NULL,
+                    inputs TEXT NOT NULL,
+                    source TEXT,
+                    started_at TEXT NOT NULL,
+                    updated_at TEXT NOT NULL
+                )
+            """
+            )
+            conn.execute(
+                """
+                CREATE TABLE IF NOT EXISTS run_steps (
+                    pipeline_id TEXT NOT NULL,
+                    step_name TEXT NOT NULL,
+                    key TEXT NOT NULL,
+                    PRIMARY KEY (pipeline_id, step_name)
+                )
+            """
+            )
+            conn.execute(
+                "CREATE INDEX IF NOT EXISTS idx_outputs_last_used ON step_outputs(last_used_at)"
+            )
+            conn.execute("CREATE INDEX IF NOT EXISTS idx_runs_updated ON pipeline_runs(updated_at)")
+
+    def get(self, key: str) -> StepCheckpoint | None:
+        """Look up a stored step output and mark it as used."""
+        now = datetime.now().isoformat()
+        with self._connect() as conn:
+            row = conn.execute("SELECT * FROM step_outputs WHERE key = ?", (key,)).fetchone()
+            if row is None:
+                return None
+            conn.execute(
+                "UPDATE step_outputs SET last_used_at = ?, hits = hits + 1 WHERE key = ?",
+                (now, key),
+            )
+        checkpoint = self._row_to_checkpoint(row)
+        checkpoint.last_used_at = now
+        checkpoint.hits += 1
+        return checkpoint
+
+    def put(self, key: str, pipeline_name: str, step_name: str, response: Any) -> None:
+        """Store the output of a completed step."""
+        now = datetime.now().isoformat()
+        with self._connect() as conn:
+            conn.execute(
+                """
+                INSERT OR REPLACE INTO step_outputs (
+                    key, pipeline_name, step_name, model, provider, content,
+                    usage, created_at, last_used_at, hits
+                ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, 0)
+            """,
+                (
+                    key,
+                    pipeline_name,
+                    step_name,
+                    response.model,
+                    getattr(response, "provider", "") or "",
+                    response.content,
+                    _usage_to_json(response.usage),
+                    now,
+                    now,
+                ),
+            )
+
+    def start_run(
+        self,
+        pipeline_id: str,
+        pipeline_name: str,
+        inputs: dict[str, Any],
+        source: str | None = None,
+    ) -> None:
+        """Record (or restart) a pipeline run with its initial inputs."""
+        now = datetime.now().isoformat()
+        with self._connect() as conn:
+            conn.execute(
+                """
+                INSERT INTO pipeline_runs (
+                    pipeline_id, pipeline_name, status, inputs, source, started_at, updated_at
+                ) VALUES (?, ?, 'running', ?, ?, ?, ?)
+                ON CONFLICT(pipeline_id) DO UPDATE SET
+                    status = 'running',
+                    inputs = excluded.inputs,
+                    source = COALESCE(excluded.source, source),
+                    updated_at = excluded.updated_at
+            """,
+                (pipeline_id, pipeline_name, json.dumps(inputs, default=str), source, now, now),
+            )
+
+    def record_step(self, pipeline_id: str, step_name: str, key: str) -> None:
+        """Associate a step of a run with its stored output."""
+        with self._connect() as conn:
+            conn.execute(
+                "INSERT OR REPLACE INTO run_steps (pipeline_id, step_name, key) VALUES (?, ?, ?)",
+                (pipeline_id, step_name, key),
+            )
+            conn.execute(
+                "UPDATE pipeline_runs SET updated_at = ? WHERE pipeline_id = ?",
+                (datetime.now().isoformat(), pipeline_id),
+            )
+
+    def finish_run(self, pipeline_id: str, status: str) -> None:
+        """Mark a run as completed or failed."""
+        with self._connect() as conn:
+            conn.execute(
+                "UPDATE pipeline_runs SET status = ?, updated_at = ? WHERE pipeline_id = ?",
+                (status, datetime.now().isoformat(), pipeline_id),
+            )
+
+    async def get_async(self, key: str) -> StepCheckpoint | None:
+        """get() on a worker thread, for use from async code."""
+        return await asyncio.to_thread(self.get, key)
+
+    async def put_async(self, key: str, pipeline_name: str, step_name: str, response: Any) -> None:
+        """put() on a worker thread, for use from async code."""
+        await asyncio.to_thread(self.put, key, pipeline_name, step_name, response)
+
+    async def start_run_async(
+        self,
+        pipeline_id: str,
+        pipeline_name: str,
+        inputs: dict[str, Any],
+        source: str | None = None,
+    ) -> None:
+        """start_run() on a worker thread, for use from async code."""
+        await asyncio.to_thread(self.start_run, pipeline_id, pipeline_name, inputs, source)
+
+    async def record_step_async(self, pipeline_id: str, step_name: str, key: str) -> None:
+        """record_step() on a worker thread, for use from async code."""
+        await asyncio.to_thread(self.record_step, pipeline_id, step_name, key)
+
+    async def finish_run_async(self, pipeline_id: str, status: str) -> None:
+        """finish_run() on a worker thread, for use from async code."""
+        await asyncio.to_thread(self.finish_run, pipeline_id, status)
+
+    async def load_run_outputs_async(self, pipeline_id: str) -> dict[str, StepCheckpoint]:
+        """load_run_outputs() on a worker thread, for use from async code."""
+        return await asyncio.to_thread(self.load_run_outputs, pipeline_id)
+
+    def get_run(self, pipeline_id: str) -> PipelineRun | None:
+        """Load a recorded run and the checkpoint keys of its completed steps."""
+        with self._connect() as conn:
+            row = conn.execute(
+                "SELECT * FROM pipeline_runs WHERE pipeline_id = ?", (pipeline_id,)
+            ).fetchone()
+            if row is None:
+                return None
+            steps = conn.execute(
+                "SELECT step_name, key FROM run_steps WHERE pipeline_id = ?", (pipeline_id,)
+            ).fetchall()
+        run = self._row_to_run(row)
+        run.steps = {s["step_name"]: s["key"] for s in steps}
+        return run
+
+    def load_run_outputs(self, pipeline_id: str) -> dict[str, StepCheckpoint]:
+        """Stored outputs of a run's completed steps, keyed by step name."""
+        with self._connect() as conn:
+            rows = conn.execute(
+                """
+                SELECT r.step_name AS run_step, o.*
+                FROM run_steps r JOIN step_outputs o ON o.key = r.key
+                WHERE r.pipeline_id = ?
+            """,
+                (pipeline_id,),
+            ).fetchall()
+        return {row["run_step"]: self._row_to_checkpoint(row) for row in rows}
+
+    def list_runs(self, limit: int = 10) -> list[PipelineRun]:
+        """Most recently updated runs first."""
+        with self._connect() as conn:
+            rows = conn.execute(
+                "SELECT * FROM pipeline_runs ORDER BY updated_at DESC LIMIT ?", (limit,)
+            ).fetchall()
+        return [self._row_to_run(row) for row in rows]
+
+    def list_checkpoints(
+        self, pipeline_name: str | None = None, limit: int = 50
+    ) -> list[StepCheckpoint]:
+        """Most recently used step outputs first, optionally for one pipeline."""
+        query = "SELECT * FROM step_outputs"
+        params: tuple[Any, ...] = ()
+        if pipeline_name:
+            query += " WHERE pipeline_name = ?"
+            params = (pipeline_name,)
+        query += " ORDER BY last_used_at DESC LIMIT ?"
+        with self._connect() as conn:
+            rows = conn.execute(query, (*params, limit)).fetchall()
+        return [self._row_to_checkpoint(row) for row in rows]
+
+    def stats(self) -> dict[str, Any]:
+        """Counts and size of the store."""
+        with self._connect() as conn:
+            outputs, hits, size = conn.execute(
+                "SELECT COUNT(*), COALESCE(SUM(hits), 0), COALESCE(SUM(LENGTH(content)), 0) "
+                "FROM step_outputs"
+            ).fetchone()
+            runs = conn.execute("SELECT COUNT(*) FROM pipeline_runs").fetchone()[0]
+        return {"checkpoints": outputs, "runs": runs, "hits": hits, "content_bytes": size}
+
+    def prune(self, older_than: timedelta | None = None, pipeline_name: str | None = None) -> int:
+        """
+        Delete step outputs not used within ``older_than`` (all, if None), optionally
+        only for one pipeline, along with runs left without any stored steps.
+
+        Returns:
+            Number of step outputs deleted.
+        """
+        conditions = []
+        params: list[Any] = []
+        if older_than is not None:
+            conditions.append("last_used_at < ?")
+            params.append((datetime.now() - older_than).isoformat())
+        if pipeline_name:
+            conditions.append("pipeline_name = ?")
+            params.append(pipeline_name)
+        where = f" WHERE {' AND '.join(conditions)}" if conditions else ""
+
+        with self._connect() as conn:
+            deleted = conn.execute(f"DELETE FROM step_outputs{where}", params).rowcount
+            conn.execute("DELETE FROM run_steps WHERE key NOT IN (SELECT key FROM step_outputs)")
+            conn.execute(
+                "DELETE FROM pipeline_runs WHERE status != 'running' "
+                "AND pipeline_id NOT IN (SELECT pipeline_id FROM run_steps)"
+            )
+        logger.info(f"Pruned {deleted} pipeline checkpoints from {self.db_path}")
+        return deleted
+
+    @staticmethod
+    def _row_to_checkpoint(row: sqlite3.Row) -> StepCheckpoint:
+        return StepCheckpoint(
+            key=row["key"],
+            pipeline_name=row["pipeline_name"],
+            step_name=row["step_name"],
+            model=row["model"],
+            provider=row["provider"],
+            content=row["content"],
+            usage=_usage_from_json(row["usage"]),
+            created_at=row["created_at"],
+            last_used_at=row["last_used_at"],
+            hits=row["hits"],
+        )
+
+    @staticmethod
+    def _row_to_run(row: sqlite3.Row) -> PipelineRun:
+        return PipelineRun(
+            pipeline_id=row["pipeline_id"],
+            pipeline_name=row["pipeline_name"],
+            status=row["status"],
+            inputs=json.loads(row["inputs"]),
+            started_at=row["started_at"],
+            updated_at=row["updated_at"],
+            source=row["source"],
+        )
@@ -1,3 +1,3 @@
-from .engine import ConsensusEngine, ConsensusOrchestrator
+from .engine import ConsensusEngine, ConsensusOrchestrator, VoteResult
 
-__all__ = ["ConsensusEngine", "ConsensusOrchestrator"]
+__all__ = ["ConsensusEngine", "ConsensusOrchestrator", "VoteResult"]
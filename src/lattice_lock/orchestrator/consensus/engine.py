@@ -1,13 +1,33 @@
 import asyncio
 import logging
+import time
 from collections import Counter
+from dataclasses import dataclass, field
 from typing import Any
 
 from lattice_lock.orchestrator.core import ModelOrchestrator
-from lattice_lock.orchestrator.types import TaskType
+from lattice_lock.orchestrator.types import APIResponse, TaskType
 
 logger = logging.getLogger(__name__)
 
+VOTING_INSTRUCTIONS = (
+    "Review the above request. Vote 'Approved' or 'Rejected'. Provide ONLY the vote word."
+)
+
+
+@dataclass
+class VoteResult:
+    """Outcome of a quorum vote."""
+
+    decision: str  # "Approved", "Rejected", "Abstain" or "Indeterminate"
+    confidence: float  # Share of received votes that went to the decision
+    votes: dict[str, str] = field(default_factory=dict)  # model_id -> vote
+    failed: list[str] = field(default_factory=list)  # Models that errored
+    skipped: list[str] = field(default_factory=list)  # Models cancelled before voting
+    early_terminated: bool = False  # Stopped before every voter answered
+    deadline_exceeded: bool = False
+    elapsed_ms: float = 0.0
+
 
 class ConsensusEngine:
     """
@@ -27,11 +47,7 @@ class ConsensusEngine:
         logger.info(f"Executing consensus vote with models: {models}")
 
         # Prepare voting instructions
-        voting_prompt = (
-            f"{prompt}\n\n"
-            "Review the above request. Vote 'Approved' or 'Rejected'. "
-            "Provide ONLY the vote word."
-        )
+        voting_prompt = f"{prompt}\n\n{VOTING_INSTRUCTIONS}"
 
         tasks = [
             self.orchestrator.route_request(prompt=voting_prompt, model_id=model_id, task_type=None)
@@ -47,15 +63,7 @@ class ConsensusEngine:
                 logger.error(f"Model {model_id} failed to vote: {result}")
                 continue
 
-            # Normalize vote text
-            vote_text = result.content.strip().split("\n")[0].replace("'", "").replace('"', "")
-            if "Approved" in vote_text:
-                votes.append("Approved")
-            elif "Rejected" in vote_text:
-                votes.append("Rejected")
-            else:
-                logger.warning(f"Model {model_id} returned unclear vote: {vote_text}")
-                votes.append("Abstain")
+            votes.append(self._parse_vote(model_id, result))
 
         if not votes:
             logger.warning("No valid votes received.")
@@ -70,6 +78,112 @@ class ConsensusEngine:
 
         return winner
 
+    async def execute_quorum_voting(
+        self,
+        prompt: str,
+        models: list[str],
+        quorum: int | None = None,
+        timeout: float | None = None,
+    ) -> VoteResult:
+        """
+        Queries models in parallel and tallies votes as they arrive.
+
+        Returns as soon as the outcome can no longer change, the leading option
+        reaches ``quorum`` votes, or ``timeout`` seconds elapse. Outstanding
+        requests are cancelled to save cost and reported in ``skipped``.
+
+        Args:
+            prompt: The request to vote on.
+            models: Model IDs to poll.
+            quorum: Optional number of matching votes that is sufficient to decide.
+                Without it the vote ends only when the leader cannot be overtaken.
+            timeout: Optional deadline in seconds; votes received so far are tallied.
+        """
+        logger.info(f"Executing quorum vote with models: {models}")
+        voting_prompt = f"{prompt}\n\n{VOTING_INSTRUCTIONS}"
+        start = time.perf_counter()
+
+        tasks = {
+            asyncio.create_task(
+                self.orchestrator.route_request(
+                    prompt=voting_prompt, model_id=model_id, task_type=None
+                )
+            ): model_id
+            for model_id in models
+        }
+        pending = set(tasks)
+        result = VoteResult(decision="Indeterminate", confidence=0.0)
+        tally: Counter[str] = Counter()
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + timeout if timeout is not None else None
+
+        try:
+            while pending:
+                remaining_time = None if deadline is None else deadline - loop.time()
+                if remaining_time is not None and remaining_time <= 0:
+                    result.deadline_exceeded = True
+                    break
+                done, pending = await asyncio.wait(
+                    pending, timeout=remaining_time, return_when=asyncio.FIRST_COMPLETED
+                )
+                for task in done:
+                    model_id = tasks[task]
+                    try:
+                        response = task.result()
+                    except Exception as e:
+                        logger.error(f"Model {model_id} failed to vote: {e}")
+                        result.failed.append(model_id)
+                        continue
+                    vote = self._parse_vote(model_id, response)
+                    result.votes[model_id] = vote
+                    tally[vote] += 1
+
+                if pending and self._vote_is_decided(tally, len(pending), quorum):
+                    result.early_terminated = True
+                    break
+        finally:
+            for task in pending:
+                task.cancel()
+            if pending:
+                await asyncio.gather(*pending, return_exceptions=True)
+            result.skipped = [tasks[t] for t in pending]
+
+        result.elapsed_ms = (time.perf_counter() - start) * 1000
+        if tally:
+            result.decision, winning_votes = tally.most_common(1)[0]
+            result.confidence = winning_votes / sum(tally.values())
+        else:
+            logger.warning("No valid votes received.")
+
+        logger.info(
+            f"Quorum vote: {result.decision} (Confidence: {result.confidence:.2f}, "
+            f"votes: {len(result.votes)}, skipped: {len(result.skipped)})"
+        )
+        return result
+
+    @staticmethod
+    def _vote_is_decided(tally: Counter[str], outstanding: int, quorum: int | None) -> bool:
+        """True if the leading option cannot be overtaken or has reached the quorum."""
+        if not tally:
+            return False
+        ranked = tally.most_common(2)
+        leader = ranked[0][1]
+        if quorum is not None and leader >= quorum:
+            return True
+        runner_up = ranked[1][1] if len(ranked) > 1 else 0
+        return leader > runner_up + outstanding
+
+    @staticmethod
+    def _parse_vote(model_id: str, response: APIResponse) -> str:
+        """Normalize a model's reply to Approved, Rejected or Abstain."""
+        vote_text = response.content.strip().split("\n")[0].replace("'", "").replace('"', "")
+        if "Approved" in vote_text:
+            return "Approved"
+        if "Rejected" in vote_text:
+            return "Rejected"
+        logger.warning(f"Model {model_id} returned unclear vote: {vote_text}")
+        return "Abstain"
+
 
 class ConsensusOrchestrator:
     """
@@ -1,23 +1,63 @@
 import logging
 import os
+import time
 from collections.abc import Callable
 
-from lattice_lock.tracing import AsyncSpanContext, generate_trace_id, get_current_trace_id
+from lattice_lock.tracing import (
+    AsyncSpanContext,
+    SpanContext,
+    deadline_scope,
+    generate_trace_id,
+    get_current_trace_id,
+    get_performance_metrics,
+    get_remaining_time,
+)
 
 from .analysis import TaskAnalyzer
 from .cost.tracker import CostTracker
-from .exceptions import APIClientError
-from .execution import ClientPool, ConversationExecutor
+from .exceptions import APIClientError, DeadlineExceededError, OverloadedError
+from .execution import (
+    AdmissionController,
+    ClientPool,
+    ConversationExecutor,
+    EndpointPool,
+    FairScheduler,
+    MapReduceExecutor,
+    RequestClass,
+)
+from .execution.cascade import (
+    AcceptanceCheck,
+    CascadeExecutor,
+    CascadeStats,
+    SelfReportedConfidenceCheck,
+)
+from .execution.map_reduce import DEFAULT_MAX_CHUNK_TOKENS, chunk_token_budget
 from .function_calling import FunctionCallHandler
 from .guide import ModelGuideParser
 from .providers import ProviderUnavailableError
 from .registry import ModelRegistry
 from .scoring import ModelScorer
 from .selection import ModelSelector
-from .types import APIResponse, TaskRequirements, TaskType
+from .types import APIResponse, ModelCapabilities, TaskRequirements, TaskType
 
 logger = logging.getLogger(__name__)
 
+# Smallest context window considered when picking a model for map-reduce chunks
+MIN_CHUNK_CONTEXT = 16000
+# Minimum speed_rating (0-10) preferred for map-reduce chunk models
+FAST_MODEL_SPEED = 7.0
+# Context window assumed for models missing from the registry
+DEFAULT_CONTEXT_WINDOW = 8000
+# Fallback attempts are skipped when less than this many seconds of the deadline remain
+MIN_FALLBACK_BUDGET_S = 1.0
+
+
+def _record_stage(stage: str, start: float, success: bool = True) -> None:
+    """Record the duration of a route_request stage as ``route_request.<stage>``."""
+    get_performance_metrics().record_operation(
+        f"route_request.{stage}", (time.perf_counter() - start) * 1000, success
+    )
+
 
 class ModelOrchestrator:
     """
@@ -40,6 +80,10 @@ class ModelOrchestrator:
         self.selector = ModelSelector(self.registry, self.scorer, self.guide)
         self.client_pool = ClientPool()
         self.executor = ConversationExecutor(self.function_call_handler, self.cost_tracker)
+        self.admission = AdmissionController()
+        self.scheduler = FairScheduler(on_wait=self.admission.record_delay)
+        self.cascade_stats = CascadeStats()
+        self.min_fallback_budget = MIN_FALLBACK_BUDGET_S
 
         self._initialize_analyzer_client()
 
@@ -66,6 +110,9 @@ class ModelOrchestrator:
         model_id: str | None = None,
         task_type: TaskType | None = None,
         trace_id: str | None = None,
+        timeout: float | None = None,
+        tenant: str | None = None,
+        request_class: RequestClass | str = RequestClass.INTERACTIVE,
         **kwargs,
     ) -> APIResponse:
         """
@@ -76,20 +123,72 @@ class ModelOrchestrator:
             model_id: Optional specific model ID to force use.
             task_type: Optional manual task type override.
             trace_id: Optional trace ID for distributed tracing.
+            timeout: Optional end-to-end budget in seconds, covering analysis, every
+                conversation turn and every fallback attempt. Nested calls inherit
+                the remaining budget of an enclosing deadline.
+            tenant: Project or API key the request is scheduled for. Provider slots
+                are shared between tenants by weighted fair queuing (see
+                ``self.scheduler.configure_tenant``).
+            request_class: INTERACTIVE or BATCH; batch requests get a smaller share
+                of a tenant's slots.
             **kwargs: Additional arguments passed to the API client.
+
+        Raises:
+            DeadlineExceededError: If the deadline passes before a response is available.
+            OverloadedError: If the request is shed by admission control (retryable;
+                see ``retry_after``).
         """
+        start = time.perf_counter()
+        success = False
+        with deadline_scope(timeout):
+            try:
+                with self.admission.admit(request_class):
+                    response = await self._route_request(
+                        prompt, model_id, task_type, trace_id, tenant, request_class, **kwargs
+                    )
+                success = True
+                return response
+            except DeadlineExceededError:
+                get_performance_metrics().increment("route_request.deadline_miss")
+                raise
+            except OverloadedError as e:
+                logger.warning(f"Request shed: {e.message}")
+                raise
+            finally:
+                _record_stage("total", start, success)
+
+    async def _route_request(
+        self,
+        prompt: str,
+        model_id: str | None,
+        task_type: TaskType | None,
+        trace_id: str | None,
+        tenant: str | None,
+        request_class: RequestClass | str,
+        **kwargs,
+    ) -> APIResponse:
         # Generate or use provided trace ID for request correlation
         request_trace_id = trace_id or get_current_trace_id() or generate_trace_id()
 
         async with AsyncSpanContext(
             "route_request",
             trace_id=request_trace_id,
-            attributes={"model_id": model_id, "task_type": str(task_type)},
+            attributes={
+                "model_id": model_id,
+                "task_type": str(task_type),
+                "deadline_remaining_s": get_remaining_time(),
+                "tenant": tenant,
+                "request_class": str(request_class),
+            },
         ):
             # 1. Analyze Task
-            requirements = await self.analyzer.analyze_async(prompt)
-            if task_type:
-                requirements.task_type = task_type
+            stage_start = time.perf_counter()
+            with SpanContext("analyze") as span:
+                requirements = await self.analyzer.analyze_async(prompt)
+                if task_type:
+                    requirements.task_type = task_type
+                span.attributes["task_type"] = requirements.task_type.name
+            _record_stage("analyze", stage_start)
 
             logger.info(
                 f"Analyzed task: {requirements.task_type.name}, Priority: {requirements.priority}",
@@ -97,6 +196,7 @@ class ModelOrchestrator:
             )
 
             # 2. Select Model
+            stage_start = time.perf_counter()
             selected_model_id = model_id
 
             # Check for LATTICE_DEFAULT_MODEL override if no specific model requested
@@ -110,7 +210,9 @@ class ModelOrchestrator:
                     )
 
             if not selected_model_id:
-                selected_model_id = self.selector.select_best_model(requirements)
+                with SpanContext("select") as span:
+                    selected_model_id = self.selector.select_best_model(requirements)
+                    span.attributes["model_id"] = selected_model_id
 
             if not selected_model_id:
                 raise ValueError("No suitable model found for request")
@@ -118,6 +220,7 @@ class ModelOrchestrator:
             model_cap = self.registry.get_model(selected_model_id)
             if not model_cap:
                 raise ValueError(f"Model {selected_model_id} not found in registry")
+            _record_stage("select", stage_start)
 
             logger.info(
                 f"Selected model: {selected_model_id} ({model_cap.provider.value})",
@@ -129,17 +232,15 @@ class ModelOrchestrator:
             messages = kwargs.pop("messages", [{"role": "user", "content": prompt}])
 
             try:
-                # Get client from pool
-                client = self.client_pool.get_client(model_cap.provider.value)
-
                 # Execute conversation (single turn logic wrapped in conversation executor for now)
                 # But route_request is often single turn. ConversationExecutor handles tool loops.
-                return await self.executor.execute(
-                    model_cap=model_cap,
-                    client=client,
-                    messages=messages,
-                    trace_id=request_trace_id,
-                    task_type=requirements.task_type.name,  # Pass task type for tracking
+                return await self._execute_scheduled(
+                    model_cap,
+                    messages,
+                    request_trace_id,
+                    requirements,
+                    tenant,
+                    request_class,
                     **kwargs,
                 )
 
@@ -161,16 +262,160 @@ class ModelOrchestrator:
                 prompt,
                 failed_model=selected_model_id,
                 trace_id=request_trace_id,
+                tenant=tenant,
+                request_class=request_class,
                 messages=messages,
                 **kwargs,
             )
 
+    async def route_map_reduce(
+        self,
+        content: str,
+        instruction: str,
+        task_type: TaskType | None = None,
+        chunk_model: str | None = None,
+        reduce_model: str | None = None,
+        max_chunk_tokens: int = DEFAULT_MAX_CHUNK_TOKENS,
+        max_parallel: int = 8,
+        **kwargs,
+    ) -> APIResponse:
+        """
+        Route a request whose input is too large for most models' context window.
+
+        The content is split into chunks sized from the chunk model's context
+        window, the chunks are processed in parallel on a cheap fast model, and the
+        partial answers are reduced into a single response.
+
+        Args:
+            content: The oversized input (large log, whole file set, document).
+            instruction: What to do with the content.
+            task_type: Optional task type; analyzed from the instruction if omitted.
+            chunk_model: Model for the chunk calls. Defaults to the cheapest fast
+                model with at least MIN_CHUNK_CONTEXT tokens of context.
+            reduce_model: Model for combining partial answers (routed if omitted).
+            max_chunk_tokens: Upper bound on input tokens per chunk.
+            max_parallel: Maximum model calls in flight at once.
+            **kwargs: Additional arguments passed to the API client.
+
+        Returns:
+            The reduced APIResponse, with usage summed over all calls.
+        """
+        if task_type is None:
+            task_type = (await self.analyzer.analyze_async(instruction)).task_type
+
+        chunk_model = chunk_model or self._select_chunk_model(task_type)
+        chunk_tokens = chunk_token_budget(
+            self._context_window(chunk_model), instruction, max_chunk_tokens
+        )
+        reduce_tokens = (
+            chunk_token_budget(self._context_window(reduce_model), instruction, max_chunk_tokens)
+            if reduce_model
+            else None
+        )
+
+        executor = MapReduceExecutor(self.route_request, max_parallel=max_parallel)
+        return await executor.execute(
+            content,
+            instruction,
+            chunk_model=chunk_model,
+            chunk_tokens=chunk_tokens,
+            reduce_model=reduce_model,
+            reduce_tokens=reduce_tokens,
+            task_type=task_type,
+            **kwargs,
+        )
+
+    async def route_cascade(
+        self,
+        prompt: str,
+        check: AcceptanceCheck | None = None,
+        task_type: TaskType | None = None,
+        models: list[str] | None = None,
+        max_tiers: int = 3,
+        **kwargs,
+    ) -> APIResponse:
+        """
+        Route a request cheap-first, escalating to stronger models only when needed.
+
+        The cheapest eligible model answers first; if ``check`` rejects the answer
+        the request moves to the next, stronger model. Escalation rate, latency and
+        cost saved are accumulated per task type in ``self.cascade_stats``.
+
+        Args:
+            prompt: The user prompt.
+            check: Acceptance check for answers. Defaults to asking the model for a
+                self-reported confidence of at least 0.7.
+            task_type: Optional manual task type override.
+            models: Explicit model ladder, cheapest first. Built from the registry
+                if omitted.
+            max_tiers: Maximum number of models in a generated ladder.
+            **kwargs: Additional arguments passed to the API client.
+
+        Returns:
+            The first accepted APIResponse (or the strongest model's answer), with
+            usage covering every attempt.
+        """
+        requirements = await self.analyzer.analyze_async(prompt)
+        if task_type:
+            requirements.task_type = task_type
+
+        ladder = models or self._cascade_ladder(requirements, max_tiers)
+        if not ladder:
+            raise ValueError("No suitable model found for request")
+        logger.info(f"Cascade ladder for {requirements.task_type.name}: {' -> '.join(ladder)}")
+
+        executor = CascadeExecutor(self.route_request, self.registry, self.cascade_stats)
+        return await executor.execute(
+            prompt,
+            ladder,
+            check or SelfReportedConfidenceCheck(),
+            task_type=requirements.task_type,
+            **kwargs,
+        )
+
+    def _cascade_ladder(self, requirements: TaskRequirements, max_tiers: int) -> list[str]:
+        """
+        Cheapest eligible model first, then progressively stronger models, ending
+        with the model normal routing would pick.
+        """
+        ladder: list[str] = []
+        best_quality = -1.0
+        for model_id in self.selector.rank_by_cost(requirements):
+            model_cap = self.registry.get_model(model_id)
+            if model_cap is None:
+                continue
+            quality = (model_cap.reasoning_score + model_cap.coding_score) / 2
+            if quality > best_quality:
+                ladder.append(model_id)
+                best_quality = quality
+
+        strongest = self.selector.select_best_model(requirements)
+        if strongest:
+            ladder = [m for m in ladder if m != strongest][: max(max_tiers - 1, 0)] + [strongest]
+        return ladder[:max_tiers]
+
+    def _select_chunk_model(self, task_type: TaskType) -> str | None:
+        """Cheapest fast model able to take a reasonably sized chunk."""
+        requirements = TaskRequirements(
+            task_type=task_type, min_context=MIN_CHUNK_CONTEXT, priority="speed"
+        )
+        ranked = self.selector.rank_by_cost(requirements, min_speed=FAST_MODEL_SPEED)
+        if not ranked:
+            ranked = self.selector.rank_by_cost(requirements)
+        return ranked[0] if ranked else None
+
+    def _context_window(self, model_id: str | None) -> int:
+        model_cap = self.registry.get_model(model_id) if model_id else None
+        return model_cap.context_window if model_cap else DEFAULT_CONTEXT_WINDOW
+
     async def _handle_fallback(
         self,
         requirements: TaskRequirements,
         prompt: str,
         failed_model: str,
         trace_id: str | None = None,
+        tenant: str | None = None,
+        request_class: RequestClass | str = RequestClass.INTERACTIVE,
         **kwargs,
     ) -> APIResponse:
         """
@@ -179,6 +424,7 @@ class ModelOrchestrator:
         and ClientPool/Executor for execution.
         """
         request_trace_id = trace_id or get_current_trace_id() or "unknown"
+        self._check_fallback_budget(failed_model, request_trace_id)
 
         # Get fallback chain
         chain = self.selector.get_fallback_chain(requirements, failed_model)
@@ -191,7 +437,7 @@ class ModelOrchestrator:
                 f"Please configure credentials for at least one provider."
             )
 
-        failed_attempts = []
+        failed_attempts: list[tuple[str, str]] = []
         for model_id in chain:
             if model_id == failed_model:
                 continue
@@ -205,13 +451,14 @@ class ModelOrchestrator:
             # but guide-based chains might include unavailable ones.
             # ClientPool.get_client will raise if unavailable, so we catch it.
 
+            self._check_fallback_budget(model_id, request_trace_id, failed_attempts)
+
             logger.info(
                 f"Attempting fallback to: {model_id} ({model_cap.provider.value})",
                 extra={"trace_id": request_trace_id},
             )
 
             try:
-                client = self.client_pool.get_client(model_cap.provider.value)
                 # Use pop to ensure messages isn't passed twice (once here, once in kwargs)
                 # But be careful: we need messages for subsequent loop iterations if this one fails.
                 # So we should get it, but ensure we don't pass it in **kwargs to execute
@@ -226,12 +473,13 @@ class ModelOrchestrator:
                 pass_kwargs = kwargs.copy()
                 iter_messages = pass_kwargs.pop("messages", [{"role": "user", "content": prompt}])
 
-                response = await self.executor.execute(
-                    model_cap=model_cap,
-                    client=client,
-                    messages=iter_messages,
-                    trace_id=request_trace_id,
-                    task_type=requirements.task_type.name,
+                response = await self._execute_scheduled(
+                    model_cap,
+                    iter_messages,
+                    request_trace_id,
+                    requirements,
+                    tenant,
+                    request_class,
                     **pass_kwargs,
                 )
 
@@ -241,6 +489,8 @@ class ModelOrchestrator:
                     continue
                 return response
 
+            except DeadlineExceededError:
+                raise
             except ProviderUnavailableError as e:
                 logger.warning(f"Fallback model {model_id} provider unavailable: {e.message}")
                 failed_attempts.append((model_id, e.message))
@@ -264,6 +514,76 @@ class ModelOrchestrator:
             f"Check your API credentials and provider configuration."
         )
 
+    async def _execute_scheduled(
+        self,
+        model_cap: ModelCapabilities,
+        messages: list[dict],
+        trace_id: str,
+        requirements: TaskRequirements,
+        tenant: str | None,
+        request_class: RequestClass | str,
+        **kwargs,
+    ) -> APIResponse:
+        """Run the conversation on ``model_cap`` once the scheduler grants a provider slot."""
+        # Get client from pool before queueing, so unavailable providers fail fast
+        provider = model_cap.provider.value
+        client = self.client_pool.get_client(provider)
+        if (
+            isinstance(client, EndpointPool)
+            and self.scheduler.provider_concurrency.get(provider) != client.capacity
+        ):
+            # Scale provider slots with the endpoints currently serving it
+            self.scheduler.set_provider_concurrency(provider, client.capacity)
+        stage_start = time.perf_counter()
+        async with self.scheduler.slot(provider, tenant, request_class):
+            queue_wait_ms = (time.perf_counter() - stage_start) * 1000
+            _record_stage("queue", stage_start)
+            stage_start = time.perf_counter()
+            success = False
+            try:
+                async with AsyncSpanContext(
+                    "provider.execute",
+                    attributes={
+                        "provider": provider,
+                        "model": model_cap.api_name,
+                        "queue_wait_ms": queue_wait_ms,
+                    },
+                ):
+                    response = await self.executor.execute(
+                        model_cap=model_cap,
+                        client=client,
+                        messages=messages,
+                        trace_id=trace_id,
+                        task_type=requirements.task_type.name,  # Pass task type for tracking
+                        **kwargs,
+                    )
+                success = not response.error
+                return response
+            finally:
+                _record_stage("provider", stage_start, success)
+
+    def _check_fallback_budget(
+        self,
+        model_id: str,
+        trace_id: str,
+        failed_attempts: list[tuple[str, str]] | None = None,
+    ) -> None:
+        """Raise DeadlineExceededError if too little of the deadline is left to try ``model_id``."""
+        remaining = get_remaining_time()
+        if remaining is None or remaining >= self.min_fallback_budget:
+            return
+
+        get_performance_metrics().increment("route_request.fallback_skipped")
+        logger.warning(
+            f"Skipping fallback after {model_id}: {max(remaining, 0.0):.2f}s of deadline left",
+            extra={"trace_id": trace_id},
+        )
+        attempted = "; ".join(f"{m}: {e}" for m, e in failed_attempts or [])
+        raise DeadlineExceededError(
+            f"Deadline too close to attempt fallback ({max(remaining, 0.0):.2f}s left)"
+            + (f". Attempted: {attempted}" if attempted else "")
+        )
+
     def get_available_providers(self) -> list[str]:
         """Get list of providers that have credentials configured."""
         from .providers import ProviderAvailability
@@ -30,6 +30,22 @@ class ProviderConnectionError(APIClientError):
     pass
 
 
+class DeadlineExceededError(APIClientError):
+    """Raised when a request's deadline passes before it (or its fallbacks) complete."""
+
+    pass
+
+
+class OverloadedError(APIClientError):
+    """Raised when the orchestrator sheds a request under overload. Safe to retry later."""
+
+    def __init__(self, message: str, retry_after: float | None = None, **kwargs):
+        super().__init__(message, status_code=503, **kwargs)
+        self.retry_after = retry_after
+        if retry_after is not None:
+            self.details["retry_after"] = retry_after
+
+
 class InvalidPolicyError(APIClientError):
     """Raised when a request violates configured policies."""
 
@@ -1,4 +1,18 @@
+from .admission import AdmissionController
+from .cascade import CascadeExecutor
 from .client_pool import ClientPool
 from .conversation import ConversationExecutor
+from .endpoint_pool import EndpointPool
+from .map_reduce import MapReduceExecutor
+from .scheduler import FairScheduler, RequestClass
 
-__all__ = ["ConversationExecutor", "ClientPool"]
+__all__ = [
+    "AdmissionController",
+    "ConversationExecutor",
+    "EndpointPool",
+    "ClientPool",
+    "MapReduceExecutor",
+    "CascadeExecutor",
+    "FairScheduler",
+    "RequestClass",
+]
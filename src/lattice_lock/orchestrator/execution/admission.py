@@ -0,0 +1,157 @@
+"""
+Admission control and load shedding for orchestrator requests.
+
+Overload is detected the way CoDel detects a standing queue: the controller
+watches how long admitted requests wait for a provider slot, and once that wait
+has stayed above ``target_delay_ms`` for a whole ``interval_ms`` the
+orchestrator is considered overloaded. While overloaded, batch requests are
+rejected outright and interactive requests are shed at a rate that grows with
+the square root of the number already shed, until waits fall back under target.
+A hard cap on in-flight requests applies regardless of queueing delay.
+
+Rejected requests raise OverloadedError, which carries a ``retry_after`` hint so
+callers can back off instead of retrying immediately.
+"""
+
+import logging
+import math
+import time
+from collections.abc import Iterator
+from contextlib import contextmanager
+from typing import Any
+
+from lattice_lock.orchestrator.exceptions import OverloadedError
+from lattice_lock.tracing import get_performance_metrics
+
+from .scheduler import RequestClass
+
+logger = logging.getLogger(__name__)
+
+# Acceptable queueing delay before a request reaches a provider
+DEFAULT_TARGET_DELAY_MS = 100.0
+# How long the delay must stay above target before shedding starts
+DEFAULT_INTERVAL_MS = 1000.0
+# Hard cap on concurrently admitted requests
+DEFAULT_MAX_IN_FLIGHT = 512
+
+
+class AdmissionController:
+    """
+    Decides whether a new request is admitted, based on in-flight count and the
+    queueing delay of recently admitted requests.
+    """
+
+    def __init__(
+        self,
+        target_delay_ms: float = DEFAULT_TARGET_DELAY_MS,
+        interval_ms: float = DEFAULT_INTERVAL_MS,
+        max_in_flight: int = DEFAULT_MAX_IN_FLIGHT,
+    ):
+        """
+        Args:
+            target_delay_ms: Queueing delay considered healthy.
+            interval_ms: Time the delay must exceed the target before shedding.
+            max_in_flight: Requests admitted concurrently before all new ones are rejected.
+        """
+        self.target_delay_ms = target_delay_ms
+        self.interval_ms = interval_ms
+        self.max_in_flight = max_in_flight
+
+        self.in_flight = 0
+        self.admitted = 0
+        self.shed: dict[str, int] = {rc.value: 0 for rc in RequestClass}
+        self.last_delay_ms = 0.0
+
+        self._first_above: float | None = None  # when the delay would count as standing
+        self._dropping = False
+        self._drop_count = 0
+        self._drop_next = 0.0
+
+    @property
+    def overloaded(self) -> bool:
+        return self._dropping
+
+    def record_delay(self, delay_ms: float) -> None:
+        """Feed the queueing delay of a request that has just reached a provider."""
+        now = time.monotonic()
+        self.last_delay_ms = delay_ms
+        if delay_ms < self.target_delay_ms:
+            self._first_above = None
+            if self._dropping:
+                logger.info(f"Queueing delay back under {self.target_delay_ms:g}ms; admitting all")
+            self._dropping = False
+            return
+
+        if self._first_above is None:
+            self._first_above = now + self.interval_ms / 1000
+        elif now >= self._first_above and not self._dropping:
+            logger.warning(
+                f"Queueing delay above {self.target_delay_ms:g}ms for "
+                f"{self.interval_ms:g}ms ({delay_ms:.0f}ms); shedding load"
+            )
+            self._dropping = True
+            self._drop_count = 0
+            self._drop_next = now
+
+    @contextmanager
+    def admit(self, request_class: RequestClass | str = RequestClass.INTERACTIVE) -> Iterator[None]:
+        """
+        Hold an admission for the enclosed request.
+
+        Raises:
+            OverloadedError: If the request is shed.
+        """
+        request_class = RequestClass(request_class)
+        reason = self._shed_reason(request_class)
+        if reason:
+            self.shed[request_class.value] += 1
+            get_performance_metrics().increment(f"admission.shed.{request_class.value}")
+            raise OverloadedError(
+                f"Orchestrator overloaded ({reason}); {request_class.value} request rejected",
+                retry_after=self.retry_after,
+            )
+
+        self.in_flight += 1
+        self.admitted += 1
+        try:
+            yield
+        finally:
+            self.in_flight -= 1
+            if self.in_flight == 0:
+                # Nothing left queued: a standing queue cannot persist
+                self._first_above = None
+                self._dropping = False
+
+    @property
+    def retry_after(self) -> float:
+        """Seconds callers should wait before retrying a shed request."""
+        return max(self.interval_ms, self.last_delay_ms) / 1000
+
+    def stats(self) -> dict[str, Any]:
+        return {
+            "in_flight": self.in_flight,
+            "max_in_flight": self.max_in_flight,
+            "admitted": self.admitted,
+            "overloaded": self._dropping,
+            "queue_delay_ms": self.last_delay_ms,
+            "target_delay_ms": self.target_delay_ms,
+            "shed": dict(self.shed),
+        }
+
+    def _shed_reason(self, request_class: RequestClass) -> str | None:
+        if self.in_flight >= self.max_in_flight:
+            return f"{self.in_flight} requests in flight"
+        if not self._dropping:
+            return None
+
+        delay = f"queueing delay {self.last_delay_ms:.0f}ms > {self.target_delay_ms:g}ms"
+        if request_class is RequestClass.BATCH:
+            return delay
+
+        # CoDel control law: shed interactive requests at increasing frequency
+        now = time.monotonic()
+        if now < self._drop_next:
+            return None
+        self._drop_count += 1
+        self._drop_next = now + self.interval_ms / 1000 / math.sqrt(self._drop_count)
+        return delay
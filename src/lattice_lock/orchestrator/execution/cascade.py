@@ -0,0 +1,362 @@
+"""
+Cheap-first model cascade with confidence-gated escalation.
+
+A request is first answered by the cheapest model in a ladder of progressively
+stronger models. A local acceptance check decides whether the answer is good
+enough; only when it is not does the request escalate to the next model.
+Per-task-type statistics record how often escalation happens, the latency it
+adds and the cost saved compared with always using the strongest model.
+"""
+
+import json
+import logging
+import re
+import time
+from abc import ABC, abstractmethod
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass, field
+from typing import Any
+
+from lattice_lock.orchestrator.registry import ModelRegistry
+from lattice_lock.orchestrator.types import APIResponse, TaskType, TokenUsage
+
+logger = logging.getLogger(__name__)
+
+RouteFn = Callable[..., Awaitable[APIResponse]]
+
+CONFIDENCE_INSTRUCTION = (
+    "\n\nAfter your answer, add a final line of the form `CONFIDENCE: <0.0-1.0>` "
+    "stating how confident you are that the answer is correct and complete."
+)
+
+VERIFIER_TEMPLATE = """You are reviewing an answer produced by another model.
+
+Request:
+{prompt}
+
+Answer:
+{answer}
+
+Is the answer correct, complete and responsive to the request? Reply with ACCEPT or
+REJECT on the first line, followed by a one-sentence reason."""
+
+# Matches "CONFIDENCE: 0.8", tolerating markdown emphasis such as "**Confidence:** 0.8"
+_CONFIDENCE_RE = re.compile(
+    r"^\s*\**confidence\**\s*[:=]\s*\**\s*([01](?:\.\d+)?)\s*\**\s*$", re.I | re.M
+)
+
+
+@dataclass
+class CheckResult:
+    """Outcome of an acceptance check on one answer."""
+
+    accepted: bool
+    confidence: float | None = None
+    reason: str = ""
+
+
+class AcceptanceCheck(ABC):
+    """
+    Decides whether a cascade answer is good enough to return.
+
+    Subclasses implement ``evaluate``; ``prepare_prompt`` may add instructions the
+    check relies on (for example asking the model to report its confidence).
+    """
+
+    def prepare_prompt(self, prompt: str) -> str:
+        return prompt
+
+    @abstractmethod
+    async def evaluate(self, prompt: str, response: APIResponse) -> CheckResult:
+        """Judge ``response`` to ``prompt``."""
+
+
+class NonEmptyCheck(AcceptanceCheck):
+    """Accepts any answer that is not blank and did not report an error."""
+
+    async def evaluate(self, prompt: str, response: APIResponse) -> CheckResult:
+        if response.error:
+            return CheckResult(False, reason=f"error: {response.error}")
+        if not (response.content or "").strip():
+            return CheckResult(False, reason="empty answer")
+        return CheckResult(True)
+
+
+class JSONFormatCheck(AcceptanceCheck):
+    """Accepts answers that parse as a JSON object containing the required keys."""
+
+    def __init__(self, required_keys: list[str] | None = None):
+        self.required_keys = list(required_keys or [])
+
+    async def evaluate(self, prompt: str, response: APIResponse) -> CheckResult:
+        text = (response.content or "").strip()
+        # Tolerate a fenced code block around the JSON
+        if text.startswith("```"):
+            text = text.strip("`").removeprefix("json").strip()
+        try:
+            data = json.loads(text)
+        except json.JSONDecodeError as e:
+            return CheckResult(False, reason=f"invalid JSON: {e.msg}")
+        if not isinstance(data, dict):
+            return CheckResult(False, reason="JSON is not an object")
+        missing = [k for k in self.required_keys if k not in data]
+        if missing:
+            return CheckResult(False, reason=f"missing keys: {', '.join(missing)}")
+        return CheckResult(True)
+
+
+class RegexFormatCheck(AcceptanceCheck):
+    """Accepts answers matching a regular expression."""
+
+    def __init__(self, pattern: str, flags: int = re.S):
+        self.pattern = re.compile(pattern, flags)
+
+    async def evaluate(self, prompt: str, response: APIResponse) -> CheckResult:
+        if self.pattern.search(response.content or ""):
+            return CheckResult(True)
+        return CheckResult(False, reason=f"answer does not match {self.pattern.pattern!r}")
+
+
+class SelfReportedConfidenceCheck(AcceptanceCheck):
+    """
+    Asks the model to append a confidence score and accepts answers at or above
+    ``threshold``. The confidence line is removed from the returned content.
+    """
+
+    def __init__(self, threshold: float = 0.7):
+        self.threshold = threshold
+
+    def prepare_prompt(self, prompt: str) -> str:
+        return prompt + CONFIDENCE_INSTRUCTION
+
+    async def evaluate(self, prompt: str, response: APIResponse) -> CheckResult:
+        matches = list(_CONFIDENCE_RE.finditer(response.content or ""))
+        if not matches:
+            return CheckResult(False, reason="no confidence reported")
+        last = matches[-1]
+        confidence = min(1.0, float(last.group(1)))
+        response.content = (
+            response.content[: last.start()] + response.content[last.end() :]
+        ).strip()
+        if confidence < self.threshold:
+            return CheckResult(False, confidence, f"confidence {confidence:.2f} < {self.threshold}")
+        return CheckResult(True, confidence)
+
+
+class VerifierCheck(AcceptanceCheck):
+    """Asks a (cheap) verifier model to accept or reject the answer."""
+
+    def __init__(self, route: RouteFn, verifier_model: str | None = None):
+        self.route = route
+        self.verifier_model = verifier_model
+
+    async def evaluate(self, prompt: str, response: APIResponse) -> CheckResult:
+        verdict = await self.route(
+            VERIFIER_TEMPLATE.format(prompt=prompt, answer=response.content),
+            model_id=self.verifier_model,
+        )
+        first_line, _, reason = (verdict.content or "").strip().partition("\n")
+        accepted = first_line.strip().upper().startswith("ACCEPT")
+        return CheckResult(accepted, reason=reason.strip() or first_line.strip())
+
+
+@dataclass
+class CascadeTaskStats:
+    """Cascade statistics for one task type."""
+
+    requests: int = 0
+    escalations: int = 0  # requests that needed more than the first model
+    unaccepted: int = 0  # requests where no model passed the check
+    total_latency_ms: float = 0.0
+    total_cost: float = 0.0
+    cost_saved: float = 0.0  # versus sending the request to the strongest model only
+    accepted_by_tier: dict[int, int] = field(default_factory=dict)
+
+    @property
+    def escalation_rate(self) -> float:
+        return self.escalations / self.requests if self.requests else 0.0
+
+    @property
+    def avg_latency_ms(self) -> float:
+        return self.total_latency_ms / self.requests if self.requests else 0.0
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "requests": self.requests,
+            "escalations": self.escalations,
+            "escalation_rate": self.escalation_rate,
+            "unaccepted": self.unaccepted,
+            "avg_latency_ms": self.avg_latency_ms,
+            "total_cost": self.total_cost,
+            "cost_saved": self.cost_saved,
+            "accepted_by_tier": dict(self.accepted_by_tier),
+        }
+
+
+class CascadeStats:
+    """Cascade statistics keyed by task type."""
+
+    def __init__(self):
+        self.by_task: dict[str, CascadeTaskStats] = {}
+
+    def record(
+        self,
+        task_type: str,
+        tiers_used: int,
+        accepted_tier: int | None,
+        latency_ms: float,
+        cost: float,
+        baseline_cost: float,
+    ) -> None:
+        stats = self.by_task.setdefault(task_type, CascadeTaskStats())
+        stats.requests += 1
+        if tiers_used > 1:
+            stats.escalations += 1
+        if accepted_tier is None:
+            stats.unaccepted += 1
+        else:
+            stats.accepted_by_tier[accepted_tier] = stats.accepted_by_tier.get(accepted_tier, 0) + 1
+        stats.total_latency_ms += latency_ms
+        stats.total_cost += cost
+        stats.cost_saved += baseline_cost - cost
+
+    def to_dict(self) -> dict[str, dict[str, Any]]:
+        return {task: stats.to_dict() for task, stats in self.by_task.items()}
+
+
+class CascadeExecutor:
+    """
+    Runs a request through a ladder of models, cheapest first, until one answer
+    passes the acceptance check.
+    """
+
+    def __init__(self, route: RouteFn, registry: ModelRegistry, stats: CascadeStats | None = None):
+        """
+        Args:
+            route: Coroutine used for every model call, with the signature of
+                ``ModelOrchestrator.route_request``.
+            registry: Registry used to price answers for the cost-saved statistic.
+            stats: Statistics to update; a new instance is created if omitted.
+        """
+        self.route = route
+        self.registry = registry
+        self.stats = stats or CascadeStats()
+
+    async def execute(
+        self,
+        prompt: str,
+        models: list[str],
+        check: AcceptanceCheck,
+        task_type: TaskType | None = None,
+        **kwargs,
+    ) -> APIResponse:
+        """
+        Answer ``prompt`` with the first model in ``models`` whose answer passes ``check``.
+
+        If no answer passes, the answer of the last (strongest) model is returned.
+        The response's usage covers every attempt, and ``raw_response["cascade"]``
+        lists the attempts with their check results.
+        """
+        if not models:
+            raise ValueError("Cascade requires at least one model")
+
+        start = time.perf_counter()
+        prepared = check.prepare_prompt(prompt)
+        attempts: list[dict[str, Any]] = []
+        total_cost = 0.0
+        usage = TokenUsage(prompt_tokens=0, completion_tokens=0, total_tokens=0, cost=0.0)
+        response: APIResponse | None = None
+        accepted_tier: int | None = None
+
+        for tier, model_id in enumerate(models):
+            attempt_start = time.perf_counter()
+            try:
+                candidate = await self.route(
+                    prepared, model_id=model_id, task_type=task_type, **kwargs
+                )
+            except Exception as e:
+                logger.warning(f"Cascade tier {tier} ({model_id}) failed: {e}")
+                attempts.append({"model": model_id, "accepted": False, "reason": str(e)})
+                continue
+
+            response = candidate
+            try:
+                result = await check.evaluate(prompt, response)
+            except Exception as e:
+                result = CheckResult(False, reason=f"acceptance check failed: {e}")
+            cost = self._cost(response.model or model_id, response.usage)
+            total_cost += cost
+            self._add_usage(usage, response.usage)
+            attempts.append(
+                {
+                    "model": response.model or model_id,
+                    "accepted": result.accepted,
+                    "confidence": result.confidence,
+                    "reason": result.reason,
+                    "latency_ms": (time.perf_counter() - attempt_start) * 1000,
+                    "cost": cost,
+                }
+            )
+            if result.accepted:
+                accepted_tier = tier
+                break
+            logger.info(
+                f"Cascade escalating from {model_id} ({tier + 1}/{len(models)}): {result.reason}"
+            )
+
+        if response is None:
+            details = "; ".join(f"{a['model']}: {a['reason']}" for a in attempts)
+            raise RuntimeError(f"All cascade models failed: {details}")
+
+        latency_ms = (time.perf_counter() - start) * 1000
+        self.stats.record(
+            task_type.name if task_type else TaskType.GENERAL.name,
+            tiers_used=len(attempts),
+            accepted_tier=accepted_tier,
+            latency_ms=latency_ms,
+            cost=total_cost,
+            baseline_cost=self._price(models[-1], response.usage) or total_cost,
+        )
+
+        usage.cost = total_cost
+        response.usage = usage
+        response.latency_ms = int(latency_ms)
+        response.raw_response = {
+            **(response.raw_response or {}),
+            "cascade": {"attempts": attempts, "accepted_tier": accepted_tier},
+        }
+        return response
+
+    def _cost(self, model_id: str, usage: Any) -> float:
+        """Reported cost of an answer, or its price from the registry if not reported."""
+        if isinstance(usage, TokenUsage) and usage.cost:
+            return usage.cost
+        return self._price(model_id, usage)
+
+    def _price(self, model_id: str, usage: Any) -> float:
+        """What ``usage`` costs at ``model_id``'s registry prices (0.0 if unknown)."""
+        prompt_tokens, completion_tokens = self._token_counts(usage)
+        model_cap = self.registry.get_model(model_id)
+        if not model_cap:
+            return 0.0
+        return (
+            prompt_tokens * model_cap.input_cost + completion_tokens * model_cap.output_cost
+        ) / 1_000_000
+
+    @staticmethod
+    def _token_counts(usage: Any) -> tuple[int, int]:
+        if isinstance(usage, TokenUsage):
+            return usage.prompt_tokens, usage.completion_tokens
+        if isinstance(usage, dict):
+            return (
+                int(usage.get("prompt_tokens") or usage.get("input_tokens") or 0),
+                int(usage.get("completion_tokens") or usage.get("output_tokens") or 0),
+            )
+        return 0, 0
+
+    @classmethod
+    def _add_usage(cls, total: TokenUsage, usage: Any) -> None:
+        prompt_tokens, completion_tokens = cls._token_counts(usage)
+        total.prompt_tokens += prompt_tokens
+        total.completion_tokens += completion_tokens
+        total.total_tokens += prompt_tokens + completion_tokens
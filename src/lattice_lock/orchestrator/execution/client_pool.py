@@ -1,10 +1,92 @@
 import logging
+import os
+import weakref
 
+from lattice_lock.config import get_config
+from lattice_lock.metrics import MetricFamily, get_metrics_registry
 from lattice_lock.orchestrator.providers import ProviderUnavailableError, get_api_client
 from lattice_lock.orchestrator.providers.base import BaseAPIClient
 
+from .endpoint_pool import (
+    DEFAULT_ENDPOINT_CONCURRENCY,
+    HEALTH_CHECK_INTERVAL,
+    Endpoint,
+    EndpointPool,
+)
+
 logger = logging.getLogger(__name__)
 
+# Comma-separated endpoint lists that turn a provider into an EndpointPool
+ENDPOINT_ENV_VARS = {
+    "ollama": "CUSTOM_API_URLS",
+    "local": "CUSTOM_API_URLS",
+    "vllm": "VLLM_API_URLS",
+    "azure": "AZURE_OPENAI_ENDPOINTS",
+}
+# Client constructor argument that receives the endpoint URL, per provider
+ENDPOINT_KWARGS = {
+    "ollama": "base_url",
+    "local": "base_url",
+    "vllm": "base_url",
+    "openai": "base_url",
+    "azure": "endpoint",
+}
+
+
+# Pools with initialized clients, reported together by one metrics collector
+_live_pools: "weakref.WeakSet[ClientPool]" = weakref.WeakSet()
+
+
+def _collect_metrics() -> list[MetricFamily]:
+    """Report initialized clients and endpoint pool state across all live client pools."""
+    clients: dict[str, int] = {}
+    endpoints: dict[tuple[str, str], list[Endpoint]] = {}
+    for pool in list(_live_pools):
+        for provider, client in list(pool._clients.items()):
+            clients[provider] = clients.get(provider, 0) + 1
+            if not isinstance(client, EndpointPool):
+                continue
+            for endpoint in client.endpoints:
+                endpoints.setdefault((provider, endpoint.url), []).append(endpoint)
+
+    clients_family = MetricFamily(
+        "lattice_client_pool_clients", "gauge", "Initialized API clients by provider."
+    )
+    outstanding = MetricFamily(
+        "lattice_endpoint_outstanding_requests", "gauge", "In-flight requests per endpoint."
+    )
+    requests = MetricFamily(
+        "lattice_endpoint_requests_total", "counter", "Requests sent to each endpoint."
+    )
+    failures = MetricFamily(
+        "lattice_endpoint_failures_total", "counter", "Failed requests per endpoint."
+    )
+    latency = MetricFamily(
+        "lattice_endpoint_latency_ewma_seconds",
+        "gauge",
+        "Exponentially weighted average latency per endpoint.",
+    )
+    available = MetricFamily(
+        "lattice_endpoint_available", "gauge", "1 if the endpoint is healthy and not ejected."
+    )
+    for provider, count in clients.items():
+        clients_family.add(count, provider=provider)
+    # The same endpoint can sit behind several pools: counts are summed, latency
+    # averaged, and it is only reported available if every pool can use it
+    for (provider, url), shared in endpoints.items():
+        labels = {"provider": provider, "endpoint": url}
+        outstanding.add(sum(e.outstanding for e in shared), **labels)
+        requests.add(sum(e.requests for e in shared), **labels)
+        failures.add(sum(e.failures for e in shared), **labels)
+        latencies = [e.latency_ewma_ms for e in shared if e.latency_ewma_ms is not None]
+        if latencies:
+            latency.add(sum(latencies) / len(latencies) / 1000, **labels)
+        available.add(int(all(e.available for e in shared)), **labels)
+    return [clients_family, outstanding, requests, failures, latency, available]
+
+
+get_metrics_registry().register_collector(_collect_metrics)
+
 
 class ClientPool:
     """
@@ -14,11 +96,78 @@ class ClientPool:
 
     def __init__(self):
         self._clients: dict[str, BaseAPIClient] = {}
+        self._endpoints: dict[str, tuple[list[str], int]] = {}
+        _live_pools.add(self)
+
+    def register_endpoints(
+        self,
+        provider: str,
+        urls: list[str],
+        max_concurrency: int = DEFAULT_ENDPOINT_CONCURRENCY,
+    ) -> None:
+        """
+        Back ``provider`` with a pool of endpoints instead of a single client.
+
+        Takes effect the next time the provider's client is created.
+
+        Args:
+            provider: The provider name (e.g., 'ollama', 'azure').
+            urls: Endpoint base URLs (Azure: resource endpoints).
+            max_concurrency: Concurrent requests allowed per endpoint.
+        """
+        if provider not in ENDPOINT_KWARGS:
+            raise ValueError(f"Provider '{provider}' does not support endpoint pools")
+        self._endpoints[provider] = (list(urls), max_concurrency)
+        self._clients.pop(provider, None)
+
+    def register_client(self, provider: str, client: BaseAPIClient) -> None:
+        """Use an already configured client for ``provider`` (e.g. a mock server client)."""
+        self._clients[provider] = client
+        _live_pools.add(self)
+
+    def _endpoint_config(self, provider: str) -> tuple[list[str], int] | None:
+        if provider in self._endpoints:
+            return self._endpoints[provider]
+        env_var = ENDPOINT_ENV_VARS.get(provider)
+        urls = (
+            [u.strip() for u in os.getenv(env_var, "").split(",") if u.strip()] if env_var else []
+        )
+        if len(urls) > 1:
+            concurrency = int(
+                os.getenv("LATTICE_ENDPOINT_MAX_CONCURRENCY", DEFAULT_ENDPOINT_CONCURRENCY)
+            )
+            return urls, concurrency
+        return None
+
+    def _create_client(self, provider: str) -> BaseAPIClient:
+        endpoints = self._endpoint_config(provider)
+        if not endpoints:
+            # We use check_availability=True to ensure we don't return broken clients
+            return get_api_client(provider, check_availability=True)
+
+        urls, max_concurrency = endpoints
+        url_kwarg = ENDPOINT_KWARGS[provider]
+        logger.info(f"Creating endpoint pool for {provider}: {', '.join(urls)}")
+        pool = EndpointPool(
+            get_config(),
+            provider,
+            urls,
+            lambda url: get_api_client(provider, check_availability=True, **{url_kwarg: url}),
+            max_concurrency=max_concurrency,
+            health_check_interval=float(
+                os.getenv("LATTICE_ENDPOINT_HEALTH_INTERVAL", HEALTH_CHECK_INTERVAL)
+            ),
+        )
+        pool.ensure_health_checks()
+        return pool
 
     def get_client(self, provider: str) -> BaseAPIClient:
         """
         Get or create an API client for the specified provider.
 
+        Providers with several endpoints (registered, or listed comma-separated in
+        the provider's ENDPOINT_ENV_VARS variable) get an EndpointPool.
+
         Args:
             provider: The provider name (e.g., 'openai', 'anthropic').
 
@@ -30,8 +179,8 @@ class ClientPool:
         """
         if provider not in self._clients:
             try:
-                # We use check_availability=True to ensure we don't return broken clients
-                self._clients[provider] = get_api_client(provider, check_availability=True)
+                self._clients[provider] = self._create_client(provider)
+                _live_pools.add(self)
                 logger.debug(f"Initialized new client for provider: {provider}")
             except ProviderUnavailableError as e:
                 logger.error(f"Cannot create client for provider '{provider}': {e.message}")
@@ -42,6 +191,8 @@ class ClientPool:
     async def close_all(self):
         """Close all initialized clients."""
         for name, client in self._clients.items():
+            if isinstance(client, EndpointPool):
+                client.stop_health_checks()
             try:
                 # Assuming clients might have a close method in the future,
                 # strictly speaking BaseAPIClient doesn't mandate it yet but good practice.
@@ -55,7 +206,11 @@ class ClientPool:
             except Exception as e:
                 logger.warning(f"Error closing client {name}: {e}")
         self._clients.clear()
+        _live_pools.discard(self)
 
     def reset(self):
         """Clear the client cache (useful for testing)."""
+        for client in self._clients.values():
+            if isinstance(client, EndpointPool):
+                client.stop_health_checks()
         self._clients.clear()
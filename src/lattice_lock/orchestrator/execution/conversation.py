@@ -3,10 +3,11 @@ import logging
 from typing import Any
 
 from lattice_lock.orchestrator.cost.tracker import CostTracker
+from lattice_lock.orchestrator.exceptions import DeadlineExceededError
 from lattice_lock.orchestrator.function_calling import FunctionCallHandler
 from lattice_lock.orchestrator.providers.base import BaseAPIClient
 from lattice_lock.orchestrator.types import APIResponse, ModelCapabilities, TokenUsage
-from lattice_lock.tracing import get_current_trace_id
+from lattice_lock.tracing import SpanContext, get_current_trace_id, get_remaining_time
 
 logger = logging.getLogger(__name__)
 
@@ -67,6 +68,13 @@ class ConversationExecutor:
                 extra={"trace_id": request_trace_id},
             )
 
+            # Stop before starting a turn the request deadline leaves no time for
+            remaining = get_remaining_time()
+            if remaining is not None and remaining <= 0:
+                raise DeadlineExceededError(
+                    f"Deadline exceeded before turn {turn+1} for model {model_cap.api_name}"
+                )
+
             # Call the model
             response = await client.chat_completion(
                 model=model_cap.api_name,
@@ -91,11 +99,12 @@ class ConversationExecutor:
 
             # Record individual transaction cost
             # Note: We record each step, but we return the aggregated usage on the final response object
-            self.cost_tracker.record_transaction(
-                response,
-                task_type=task_type,
-                trace_id=request_trace_id,
-            )
+            with SpanContext("cost.record"):
+                self.cost_tracker.record_transaction(
+                    response,
+                    task_type=task_type,
+                    trace_id=request_trace_id,
+                )
 
             # Check for function call
             if response.function_call:
@@ -108,9 +117,10 @@ class ConversationExecutor:
                 )
 
                 try:
-                    function_result = await self.function_call_handler.execute_function_call(
-                        function_call_name, **function_call_args
-                    )
+                    with SpanContext("tool.execute", attributes={"tool": function_call_name}):
+                        function_result = await self.function_call_handler.execute_function_call(
+                            function_call_name, **function_call_args
+                        )
 
                     # Update response with result (for potential return if it was the last turn)
                     response.function_call_result = function_result
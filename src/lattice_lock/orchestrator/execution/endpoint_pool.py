@@ -0,0 +1,286 @@
+"""
+Pools of interchangeable endpoints behind one provider.
+
+An EndpointPool wraps one API client per endpoint (several vLLM/Ollama servers,
+several Azure deployments) and presents them as a single client. Each call goes
+to the healthy endpoint with the fewest outstanding requests, subject to a
+per-endpoint concurrency cap. Endpoints that fail health checks, fail
+repeatedly, or become much slower than their peers are ejected for a while.
+"""
+
+import asyncio
+import logging
+import statistics
+import time
+from collections.abc import Callable
+from dataclasses import dataclass
+from typing import Any
+
+from lattice_lock.config import AppConfig
+from lattice_lock.orchestrator.exceptions import DeadlineExceededError
+from lattice_lock.orchestrator.providers import ProviderUnavailableError
+from lattice_lock.orchestrator.providers.base import BaseAPIClient
+from lattice_lock.tracing import get_remaining_time
+
+logger = logging.getLogger(__name__)
+
+# Concurrent requests one endpoint accepts unless configured otherwise
+DEFAULT_ENDPOINT_CONCURRENCY = 8
+# Weight of the newest sample in an endpoint's latency moving average
+LATENCY_EWMA_ALPHA = 0.2
+# Samples an endpoint needs before it can be ejected for being slow
+MIN_LATENCY_SAMPLES = 5
+# An endpoint this many times slower than the pool median is ejected
+SLOW_ENDPOINT_FACTOR = 3.0
+# Consecutive failures after which an endpoint is ejected
+MAX_CONSECUTIVE_FAILURES = 3
+# Base ejection time; repeated ejections back off linearly up to 10x
+EJECTION_SECONDS = 30.0
+# Never eject more than this fraction of a pool's endpoints
+MAX_EJECTED_FRACTION = 0.5
+# Seconds between background health checks of a pool's endpoints
+HEALTH_CHECK_INTERVAL = 30.0
+
+
+@dataclass
+class Endpoint:
+    """One server behind a pooled provider."""
+
+    url: str
+    client: BaseAPIClient
+    max_concurrency: int = DEFAULT_ENDPOINT_CONCURRENCY
+    outstanding: int = 0
+    requests: int = 0
+    failures: int = 0
+    consecutive_failures: int = 0
+    latency_ewma_ms: float | None = None
+    latency_samples: int = 0
+    healthy: bool = True
+    ejected_until: float = 0.0
+    ejections: int = 0
+
+    @property
+    def ejected(self) -> bool:
+        return time.monotonic() < self.ejected_until
+
+    @property
+    def available(self) -> bool:
+        return self.healthy and not self.ejected
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "url": self.url,
+            "outstanding": self.outstanding,
+            "max_concurrency": self.max_concurrency,
+            "requests": self.requests,
+            "failures": self.failures,
+            "latency_ewma_ms": self.latency_ewma_ms,
+            "healthy": self.healthy,
+            "ejected": self.ejected,
+        }
+
+
+class EndpointPool(BaseAPIClient):
+    """
+    A provider client that balances calls over several endpoints by least
+    outstanding requests.
+    """
+
+    def __init__(
+        self,
+        config: AppConfig,
+        provider: str,
+        urls: list[str],
+        client_factory: Callable[[str], BaseAPIClient],
+        max_concurrency: int = DEFAULT_ENDPOINT_CONCURRENCY,
+        health_check_interval: float | None = None,
+    ):
+        """
+        Args:
+            config: Application configuration.
+            provider: Provider name, for logging and errors.
+            urls: Endpoint base URLs.
+            client_factory: Creates the client for one endpoint URL.
+            max_concurrency: Concurrent requests allowed per endpoint.
+            health_check_interval: Seconds between background health checks,
+                started once an event loop is running; None disables them.
+        """
+        self.provider = provider
+        self.health_check_interval = health_check_interval
+        self.endpoints = [Endpoint(url, client_factory(url), max_concurrency) for url in urls]
+        self._capacity_freed = asyncio.Condition()
+        self._health_task: asyncio.Task | None = None
+        super().__init__(config)
+
+    def _validate_config(self) -> None:
+        if not self.endpoints:
+            raise ProviderUnavailableError(self.provider, "No endpoints configured")
+
+    @property
+    def capacity(self) -> int:
+        """Total concurrent requests the available endpoints accept."""
+        return sum(e.max_concurrency for e in self.endpoints if e.available) or 1
+
+    async def chat_completion(self, model: str, messages: list[dict[str, Any]], **kwargs) -> Any:
+        """Send the completion to the least loaded available endpoint."""
+        self.ensure_health_checks()
+        endpoint = await self._acquire()
+        start = time.perf_counter()
+        try:
+            response = await endpoint.client.chat_completion(model, messages, **kwargs)
+        except Exception:
+            self._record_failure(endpoint)
+            raise
+        else:
+            if getattr(response, "error", None):
+                self._record_failure(endpoint)
+            else:
+                self._record_success(endpoint, (time.perf_counter() - start) * 1000)
+            return response
+        finally:
+            await self._release(endpoint)
+
+    async def health_check(self) -> bool:
+        """Check every endpoint; True if at least one is healthy."""
+        results = await asyncio.gather(
+            *(e.client.health_check() for e in self.endpoints), return_exceptions=True
+        )
+        for endpoint, result in zip(self.endpoints, results, strict=True):
+            healthy = result is True
+            if healthy != endpoint.healthy:
+                logger.warning(
+                    f"{self.provider} endpoint {endpoint.url} is now "
+                    f"{'healthy' if healthy else f'unhealthy: {result}'}"
+                )
+            endpoint.healthy = healthy
+        if any(e.healthy for e in self.endpoints):
+            async with self._capacity_freed:
+                self._capacity_freed.notify_all()
+        return any(e.healthy for e in self.endpoints)
+
+    def start_health_checks(self, interval: float = 30.0) -> None:
+        """Run health_check every ``interval`` seconds in the background."""
+        if self._health_task and not self._health_task.done():
+            return
+
+        async def _loop():
+            while True:
+                try:
+                    await self.health_check()
+                except Exception as e:
+                    logger.warning(f"{self.provider} endpoint health check failed: {e}")
+                await asyncio.sleep(interval)
+
+        self._health_task = asyncio.create_task(_loop())
+
+    def ensure_health_checks(self) -> None:
+        """Start background health checks if configured and a loop is running."""
+        if self.health_check_interval is None or self._health_task is not None:
+            return
+        try:
+            asyncio.get_running_loop()
+        except RuntimeError:
+            # Created outside a loop; started on the first call instead
+            return
+        self.start_health_checks(self.health_check_interval)
+
+    def stop_health_checks(self) -> None:
+        if self._health_task:
+            self._health_task.cancel()
+            self._health_task = None
+
+    async def close(self) -> None:
+        self.stop_health_checks()
+        for endpoint in self.endpoints:
+            close = getattr(endpoint.client, "close", None)
+            if close:
+                result = close()
+                if asyncio.iscoroutine(result):
+                    await result
+
+    def stats(self) -> list[dict[str, Any]]:
+        return [e.to_dict() for e in self.endpoints]
+
+    def _pick(self) -> Endpoint | None:
+        candidates = [e for e in self.endpoints if e.available]
+        if not candidates:
+            # Everything is down or ejected: keep serving from whatever is left
+            # rather than failing every request
+            candidates = self.endpoints
+        candidates = [e for e in candidates if e.outstanding < e.max_concurrency]
+        if not candidates:
+            return None
+        return min(
+            candidates,
+            key=lambda e: (e.outstanding / e.max_concurrency, e.latency_ewma_ms or 0.0),
+        )
+
+    async def _acquire(self) -> Endpoint:
+        endpoint = self._pick()
+        while endpoint is None:
+            async with self._capacity_freed:
+                try:
+                    await asyncio.wait_for(
+                        self._capacity_freed.wait_for(lambda: self._pick() is not None),
+                        get_remaining_time(),
+                    )
+                except asyncio.TimeoutError as e:
+                    raise DeadlineExceededError(
+                        f"Deadline exceeded waiting for a free {self.provider} endpoint",
+                        provider=self.provider,
+                    ) from e
+                endpoint = self._pick()
+        endpoint.outstanding += 1
+        endpoint.requests += 1
+        return endpoint
+
+    async def _release(self, endpoint: Endpoint) -> None:
+        endpoint.outstanding -= 1
+        async with self._capacity_freed:
+            self._capacity_freed.notify()
+
+    def _record_success(self, endpoint: Endpoint, latency_ms: float) -> None:
+        endpoint.consecutive_failures = 0
+        endpoint.latency_samples += 1
+        if endpoint.latency_ewma_ms is None:
+            endpoint.latency_ewma_ms = latency_ms
+        else:
+            endpoint.latency_ewma_ms += LATENCY_EWMA_ALPHA * (latency_ms - endpoint.latency_ewma_ms)
+
+        peers = [
+            e.latency_ewma_ms
+            for e in self.endpoints
+            if e.available
+            and e.latency_samples >= MIN_LATENCY_SAMPLES
+            and e.latency_ewma_ms is not None
+        ]
+        if endpoint.latency_samples >= MIN_LATENCY_SAMPLES and len(peers) > 1:
+            median = statistics.median(peers)
+            if endpoint.latency_ewma_ms > SLOW_ENDPOINT_FACTOR * median:
+                self._eject(
+                    endpoint, f"latency {endpoint.latency_ewma_ms:.0f}ms vs median {median:.0f}ms"
+                )
+
+    def _record_failure(self, endpoint: Endpoint) -> None:
+        endpoint.failures += 1
+        endpoint.consecutive_failures += 1
+        if endpoint.consecutive_failures >= MAX_CONSECUTIVE_FAILURES:
+            self._eject(endpoint, f"{endpoint.consecutive_failures} consecutive failures")
+
+    def _eject(self, endpoint: Endpoint, reason: str) -> None:
+        if endpoint.ejected:
+            return
+        ejected = sum(1 for e in self.endpoints if e.ejected)
+        if ejected + 1 > len(self.endpoints) * MAX_EJECTED_FRACTION:
+            logger.debug(f"Not ejecting {endpoint.url}: too many {self.provider} endpoints ejected")
+            return
+        endpoint.ejections += 1
+        duration = EJECTION_SECONDS * min(endpoint.ejections, 10)
+        endpoint.ejected_until = time.monotonic() + duration
+        # Start over once it comes back
+        endpoint.consecutive_failures = 0
+        endpoint.latency_ewma_ms = None
+        endpoint.latency_samples = 0
+        logger.warning(
+            f"Ejecting {self.provider} endpoint {endpoint.url} for {duration:g}s: {reason}"
+        )
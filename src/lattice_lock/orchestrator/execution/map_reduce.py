@@ -0,0 +1,254 @@
+"""
+Map-reduce execution for inputs that exceed a model's context window.
+
+The input is split into token-bounded chunks on natural boundaries (paragraphs,
+then lines, then sentences, then words), each chunk is processed in parallel on a
+cheap fast model, and the partial answers are reduced into one response, in
+several rounds if the partials themselves do not fit in one prompt.
+"""
+
+import asyncio
+import logging
+import time
+from collections.abc import Awaitable, Callable
+from typing import Any
+
+from lattice_lock.orchestrator.types import APIResponse, TokenUsage
+
+logger = logging.getLogger(__name__)
+
+# Rough characters-per-token ratio used to size chunks without a tokenizer
+CHARS_PER_TOKEN = 4
+# Fraction of a model's context window kept free for its output
+OUTPUT_RESERVE = 0.25
+# Upper bound on chunk size so large-context models still get parallel work
+DEFAULT_MAX_CHUNK_TOKENS = 16000
+# Boundaries tried in order when a piece of text is too large for one chunk
+SPLIT_BOUNDARIES = ("\n\n", "\n", ". ", " ")
+
+MAP_TEMPLATE = """{instruction}
+
+You are seeing part {index} of {total} of the input. Answer using only this part;
+another step will combine the answers for all parts. If this part contains nothing
+relevant, say so briefly.
+
+--- Input part {index}/{total} ---
+{chunk}"""
+
+REDUCE_TEMPLATE = """{instruction}
+
+The input was too large to process at once, so it was split into parts and each
+part was answered separately. Combine the partial answers below into a single,
+complete answer. Remove duplication and resolve contradictions.
+
+{partials}"""
+
+RouteFn = Callable[..., Awaitable[APIResponse]]
+
+
+def estimate_tokens(text: str) -> int:
+    """Cheap token estimate for sizing prompts."""
+    return len(text) // CHARS_PER_TOKEN + 1
+
+
+def chunk_token_budget(
+    context_window: int, instruction: str, max_chunk_tokens: int = DEFAULT_MAX_CHUNK_TOKENS
+) -> int:
+    """Tokens of input that fit in one map prompt for a model with ``context_window``."""
+    overhead = estimate_tokens(
+        MAP_TEMPLATE.format(instruction=instruction, index=0, total=0, chunk="")
+    )
+    usable = int(context_window * (1 - OUTPUT_RESERVE)) - overhead
+    # Always leave room for a meaningful chunk, even with a very long instruction
+    return max(min(usable, max_chunk_tokens), 256)
+
+
+def split_text(text: str, max_tokens: int) -> list[str]:
+    """
+    Split text into chunks of at most ``max_tokens`` estimated tokens.
+
+    Splits on the coarsest natural boundary that makes each piece fit, then packs
+    consecutive pieces greedily. Joining the chunks reproduces the input exactly.
+    """
+    max_chars = max(1, max_tokens * CHARS_PER_TOKEN)
+    if not text:
+        return []
+    chunks: list[str] = []
+    current = ""
+    for piece in _split_pieces(text, max_chars, 0):
+        if current and len(current) + len(piece) > max_chars:
+            chunks.append(current)
+            current = ""
+        current += piece
+    if current:
+        chunks.append(current)
+    return chunks
+
+
+def _split_pieces(text: str, max_chars: int, level: int) -> list[str]:
+    if len(text) <= max_chars:
+        return [text]
+    if level == len(SPLIT_BOUNDARIES):
+        return [text[i : i + max_chars] for i in range(0, len(text), max_chars)]
+
+    separator = SPLIT_BOUNDARIES[level]
+    parts = text.split(separator)
+    pieces: list[str] = []
+    for i, part in enumerate(parts):
+        if i < len(parts) - 1:
+            part += separator
+        if part:
+            pieces.extend(_split_pieces(part, max_chars, level + 1))
+    return pieces
+
+
+def _add_usage(total: TokenUsage, usage: Any) -> None:
+    if isinstance(usage, TokenUsage):
+        total.prompt_tokens += usage.prompt_tokens
+        total.completion_tokens += usage.completion_tokens
+        total.total_tokens += usage.total_tokens
+        total.cost = (total.cost or 0.0) + (usage.cost or 0.0)
+    elif isinstance(usage, dict):
+        total.prompt_tokens += usage.get("input_tokens", usage.get("prompt_tokens", 0))
+        total.completion_tokens += usage.get("output_tokens", usage.get("completion_tokens", 0))
+        total.total_tokens = total.prompt_tokens + total.completion_tokens
+
+
+class MapReduceExecutor:
+    """
+    Runs one logical request as parallel map calls followed by reduce calls.
+    """
+
+    def __init__(self, route: RouteFn, max_parallel: int = 8):
+        """
+        Args:
+            route: Coroutine used for every model call, with the signature of
+                ``ModelOrchestrator.route_request``.
+            max_parallel: Maximum model calls in flight at once.
+        """
+        self.route = route
+        self.max_parallel = max_parallel
+
+    async def execute(
+        self,
+        content: str,
+        instruction: str,
+        chunk_model: str | None,
+        chunk_tokens: int,
+        reduce_model: str | None = None,
+        reduce_tokens: int | None = None,
+        **kwargs,
+    ) -> APIResponse:
+        """
+        Process ``content`` according to ``instruction`` in token-bounded chunks.
+
+        Args:
+            content: The oversized input (log, file set, document).
+            instruction: What to do with the input.
+            chunk_model: Model for the map calls (None lets routing decide).
+            chunk_tokens: Maximum estimated tokens of input per map call.
+            reduce_model: Model for the reduce calls (None lets routing decide).
+            reduce_tokens: Maximum estimated tokens of partial answers per reduce
+                call. Defaults to ``chunk_tokens``.
+            **kwargs: Passed through to every routed call.
+
+        Returns:
+            APIResponse of the final reduce, with usage summed over every call and
+            a ``map_reduce`` summary in ``raw_response``.
+        """
+        start = time.perf_counter()
+        semaphore = asyncio.Semaphore(self.max_parallel)
+        usage = TokenUsage(prompt_tokens=0, completion_tokens=0, total_tokens=0, cost=0.0)
+        calls = 0
+
+        async def _call(prompt: str, model_id: str | None) -> APIResponse:
+            nonlocal calls
+            async with semaphore:
+                response = await self.route(prompt, model_id=model_id, **kwargs)
+            calls += 1
+            _add_usage(usage, response.usage)
+            return response
+
+        chunks = split_text(content, chunk_tokens)
+        if len(chunks) <= 1:
+            response = await _call(f"{instruction}\n\n{content}", chunk_model)
+            return self._finish(response, usage, start, chunks=len(chunks), rounds=0, calls=calls)
+
+        logger.info(
+            f"Map-reduce: {len(chunks)} chunks of <= {chunk_tokens} tokens on "
+            f"{chunk_model or 'routed model'}"
+        )
+        mapped = await asyncio.gather(
+            *(
+                _call(
+                    MAP_TEMPLATE.format(
+                        instruction=instruction, index=i + 1, total=len(chunks), chunk=chunk
+                    ),
+                    chunk_model,
+                )
+                for i, chunk in enumerate(chunks)
+            )
+        )
+        partials = [r.content for r in mapped]
+
+        budget = reduce_tokens or chunk_tokens
+        rounds = 1
+        groups = self._group_partials(partials, budget)
+        while len(groups) > 1:
+            logger.info(f"Map-reduce: reducing {len(partials)} partials in {len(groups)} groups")
+            reduced = await asyncio.gather(
+                *(_call(self._reduce_prompt(instruction, g), reduce_model) for g in groups)
+            )
+            partials = [r.content for r in reduced]
+            groups = self._group_partials(partials, budget)
+            rounds += 1
+
+        response = await _call(self._reduce_prompt(instruction, groups[0]), reduce_model)
+        return self._finish(response, usage, start, chunks=len(chunks), rounds=rounds, calls=calls)
+
+    @staticmethod
+    def _reduce_prompt(instruction: str, partials: list[str]) -> str:
+        formatted = "\n\n".join(
+            f"--- Partial answer {i + 1} ---\n{p}" for i, p in enumerate(partials)
+        )
+        return REDUCE_TEMPLATE.format(instruction=instruction, partials=formatted)
+
+    @staticmethod
+    def _group_partials(partials: list[str], budget: int) -> list[list[str]]:
+        """Pack partial answers into groups that fit ``budget`` tokens.
+
+        Each partial is truncated to half the budget so every group but the last
+        holds at least two partials and each reduce round shrinks the set.
+        """
+        max_chars = max(1, (budget // 2 - 1) * CHARS_PER_TOKEN)
+        groups: list[list[str]] = []
+        current: list[str] = []
+        current_tokens = 0
+        for partial in partials:
+            partial = partial[:max_chars]
+            tokens = estimate_tokens(partial)
+            if current and current_tokens + tokens > budget:
+                groups.append(current)
+                current, current_tokens = [], 0
+            current.append(partial)
+            current_tokens += tokens
+        if current:
+            groups.append(current)
+        return groups
+
+    @staticmethod
+    def _finish(
+        response: APIResponse,
+        usage: TokenUsage,
+        start: float,
+        chunks: int,
+        rounds: int,
+        calls: int,
+    ) -> APIResponse:
+        response.usage = usage
+        response.latency_ms = int((time.perf_counter() - start) * 1000)
+        response.raw_response = {
+            **(response.raw_response or {}),
+            "map_reduce": {"chunks": chunks, "reduce_rounds": rounds, "calls": calls},
+        }
+        return response
@@ -0,0 +1,305 @@
+"""
+Weighted fair queuing of model calls across tenants.
+
+Every provider has a fixed number of concurrency slots. Requests that find no
+free slot wait in a queue and are dispatched by start-time fair queuing: each
+(tenant, request class) flow advances a virtual finish tag by ``1 / weight``
+per request, and the waiting request with the highest tenant priority and the
+smallest tag is dispatched next. A tenant flooding the queue with batch work
+therefore only delays other tenants by its weighted share, instead of starving
+them.
+"""
+
+import asyncio
+import bisect
+import heapq
+import itertools
+import logging
+import time
+from collections.abc import AsyncIterator, Awaitable, Callable
+from contextlib import asynccontextmanager
+from dataclasses import dataclass, field
+from enum import Enum
+from typing import Any, TypeVar
+
+from lattice_lock.orchestrator.exceptions import DeadlineExceededError
+from lattice_lock.tracing import get_remaining_time
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+DEFAULT_TENANT = "default"
+# Concurrency slots per provider unless configured otherwise
+DEFAULT_PROVIDER_CONCURRENCY = 16
+# Upper bounds (ms) of the wait-time histogram buckets; the last bucket is unbounded
+WAIT_TIME_BUCKETS_MS = (1, 5, 10, 25, 50, 100, 250, 500, 1000, 2500, 5000, 10000)
+
+
+class RequestClass(str, Enum):
+    """Latency class of a request."""
+
+    INTERACTIVE = "interactive"
+    BATCH = "batch"
+
+
+# Share multiplier of each class within a tenant's weight
+DEFAULT_CLASS_WEIGHTS = {RequestClass.INTERACTIVE: 4.0, RequestClass.BATCH: 1.0}
+
+
+@dataclass
+class TenantConfig:
+    """Scheduling parameters of one tenant (project or API key)."""
+
+    weight: float = 1.0  # share of provider slots relative to other tenants
+    priority: int = 0  # higher priorities are always dispatched first
+
+
+@dataclass
+class WaitTimeHistogram:
+    """Histogram of queue wait times with per-bucket (non-cumulative) counts."""
+
+    bounds: tuple[float, ...] = WAIT_TIME_BUCKETS_MS
+    counts: list[int] = field(default_factory=list)
+    count: int = 0
+    total_ms: float = 0.0
+    max_ms: float = 0.0
+
+    def __post_init__(self):
+        if not self.counts:
+            self.counts = [0] * (len(self.bounds) + 1)
+
+    def record(self, wait_ms: float) -> None:
+        self.counts[bisect.bisect_left(self.bounds, wait_ms)] += 1
+        self.count += 1
+        self.total_ms += wait_ms
+        self.max_ms = max(self.max_ms, wait_ms)
+
+    @property
+    def avg_ms(self) -> float:
+        return self.total_ms / self.count if self.count else 0.0
+
+    def to_dict(self) -> dict[str, Any]:
+        labels = [f"le_{b:g}" for b in self.bounds] + ["le_inf"]
+        return {
+            "count": self.count,
+            "avg_ms": self.avg_ms,
+            "max_ms": self.max_ms,
+            "buckets": dict(zip(labels, self.counts, strict=True)),
+        }
+
+
+@dataclass
+class TenantStats:
+    """Queueing statistics of one tenant, across all providers."""
+
+    queued: int = 0
+    in_flight: int = 0
+    dispatched: int = 0
+    wait_ms: WaitTimeHistogram = field(default_factory=WaitTimeHistogram)
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "queue_depth": self.queued,
+            "in_flight": self.in_flight,
+            "dispatched": self.dispatched,
+            "wait_ms": self.wait_ms.to_dict(),
+        }
+
+
+@dataclass(order=True)
+class _Waiter:
+    sort_key: tuple[int, float, int]
+    start_tag: float = field(compare=False)
+    tenant: str = field(compare=False)
+    future: asyncio.Future = field(compare=False)
+
+
+class _ProviderQueue:
+    """Slots and waiting requests of one provider."""
+
+    def __init__(self, capacity: int):
+        self.capacity = capacity
+        self.in_use = 0
+        self.virtual_time = 0.0
+        self.finish_tags: dict[tuple[str, RequestClass], float] = {}
+        self.waiters: list[_Waiter] = []
+
+
+class FairScheduler:
+    """
+    Dispatches model calls to per-provider concurrency slots with weighted fair
+    queuing across tenants and request classes.
+    """
+
+    def __init__(
+        self,
+        provider_concurrency: dict[str, int] | None = None,
+        default_concurrency: int = DEFAULT_PROVIDER_CONCURRENCY,
+        tenants: dict[str, TenantConfig] | None = None,
+        class_weights: dict[RequestClass, float] | None = None,
+        on_wait: Callable[[float], None] | None = None,
+    ):
+        """
+        Args:
+            provider_concurrency: Slots per provider name; others get ``default_concurrency``.
+            default_concurrency: Slots for providers not listed explicitly.
+            tenants: Per-tenant weights and priorities; unknown tenants get the defaults.
+            class_weights: Share multiplier per request class.
+            on_wait: Called with the queue wait (ms) of every dispatched request,
+                e.g. ``AdmissionController.record_delay``.
+        """
+        self.provider_concurrency = dict(provider_concurrency or {})
+        self.default_concurrency = default_concurrency
+        self.tenants = dict(tenants or {})
+        self.class_weights = {**DEFAULT_CLASS_WEIGHTS, **(class_weights or {})}
+        self._queues: dict[str, _ProviderQueue] = {}
+        self._stats: dict[str, TenantStats] = {}
+        self._seq = itertools.count()
+        self.on_wait = on_wait
+
+    def configure_tenant(self, tenant: str, weight: float = 1.0, priority: int = 0) -> None:
+        """Set (or replace) the scheduling parameters of a tenant."""
+        if weight <= 0:
+            raise ValueError(f"Tenant weight must be positive, got {weight}")
+        self.tenants[tenant] = TenantConfig(weight=weight, priority=priority)
+
+    def set_provider_concurrency(self, provider: str, slots: int) -> None:
+        """Change the number of concurrency slots of a provider."""
+        if slots < 1:
+            raise ValueError(f"Provider concurrency must be at least 1, got {slots}")
+        self.provider_concurrency[provider] = slots
+        if provider in self._queues:
+            queue = self._queues[provider]
+            queue.capacity = slots
+            self._dispatch(queue)
+
+    @asynccontextmanager
+    async def slot(
+        self,
+        provider: str,
+        tenant: str | None = None,
+        request_class: RequestClass | str = RequestClass.INTERACTIVE,
+    ) -> AsyncIterator[None]:
+        """
+        Hold one of ``provider``'s concurrency slots for the enclosed call.
+
+        Waits in the fair queue when all slots are busy. The wait is bounded by
+        the current request deadline, if any.
+
+        Raises:
+            DeadlineExceededError: If the deadline passes while waiting for a slot.
+        """
+        tenant = tenant or DEFAULT_TENANT
+        request_class = RequestClass(request_class)
+        queue = self._queue(provider)
+        stats = self._stats.setdefault(tenant, TenantStats())
+
+        enqueued_at = time.perf_counter()
+        if queue.in_use < queue.capacity and not queue.waiters:
+            queue.in_use += 1
+        else:
+            await self._wait(queue, tenant, request_class, enqueued_at, stats)
+
+        wait_ms = (time.perf_counter() - enqueued_at) * 1000
+        stats.wait_ms.record(wait_ms)
+        if self.on_wait:
+            self.on_wait(wait_ms)
+        stats.dispatched += 1
+        stats.in_flight += 1
+        try:
+            yield
+        finally:
+            stats.in_flight -= 1
+            queue.in_use -= 1
+            self._dispatch(queue)
+
+    async def run(
+        self,
+        provider: str,
+        call: Callable[[], Awaitable[T]],
+        tenant: str | None = None,
+        request_class: RequestClass | str = RequestClass.INTERACTIVE,
+    ) -> T:
+        """Run ``call()`` in a slot of ``provider``."""
+        async with self.slot(provider, tenant, request_class):
+            return await call()
+
+    def stats(self) -> dict[str, Any]:
+        """Per-tenant queue depth, in-flight count and wait-time histogram, plus slot usage."""
+        return {
+            "tenants": {tenant: stats.to_dict() for tenant, stats in self._stats.items()},
+            "providers": {
+                provider: {
+                    "capacity": queue.capacity,
+                    "in_use": queue.in_use,
+                    "queue_depth": len(queue.waiters),
+                }
+                for provider, queue in self._queues.items()
+            },
+        }
+
+    def _queue(self, provider: str) -> _ProviderQueue:
+        if provider not in self._queues:
+            capacity = self.provider_concurrency.get(provider, self.default_concurrency)
+            self._queues[provider] = _ProviderQueue(capacity)
+        return self._queues[provider]
+
+    async def _wait(
+        self,
+        queue: _ProviderQueue,
+        tenant: str,
+        request_class: RequestClass,
+        enqueued_at: float,
+        stats: TenantStats,
+    ) -> None:
+        config = self.tenants.get(tenant, TenantConfig())
+        weight = config.weight * self.class_weights.get(request_class, 1.0)
+        flow = (tenant, request_class)
+        start_tag = max(queue.virtual_time, queue.finish_tags.get(flow, 0.0))
+        finish_tag = start_tag + 1.0 / weight
+        queue.finish_tags[flow] = finish_tag
+
+        waiter = _Waiter(
+            sort_key=(-config.priority, finish_tag, next(self._seq)),
+            start_tag=start_tag,
+            tenant=tenant,
+            future=asyncio.get_running_loop().create_future(),
+        )
+        heapq.heappush(queue.waiters, waiter)
+        stats.queued += 1
+        # Slots may already be free when the queue was non-empty only because of
+        # waiters that were cancelled
+        self._dispatch(queue)
+
+        try:
+            await asyncio.wait_for(asyncio.shield(waiter.future), get_remaining_time())
+        except (asyncio.CancelledError, asyncio.TimeoutError) as e:
+            if waiter.future.done() and not waiter.future.cancelled():
+                # Granted a slot at the same moment we gave up: hand it on
+                queue.in_use -= 1
+                self._dispatch(queue)
+            else:
+                waiter.future.cancel()
+            if isinstance(e, asyncio.TimeoutError):
+                raise DeadlineExceededError(
+                    f"Deadline exceeded after {(time.perf_counter() - enqueued_at) * 1000:.0f}ms "
+                    f"waiting for a slot"
+                ) from e
+            raise
+        finally:
+            stats.queued -= 1
+
+    def _dispatch(self, queue: _ProviderQueue) -> None:
+        """Grant free slots to the waiters with the smallest finish tags."""
+        while queue.waiters and queue.in_use < queue.capacity:
+            waiter = heapq.heappop(queue.waiters)
+            if waiter.future.done():
+                continue  # cancelled while queued
+            queue.in_use += 1
+            queue.virtual_time = max(queue.virtual_time, waiter.start_tag)
+            waiter.future.set_result(None)
+        if not queue.waiters:
+            # Idle: restart virtual time so returning flows are not penalised for history
+            queue.virtual_time = 0.0
+            queue.finish_tags.clear()
@@ -9,10 +9,12 @@ from typing import TYPE_CHECKING, Any, Optional
 from lattice_lock.config import AppConfig
 from lattice_lock.orchestrator.exceptions import (
     AuthenticationError,
+    DeadlineExceededError,
     ProviderConnectionError,
     RateLimitError,
     ServerError,
 )
+from lattice_lock.tracing import SpanContext, get_remaining_time
 
 if TYPE_CHECKING:
     import httpx
@@ -178,24 +180,40 @@ class BaseAPIClient(ABC):
         """
         Make HTTP request with latency tracking.
 
+        The timeout is shortened to the time left before the current request
+        deadline (see lattice_lock.tracing.deadline_scope), if one is set.
+
         Returns:
             Tuple of (response_data, latency_ms)
+
+        Raises:
+            DeadlineExceededError: If the deadline has passed before or during the request.
         """
         import time
 
         import httpx
 
+        remaining = get_remaining_time()
+        if remaining is not None:
+            if remaining <= 0:
+                raise DeadlineExceededError(f"Deadline exceeded before request to {url}")
+            timeout = min(timeout, remaining)
+
         session = await self._get_session()
         start_time = time.perf_counter()
 
         try:
-            response = await session.request(
-                method,
-                url,
-                headers=headers,
-                json=json_data,
-                timeout=httpx.Timeout(timeout),
-            )
+            # Query strings can carry credentials, so spans keep only the path
+            span_attributes = {"method": method, "url": url.split("?", 1)[0]}
+            with SpanContext("http.request", attributes=span_attributes) as span:
+                response = await session.request(
+                    method,
+                    url,
+                    headers=headers,
+                    json=json_data,
+                    timeout=httpx.Timeout(timeout),
+                )
+                span.attributes["status_code"] = response.status_code
             latency_ms = (time.perf_counter() - start_time) * 1000
 
             try:
@@ -225,6 +243,9 @@ class BaseAPIClient(ABC):
         except (AuthenticationError, RateLimitError, ServerError) as e:
             raise e
         except Exception as e:
+            remaining = get_remaining_time()
+            if remaining is not None and remaining <= 0:
+                raise DeadlineExceededError(f"Deadline exceeded during request to {url}") from e
             # Rethrow as specific error types would be better, but generic for now
             raise ProviderConnectionError(str(e)) from e
 
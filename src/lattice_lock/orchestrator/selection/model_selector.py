@@ -58,6 +58,29 @@ class ModelSelector:
         candidates.sort(key=lambda x: x[1], reverse=True)
         return candidates[0][0]
 
+    def rank_by_cost(self, requirements: TaskRequirements, min_speed: float = 0.0) -> list[str]:
+        """
+        Rank eligible models from cheapest to most expensive.
+
+        Args:
+            requirements: The task requirements (hard constraints must be met).
+            min_speed: Minimum speed_rating (0-10) a model needs to be included.
+
+        Returns:
+            Model IDs ordered by blended cost, faster models first on ties.
+        """
+        candidates = []
+        for model in self.registry.get_all_models():
+            if self.guide.is_model_blocked(model.api_name) or model.speed_rating < min_speed:
+                continue
+            if not self._is_provider_available(model.provider.value):
+                continue
+            if self.scorer.score(model, requirements) > 0:
+                candidates.append(model)
+
+        candidates.sort(key=lambda m: (m.blended_cost, -m.speed_rating))
+        return [m.name for m in candidates]
+
     def get_fallback_chain(self, requirements: TaskRequirements, failed_model: str) -> list[str]:
         """
         Get a list of fallback models.
@@ -0,0 +1,235 @@
+"""
+Lattice Lock Profiling
+
+Opt-in profiling for CLI runs (``lattice --profile <command>``):
+
+- a cProfile dump (``.prof``, readable with pstats or snakeviz)
+- a collapsed-stack file (``.collapsed``, for flamegraph.pl or speedscope)
+  built by sampling the profiled thread's stack
+- per-stage wall time and peak memory (tracemalloc)
+
+Library code marks its stages with ``with stage("parse"):``. Outside a
+profiled run this costs a context variable lookup.
+"""
+
+import contextlib
+import contextvars
+import cProfile
+import os
+import sys
+import threading
+import time
+import tracemalloc
+from collections import Counter
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+from typing import Any
+
+# Seconds between stack samples for the collapsed-stack output
+DEFAULT_SAMPLE_INTERVAL = 0.005
+# Where profile artifacts are written, relative to the project directory
+DEFAULT_PROFILE_DIR = ".lattice-lock/profiles"
+
+_active_profiler: contextvars.ContextVar["Profiler | None"] = contextvars.ContextVar(
+    "active_profiler", default=None
+)
+_NO_STAGE = contextlib.nullcontext()
+
+
+@dataclass
+class StageTiming:
+    """Accumulated wall time of one named stage."""
+
+    name: str
+    calls: int = 0
+    # Time inside the stage, including nested stages
+    total_ms: float = 0.0
+    # Time inside the stage minus nested stages
+    self_ms: float = 0.0
+
+
+@dataclass
+class ProfileReport:
+    """Summary of a profiled run."""
+
+    command: str
+    wall_ms: float
+    peak_memory_bytes: int | None
+    stages: list[StageTiming] = field(default_factory=list)
+    samples: int = 0
+    profile_path: str | None = None
+    collapsed_path: str | None = None
+
+    def to_dict(self) -> dict[str, Any]:
+        return asdict(self)
+
+
+class _StageContext:
+    __slots__ = ("_profiler", "_name")
+
+    def __init__(self, profiler: "Profiler", name: str):
+        self._profiler = profiler
+        self._name = name
+
+    def __enter__(self) -> None:
+        self._profiler._enter_stage(self._name)
+
+    def __exit__(self, *exc_info) -> None:
+        self._profiler._exit_stage()
+
+
+def stage(name: str) -> contextlib.AbstractContextManager:
+    """Time a block as stage ``name`` if a profiler is active, else do nothing."""
+    profiler = _active_profiler.get()
+    if profiler is None:
+        return _NO_STAGE
+    return _StageContext(profiler, name)
+
+
+def _frame_label(frame) -> str:
+    code = frame.f_code
+    return f"{code.co_name} ({os.path.basename(code.co_filename)}:{code.co_firstlineno})".replace(
+        ";", ":"
+    )
+
+
+class Profiler:
+    """
+    Runs cProfile, a stack sampler and tracemalloc around a block of work.
+
+    Stages are timed per thread; asyncio tasks sharing a thread should not
+    interleave stages.
+    """
+
+    def __init__(
+        self,
+        command: str = "lattice",
+        sample_interval: float = DEFAULT_SAMPLE_INTERVAL,
+        trace_memory: bool = True,
+    ):
+        self.command = command
+        self.sample_interval = sample_interval
+        self.trace_memory = trace_memory
+        self.stages: dict[str, StageTiming] = {}
+        self.stacks: Counter[str] = Counter()
+        self._profile = cProfile.Profile()
+        # Per thread: [stage name, start, time spent in nested stages]
+        self._stage_stacks: dict[int, list[list]] = {}
+        self._lock = threading.Lock()
+        self._stop_sampling = threading.Event()
+        self._sampler: threading.Thread | None = None
+        self._token: contextvars.Token | None = None
+        self._started_tracemalloc = False
+        self._start = 0.0
+        self._wall_ms = 0.0
+        self._peak_memory: int | None = None
+
+    def _enter_stage(self, name: str) -> None:
+        stack = self._stage_stacks.setdefault(threading.get_ident(), [])
+        stack.append([name, time.perf_counter(), 0.0])
+
+    def _exit_stage(self) -> None:
+        stack = self._stage_stacks.get(threading.get_ident())
+        if stack:
+            self._close_stage(stack)
+
+    def _close_stage(self, stack: list[list]) -> None:
+        name, start, nested = stack.pop()
+        elapsed = (time.perf_counter() - start) * 1000
+        if stack:
+            stack[-1][2] += elapsed
+        with self._lock:
+            timing = self.stages.get(name)
+            if timing is None:
+                timing = self.stages[name] = StageTiming(name)
+            timing.calls += 1
+            timing.total_ms += elapsed
+            timing.self_ms += elapsed - nested
+
+    def stage(self, name: str) -> _StageContext:
+        return _StageContext(self, name)
+
+    def _sample(self, thread_id: int) -> None:
+        while not self._stop_sampling.wait(self.sample_interval):
+            frame = sys._current_frames().get(thread_id)
+            labels = []
+            while frame is not None:
+                labels.append(_frame_label(frame))
+                frame = frame.f_back
+            if labels:
+                self.stacks[";".join(reversed(labels))] += 1
+
+    def start(self) -> "Profiler":
+        """Start profiling the calling thread."""
+        self._token = _active_profiler.set(self)
+        if self.trace_memory and not tracemalloc.is_tracing():
+            tracemalloc.start()
+            self._started_tracemalloc = True
+        if self.trace_memory:
+            tracemalloc.reset_peak()
+        self._sampler = threading.Thread(
+            target=self._sample,
+            args=(threading.get_ident(),),
+            name="lattice-profile-sampler",
+            daemon=True,
+        )
+        self._sampler.start()
+        self._start = time.perf_counter()
+        self._profile.enable()
+        return self
+
+    def stop(self) -> None:
+        """Stop profiling; idempotent."""
+        if self._token is None:
+            return
+        self._profile.disable()
+        self._wall_ms = (time.perf_counter() - self._start) * 1000
+        self._stop_sampling.set()
+        if self._sampler is not None:
+            self._sampler.join()
+        if tracemalloc.is_tracing() and self.trace_memory:
+            self._peak_memory = tracemalloc.get_traced_memory()[1]
+            if self._started_tracemalloc:
+                tracemalloc.stop()
+        # Close stages left open by an exception
+        for stack in self._stage_stacks.values():
+            while stack:
+                self._close_stage(stack)
+        try:
+            _active_profiler.reset(self._token)
+        except ValueError:
+            # Stopped from a different context (e.g. a click close callback)
+            _active_profiler.set(None)
+        self._token = None
+
+    def __enter__(self) -> "Profiler":
+        return self.start()
+
+    def __exit__(self, *exc_info) -> None:
+        self.stop()
+
+    def write(self, prefix: str | Path) -> tuple[Path, Path]:
+        """Write ``<prefix>.prof`` and ``<prefix>.collapsed``; returns both paths."""
+        prefix = Path(prefix)
+        prefix.parent.mkdir(parents=True, exist_ok=True)
+        profile_path = prefix.with_name(prefix.name + ".prof")
+        collapsed_path = prefix.with_name(prefix.name + ".collapsed")
+        self._profile.dump_stats(str(profile_path))
+        collapsed_path.write_text(
+            "".join(f"{stack} {count}\n" for stack, count in self.stacks.most_common())
+        )
+        return profile_path, collapsed_path
+
+    def report(
+        self, profile_path: Path | None = None, collapsed_path: Path | None = None
+    ) -> ProfileReport:
+        """Build the summary, stages ordered by self time."""
+        return ProfileReport(
+            command=self.command,
+            wall_ms=round(self._wall_ms, 3),
+            peak_memory_bytes=self._peak_memory,
+            stages=sorted(self.stages.values(), key=lambda s: s.self_ms, reverse=True),
+            samples=sum(self.stacks.values()),
+            profile_path=str(profile_path) if profile_path else None,
+            collapsed_path=str(collapsed_path) if collapsed_path else None,
+        )
@@ -1,6 +1,7 @@
 import hashlib
 import json
 import logging
+import threading
 from pathlib import Path
 from typing import Any
 
@@ -17,6 +18,8 @@ class SheriffCache:
         self._cache: dict[Path, dict[str, Any]] = (
             {}
         )  # {file_path: {file_hash: str, violations: List[dict]}}
+        # Guards _cache when a long-lived cache is shared by worker threads (e.g. the MCP server)
+        self._lock = threading.Lock()
         self.cache_dir.mkdir(parents=True, exist_ok=True)
 
     def _get_file_hash(self, file_path: Path) -> str:
@@ -47,7 +50,8 @@ class SheriffCache:
         """Saves the cache to disk."""
         try:
             # Convert Path keys to strings for JSON serialization
-            serializable_cache = {str(k): v for k, v in self._cache.items()}
+            with self._lock:
+                serializable_cache = {str(k): v for k, v in self._cache.items()}
             with open(self.cache_file, "w", encoding="utf-8") as f:
                 json.dump(serializable_cache, f, indent=2)
         except OSError as e:
@@ -79,7 +83,8 @@ class SheriffCache:
         Expects violations_data as a list of dictionaries (Violation.__dict__).
         """
         file_hash = self._get_file_hash(file_path)
-        self._cache[file_path] = {"file_hash": file_hash, "violations": violations_data}
+        with self._lock:
+            self._cache[file_path] = {"file_hash": file_hash, "violations": violations_data}
 
 
 def get_config_hash(config: SheriffConfig) -> str:
@@ -9,15 +9,26 @@ import logging
 import os
 from dataclasses import dataclass, field
 from pathlib import Path
+from typing import Any
 
+from lattice_lock.metrics import get_metrics_registry
+from lattice_lock.profiling import stage
+from lattice_lock.tracing import timed, traced
 from lattice_lock.utils.safe_path import resolve_under_root
 
 from .ast_visitor import SheriffVisitor
+from .cache import SheriffCache, get_config_hash
 from .config import SheriffConfig, ViolationSeverity
 from .rules import Violation
 
 logger = logging.getLogger("lattice_lock.sheriff")
 
+_CACHE_REQUESTS = get_metrics_registry().counter(
+    "lattice_cache_requests_total", "Cache lookups by cache and result.", ["cache", "result"]
+)
+_CACHE_HITS = _CACHE_REQUESTS.labels("sheriff", "hit")
+_CACHE_MISSES = _CACHE_REQUESTS.labels("sheriff", "miss")
+
 
 @dataclass
 class SheriffResult:
@@ -57,6 +68,8 @@ class SheriffResult:
         }
 
 
+@traced("sheriff.validate_file")
+@timed("sheriff.validate_file")
 def validate_file_with_audit(
     file_path: Path, config: SheriffConfig, ignore_patterns: list[str] | None = None
 ) -> tuple[list[Violation], list[Violation]]:
@@ -77,15 +90,17 @@ def validate_file_with_audit(
         return [], []
 
     try:
-        with open(file_path, encoding="utf-8") as f:
+        with stage("read"), open(file_path, encoding="utf-8") as f:
             content = f.read()
 
         # Parse AST
-        tree = ast.parse(content, filename=str(file_path))
+        with stage("parse"):
+            tree = ast.parse(content, filename=str(file_path))
 
         # Run Visitor
-        visitor = SheriffVisitor(str(file_path), config, content)
-        visitor.visit(tree)
+        with stage("visit"):
+            visitor = SheriffVisitor(str(file_path), config, content)
+            visitor.visit(tree)
 
         # Return violations directly from visitor
         return visitor.get_violations(), visitor.get_ignored_violations()
@@ -110,6 +125,7 @@ def validate_file_with_audit(
         ], []
 
 
+@traced("sheriff.validate_path")
 def validate_path_with_audit(
     path: Path,
     config: SheriffConfig,
@@ -147,34 +163,38 @@ def validate_path_with_audit(
             ignored_violations.extend(iv)
 
     elif path.is_dir():
-        for root, _, files in os.walk(path):
-            current_dir = Path(root)
-
-            # Apply directory-level ignore patterns
-            ignored_by_dir_pattern = False
-            for pattern in ignore_patterns:
-                relative_dir = current_dir.relative_to(path) if current_dir != path else Path(".")
-                if relative_dir.match(pattern):
-                    ignored_by_dir_pattern = True
-                    break
-            if ignored_by_dir_pattern:
-                continue
-
-            for file in files:
-                file_path = current_dir / file
-                if file_path.suffix == ".py":
-                    # Apply file-level ignore patterns
-                    ignored_by_file_pattern = False
-                    for pattern in ignore_patterns:
-                        if file_path.match(pattern):
-                            ignored_by_file_pattern = True
-                            break
-                    if ignored_by_file_pattern:
-                        continue
-
-                    v, iv = validate_file_with_audit(file_path, config, ignore_patterns)
-                    violations.extend(v)
-                    ignored_violations.extend(iv)
+        # Nested per-file stages are excluded from the discovery self time
+        with stage("discovery"):
+            for root, _, files in os.walk(path):
+                current_dir = Path(root)
+
+                # Apply directory-level ignore patterns
+                ignored_by_dir_pattern = False
+                for pattern in ignore_patterns:
+                    relative_dir = (
+                        current_dir.relative_to(path) if current_dir != path else Path(".")
+                    )
+                    if relative_dir.match(pattern):
+                        ignored_by_dir_pattern = True
+                        break
+                if ignored_by_dir_pattern:
+                    continue
+
+                for file in files:
+                    file_path = current_dir / file
+                    if file_path.suffix == ".py":
+                        # Apply file-level ignore patterns
+                        ignored_by_file_pattern = False
+                        for pattern in ignore_patterns:
+                            if file_path.match(pattern):
+                                ignored_by_file_pattern = True
+                                break
+                        if ignored_by_file_pattern:
+                            continue
+
+                        v, iv = validate_file_with_audit(file_path, config, ignore_patterns)
+                        violations.extend(v)
+                        ignored_violations.extend(iv)
 
     return violations, ignored_violations
 
@@ -212,10 +232,57 @@ def validate_path(
     return violations
 
 
+def _violation_to_cache_entry(violation: Violation) -> dict[str, Any]:
+    """Serialize a violation for SheriffCache (superset of the CLI cache entry format)."""
+    return {
+        "rule_id": violation.rule_id,
+        "message": violation.message,
+        "line_number": violation.line_number,
+        "filename": str(violation.filename),
+        "column": violation.column,
+        "severity": violation.severity.value,
+        "suggestion": violation.suggestion,
+        "ignored": False,
+    }
+
+
+def _violation_from_cache_entry(data: dict[str, Any]) -> Violation:
+    """Rebuild a violation from a SheriffCache entry written by either the CLI or run_sheriff."""
+    return Violation(
+        rule_id=data["rule_id"],
+        message=data["message"],
+        line_number=data["line_number"],
+        filename=data["filename"],
+        column=data.get("column", 0),
+        severity=ViolationSeverity(data.get("severity", ViolationSeverity.ERROR.value)),
+        suggestion=data.get("suggestion"),
+    )
+
+
+def _validate_file_cached(
+    file_path: Path, config: SheriffConfig, cache: SheriffCache | None
+) -> list[Violation]:
+    """Validate a file, reusing cached violations when its content hash is unchanged."""
+    if cache is None:
+        violations, _ = validate_file_with_audit(file_path, config)
+        return violations
+
+    cached = cache.get_cached_violations(file_path)
+    if cached is not None:
+        _CACHE_HITS.inc()
+        return [_violation_from_cache_entry(v) for v in cached if not v.get("ignored", False)]
+
+    _CACHE_MISSES.inc()
+    violations, _ = validate_file_with_audit(file_path, config)
+    cache.set_violations(file_path, [_violation_to_cache_entry(v) for v in violations])
+    return violations
+
+
 def run_sheriff(
     target_path: str,
     config: dict | None = None,
     json_output: bool = False,
+    cache: SheriffCache | None = None,
 ) -> SheriffResult:
     """
     Run Sheriff analysis on a directory or file.
@@ -224,6 +291,8 @@ def run_sheriff(
         target_path: Path to analyze (file or directory)
         config: Optional configuration dict (uses DEFAULT_CONFIG if not provided)
         json_output: Whether to format output as JSON
+        cache: Optional SheriffCache; unchanged files reuse their cached violations.
+            Ignored if it was built for a different configuration.
 
     Returns:
         SheriffResult with all violations found
@@ -246,6 +315,10 @@ def run_sheriff(
     else:
         sheriff_config = SheriffConfig()
 
+    if cache is not None and cache.config_hash != get_config_hash(sheriff_config):
+        logger.debug("Sheriff cache was built for a different config; not using it.")
+        cache = None
+
     result = SheriffResult()
 
     try:
@@ -282,7 +355,7 @@ def run_sheriff(
 
     # Analyze each file
     for filepath in python_files:
-        violations, _ = validate_file_with_audit(filepath, sheriff_config)
+        violations = _validate_file_cached(filepath, sheriff_config, cache)
         for v in violations:
             result.add_violation(v)
         result.files_checked += 1
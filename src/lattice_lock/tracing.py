@@ -6,22 +6,31 @@ across components without requiring external dependencies like OpenTelemetry.
 
 Features:
 - Trace ID generation and propagation
-- Span tracking for major operations
+- Request deadline propagation
+- Span tracking for major operations, with head-based sampling into an
+  in-process ring buffer exportable as Chrome trace-event or OTLP JSON
 - Context management for async operations
 - Performance timing instrumentation
 """
 
 import asyncio
+import contextlib
 import contextvars
 import functools
+import json
 import logging
+import os
+import random
 import time
-import uuid
-from collections.abc import Callable
+from collections import deque
+from collections.abc import Callable, Iterator
 from dataclasses import dataclass, field
 from datetime import datetime
+from pathlib import Path
 from typing import Any, ParamSpec, TypeVar
 
+from lattice_lock.metrics import get_metrics_registry
+
 P = ParamSpec("P")
 R = TypeVar("R")
 
@@ -31,6 +40,14 @@ _trace_context: contextvars.ContextVar[dict[str, Any] | None] = contextvars.Cont
     "trace_context", default=None
 )
 
+# Absolute time.monotonic() value by which the current request must finish
+_deadline: contextvars.ContextVar[float | None] = contextvars.ContextVar("deadline", default=None)
+
+# Fraction of new traces whose spans are kept by the span collector (0 disables recording)
+DEFAULT_TRACE_SAMPLE_RATE = float(os.getenv("LATTICE_TRACE_SAMPLE_RATE", "0") or 0)
+# Finished spans kept in memory; the oldest are dropped first
+DEFAULT_SPAN_BUFFER_SIZE = int(os.getenv("LATTICE_TRACE_BUFFER_SIZE", "10000") or 10000)
+
 
 def asyncio_iscoroutinefunction(func: Any) -> bool:
     """Check if a function is a coroutine function safely."""
@@ -38,13 +55,14 @@ def asyncio_iscoroutinefunction(func: Any) -> bool:
 
 
 def generate_trace_id() -> str:
-    """Generate a unique trace ID."""
-    return uuid.uuid4().hex[:16]
+    """Generate a unique trace ID (64 random bits as hex)."""
+    # getrandbits is several times cheaper than uuid4 and IDs need not be cryptographic
+    return f"{random.getrandbits(64):016x}"
 
 
 def generate_span_id() -> str:
-    """Generate a unique span ID."""
-    return uuid.uuid4().hex[:8]
+    """Generate a unique span ID (32 random bits as hex)."""
+    return f"{random.getrandbits(32):08x}"
 
 
 def get_current_trace_id() -> str | None:
@@ -63,20 +81,33 @@ def get_current_span_id() -> str | None:
     return ctx.get("span_id")
 
 
-def set_trace_context(trace_id: str, span_id: str | None = None) -> contextvars.Token:
+def is_trace_sampled() -> bool | None:
+    """Whether the current trace is being recorded, or None if not decided yet."""
+    ctx = _trace_context.get()
+    if ctx is None:
+        return None
+    return ctx.get("sampled")
+
+
+def set_trace_context(
+    trace_id: str, span_id: str | None = None, sampled: bool | None = None
+) -> contextvars.Token:
     """
     Set the trace context for the current execution.
 
     Args:
         trace_id: The trace ID to set
         span_id: Optional span ID to set
+        sampled: Optional sampling decision for the trace's spans
 
     Returns:
         Token that can be used to reset the context
     """
-    ctx = {"trace_id": trace_id}
+    ctx: dict[str, Any] = {"trace_id": trace_id}
     if span_id:
         ctx["span_id"] = span_id
+    if sampled is not None:
+        ctx["sampled"] = sampled
     return _trace_context.set(ctx)
 
 
@@ -85,6 +116,48 @@ def reset_trace_context(token: contextvars.Token) -> None:
     _trace_context.reset(token)
 
 
+def get_deadline() -> float | None:
+    """Get the current request deadline (a time.monotonic() value), if any."""
+    return _deadline.get()
+
+
+def get_remaining_time() -> float | None:
+    """Seconds left before the current deadline (may be negative), or None if unbounded."""
+    deadline = _deadline.get()
+    if deadline is None:
+        return None
+    return deadline - time.monotonic()
+
+
+@contextlib.contextmanager
+def deadline_scope(timeout: float | None) -> Iterator[float | None]:
+    """
+    Bound the enclosed work to ``timeout`` seconds from now.
+
+    Nested scopes can only shorten an enclosing deadline, never extend it. The
+    deadline follows the work through awaits and tasks created inside the scope.
+
+    Args:
+        timeout: Time budget in seconds, or None to keep the current deadline.
+
+    Yields:
+        The effective deadline (a time.monotonic() value), or None if unbounded.
+    """
+    current = _deadline.get()
+    if timeout is None:
+        yield current
+        return
+
+    deadline = time.monotonic() + timeout
+    if current is not None:
+        deadline = min(deadline, current)
+    token = _deadline.set(deadline)
+    try:
+        yield deadline
+    finally:
+        _deadline.reset(token)
+
+
 @dataclass
 class Span:
     """Represents a traced operation span."""
@@ -130,70 +203,183 @@ class Span:
         }
 
 
-class SpanContext:
-    """Context manager for creating and managing spans."""
+class SpanCollector:
+    """
+    Keeps finished spans of sampled traces in a bounded ring buffer.
+
+    Sampling is head-based: the decision is made once when a trace's first span
+    starts and inherited by all of its child spans, so a trace is either
+    recorded completely or not at all. Unsampled spans cost only their ID and
+    context bookkeeping.
+    """
 
     def __init__(
         self,
-        name: str,
-        trace_id: str | None = None,
-        parent_span_id: str | None = None,
-        attributes: dict[str, Any] | None = None,
+        sample_rate: float = DEFAULT_TRACE_SAMPLE_RATE,
+        capacity: int = DEFAULT_SPAN_BUFFER_SIZE,
     ):
-        self.name = name
-        self.trace_id = trace_id or get_current_trace_id() or generate_trace_id()
-        self.parent_span_id = parent_span_id or get_current_span_id()
-        self.span_id = generate_span_id()
-        self.attributes = attributes or {}
-        self.span: Span | None = None
-        self._token: contextvars.Token | None = None
+        if not 0.0 <= sample_rate <= 1.0:
+            raise ValueError(f"Sample rate must be between 0 and 1, got {sample_rate}")
+        self.sample_rate = sample_rate
+        self.capacity = capacity
+        self._spans: deque[Span] = deque(maxlen=capacity)
+        self.recorded = 0
 
-    def __enter__(self) -> Span:
-        self.span = Span(
-            name=self.name,
-            trace_id=self.trace_id,
-            span_id=self.span_id,
-            parent_span_id=self.parent_span_id,
-            attributes=self.attributes,
-        )
-        self._token = set_trace_context(self.trace_id, self.span_id)
-
-        logger.debug(
-            f"Starting span: {self.name}",
-            extra={
-                "trace_id": self.trace_id,
-                "span_id": self.span_id,
-                "parent_span_id": self.parent_span_id,
-            },
-        )
+    @property
+    def dropped(self) -> int:
+        """Spans evicted from the buffer to make room for newer ones."""
+        return self.recorded - len(self._spans)
+
+    def should_sample(self) -> bool:
+        """Sampling decision for a new trace."""
+        if self.sample_rate >= 1.0:
+            return True
+        if self.sample_rate <= 0.0:
+            return False
+        return random.random() < self.sample_rate
+
+    def record(self, span: Span) -> None:
+        self._spans.append(span)
+        self.recorded += 1
+
+    def spans(self, trace_id: str | None = None) -> list[Span]:
+        """Recorded spans, oldest first, optionally of a single trace."""
+        if trace_id is None:
+            return list(self._spans)
+        return [span for span in self._spans if span.trace_id == trace_id]
+
+    def clear(self) -> None:
+        self._spans.clear()
+        self.recorded = 0
+
+    def to_chrome_trace(self) -> dict[str, Any]:
+        """
+        Spans as Chrome trace-event JSON (chrome://tracing, Perfetto).
+
+        Each trace is drawn on its own row.
+        """
+        pid = os.getpid()
+        rows: dict[str, int] = {}
+        events = []
+        for span in self._spans:
+            if span.end_time is None:
+                continue
+            args = {k: v for k, v in span.attributes.items() if v is not None}
+            args.update(trace_id=span.trace_id, span_id=span.span_id, status=span.status)
+            if span.parent_span_id:
+                args["parent_span_id"] = span.parent_span_id
+            if span.error:
+                args["error"] = span.error
+            events.append(
+                {
+                    "name": span.name,
+                    "cat": "lattice_lock",
+                    "ph": "X",
+                    "ts": span.start_time * 1_000_000,
+                    "dur": (span.end_time - span.start_time) * 1_000_000,
+                    "pid": pid,
+                    "tid": rows.setdefault(span.trace_id, len(rows) + 1),
+                    "args": _json_safe(args),
+                }
+            )
+        return {"traceEvents": events, "displayTimeUnit": "ms"}
+
+    def to_otlp(self, service_name: str = "lattice-lock") -> dict[str, Any]:
+        """Spans as an OTLP/JSON ``ExportTraceServiceRequest``."""
+        spans = []
+        for span in self._spans:
+            if span.end_time is None:
+                continue
+            otlp_span = {
+                # OTLP IDs are 16 and 8 bytes; shorter IDs are left-padded
+                "traceId": span.trace_id.rjust(32, "0"),
+                "spanId": span.span_id.rjust(16, "0"),
+                "name": span.name,
+                "kind": 1,  # SPAN_KIND_INTERNAL
+                "startTimeUnixNano": str(int(span.start_time * 1e9)),
+                "endTimeUnixNano": str(int(span.end_time * 1e9)),
+                "attributes": [
+                    {"key": k, "value": _otlp_value(v)}
+                    for k, v in span.attributes.items()
+                    if v is not None
+                ],
+                "status": (
+                    {"code": 2, "message": span.error or ""}
+                    if span.status == "error"
+                    else {"code": 1}
+                ),
+            }
+            if span.parent_span_id:
+                otlp_span["parentSpanId"] = span.parent_span_id.rjust(16, "0")
+            spans.append(otlp_span)
+        return {
+            "resourceSpans": [
+                {
+                    "resource": {
+                        "attributes": [
+                            {"key": "service.name", "value": {"stringValue": service_name}}
+                        ]
+                    },
+                    "scopeSpans": [{"scope": {"name": __name__}, "spans": spans}],
+                }
+            ]
+        }
 
-        return self.span
+    def export_chrome_trace(self, path: str | Path) -> Path:
+        """Write the spans as a Chrome trace-event JSON file."""
+        return _write_json(path, self.to_chrome_trace())
 
-    def __exit__(self, exc_type, exc_val, exc_tb) -> bool:
-        if self.span:
-            if exc_val:
-                self.span.end(status="error", error=str(exc_val))
-            else:
-                self.span.end()
+    def export_otlp_json(self, path: str | Path, service_name: str = "lattice-lock") -> Path:
+        """Write the spans as an OTLP/JSON file."""
+        return _write_json(path, self.to_otlp(service_name))
 
-            logger.debug(
-                f"Ended span: {self.name} ({self.span.duration_ms:.2f}ms)",
-                extra={
-                    "trace_id": self.trace_id,
-                    "span_id": self.span.span_id,
-                    "duration_ms": self.span.duration_ms,
-                    "status": self.span.status,
-                },
-            )
 
-        if self._token:
-            reset_trace_context(self._token)
+def _otlp_value(value: Any) -> dict[str, Any]:
+    if isinstance(value, bool):
+        return {"boolValue": value}
+    if isinstance(value, int):
+        return {"intValue": str(value)}
+    if isinstance(value, float):
+        return {"doubleValue": value}
+    return {"stringValue": str(value)}
 
-        return False
 
+def _json_safe(values: dict[str, Any]) -> dict[str, Any]:
+    return {k: v if isinstance(v, str | int | float | bool) else str(v) for k, v in values.items()}
+
+
+def _write_json(path: str | Path, data: dict[str, Any]) -> Path:
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with open(path, "w") as f:
+        json.dump(data, f)
+    return path
+
+
+_span_collector = SpanCollector()
+
+
+def get_span_collector() -> SpanCollector:
+    """Get the global span collector."""
+    return _span_collector
+
+
+def configure_span_collector(
+    sample_rate: float | None = None, capacity: int | None = None
+) -> SpanCollector:
+    """Replace the global span collector (recorded spans are discarded)."""
+    global _span_collector
+    _span_collector = SpanCollector(
+        sample_rate=_span_collector.sample_rate if sample_rate is None else sample_rate,
+        capacity=capacity or _span_collector.capacity,
+    )
+    return _span_collector
 
-class AsyncSpanContext:
-    """Async context manager for creating and managing spans."""
+
+class SpanContext:
+    """Context manager for creating and managing spans."""
+
+    _kind = "span"
 
     def __init__(
         self,
@@ -203,14 +389,18 @@ class AsyncSpanContext:
         attributes: dict[str, Any] | None = None,
     ):
         self.name = name
-        self.trace_id = trace_id or get_current_trace_id() or generate_trace_id()
+        current_trace_id = get_current_trace_id()
+        self.trace_id = trace_id or current_trace_id or generate_trace_id()
         self.parent_span_id = parent_span_id or get_current_span_id()
         self.span_id = generate_span_id()
         self.attributes = attributes or {}
+        # Child spans follow their trace's sampling decision; a new trace makes its own
+        sampled = is_trace_sampled() if self.trace_id == current_trace_id else None
+        self.sampled = _span_collector.should_sample() if sampled is None else sampled
         self.span: Span | None = None
         self._token: contextvars.Token | None = None
 
-    async def __aenter__(self) -> Span:
+    def _start(self) -> Span:
         self.span = Span(
             name=self.name,
             trace_id=self.trace_id,
@@ -218,39 +408,62 @@ class AsyncSpanContext:
             parent_span_id=self.parent_span_id,
             attributes=self.attributes,
         )
-        self._token = set_trace_context(self.trace_id, self.span_id)
-
-        logger.debug(
-            f"Starting async span: {self.name}",
-            extra={
-                "trace_id": self.trace_id,
-                "span_id": self.span_id,
-                "parent_span_id": self.parent_span_id,
-            },
-        )
+        self._token = set_trace_context(self.trace_id, self.span_id, self.sampled)
+
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(
+                f"Starting {self._kind}: {self.name}",
+                extra={
+                    "trace_id": self.trace_id,
+                    "span_id": self.span_id,
+                    "parent_span_id": self.parent_span_id,
+                },
+            )
 
         return self.span
 
-    async def __aexit__(self, exc_type, exc_val, exc_tb) -> bool:
+    def _finish(self, exc_val: BaseException | None) -> None:
         if self.span:
             if exc_val:
                 self.span.end(status="error", error=str(exc_val))
             else:
                 self.span.end()
 
-            logger.debug(
-                f"Ended async span: {self.name} ({self.span.duration_ms:.2f}ms)",
-                extra={
-                    "trace_id": self.trace_id,
-                    "span_id": self.span.span_id,
-                    "duration_ms": self.span.duration_ms,
-                    "status": self.span.status,
-                },
-            )
+            if self.sampled:
+                _span_collector.record(self.span)
+
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug(
+                    f"Ended {self._kind}: {self.name} ({self.span.duration_ms:.2f}ms)",
+                    extra={
+                        "trace_id": self.trace_id,
+                        "span_id": self.span.span_id,
+                        "duration_ms": self.span.duration_ms,
+                        "status": self.span.status,
+                    },
+                )
 
         if self._token:
             reset_trace_context(self._token)
 
+    def __enter__(self) -> Span:
+        return self._start()
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> bool:
+        self._finish(exc_val)
+        return False
+
+
+class AsyncSpanContext(SpanContext):
+    """Async context manager for creating and managing spans."""
+
+    _kind = "async span"
+
+    async def __aenter__(self) -> Span:
+        return self._start()
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb) -> bool:
+        self._finish(exc_val)
         return False
 
 
@@ -301,13 +514,34 @@ def traced(
     return decorator
 
 
+_OPERATION_SECONDS = get_metrics_registry().histogram(
+    "lattice_operation_duration_seconds",
+    "Duration of timed operations and route_request stages.",
+    ["operation"],
+)
+_OPERATION_ERRORS = get_metrics_registry().counter(
+    "lattice_operation_errors_total", "Timed operations that failed.", ["operation"]
+)
+_EVENTS = get_metrics_registry().counter(
+    "lattice_events_total", "Named events such as deadline misses.", ["event"]
+)
+
+
 @dataclass
 class PerformanceMetrics:
-    """Collects performance metrics for monitoring."""
+    """Collects performance metrics for monitoring (also reported to the metrics registry)."""
 
     operation_times: dict[str, list[float]] = field(default_factory=dict)
     operation_counts: dict[str, int] = field(default_factory=dict)
     error_counts: dict[str, int] = field(default_factory=dict)
+    counters: dict[str, int] = field(default_factory=dict)
+    # Durations kept per operation for percentiles; None keeps every sample
+    max_samples: int | None = 1000
+
+    def increment(self, name: str, amount: int = 1) -> None:
+        """Increment a named event counter (e.g. deadline misses)."""
+        self.counters[name] = self.counters.get(name, 0) + amount
+        _EVENTS.labels(name).inc(amount)
 
     def record_operation(self, operation: str, duration_ms: float, success: bool = True) -> None:
         """Record an operation's performance."""
@@ -318,12 +552,14 @@ class PerformanceMetrics:
 
         self.operation_times[operation].append(duration_ms)
         self.operation_counts[operation] += 1
+        _OPERATION_SECONDS.labels(operation).observe(duration_ms / 1000)
 
         if not success:
             self.error_counts[operation] += 1
+            _OPERATION_ERRORS.labels(operation).inc()
 
-        if len(self.operation_times[operation]) > 1000:
-            self.operation_times[operation] = self.operation_times[operation][-1000:]
+        if self.max_samples is not None and len(self.operation_times[operation]) > self.max_samples:
+            self.operation_times[operation] = self.operation_times[operation][-self.max_samples :]
 
     def get_percentile(self, operation: str, percentile: float) -> float | None:
         """Get a percentile value for an operation's duration."""
@@ -365,10 +601,31 @@ class PerformanceMetrics:
 
 _global_metrics = PerformanceMetrics()
 
+# Metrics that replace the global instance for work inside performance_metrics_scope()
+_scoped_metrics: contextvars.ContextVar[PerformanceMetrics | None] = contextvars.ContextVar(
+    "scoped_metrics", default=None
+)
+
 
 def get_performance_metrics() -> PerformanceMetrics:
-    """Get the global performance metrics instance."""
-    return _global_metrics
+    """Get the performance metrics instance for the current context (usually the global one)."""
+    scoped = _scoped_metrics.get()
+    return _global_metrics if scoped is None else scoped
+
+
+@contextlib.contextmanager
+def performance_metrics_scope(metrics: PerformanceMetrics) -> Iterator[PerformanceMetrics]:
+    """
+    Record operations of the enclosed work into ``metrics`` instead of the global instance.
+
+    Like deadline_scope, the scope follows the work through awaits and tasks
+    created inside it. Registry metrics (Prometheus) are still updated.
+    """
+    token = _scoped_metrics.set(metrics)
+    try:
+        yield metrics
+    finally:
+        _scoped_metrics.reset(token)
 
 
 def reset_performance_metrics() -> None:
@@ -1,9 +1,12 @@
 """Utilities for Lattice Lock Framework."""
 
 from .async_compat import BackgroundTaskQueue, get_background_queue, reset_background_queue
+from .quantiles import QuantileSketch, WindowedQuantileSketch
 
 __all__ = [
     "BackgroundTaskQueue",
+    "QuantileSketch",
+    "WindowedQuantileSketch",
     "get_background_queue",
     "reset_background_queue",
 ]
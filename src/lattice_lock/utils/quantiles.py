@@ -0,0 +1,220 @@
+"""
+Mergeable streaming quantile sketches.
+
+QuantileSketch buckets values on a logarithmic scale (the DDSketch/HDR
+histogram approach): recording is O(1), memory depends on the value range
+rather than the number of samples, and any quantile is answered within a fixed
+relative error. Sketches with the same accuracy merge exactly by adding bucket
+counts, so sketches from several workers or time windows can be combined.
+
+WindowedQuantileSketch keeps one sketch per fixed time interval and merges the
+intervals that fall inside the requested window.
+"""
+
+import math
+import time
+from collections import deque
+from typing import Any
+
+# Relative error of quantile estimates (1% means p99=200ms is reported as 198-202ms)
+DEFAULT_RELATIVE_ACCURACY = 0.01
+# Buckets kept per sketch; beyond this the lowest buckets are folded together
+DEFAULT_MAX_BUCKETS = 2048
+# Values at or below this are counted in a dedicated zero bucket
+MIN_INDEXABLE_VALUE = 1e-9
+
+
+class QuantileSketch:
+    """Log-bucketed quantile sketch with bounded relative error."""
+
+    def __init__(
+        self,
+        relative_accuracy: float = DEFAULT_RELATIVE_ACCURACY,
+        max_buckets: int = DEFAULT_MAX_BUCKETS,
+    ):
+        if not 0 < relative_accuracy < 1:
+            raise ValueError(f"Relative accuracy must be in (0, 1), got {relative_accuracy}")
+        self.relative_accuracy = relative_accuracy
+        self.max_buckets = max_buckets
+        self._gamma = (1 + relative_accuracy) / (1 - relative_accuracy)
+        self._log_gamma = math.log(self._gamma)
+        self.buckets: dict[int, int] = {}
+        self.zero_count = 0
+        self.count = 0
+        self.sum = 0.0
+        self.min = math.inf
+        self.max = -math.inf
+
+    def add(self, value: float, count: int = 1) -> None:
+        """Record ``value`` (negative values are clamped to zero)."""
+        value = max(value, 0.0)
+        if value <= MIN_INDEXABLE_VALUE:
+            self.zero_count += count
+        else:
+            index = math.ceil(math.log(value) / self._log_gamma)
+            self.buckets[index] = self.buckets.get(index, 0) + count
+            if len(self.buckets) > self.max_buckets:
+                self._collapse()
+        self.count += count
+        self.sum += value * count
+        self.min = min(self.min, value)
+        self.max = max(self.max, value)
+
+    @property
+    def mean(self) -> float:
+        return self.sum / self.count if self.count else 0.0
+
+    def quantile(self, q: float) -> float | None:
+        """Estimate the ``q`` quantile (0-1), or None if the sketch is empty."""
+        if not 0 <= q <= 1:
+            raise ValueError(f"Quantile must be between 0 and 1, got {q}")
+        if self.count == 0:
+            return None
+        rank = q * (self.count - 1)
+        seen = self.zero_count
+        if rank < seen:
+            return 0.0
+        for index in sorted(self.buckets):
+            seen += self.buckets[index]
+            if seen > rank:
+                # Midpoint of the bucket (in relative terms), clamped to the observed range
+                estimate = 2 * self._gamma**index / (self._gamma + 1)
+                return min(max(estimate, self.min), self.max)
+        return self.max
+
+    def percentile(self, percentile: float) -> float | None:
+        """Estimate a percentile (0-100)."""
+        return self.quantile(percentile / 100.0)
+
+    def merge(self, other: "QuantileSketch") -> "QuantileSketch":
+        """Add ``other``'s samples to this sketch (in place) and return self."""
+        if not math.isclose(other.relative_accuracy, self.relative_accuracy):
+            raise ValueError("Only sketches with the same relative accuracy can be merged")
+        for index, count in other.buckets.items():
+            self.buckets[index] = self.buckets.get(index, 0) + count
+        if len(self.buckets) > self.max_buckets:
+            self._collapse()
+        self.zero_count += other.zero_count
+        self.count += other.count
+        self.sum += other.sum
+        self.min = min(self.min, other.min)
+        self.max = max(self.max, other.max)
+        return self
+
+    def copy(self) -> "QuantileSketch":
+        return QuantileSketch(self.relative_accuracy, self.max_buckets).merge(self)
+
+    def _collapse(self) -> None:
+        # Fold the lowest buckets into one: only the low quantiles lose accuracy
+        indexes = sorted(self.buckets)
+        excess = len(indexes) - self.max_buckets + 1
+        target = indexes[excess]
+        self.buckets[target] += sum(self.buckets.pop(i) for i in indexes[:excess])
+
+    def to_dict(self) -> dict[str, Any]:
+        """JSON-serializable form, e.g. to ship a worker's sketch to an aggregator."""
+        return {
+            "relative_accuracy": self.relative_accuracy,
+            "buckets": {str(k): v for k, v in self.buckets.items()},
+            "zero_count": self.zero_count,
+            "count": self.count,
+            "sum": self.sum,
+            "min": self.min if self.count else None,
+            "max": self.max if self.count else None,
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> "QuantileSketch":
+        sketch = cls(data.get("relative_accuracy", DEFAULT_RELATIVE_ACCURACY))
+        sketch.buckets = {int(k): v for k, v in data.get("buckets", {}).items()}
+        sketch.zero_count = data.get("zero_count", 0)
+        sketch.count = data.get("count", 0)
+        sketch.sum = data.get("sum", 0.0)
+        if sketch.count:
+            sketch.min = data["min"]
+            sketch.max = data["max"]
+        return sketch
+
+
+class WindowedQuantileSketch:
+    """Quantile sketches rolled up per time interval, queryable over recent windows."""
+
+    def __init__(
+        self,
+        interval_seconds: float = 60.0,
+        retention_intervals: int = 60,
+        relative_accuracy: float = DEFAULT_RELATIVE_ACCURACY,
+    ):
+        """
+        Args:
+            interval_seconds: Length of one rollup interval.
+            retention_intervals: Intervals kept; older ones are discarded.
+            relative_accuracy: Accuracy of each interval's sketch.
+        """
+        self.interval_seconds = interval_seconds
+        self.retention_intervals = retention_intervals
+        self.relative_accuracy = relative_accuracy
+        # (interval start, sketch), oldest first
+        self._intervals: deque[tuple[float, QuantileSketch]] = deque(maxlen=retention_intervals)
+
+    def add(self, value: float, timestamp: float | None = None) -> None:
+        self._interval_for(time.time() if timestamp is None else timestamp).add(value)
+
+    def _interval_for(self, timestamp: float) -> QuantileSketch:
+        start = timestamp - timestamp % self.interval_seconds
+        if self._intervals and self._intervals[-1][0] == start:
+            return self._intervals[-1][1]
+        sketch = QuantileSketch(self.relative_accuracy)
+        if not self._intervals or self._intervals[-1][0] < start:
+            self._intervals.append((start, sketch))
+            return sketch
+        # Late sample, or an interval merged in from another worker
+        for position in range(len(self._intervals) - 1, -1, -1):
+            interval_start, existing = self._intervals[position]
+            if interval_start == start:
+                return existing
+            if interval_start < start:
+                break
+        else:
+            position = -1
+        if len(self._intervals) == self.retention_intervals:
+            if position < 0:
+                # Older than everything retained: the sample is dropped
+                return sketch
+            self._intervals.popleft()
+            position -= 1
+        self._intervals.insert(position + 1, (start, sketch))
+        return sketch
+
+    def merged(self, window_seconds: float | None = None, now: float | None = None):
+        """One sketch covering the last ``window_seconds`` (all retained intervals by default)."""
+        result = QuantileSketch(self.relative_accuracy)
+        cutoff = None
+        if window_seconds is not None:
+            cutoff = (time.time() if now is None else now) - window_seconds
+        for start, sketch in self._intervals:
+            if cutoff is None or start + self.interval_seconds > cutoff:
+                result.merge(sketch)
+        return result
+
+    def merge(self, other: "WindowedQuantileSketch") -> "WindowedQuantileSketch":
+        """Merge another worker's intervals into this one (in place)."""
+        for start, sketch in other._intervals:
+            self._interval_for(start).merge(sketch)
+        return self
+
+    def clear(self) -> None:
+        self._intervals.clear()
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "interval_seconds": self.interval_seconds,
+            "intervals": [[start, sketch.to_dict()] for start, sketch in self._intervals],
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any], **kwargs) -> "WindowedQuantileSketch":
+        windowed = cls(interval_seconds=data["interval_seconds"], **kwargs)
+        for start, sketch in data.get("intervals", []):
+            windowed._interval_for(start).merge(QuantileSketch.from_dict(sketch))
+        return windowed
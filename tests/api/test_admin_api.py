@@ -125,6 +125,24 @@ class TestHealthEndpoint:
         assert data["projects_count"] == 1
 
 
+@pytest.mark.asyncio
+class TestMetricsEndpoint:
+    """Tests for GET /metrics."""
+
+    async def test_metrics_text_format(self, client: AsyncClient) -> None:
+        """Test that /metrics serves the Prometheus text format with request timings."""
+        await client.get("/api/v1/health")
+        response = await client.get("/metrics")
+
+        assert response.status_code == 200
+        assert response.headers["content-type"].startswith("text/plain; version=0.0.4")
+        assert "# TYPE lattice_admin_request_duration_seconds histogram" in response.text
+        assert (
+            'lattice_admin_request_duration_seconds_count{method="GET",status="200"}'
+            in response.text
+        )
+
+
 @pytest.mark.asyncio
 class TestProjectsListEndpoint:
     """Tests for GET /api/v1/projects."""
@@ -293,3 +311,35 @@ class TestHelperServices:
         assert (
             sample_project.status == ProjectStatus.ERROR
         )  # Failed validation should trigger error status
+
+    async def test_record_project_errors_service(
+        self, db_session: AsyncSession, sample_project: Project
+    ):
+        """Test record_project_errors writes a batch in one transaction."""
+        from lattice_lock.admin.services import record_project_errors
+
+        base = {"message": "boom", "category": "runtime", "details": {"n": 1}}
+        recorded = await record_project_errors(
+            db_session,
+            [
+                {**base, "project_id": sample_project.id, "error_code": "LL-1", "severity": "high"},
+                {**base, "project_id": "proj_missing", "error_code": "LL-2", "severity": "low"},
+                {
+                    **base,
+                    "project_id": sample_project.id,
+                    "error_code": "LL-3",
+                    "severity": "low",
+                    "timestamp": 123.0,
+                },
+            ],
+        )
+
+        assert recorded == 2
+        result = await db_session.execute(
+            select(ProjectError).where(ProjectError.project_id == sample_project.id)
+        )
+        errors = {e.error_code: e for e in result.scalars().all()}
+        assert set(errors) == {"LL-1", "LL-3"}
+        assert errors["LL-3"].timestamp == 123.0
+        await db_session.refresh(sample_project)
+        assert sample_project.status == "warning"
@@ -245,6 +245,166 @@ class TestTokenRevocation:
         assert "revoked" in exc_info.value.detail.lower()
 
 
+class TestTokenCache:
+    """Tests for the validated access token LRU."""
+
+    def test_cached_token_skips_signature_check(self, test_user: User, monkeypatch):
+        """Test that a validated token is served from the cache."""
+        from lattice_lock.admin.auth import tokens
+
+        token = create_access_token(test_user.username, test_user.role)
+        first = verify_token(token)
+        monkeypatch.setattr(
+            tokens.jwt, "decode", lambda *_, **__: pytest.fail("token decoded on cache hit")
+        )
+        assert verify_token(token) == first
+
+    def test_revocation_applies_to_cached_token(self, test_user: User):
+        """Test that revoking a cached token takes effect immediately."""
+        token = create_access_token(test_user.username, test_user.role)
+        token_data = verify_token(token)
+        revoke_token(token_data.jti)
+
+        with pytest.raises(HTTPException) as exc_info:
+            verify_token(token)
+        assert "revoked" in exc_info.value.detail.lower()
+
+    def test_config_change_invalidates_cache(self, test_user: User, auth_secrets):
+        """Test that tokens validated under another secret are checked again."""
+        token = create_access_token(test_user.username, test_user.role)
+        verify_token(token)
+        configure(AuthConfig(secret_key=auth_secrets["CUSTOM_SECRET_KEY"]))
+
+        with pytest.raises(HTTPException):
+            verify_token(token)
+
+    def test_cached_access_token_is_not_a_refresh_token(self, test_user: User):
+        """Test that the cache does not bypass token type checks."""
+        token = create_access_token(test_user.username, test_user.role)
+        verify_token(token)
+        with pytest.raises(HTTPException):
+            verify_token(token, expected_type="refresh")
+
+    def test_cache_is_bounded(self, test_user: User, monkeypatch):
+        """Test that the least recently used tokens are evicted."""
+        from lattice_lock.admin.auth import tokens
+
+        monkeypatch.setattr(tokens, "TOKEN_CACHE_SIZE", 3)
+        for _ in range(5):
+            verify_token(create_access_token(test_user.username, test_user.role))
+        assert len(tokens._validated_tokens) == 3
+
+    @pytest.mark.asyncio
+    async def test_verify_token_async(self, test_user: User):
+        """Test async token verification."""
+        from lattice_lock.admin.auth import verify_token_async
+
+        token = create_access_token(test_user.username, test_user.role)
+        token_data = await verify_token_async(token)
+        assert token_data.sub == test_user.username
+
+
+class TestAuthWorkerPool:
+    """Tests for the auth worker pool."""
+
+    @pytest.mark.asyncio
+    async def test_runs_work_off_the_event_loop(self):
+        """Test that jobs run on pool threads."""
+        import threading
+
+        from lattice_lock.admin.auth import AuthWorkerPool
+
+        pool = AuthWorkerPool(max_workers=2)
+        try:
+            name = await pool.run(lambda: threading.current_thread().name)
+        finally:
+            pool.shutdown()
+        assert name.startswith("lattice-auth")
+        assert pool.completed == 1
+        assert pool.pending == 0
+
+    @pytest.mark.asyncio
+    async def test_rejects_when_saturated(self):
+        """Test that jobs beyond max_pending get a 503."""
+        import asyncio
+        import threading
+
+        from lattice_lock.admin.auth import AuthWorkerPool
+
+        pool = AuthWorkerPool(max_workers=1, max_pending=2)
+        release = threading.Event()
+        try:
+            running = [asyncio.create_task(pool.run(release.wait)) for _ in range(2)]
+            await asyncio.sleep(0)
+            with pytest.raises(HTTPException) as exc_info:
+                await pool.run(release.wait)
+            assert exc_info.value.status_code == 503
+            assert pool.rejected == 1
+
+            release.set()
+            await asyncio.gather(*running)
+        finally:
+            release.set()
+            pool.shutdown()
+        assert pool.pending == 0
+
+    @pytest.mark.asyncio
+    async def test_cancelled_jobs_count_until_their_thread_finishes(self):
+        """Test that abandoning a job does not free its slot while it still runs."""
+        import asyncio
+        import threading
+
+        from lattice_lock.admin.auth import AuthWorkerPool
+
+        pool = AuthWorkerPool(max_workers=1, max_pending=1)
+        release = threading.Event()
+        try:
+            task = asyncio.create_task(pool.run(release.wait))
+            await asyncio.sleep(0.01)
+            task.cancel()
+            with pytest.raises(asyncio.CancelledError):
+                await task
+            assert pool.pending == 1
+            with pytest.raises(HTTPException):
+                await pool.run(release.wait)
+
+            release.set()
+            for _ in range(100):
+                if pool.pending == 0:
+                    break
+                await asyncio.sleep(0.01)
+            assert pool.pending == 0
+        finally:
+            release.set()
+            pool.shutdown()
+
+    def test_only_the_global_pool_reports_metrics(self):
+        """Test that recreated pools do not repeat the pool series."""
+        from lattice_lock.admin.auth import AuthWorkerPool, get_auth_pool, reset_auth_pool
+        from lattice_lock.metrics import get_metrics_registry
+
+        local_pool = AuthWorkerPool()
+        local_pool.shutdown()
+        previous = get_auth_pool()
+        reset_auth_pool()
+        assert get_auth_pool() is not previous
+
+        lines = get_metrics_registry().render().splitlines()
+        assert sum(line.startswith("lattice_auth_pool_pending ") for line in lines) == 1
+
+    @pytest.mark.asyncio
+    async def test_authenticate_user_async(self, test_user: User, auth_secrets):
+        """Test that async authentication checks the password on the pool."""
+        from lattice_lock.admin.auth import authenticate_user_async, get_auth_pool
+
+        completed = get_auth_pool().completed
+        user = await authenticate_user_async(test_user.username, auth_secrets["PASSWORD"])
+        assert user is not None and user.username == test_user.username
+        assert await authenticate_user_async(test_user.username, "wrong_password") is None
+        assert await authenticate_user_async("nobody", "wrong_password") is None
+        assert get_auth_pool().completed == completed + 3
+
+
 class TestAPIKeys:
     """Tests for API key generation and validation."""
 
@@ -323,6 +483,106 @@ class TestAPIKeys:
         """Test rotating nonexistent key."""
         assert rotate_api_key("nonexistent") is None
 
+    def test_api_key_embeds_key_id(self, test_user: User):
+        """Test that the key ID is the public part of the key."""
+        api_key, key_id = generate_api_key(test_user.username, test_user.role)
+        assert api_key.startswith(f"llk_{key_id}_")
+
+    def test_verification_checks_only_the_matching_hash(self, test_user: User, monkeypatch):
+        """Test that verification runs one bcrypt check regardless of issued keys."""
+        from lattice_lock.admin.auth import api_keys
+
+        monkeypatch.setattr(api_keys, "BCRYPT_ROUNDS", 4)
+        keys = [generate_api_key(test_user.username, test_user.role)[0] for _ in range(5)]
+        checks = []
+        checkpw = api_keys.bcrypt.checkpw
+        monkeypatch.setattr(
+            api_keys.bcrypt, "checkpw", lambda *args: checks.append(args) or checkpw(*args)
+        )
+
+        verify_api_key(keys[3])
+        assert len(checks) == 1
+
+        # Unknown key IDs are rejected without hashing
+        with pytest.raises(HTTPException):
+            verify_api_key("llk_0000000000000000_secret")
+        assert len(checks) == 1
+
+    def test_verified_key_is_cached_until_revoked(self, test_user: User, monkeypatch):
+        """Test that repeat verifications skip bcrypt and revocation is honoured."""
+        from lattice_lock.admin.auth import api_keys
+
+        api_key, key_id = generate_api_key(test_user.username, test_user.role)
+        verify_api_key(api_key)
+        monkeypatch.setattr(
+            api_keys.bcrypt, "checkpw", lambda *_: pytest.fail("bcrypt called on cache hit")
+        )
+        assert verify_api_key(api_key) == (test_user.username, test_user.role)
+
+        revoke_api_key(key_id)
+        with pytest.raises(HTTPException):
+            verify_api_key(api_key)
+
+    def test_verified_key_cache_expires(self, test_user: User, monkeypatch):
+        """Test that cached verifications expire after the TTL."""
+        from lattice_lock.admin.auth import api_keys
+
+        api_key, _ = generate_api_key(test_user.username, test_user.role)
+        monkeypatch.setattr(api_keys, "VERIFIED_KEY_TTL_SECONDS", 0)
+        checks = []
+        checkpw = api_keys.bcrypt.checkpw
+        monkeypatch.setattr(
+            api_keys.bcrypt, "checkpw", lambda *args: checks.append(args) or checkpw(*args)
+        )
+
+        verify_api_key(api_key)
+        verify_api_key(api_key)
+        assert len(checks) == 2
+
+    def test_wrong_secret_is_rejected(self, test_user: User):
+        """Test that a valid key ID with the wrong secret fails."""
+        _, key_id = generate_api_key(test_user.username, test_user.role)
+        with pytest.raises(HTTPException):
+            verify_api_key(f"llk_{key_id}_not-the-secret")
+
+    @pytest.mark.asyncio
+    async def test_verify_api_key_async(self, test_user: User):
+        """Test async verification, which runs bcrypt in a worker thread."""
+        from lattice_lock.admin.auth import verify_api_key_async
+
+        api_key, _ = generate_api_key(test_user.username, test_user.role)
+        assert await verify_api_key_async(api_key) == (test_user.username, test_user.role)
+        with pytest.raises(HTTPException):
+            await verify_api_key_async("llk_invalid_key")
+
+    @pytest.mark.asyncio
+    async def test_generate_and_rotate_api_key_async(self, test_user: User, monkeypatch):
+        """Test async key generation and rotation, which hash on the auth pool."""
+        from lattice_lock.admin.auth import (
+            api_keys,
+            generate_api_key_async,
+            get_auth_pool,
+            rotate_api_key_async,
+        )
+
+        monkeypatch.setattr(api_keys, "BCRYPT_ROUNDS", 4)
+        completed = get_auth_pool().completed
+        old_key, old_id = await generate_api_key_async(
+            test_user.username, test_user.role, name="original"
+        )
+        result = await rotate_api_key_async(old_id)
+        assert get_auth_pool().completed == completed + 2
+
+        assert result is not None
+        new_key, new_id = result
+        with pytest.raises(HTTPException):
+            verify_api_key(old_key)
+        assert verify_api_key(new_key) == (test_user.username, test_user.role)
+        assert [k.name for k in list_api_keys(test_user.username) if k.key_id == new_id] == [
+            "original"
+        ]
+        assert await rotate_api_key_async("nonexistent") is None
+
 
 class TestUserManagement:
     """Tests for user management."""
@@ -0,0 +1,102 @@
+"""
+Tests for the hot-path benchmark suite, its generators and baseline comparison.
+"""
+
+import pytest
+
+from lattice_lock.benchmarks import generators, suite
+from lattice_lock.benchmarks.suite import BenchmarkResult, BenchmarkRun
+
+
+def _result(name: str, median_ms: float) -> BenchmarkResult:
+    return BenchmarkResult(
+        name=name,
+        group=name.split(".")[0],
+        rounds=3,
+        median_ms=median_ms,
+        mean_ms=median_ms,
+        min_ms=median_ms,
+        max_ms=median_ms,
+        stdev_ms=0.0,
+    )
+
+
+def test_generators_are_deterministic():
+    assert generators.generate_prompts(5, seed=3) == generators.generate_prompts(5, seed=3)
+    assert generators.generate_config(10, seed=1) == generators.generate_config(10, seed=1)
+    assert generators.generate_python_source(20, seed=2) == generators.generate_python_source(
+        20, seed=2
+    )
+
+
+def test_generated_source_and_repository_are_valid_python(tmp_path):
+    root = generators.generate_repository(tmp_path, files=3, functions_per_file=15)
+
+    modules = sorted(root.rglob("*.py"))
+    assert len(modules) == 3
+    for module in modules:
+        compile(module.read_text(), str(module), "exec")
+
+
+@pytest.mark.parametrize("name", sorted(suite.BENCHMARKS))
+def test_every_benchmark_runs(name):
+    result = suite.run_benchmark(suite.BENCHMARKS[name], rounds=1, warmup=0)
+
+    assert result.name == name
+    assert result.median_ms > 0
+
+
+def test_select_benchmarks_by_group_and_name():
+    selected = suite.select_benchmarks(["config", "sheriff.visit_module"])
+
+    assert {c.name for c in selected} == {
+        "config.deep_merge",
+        "config.normalize",
+        "sheriff.visit_module",
+    }
+    with pytest.raises(ValueError, match="Unknown benchmark"):
+        suite.select_benchmarks(["nope"])
+
+
+def test_compare_flags_regressions_beyond_threshold(tmp_path):
+    path = tmp_path / "baseline.json"
+    suite.save_baseline(path, BenchmarkRun("small", [_result("a.x", 10), _result("a.y", 10)]))
+
+    run = BenchmarkRun("small", [_result("a.x", 11.5), _result("a.y", 13), _result("a.z", 1)])
+    comparisons = {c.name: c for c in suite.compare_to_baseline(run, suite.load_baseline(path))}
+
+    assert comparisons["a.x"].change_pct == pytest.approx(15)
+    assert not comparisons["a.x"].regressed
+    assert comparisons["a.y"].regressed
+    # New benchmarks have nothing to regress against
+    assert comparisons["a.z"].baseline_ms is None
+    assert [c.name for c in run.regressions] == ["a.y"]
+
+
+def test_per_benchmark_threshold_overrides_default(tmp_path):
+    path = tmp_path / "baseline.json"
+    baseline = suite.save_baseline(path, BenchmarkRun("small", [_result("a.x", 10)]))
+    baseline["thresholds"] = {"a.x": 50}
+
+    run = BenchmarkRun("small", [_result("a.x", 14)])
+    suite.compare_to_baseline(run, baseline, threshold_pct=5)
+
+    assert not run.regressions
+
+
+def test_save_baseline_keeps_results_and_thresholds_of_other_benchmarks(tmp_path):
+    path = tmp_path / "baseline.json"
+    previous = suite.save_baseline(path, BenchmarkRun("small", [_result("a.x", 10)]))
+    previous["thresholds"] = {"a.x": 40}
+
+    saved = suite.save_baseline(path, BenchmarkRun("small", [_result("a.y", 5)]), previous)
+
+    assert set(saved["results"]) == {"a.x", "a.y"}
+    assert saved["thresholds"] == {"a.x": 40}
+
+
+def test_compare_rejects_baseline_from_other_scale():
+    baseline = {"scale": "large", "results": {}}
+
+    with pytest.raises(ValueError, match="scale"):
+        suite.compare_to_baseline(BenchmarkRun("small", [_result("a.x", 1)]), baseline)
@@ -2,8 +2,11 @@
 Benchmarks for Lattice Lock Core Components.
 """
 
+import asyncio
+
 import pytest
 
+from lattice_lock.benchmarks import MockProviderConfig, run_mock_load
 from lattice_lock.orchestrator.core import ModelOrchestrator
 
 
@@ -19,6 +22,14 @@ def test_orchestrator_instantiation_benchmark(benchmark):
 
 @pytest.mark.benchmark(group="orchestrator")
 def test_route_request_overhead_benchmark(benchmark):
-    """Benchmark overhead of route_request (mocked)."""
-    # This is a stub benchmarks as actual routing involves network
-    pass
+    """Benchmark route_request end to end against the local mock provider (no network)."""
+    provider_config = MockProviderConfig(latency_ms=0, latency_distribution="constant")
+
+    def _run():
+        return asyncio.run(run_mock_load(rate=500, requests=50, provider_config=provider_config))
+
+    report = benchmark.pedantic(_run, rounds=1, iterations=1)
+
+    assert report.succeeded == 50
+    assert report.stages["total"]["count"] == 50
+    assert report.overhead_ms["p50"] is not None
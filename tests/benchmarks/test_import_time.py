@@ -0,0 +1,63 @@
+"""
+Cold-start import-time benchmark for the Lattice Lock CLI.
+
+Runs ``python -X importtime`` in a fresh interpreter and fails if importing the
+CLI entry point exceeds the budget. The failure message lists the most
+expensive modules so regressions can be traced to the offending import.
+"""
+
+import os
+import subprocess
+import sys
+
+import pytest
+
+# Cumulative import time budget for lattice_lock.cli.__main__, in milliseconds.
+CLI_IMPORT_BUDGET_MS = float(os.environ.get("LATTICE_CLI_IMPORT_BUDGET_MS", "250"))
+
+
+def _import_times(module: str) -> dict[str, tuple[float, float]]:
+    """Return {module: (self_ms, cumulative_ms)} for a cold import of ``module``."""
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    times: dict[str, tuple[float, float]] = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "[us]" in line:
+            continue
+        self_us, cumulative_us, name = line[len("import time:") :].split("|", 2)
+        times[name.strip()] = (int(self_us) / 1000, int(cumulative_us) / 1000)
+    return times
+
+
+@pytest.mark.performance
+@pytest.mark.benchmark(group="cli")
+def test_cli_cold_start_import_budget():
+    """Importing the CLI entry point must stay within the cold-start budget."""
+    # Best of three to absorb filesystem cache noise on shared CI runners.
+    runs = [_import_times("lattice_lock.cli.__main__") for _ in range(3)]
+    best = min(runs, key=lambda t: t["lattice_lock.cli.__main__"][1])
+    total_ms = best["lattice_lock.cli.__main__"][1]
+
+    slowest = sorted(best.items(), key=lambda item: item[1][0], reverse=True)[:15]
+    breakdown = "\n".join(f"  {ms:8.1f} ms  {name}" for name, (ms, _) in slowest)
+    assert total_ms <= CLI_IMPORT_BUDGET_MS, (
+        f"CLI cold-start import took {total_ms:.1f} ms "
+        f"(budget {CLI_IMPORT_BUDGET_MS:.0f} ms). Slowest modules (self time):\n{breakdown}"
+    )
+
+
+@pytest.mark.performance
+def test_cli_cold_start_skips_heavy_dependencies():
+    """The CLI entry point must not import the admin, MCP or orchestrator stacks."""
+    times = _import_times("lattice_lock.cli.__main__")
+    heavy = [
+        name
+        for name in times
+        if name.split(".")[0] in {"fastapi", "sqlalchemy", "mcp", "httpx"}
+        or name.startswith("lattice_lock.orchestrator")
+    ]
+    assert heavy == []
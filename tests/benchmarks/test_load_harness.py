@@ -0,0 +1,133 @@
+"""
+Tests for the mock provider server and the route_request load generator.
+"""
+
+import json
+
+import httpx
+import pytest
+
+from lattice_lock.benchmarks import (
+    LoadGenerator,
+    MockProviderConfig,
+    MockProviderServer,
+    create_mock_app,
+)
+from lattice_lock.benchmarks.load import build_mock_orchestrator, percentile
+from lattice_lock.orchestrator.exceptions import RateLimitError
+from lattice_lock.orchestrator.types import APIResponse
+from lattice_lock.tracing import get_performance_metrics
+
+
+def _client(config: MockProviderConfig) -> httpx.AsyncClient:
+    transport = httpx.ASGITransport(app=create_mock_app(config))
+    return httpx.AsyncClient(transport=transport, base_url="http://mock")
+
+
+@pytest.mark.asyncio
+async def test_mock_returns_openai_shaped_completion():
+    async with _client(MockProviderConfig(latency_ms=0, completion_tokens=3)) as client:
+        response = await client.post(
+            "/v1/chat/completions",
+            json={"model": "gpt-x", "messages": [{"role": "user", "content": "hello"}]},
+        )
+
+    data = response.json()
+    assert response.status_code == 200
+    assert data["choices"][0]["message"]["content"] == "token token token"
+    assert data["usage"]["completion_tokens"] == 3
+    assert data["model"] == "gpt-x"
+
+
+@pytest.mark.asyncio
+async def test_mock_injects_rate_limits_and_errors():
+    config = MockProviderConfig(latency_ms=0, rate_limit_rate=0.5, error_rate=0.5, seed=7)
+    async with _client(config) as client:
+        statuses = [
+            (await client.post("/v1/chat/completions", json={"messages": []})).status_code
+            for _ in range(20)
+        ]
+
+    assert set(statuses) == {429, 500}
+
+
+@pytest.mark.asyncio
+async def test_mock_streams_server_sent_events():
+    config = MockProviderConfig(latency_ms=0, completion_tokens=2, stream_chunk_ms=0)
+    async with _client(config) as client:
+        response = await client.post("/v1/chat/completions", json={"messages": [], "stream": True})
+
+    events = [line[6:] for line in response.text.splitlines() if line.startswith("data: ")]
+    assert events[-1] == "[DONE]"
+    chunks = [json.loads(e) for e in events[:-1]]
+    assert "".join(c["choices"][0]["delta"].get("content", "") for c in chunks) == "token token"
+
+
+def test_unknown_latency_distribution_is_rejected():
+    with pytest.raises(ValueError):
+        MockProviderConfig(latency_distribution="pareto")
+
+
+@pytest.mark.asyncio
+async def test_openai_client_sees_429_as_rate_limit_error():
+    async with MockProviderServer(MockProviderConfig(latency_ms=0, rate_limit_rate=1.0)) as server:
+        orchestrator, model_id = build_mock_orchestrator(server.base_url)
+        client = orchestrator.client_pool.get_client("openai")
+        with pytest.raises(RateLimitError):
+            await client.chat_completion(model_id, [{"role": "user", "content": "hi"}])
+        await orchestrator.client_pool.close_all()
+
+    assert server.stats.rate_limited == 1
+
+
+@pytest.mark.asyncio
+async def test_load_generator_reports_throughput_and_errors():
+    calls = 0
+
+    async def route(prompt, **kwargs):
+        nonlocal calls
+        calls += 1
+        if calls % 5 == 0:
+            raise RuntimeError("boom")
+        return APIResponse(content=prompt, model="m", provider="p", usage=None, latency_ms=1)
+
+    report = await LoadGenerator(route, rate=1000, model_id="m").run(requests=20)
+
+    assert report.requests == 20
+    assert report.succeeded == 16
+    assert report.errors == {"RuntimeError": 4}
+    assert report.throughput_rps > 0
+    assert report.to_dict()["latency_ms"]["p99"] is not None
+
+
+def test_percentile_nearest_rank():
+    values = list(range(1, 101))
+    assert percentile(values, 50) == 50
+    assert percentile(values, 99) == 99
+    assert percentile([], 50) is None
+
+
+@pytest.mark.asyncio
+async def test_load_generator_keeps_its_own_stage_timings():
+    global_metrics = get_performance_metrics()
+    recorded = global_metrics.operation_counts.get("route_request.total", 0)
+
+    async def route(prompt, **kwargs):
+        get_performance_metrics().record_operation("route_request.total", 2.0)
+        return APIResponse(content=prompt, model="m", provider="p", usage=None, latency_ms=1)
+
+    report = await LoadGenerator(route, rate=1_000_000, max_in_flight=2000).run(requests=1500)
+
+    assert report.stages["total"]["count"] == 1500
+    assert report.stages["total"]["p50_ms"] == 2.0
+    assert get_performance_metrics() is global_metrics
+    assert global_metrics.operation_counts.get("route_request.total", 0) == recorded
+
+
+@pytest.mark.asyncio
+async def test_load_generator_needs_exactly_one_bound():
+    generator = LoadGenerator(lambda _prompt: None, rate=10)
+    with pytest.raises(ValueError):
+        await generator.run()
+    with pytest.raises(ValueError):
+        await generator.run(duration_s=1, requests=10)
@@ -0,0 +1,63 @@
+"""
+Tests for the `lattice bench` command.
+"""
+
+import json
+
+from click.testing import CliRunner
+
+from lattice_lock.cli.__main__ import cli
+
+
+def _bench(tmp_path, *args):
+    baseline = tmp_path / "baseline.json"
+    return CliRunner().invoke(
+        cli, ["bench", "config.normalize", "--rounds", "2", "--baseline", str(baseline), *args]
+    )
+
+
+def test_bench_lists_benchmarks():
+    result = CliRunner().invoke(cli, ["bench", "--list"])
+
+    assert result.exit_code == 0
+    assert "sheriff.visit_module" in result.output
+    assert "checkpoint.save_load" in result.output
+
+
+def test_bench_help_lists_registered_groups():
+    from lattice_lock.benchmarks.suite import list_groups
+
+    result = CliRunner().invoke(cli, ["bench", "--help"])
+
+    assert result.exit_code == 0
+    assert "{groups}" not in result.output
+    assert ", ".join(list_groups()) in " ".join(result.output.split())
+
+
+def test_bench_saves_and_compares_baseline(tmp_path):
+    saved = _bench(tmp_path, "--save-baseline")
+    assert saved.exit_code == 0, saved.output
+    assert (tmp_path / "baseline.json").exists()
+
+    compared = _bench(tmp_path, "--json", "--threshold", "1000")
+    assert compared.exit_code == 0, compared.output
+    data = json.loads(compared.output)
+    assert data["comparisons"][0]["baseline_ms"] is not None
+    assert data["regressions"] == []
+
+
+def test_bench_fails_when_benchmark_regresses(tmp_path):
+    _bench(tmp_path, "--save-baseline")
+
+    # Any run is "slower" than the baseline under a -100% threshold
+    result = _bench(tmp_path, "--threshold", "-100")
+
+    assert result.exit_code == 1
+    assert "regressed" in result.output
+
+
+def test_bench_rejects_unknown_group(tmp_path):
+    result = _bench(tmp_path, "nope")
+
+    assert result.exit_code == 2
+    assert "Unknown benchmark or group" in result.output
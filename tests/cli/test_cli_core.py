@@ -4,6 +4,8 @@ Tests for the Lattice Lock CLI core functionality.
 Tests the CLI entry point, version, help, and verbose flag.
 """
 
+import json
+
 import pytest
 from click.testing import CliRunner
 
@@ -87,3 +89,36 @@ class TestCLIContext:
         assert result.exit_code == 0
         # Verbose mode shows "Created" messages
         assert "Created" in result.output
+
+
+class TestCLIProfile:
+    """Tests for the global --profile option."""
+
+    def test_profile_writes_files_and_stage_summary(self, runner: CliRunner, tmp_path) -> None:
+        target = tmp_path / "module.py"
+        target.write_text("import os\n\n\ndef add(a: int, b: int) -> int:\n    return a + b\n")
+        prefix = tmp_path / "profiles" / "sheriff"
+
+        result = runner.invoke(
+            cli,
+            [
+                "--json",
+                "--profile",
+                "--profile-output",
+                str(prefix),
+                "sheriff",
+                str(tmp_path),
+                "--no-cache",
+                "--format",
+                "json",
+            ],
+        )
+
+        assert result.exit_code in (0, 1)
+        assert (tmp_path / "profiles" / "sheriff.prof").exists()
+        assert (tmp_path / "profiles" / "sheriff.collapsed").exists()
+        profile = json.loads(result.stderr[result.stderr.index('{\n  "profile"') :])["profile"]
+        assert profile["command"] == "sheriff"
+        assert {"discovery", "read", "parse", "visit"} <= {s["name"] for s in profile["stages"]}
+        # Command output on stdout is unaffected
+        assert json.loads(result.stdout)["target"] == str(tmp_path)
@@ -0,0 +1,90 @@
+"""
+Tests for lazy subcommand loading in the Lattice Lock CLI.
+"""
+
+import subprocess
+import sys
+
+import click
+import pytest
+from click.testing import CliRunner
+
+from lattice_lock.cli.__main__ import LAZY_SUBCOMMANDS, cli
+from lattice_lock.cli.lazy_group import LazyCommand, LazyGroup
+
+HEAVY_MODULES = ("fastapi", "sqlalchemy", "mcp", "lattice_lock.orchestrator", "rich")
+
+
+def _modules_loaded_after(code: str) -> set[str]:
+    """Run ``code`` in a fresh interpreter and return the loaded top-level modules."""
+    script = code + "\nimport sys\nprint('\\n'.join(sys.modules))"
+    result = subprocess.run(
+        [sys.executable, "-c", script], capture_output=True, text=True, check=True
+    )
+    return set(result.stdout.split())
+
+
+class TestLazyGroup:
+    """Tests for the LazyGroup command resolution."""
+
+    def test_lazy_command_resolves_on_get(self) -> None:
+        group = LazyGroup(
+            name="demo",
+            lazy_subcommands={"init": LazyCommand("lattice_lock.cli.commands.init:init_command")},
+        )
+        ctx = click.Context(group)
+        assert "init" not in group.commands
+
+        command = group.get_command(ctx, "init")
+
+        assert isinstance(command, click.Command)
+        assert group.commands["init"] is command
+
+    def test_unknown_command_returns_none(self) -> None:
+        group = LazyGroup(name="demo")
+        assert group.get_command(click.Context(group), "missing") is None
+
+    def test_non_command_target_raises(self) -> None:
+        group = LazyGroup(name="demo")
+        group.add_lazy_command("bad", "lattice_lock.cli.lazy_group:LazyCommand")
+        with pytest.raises(TypeError, match="expected a click.Command"):
+            group.get_command(click.Context(group), "bad")
+
+    def test_help_uses_registered_short_help(self) -> None:
+        group = LazyGroup(name="demo")
+        group.add_lazy_command("thing", "nonexistent.module:thing", "Do a thing.")
+        result = CliRunner().invoke(group, ["--help"])
+        assert result.exit_code == 0
+        assert "Do a thing." in result.output
+
+
+class TestCLILazyLoading:
+    """Tests that the real CLI only imports what it needs."""
+
+    @pytest.mark.parametrize("name", sorted(LAZY_SUBCOMMANDS))
+    def test_every_subcommand_resolves(self, name: str) -> None:
+        command = cli.get_command(click.Context(cli), name)
+        assert isinstance(command, click.Command)
+
+    def test_help_lists_all_subcommands(self) -> None:
+        result = CliRunner().invoke(cli, ["--help"])
+        assert result.exit_code == 0
+        for name in LAZY_SUBCOMMANDS:
+            assert name in result.output
+
+    def test_help_does_not_import_heavy_dependencies(self) -> None:
+        loaded = _modules_loaded_after(
+            "from click.testing import CliRunner\n"
+            "from lattice_lock.cli.__main__ import cli\n"
+            "CliRunner().invoke(cli, ['--help'])"
+        )
+        assert not [m for m in loaded if m.startswith(HEAVY_MODULES)]
+
+    def test_sheriff_does_not_import_admin_stack(self) -> None:
+        loaded = _modules_loaded_after(
+            "from click.testing import CliRunner\n"
+            "from lattice_lock.cli.__main__ import cli\n"
+            "CliRunner().invoke(cli, ['sheriff', '--help'])"
+        )
+        assert "lattice_lock.cli.commands.sheriff" in loaded
+        assert not [m for m in loaded if m.startswith(("fastapi", "sqlalchemy", "mcp"))]
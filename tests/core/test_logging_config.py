@@ -0,0 +1,105 @@
+"""
+Tests for log redaction and queue-based logging.
+"""
+
+import io
+import json
+import logging
+import queue
+
+import pytest
+
+from lattice_lock.logging_config import (
+    LogQueueHandler,
+    SensitiveDataFilter,
+    set_trace_id,
+    setup_logging,
+    shutdown_logging,
+)
+
+
+@pytest.fixture
+def restore_logging():
+    root = logging.getLogger("lattice_lock")
+    handlers, level, propagate = list(root.handlers), root.level, root.propagate
+    yield
+    shutdown_logging()
+    root.handlers[:] = handlers
+    root.setLevel(level)
+    root.propagate = propagate
+
+
+@pytest.mark.parametrize(
+    ("message", "expected"),
+    [
+        ("password=hunter2 ok", "password=[REDACTED] ok"),
+        ("api_key: sk-123, next", "api_key: [REDACTED], next"),
+        ('{"secret": "s3"}', '{"secret": "[REDACTED]"}'),
+        ("Authorization: Bearer abc.def", "Authorization: [REDACTED]"),
+        ("auth=1 authorization=2", "auth=[REDACTED] authorization=[REDACTED]"),
+        ("Selected model: gpt-4o", "Selected model: gpt-4o"),
+    ],
+)
+def test_redacts_values_after_sensitive_keys(message, expected):
+    assert SensitiveDataFilter()._redact_message(message) == expected
+
+
+def test_redacts_values_passed_as_arguments():
+    record = logging.LogRecord(
+        "t", logging.INFO, __file__, 1, "token=%s user=%s", ("abc", "bob"), None
+    )
+
+    SensitiveDataFilter().filter(record)
+
+    assert record.getMessage() == "token=[REDACTED] user=bob"
+
+
+def test_bad_format_arguments_do_not_raise_from_filter():
+    record = logging.LogRecord("t", logging.INFO, __file__, 1, "token %s %s", ("a",), None)
+
+    assert SensitiveDataFilter().filter(record) is True
+    assert record.args == ("a",)
+
+    logger = logging.getLogger("lattice_lock.tests.bad_args")
+    handler = logging.StreamHandler(io.StringIO())
+    handler.handleError = lambda _record: None
+    handler.addFilter(SensitiveDataFilter())
+    logger.addHandler(handler)
+    try:
+        logger.info("token %s %s", "a")
+    finally:
+        logger.removeHandler(handler)
+
+
+def test_queue_mode_formats_on_listener_thread(tmp_path, restore_logging):
+    log_file = tmp_path / "app.log"
+    setup_logging(level=logging.INFO, log_file=str(log_file), use_queue=True)
+    root = logging.getLogger("lattice_lock")
+    assert [type(h) for h in root.handlers] == [LogQueueHandler]
+
+    set_trace_id("trace-42")
+    logger = logging.getLogger("lattice_lock.test")
+    logger.info("Using password=%s for %s", "hunter2", "db", extra={"provider": "openai"})
+    try:
+        raise ValueError("boom")
+    except ValueError:
+        logger.exception("Request failed")
+    shutdown_logging()
+
+    records = [json.loads(line) for line in log_file.read_text().splitlines()]
+    assert records[0]["message"] == "Using password=[REDACTED] for db"
+    assert records[0]["trace_id"] == "trace-42"
+    assert records[0]["extra"] == {"provider": "openai"}
+    assert "ValueError: boom" in records[1]["exception"]
+
+
+def test_queue_handler_drops_records_when_full():
+    handler = LogQueueHandler(queue.Queue(maxsize=1))
+    record = logging.LogRecord("t", logging.INFO, __file__, 1, "msg %d", (1,), None)
+
+    handler.handle(record)
+    handler.handle(record)
+
+    assert handler.queue.qsize() == 1
+    assert handler.dropped == 1
+    assert handler.queue.get_nowait().msg == "msg 1"
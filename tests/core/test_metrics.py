@@ -0,0 +1,163 @@
+"""Tests for the metrics registry and its Prometheus text rendering."""
+
+import gc
+
+import pytest
+
+from lattice_lock.metrics import MetricFamily, MetricsRegistry, get_metrics_registry
+
+
+class TestMetricsRegistry:
+    """Tests for MetricsRegistry."""
+
+    def test_counter_render(self):
+        registry = MetricsRegistry()
+        requests = registry.counter("app_requests_total", "Requests.", ["method"])
+        requests.labels("GET").inc()
+        requests.labels(method="GET").inc(2)
+        requests.labels("POST").inc()
+
+        text = registry.render()
+        assert "# HELP app_requests_total Requests.\n" in text
+        assert "# TYPE app_requests_total counter\n" in text
+        assert 'app_requests_total{method="GET"} 3\n' in text
+        assert 'app_requests_total{method="POST"} 1\n' in text
+
+    def test_counter_rejects_decrease(self):
+        counter = MetricsRegistry().counter("app_total", "Total.")
+        with pytest.raises(ValueError):
+            counter.inc(-1)
+
+    def test_gauge(self):
+        registry = MetricsRegistry()
+        gauge = registry.gauge("app_in_flight", "In flight.")
+        gauge.inc(3)
+        gauge.dec()
+        assert "app_in_flight 2\n" in registry.render()
+        gauge.set(0.5)
+        assert "app_in_flight 0.5\n" in registry.render()
+
+    def test_metric_base_requires_new_child(self):
+        from lattice_lock.metrics import _Metric
+
+        with pytest.raises(TypeError):
+            _Metric("app_abstract", "Abstract.")
+
+    def test_histogram_buckets_are_cumulative(self):
+        registry = MetricsRegistry()
+        histogram = registry.histogram("app_seconds", "Latency.", buckets=(0.1, 1.0))
+        for value in (0.05, 0.1, 0.5, 3.0):
+            histogram.observe(value)
+
+        text = registry.render()
+        assert 'app_seconds_bucket{le="0.1"} 2\n' in text
+        assert 'app_seconds_bucket{le="1"} 3\n' in text
+        assert 'app_seconds_bucket{le="+Inf"} 4\n' in text
+        assert "app_seconds_sum 3.65\n" in text
+        assert "app_seconds_count 4\n" in text
+
+    def test_get_or_create_returns_same_metric(self):
+        registry = MetricsRegistry()
+        first = registry.counter("app_total", "Total.", ["kind"])
+        assert registry.counter("app_total", "Total.", ["kind"]) is first
+        with pytest.raises(ValueError):
+            registry.gauge("app_total", "Total.", ["kind"])
+        with pytest.raises(ValueError):
+            registry.counter("app_total", "Total.", ["other"])
+
+    def test_label_validation(self):
+        registry = MetricsRegistry()
+        with pytest.raises(ValueError):
+            registry.counter("bad name", "Bad.")
+        counter = registry.counter("app_total", "Total.", ["kind"])
+        with pytest.raises(ValueError):
+            counter.inc()
+        with pytest.raises(ValueError):
+            counter.labels("a", "b")
+
+    def test_label_values_are_escaped(self):
+        registry = MetricsRegistry()
+        registry.counter("app_total", "Total.", ["path"]).labels('a"b\\c\nd').inc()
+        assert 'app_total{path="a\\"b\\\\c\\nd"} 1\n' in registry.render()
+
+    def test_reset_keeps_bound_children(self):
+        registry = MetricsRegistry()
+        child = registry.counter("app_total", "Total.", ["kind"]).labels("x")
+        child.inc(5)
+        registry.reset()
+        child.inc()
+        assert 'app_total{kind="x"} 1\n' in registry.render()
+
+    def test_collectors_merge_families(self):
+        registry = MetricsRegistry()
+        registry.register_collector(
+            lambda: [MetricFamily("app_pool_size", "gauge", "Pool size.").add(5, pool="a")]
+        )
+        registry.register_collector(
+            lambda: [MetricFamily("app_pool_size", "gauge", "Pool size.").add(7, pool="b")]
+        )
+        extra = MetricFamily("app_extra", "summary", "Extra.").add(2, suffix="_count")
+
+        text = registry.render([lambda: [extra]])
+        assert text.count("# TYPE app_pool_size gauge") == 1
+        assert 'app_pool_size{pool="a"} 5\n' in text
+        assert 'app_pool_size{pool="b"} 7\n' in text
+        assert "app_extra_count 2\n" in text
+
+    def test_failing_collector_is_skipped(self):
+        registry = MetricsRegistry()
+        registry.counter("app_total", "Total.").inc()
+
+        def broken():
+            raise RuntimeError("boom")
+
+        registry.register_collector(broken)
+        assert "app_total 1\n" in registry.render()
+
+    def test_bound_method_collectors_are_weak(self):
+        registry = MetricsRegistry()
+
+        class Component:
+            def collect(self):
+                return [MetricFamily("app_component", "gauge", "Component.").add(1)]
+
+        component = Component()
+        registry.register_collector(component.collect)
+        assert "app_component 1\n" in registry.render()
+
+        del component
+        gc.collect()
+        assert "app_component" not in registry.render()
+
+    def test_unregister_collector(self):
+        registry = MetricsRegistry()
+
+        def collector():
+            return [MetricFamily("app_component", "gauge", "Component.").add(1)]
+
+        registry.register_collector(collector)
+        registry.unregister_collector(collector)
+        assert "app_component" not in registry.render()
+
+
+class TestComponentMetrics:
+    """Tests that components report into the global registry."""
+
+    def test_performance_metrics_reported(self):
+        from lattice_lock.tracing import PerformanceMetrics
+
+        metrics = PerformanceMetrics()
+        metrics.record_operation("test.metrics_op", 20.0, success=False)
+        metrics.increment("test.metrics_event")
+
+        text = get_metrics_registry().render()
+        assert 'lattice_operation_duration_seconds_count{operation="test.metrics_op"}' in text
+        assert 'lattice_operation_errors_total{operation="test.metrics_op"}' in text
+        assert 'lattice_events_total{event="test.metrics_event"}' in text
+
+    def test_error_metrics_reported(self):
+        from lattice_lock.errors.classification import classify_error
+        from lattice_lock.errors.middleware import ErrorMetrics
+
+        ErrorMetrics().record_error(classify_error(ValueError("bad value")))
+        assert "lattice_errors_total{error_type=" in get_metrics_registry().render()
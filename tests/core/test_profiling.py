@@ -0,0 +1,70 @@
+"""Tests for the profiling hooks used by ``lattice --profile``."""
+
+import pstats
+import time
+
+from lattice_lock.profiling import Profiler, stage
+
+
+def _busy(ms: float) -> None:
+    end = time.perf_counter() + ms / 1000
+    while time.perf_counter() < end:
+        pass
+
+
+class TestProfiler:
+    """Tests for Profiler."""
+
+    def test_stage_is_noop_without_profiler(self):
+        with stage("parse"):
+            pass
+        assert stage("parse") is stage("visit")
+
+    def test_nested_stage_self_time(self):
+        with Profiler("test") as profiler:
+            with stage("discovery"):
+                _busy(5)
+                for _ in range(2):
+                    with stage("parse"):
+                        _busy(10)
+
+        discovery = profiler.stages["discovery"]
+        parse = profiler.stages["parse"]
+        assert parse.calls == 2
+        assert parse.total_ms >= 20
+        assert discovery.total_ms >= discovery.self_ms + parse.total_ms - 1
+        assert discovery.self_ms < discovery.total_ms - 19
+
+    def test_stages_closed_on_exception(self):
+        profiler = Profiler("test").start()
+        try:
+            with stage("parse"):
+                raise ValueError("boom")
+        except ValueError:
+            pass
+        profiler.stop()
+        assert profiler.stages["parse"].calls == 1
+        with stage("parse"):
+            pass
+        assert profiler.stages["parse"].calls == 1
+
+    def test_report_and_files(self, tmp_path):
+        with Profiler("test", sample_interval=0.001) as profiler:
+            with stage("generate"):
+                _busy(30)
+                data = [bytes(1024) for _ in range(1000)]
+        del data
+
+        prof_path, collapsed_path = profiler.write(tmp_path / "out" / "run")
+        report = profiler.report(prof_path, collapsed_path)
+
+        assert report.wall_ms >= 30
+        assert report.peak_memory_bytes >= 1024 * 1000
+        assert [s.name for s in report.stages] == ["generate"]
+        assert report.samples > 0
+        assert pstats.Stats(str(prof_path)).total_calls > 0
+
+        lines = collapsed_path.read_text().splitlines()
+        assert sum(int(line.rsplit(" ", 1)[1]) for line in lines) == report.samples
+        assert any("_busy" in line for line in lines)
+        assert report.to_dict()["stages"][0]["name"] == "generate"
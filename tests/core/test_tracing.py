@@ -0,0 +1,144 @@
+"""
+Tests for span sampling, the span collector and its exporters.
+"""
+
+import json
+
+import pytest
+
+from lattice_lock import tracing
+from lattice_lock.tracing import (
+    AsyncSpanContext,
+    SpanCollector,
+    SpanContext,
+    configure_span_collector,
+    generate_span_id,
+    generate_trace_id,
+    get_span_collector,
+)
+
+
+@pytest.fixture
+def collector():
+    previous = tracing.get_span_collector()
+    yield configure_span_collector(sample_rate=1.0, capacity=100)
+    tracing._span_collector = previous
+
+
+def test_ids_are_fixed_width_hex():
+    trace_id, span_id = generate_trace_id(), generate_span_id()
+
+    assert len(trace_id) == 16 and int(trace_id, 16) >= 0
+    assert len(span_id) == 8 and int(span_id, 16) >= 0
+
+
+@pytest.mark.asyncio
+async def test_sampled_trace_records_parent_child_spans(collector):
+    async with AsyncSpanContext("root", attributes={"tenant": "acme"}) as root:
+        with SpanContext("child") as child:
+            pass
+
+    spans = {s.name: s for s in collector.spans(root.trace_id)}
+    assert set(spans) == {"root", "child"}
+    assert spans["child"].parent_span_id == root.span_id
+    assert child.trace_id == root.trace_id
+
+
+def test_unsampled_trace_records_nothing_and_children_follow_root(collector):
+    collector.sample_rate = 0.0
+    with SpanContext("root"):
+        # Sampling is decided at the root, so raising the rate mid-trace changes nothing
+        collector.sample_rate = 1.0
+        with SpanContext("child"):
+            pass
+
+    assert collector.spans() == []
+
+
+def test_ring_buffer_keeps_newest_spans():
+    collector = SpanCollector(sample_rate=1.0, capacity=3)
+    for i in range(5):
+        span = tracing.Span(name=f"s{i}", trace_id="t", span_id=f"{i}")
+        span.end()
+        collector.record(span)
+
+    assert [s.name for s in collector.spans()] == ["s2", "s3", "s4"]
+    assert collector.dropped == 2
+
+
+def test_sample_rate_is_validated():
+    with pytest.raises(ValueError):
+        SpanCollector(sample_rate=1.5)
+
+
+def test_chrome_trace_export(collector, tmp_path):
+    with SpanContext("outer", attributes={"model": "gpt"}):
+        with pytest.raises(RuntimeError):
+            with SpanContext("inner"):
+                raise RuntimeError("boom")
+
+    path = collector.export_chrome_trace(tmp_path / "trace.json")
+    events = {e["name"]: e for e in json.loads(path.read_text())["traceEvents"]}
+
+    assert events["outer"]["ph"] == "X"
+    assert events["outer"]["dur"] >= events["inner"]["dur"]
+    assert events["outer"]["tid"] == events["inner"]["tid"]
+    assert events["outer"]["args"]["model"] == "gpt"
+    assert events["inner"]["args"]["error"] == "boom"
+
+
+def test_otlp_export(collector, tmp_path):
+    with SpanContext("outer", attributes={"tokens": 12, "cached": False, "skip": None}):
+        with SpanContext("inner"):
+            pass
+
+    path = collector.export_otlp_json(tmp_path / "otlp.json", service_name="svc")
+    resource_spans = json.loads(path.read_text())["resourceSpans"][0]
+    spans = {s["name"]: s for s in resource_spans["scopeSpans"][0]["spans"]}
+
+    assert resource_spans["resource"]["attributes"][0]["value"] == {"stringValue": "svc"}
+    assert len(spans["outer"]["traceId"]) == 32
+    assert len(spans["outer"]["spanId"]) == 16
+    assert spans["inner"]["parentSpanId"] == spans["outer"]["spanId"]
+    assert spans["outer"]["attributes"] == [
+        {"key": "tokens", "value": {"intValue": "12"}},
+        {"key": "cached", "value": {"boolValue": False}},
+    ]
+    assert int(spans["outer"]["endTimeUnixNano"]) >= int(spans["outer"]["startTimeUnixNano"])
+
+
+def test_sheriff_scan_is_traced(collector, tmp_path):
+    from lattice_lock.sheriff.config import SheriffConfig
+    from lattice_lock.sheriff.sheriff import validate_path_with_audit
+
+    (tmp_path / "a.py").write_text("import os\n")
+    (tmp_path / "b.py").write_text("x = 1\n")
+
+    validate_path_with_audit(tmp_path, SheriffConfig())
+
+    names = [s.name for s in get_span_collector().spans()]
+    assert names.count("sheriff.validate_file") == 2
+    assert names[-1] == "sheriff.validate_path"
+
+
+@pytest.mark.asyncio
+async def test_route_request_spans_cover_each_stage(collector):
+    from lattice_lock.benchmarks import MockProviderConfig, MockProviderServer
+    from lattice_lock.benchmarks.load import build_mock_orchestrator
+
+    async with MockProviderServer(MockProviderConfig(latency_ms=0)) as server:
+        orchestrator, model_id = build_mock_orchestrator(server.base_url)
+        await orchestrator.route_request("Write a function", model_id=model_id)
+        await orchestrator.client_pool.close_all()
+
+    names = {s.name for s in collector.spans()}
+    assert {
+        "route_request",
+        "analyze",
+        "provider.execute",
+        "http.request",
+        "cost.record",
+    } <= names
+    http = next(s for s in collector.spans() if s.name == "http.request")
+    assert http.attributes["status_code"] == 200
+    assert len({s.trace_id for s in collector.spans()}) == 1
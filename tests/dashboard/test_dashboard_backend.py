@@ -8,6 +8,10 @@ Tests cover:
 - WebSocket connections for real-time updates
 """
 
+import asyncio
+import json
+import random
+
 import pytest
 from fastapi.testclient import TestClient
 
@@ -120,6 +124,39 @@ class TestMetricsCollector:
         snapshot = collector.get_snapshot()
         assert snapshot.total_validations == 0
         assert snapshot.error_counts == {}
+        assert snapshot.response_time_p99 == 0.0
+        assert collector.get_percentile(50, project_id="proj1") == 0.0
+
+    def test_scoped_percentiles(self):
+        """Test response time percentiles per project and per error type."""
+        collector = MetricsCollector()
+        for _ in range(100):
+            collector.record_validation(success=True, duration=0.01, project_id="fast")
+            collector.record_validation(
+                success=False, duration=1.0, error_type="timeout", project_id="slow"
+            )
+
+        assert collector.get_percentile(50, project_id="fast") == pytest.approx(0.01, rel=0.02)
+        assert collector.get_percentile(50, project_id="slow") == pytest.approx(1.0, rel=0.02)
+        assert collector.get_percentile(99, error_type="timeout") == pytest.approx(1.0, rel=0.02)
+        assert collector.get_percentile(50, project_id="unknown") == 0.0
+        assert collector.get_response_time_sketch().count == 200
+
+    def test_merge_sketches_from_other_worker(self):
+        """Test combining response time sketches from several collectors."""
+        first, second = MetricsCollector(), MetricsCollector()
+        for _ in range(10):
+            first.record_validation(success=True, duration=0.1, project_id="proj1")
+            second.record_validation(
+                success=False, duration=0.3, error_type="error", project_id="proj2"
+            )
+
+        first.merge_sketches(second.export_sketches())
+
+        assert first.get_response_time_sketch().count == 20
+        assert first.get_percentile(50, project_id="proj2") == pytest.approx(0.3, rel=0.02)
+        assert first.get_percentile(99, error_type="error") == pytest.approx(0.3, rel=0.02)
+        assert first.get_snapshot().avg_response_time == pytest.approx(0.2)
 
 
 # ============================================================================
@@ -259,6 +296,49 @@ class TestDataAggregator:
         assert len(agg.get_all_projects()) == 0
         summary = agg.get_project_summary()
         assert summary.total_projects == 0
+        assert summary.error_projects == 0
+        assert summary.avg_health_score == 0.0
+
+    def test_summary_tracks_status_transitions(self):
+        """Test that incrementally maintained totals match a full recount."""
+        agg = DataAggregator()
+        rng = random.Random(11)
+        statuses = ["healthy", "valid", "warning", "degraded", "error", "critical", "unknown"]
+        for i in range(500):
+            project_id = f"proj{rng.randrange(40)}"
+            if i % 50 == 49:
+                agg.remove_project(project_id)
+            elif i % 7 == 0:
+                agg.register_project(project_id, name=f"Project {i}")
+            else:
+                agg.update_project_status(project_id, rng.choice(statuses))
+
+        projects = list(agg.projects.values())
+        healthy = sum(1 for p in projects if p.status in DataAggregator.HEALTHY_STATUSES)
+        error = sum(1 for p in projects if p.status in DataAggregator.ERROR_STATUSES)
+
+        summary = agg.get_project_summary()
+        assert summary.total_projects == len(projects)
+        assert summary.healthy_projects == healthy
+        assert summary.error_projects == error
+        assert summary.at_risk_projects == len(projects) - healthy - error
+        assert summary.avg_health_score == round(
+            sum(p.health_score for p in projects) / len(projects), 2
+        )
+
+    def test_summary_reflects_updates_immediately(self):
+        """Test that summaries are not served stale after an update."""
+        agg = DataAggregator(cache_ttl=60)
+        agg.update_project_status("proj1", "healthy")
+        assert agg.get_project_summary().healthy_projects == 1
+
+        agg.update_project_status("proj1", "error")
+        summary = agg.get_project_summary()
+        assert summary.healthy_projects == 0
+        assert summary.error_projects == 1
+        assert summary.total_validations == 2
+        assert summary.overall_success_rate == 50.0
+        assert agg.get_all_projects()[0]["status"] == "error"
 
 
 # ============================================================================
@@ -389,6 +469,23 @@ class TestDashboardBackend:
         assert data["total_validations"] == 2
         assert data["success_rate"] < 100.0
 
+    def test_prometheus_metrics(self, client):
+        """Test the Prometheus text format metrics endpoint."""
+        client.post("/dashboard/projects/proj1", json={"status": "healthy"})
+        client.post("/dashboard/projects/proj2", json={"status": "error"})
+
+        response = client.get("/metrics")
+        assert response.status_code == 200
+        assert response.headers["content-type"].startswith("text/plain; version=0.0.4")
+
+        text = response.text
+        assert 'lattice_dashboard_projects{status="healthy"} 1' in text
+        assert 'lattice_dashboard_projects{status="error"} 1' in text
+        assert "lattice_dashboard_validations_total 2" in text
+        assert 'lattice_dashboard_errors_total{error_type="status_error"} 1' in text
+        assert 'lattice_dashboard_response_time_seconds{quantile="0.99"}' in text
+        assert "lattice_dashboard_websocket_connections 0" in text
+
     def test_get_connection_stats(self, client):
         """Test getting WebSocket connection statistics."""
         response = client.get("/dashboard/connections")
@@ -405,6 +502,35 @@ class TestDashboardBackend:
 # ============================================================================
 
 
+class FakeWebSocket:
+    """In-memory WebSocket that can stall or fail sends."""
+
+    def __init__(self, blocked: bool = False, fail: bool = False):
+        self.messages: list[dict] = []
+        self._fail = fail
+        self._open = asyncio.Event()
+        if not blocked:
+            self._open.set()
+
+    def unblock(self) -> None:
+        self._open.set()
+
+    async def accept(self) -> None:
+        pass
+
+    async def send_json(self, message: dict) -> None:
+        self.messages.append(message)
+
+    async def send_text(self, text: str) -> None:
+        await self._open.wait()
+        if self._fail:
+            raise RuntimeError("connection reset")
+        self.messages.append(json.loads(text))
+
+    async def close(self) -> None:
+        pass
+
+
 class TestWebSocketManager:
     """Tests for the WebSocketManager class."""
 
@@ -423,6 +549,90 @@ class TestWebSocketManager:
         assert stats["total_connections"] == 0
         assert stats["connections"] == []
 
+    @pytest.mark.asyncio
+    async def test_slow_client_does_not_block_others(self):
+        """Test that broadcasts are not serialized behind a slow client."""
+        manager = WebSocketManager()
+        slow, fast = FakeWebSocket(blocked=True), FakeWebSocket()
+        await manager.connect(slow, client_id="slow")
+        await manager.connect(fast, client_id="fast")
+
+        for i in range(3):
+            assert await manager.broadcast({"type": "tick", "n": i}) == 2
+        await asyncio.sleep(0.01)
+
+        assert [m["n"] for m in fast.messages if m["type"] == "tick"] == [0, 1, 2]
+        assert [m for m in slow.messages if m["type"] == "tick"] == []
+        stats = {c["client_id"]: c for c in manager.get_connection_stats()["connections"]}
+        assert stats["fast"]["sent"] == 3
+        assert stats["slow"]["queue_depth"] >= 2
+        assert stats["slow"]["queue_lag_ms"] > 0
+
+        slow.unblock()
+        await asyncio.sleep(0.01)
+        assert [m["n"] for m in slow.messages if m["type"] == "tick"] == [0, 1, 2]
+        await manager.close_all()
+
+    @pytest.mark.asyncio
+    async def test_slow_client_gets_coalesced_and_bounded_queue(self, monkeypatch):
+        """Test that stale updates are coalesced and overflow drops the oldest."""
+        monkeypatch.setattr(WebSocketManager, "SEND_QUEUE_SIZE", 3)
+        manager = WebSocketManager()
+        slow = FakeWebSocket(blocked=True)
+        await manager.connect(slow)
+        await asyncio.sleep(0)
+
+        for score in range(10):
+            await manager.broadcast_event("project_update", {"score": score}, project_id="p1")
+        for i in range(5):
+            await manager.broadcast({"type": "tick", "n": i})
+
+        stats = manager.get_connection_stats()["connections"][0]
+        assert stats["queue_depth"] == 3
+        assert stats["coalesced"] >= 8
+        assert stats["dropped"] >= 2
+
+        slow.unblock()
+        await asyncio.sleep(0.01)
+        assert [m["n"] for m in slow.messages if m["type"] == "tick"] == [2, 3, 4]
+        await manager.close_all()
+
+    @pytest.mark.asyncio
+    async def test_delta_updates(self):
+        """Test that opted-in clients receive only changed keys."""
+        manager = WebSocketManager()
+        ws_full, ws_delta = FakeWebSocket(), FakeWebSocket()
+        await manager.connect(ws_full)
+        await manager.connect(ws_delta)
+        await manager._handle_message(ws_delta, json.dumps({"type": "subscribe", "deltas": True}))
+
+        await manager.broadcast_event("project_update", {"status": "ok", "score": 90}, "p1")
+        await asyncio.sleep(0.01)
+        await manager.broadcast_event("project_update", {"status": "ok", "score": 80}, "p1")
+        await asyncio.sleep(0.01)
+
+        full_updates = [m for m in ws_full.messages if m["type"] == "project_update"]
+        delta_updates = [m for m in ws_delta.messages if m["type"] == "project_update"]
+        assert [m["data"] for m in full_updates] == [
+            {"status": "ok", "score": 90},
+            {"status": "ok", "score": 80},
+        ]
+        assert delta_updates[0]["data"] == {"status": "ok", "score": 90}
+        assert delta_updates[1] == {**delta_updates[1], "delta": True, "data": {"score": 80}}
+        await manager.close_all()
+
+    @pytest.mark.asyncio
+    async def test_dead_connection_removed(self):
+        """Test that a connection failing to send is dropped."""
+        manager = WebSocketManager()
+        broken = FakeWebSocket(fail=True)
+        await manager.connect(broken)
+        assert manager.connection_count == 1
+
+        await manager.broadcast({"type": "tick"})
+        await asyncio.sleep(0.01)
+        assert manager.connection_count == 0
+
 
 class TestWebSocketEndpoint:
     """Tests for the WebSocket endpoint."""
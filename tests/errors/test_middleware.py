@@ -5,13 +5,28 @@ import pytest
 from lattice_lock.errors.classification import Category, ErrorContext, Recoverability, Severity
 from lattice_lock.errors.middleware import (
     ErrorMetrics,
+    ErrorPersistenceBuffer,
     RetryConfig,
+    SlidingWindowCounter,
     error_boundary,
+    get_error_persistence,
     get_metrics,
+    reset_error_persistence,
     reset_metrics,
 )
 
 
+def _context(error_type: str = "TestError", severity: Severity = Severity.LOW) -> ErrorContext:
+    return ErrorContext(
+        error_type=error_type,
+        error_code="LL-TEST",
+        message="test",
+        severity=severity,
+        category=Category.UNKNOWN,
+        recoverability=Recoverability.MANUAL_INTERVENTION,
+    )
+
+
 class TestRetryConfig:
     """Tests for RetryConfig."""
 
@@ -147,3 +162,113 @@ class TestErrorMetrics:
         summary = metrics.get_summary()
         assert summary["total_errors"] == 2
         assert summary["error_counts"]["SummaryTest"] == 2
+
+
+class TestSlidingWindowCounter:
+    """Tests for SlidingWindowCounter."""
+
+    def test_counts_within_window(self):
+        window = SlidingWindowCounter(window_seconds=60, buckets=12)
+        for t in (0, 1, 30, 59):
+            window.add(t)
+        assert window.count(59) == 4
+
+    def test_expired_buckets_leave_the_count(self):
+        window = SlidingWindowCounter(window_seconds=60, buckets=12)
+        window.add(0)
+        window.add(30)
+        assert window.count(64) == 1
+        assert window.count(95) == 0
+
+    def test_reused_slot_is_cleared(self):
+        window = SlidingWindowCounter(window_seconds=10, buckets=2)
+        window.add(0, count=5)
+        window.add(10)
+        assert window.count(10) == 1
+
+    def test_late_event_older_than_slot_is_ignored(self):
+        window = SlidingWindowCounter(window_seconds=10, buckets=2)
+        window.add(10)
+        window.add(0)
+        assert window.count(10) == 1
+
+
+class TestErrorPersistenceBuffer:
+    """Tests for batched error persistence."""
+
+    @pytest.fixture(autouse=True)
+    def reset(self):
+        reset_error_persistence()
+        yield
+        reset_error_persistence()
+
+    @staticmethod
+    def _capture(buffer: ErrorPersistenceBuffer) -> list[list[dict]]:
+        batches: list[list[dict]] = []
+
+        async def write(batch):
+            batches.append(batch)
+            buffer.persisted += len(batch)
+
+        buffer._write = write
+        return batches
+
+    def test_record_error_with_project_is_buffered(self):
+        ErrorMetrics().record_error(_context(), project_id="proj_1")
+        buffer = get_error_persistence()
+        assert buffer.pending_count == 1
+        assert buffer._pending[0]["project_id"] == "proj_1"
+        assert buffer._pending[0]["severity"] == "low"
+
+    @pytest.mark.asyncio
+    async def test_flusher_writes_batches(self):
+        buffer = ErrorPersistenceBuffer(batch_size=4, flush_interval=0.01)
+        batches = self._capture(buffer)
+
+        for _ in range(10):
+            buffer.add(_context(), "proj_1")
+        flusher = buffer._flusher
+        for _ in range(5):
+            buffer.add(_context(), "proj_1")
+        assert buffer._flusher is flusher
+
+        await flusher
+        assert [len(b) for b in batches] == [4, 4, 4, 3]
+        assert buffer.persisted == 15
+        assert buffer.pending_count == 0
+
+        # A new flusher starts once the previous one has finished
+        buffer.add(_context(), "proj_1")
+        assert buffer._flusher is not flusher
+        await buffer._flusher
+        assert buffer.persisted == 16
+
+    @pytest.mark.asyncio
+    async def test_full_buffer_drops_and_counts(self):
+        buffer = ErrorPersistenceBuffer(max_pending=3, flush_interval=0.01)
+        batches = self._capture(buffer)
+
+        results = [buffer.add(_context(), "proj_1") for _ in range(5)]
+        assert results == [True, True, True, False, False]
+        assert buffer.dropped == 2
+
+        await buffer._flusher
+        assert sum(len(b) for b in batches) == 3
+        assert "lattice_error_persistence_dropped_total 2" in "\n".join(
+            f"{f.name} {f.samples[0][2]}" for f in buffer._collect_metrics()
+        )
+
+    @pytest.mark.asyncio
+    async def test_failed_write_is_counted(self, monkeypatch):
+        import lattice_lock.admin.db as admin_db
+
+        def broken_session():
+            raise RuntimeError("db down")
+
+        monkeypatch.setattr(admin_db, "get_async_session", broken_session)
+        buffer = ErrorPersistenceBuffer(flush_interval=0)
+        buffer.add(_context(), "proj_1")
+        await buffer._flusher
+
+        assert buffer.failed == 1
+        assert buffer.pending_count == 0
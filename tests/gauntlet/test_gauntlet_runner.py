@@ -0,0 +1,90 @@
+"""
+Tests for the asynchronous Gauntlet runner and the run_tests MCP tool.
+"""
+
+import asyncio
+import json
+import time
+from unittest.mock import patch
+
+import pytest
+
+from lattice_lock.gauntlet.runner import run_gauntlet_async, shard_test_files
+from lattice_lock.mcp.runtime import ToolRuntime
+from lattice_lock.mcp.tools import handle_tool_call
+
+
+@pytest.fixture
+def gauntlet_dir(tmp_path):
+    tests = tmp_path / "gauntlet"
+    tests.mkdir()
+    (tests / "test_one.py").write_text("def test_pass():\n    assert True\n")
+    (tests / "test_two.py").write_text(
+        "import pytest\n\n"
+        "def test_fail():\n    assert 1 == 2\n\n"
+        "@pytest.mark.skip(reason='not today')\n"
+        "def test_skip():\n    pass\n"
+    )
+    return tests
+
+
+def test_shard_test_files_balances_and_caps(gauntlet_dir):
+    groups = shard_test_files(gauntlet_dir, shards=8)
+    assert len(groups) == 2
+    assert sorted(p.name for g in groups for p in g) == ["test_one.py", "test_two.py"]
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("shards", [1, 2])
+async def test_run_builds_summary_from_plugin_report(gauntlet_dir, shards):
+    events = []
+
+    summary = await run_gauntlet_async(
+        gauntlet_dir, shards=shards, on_progress=lambda e, n: events.append((e, n))
+    )
+
+    assert summary.shards == shards
+    assert (summary.total, summary.passed, summary.failed, summary.skipped) == (3, 1, 1, 1)
+    assert not summary.success
+    assert [f["nodeid"].split("::")[-1] for f in summary.failures] == ["test_fail"]
+    assert sorted(e["outcome"] for e, _ in events) == ["failed", "passed", "skipped"]
+    assert sorted(n for _, n in events) == [1, 2, 3]
+
+
+@pytest.mark.asyncio
+async def test_cancellation_terminates_pytest(tmp_path):
+    tests = tmp_path / "slow"
+    tests.mkdir()
+    (tests / "test_slow.py").write_text(
+        "import time\n\ndef test_fast():\n    pass\n\ndef test_slow():\n    time.sleep(60)\n"
+    )
+    started = asyncio.Event()
+
+    task = asyncio.create_task(run_gauntlet_async(tests, on_progress=lambda _e, _n: started.set()))
+    await asyncio.wait_for(started.wait(), timeout=30)
+    begin = time.monotonic()
+    task.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await task
+    assert time.monotonic() - begin < 10
+
+
+@pytest.mark.asyncio
+async def test_run_tests_tool_returns_structured_summary(gauntlet_dir, monkeypatch):
+    monkeypatch.chdir(gauntlet_dir.parent)
+    runtime = ToolRuntime(max_workers=1, sheriff_cache_dir=gauntlet_dir.parent / ".cache")
+    progress = []
+
+    with patch("lattice_lock.mcp.tools.GauntletGenerator"):
+        result = await handle_tool_call(
+            "run_tests",
+            {"output_dir": "gauntlet", "shards": 2},
+            runtime=runtime,
+            on_progress=lambda _e, n: progress.append(n),
+        )
+    await runtime.shutdown()
+
+    data = json.loads(result[0].text)
+    assert data["summary"] == {"total": 3, "passed": 1, "failed": 1, "skipped": 1}
+    assert data["shards"] == 2
+    assert len(progress) == 3
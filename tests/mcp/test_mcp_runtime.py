@@ -0,0 +1,92 @@
+"""
+Tests for the MCP server's shared tool runtime.
+"""
+
+import json
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from lattice_lock.mcp.runtime import ToolRuntime
+from lattice_lock.mcp.tools import handle_tool_call
+from lattice_lock.sheriff.cache import SheriffCache, get_config_hash
+from lattice_lock.sheriff.config import SheriffConfig
+from lattice_lock.sheriff.sheriff import run_sheriff
+
+
+@pytest.fixture
+def project(tmp_path, monkeypatch):
+    """A project directory with one violating Python file, used as cwd."""
+    (tmp_path / "bad.py").write_text("def f(x):\n    return x\n")
+    monkeypatch.chdir(tmp_path)
+    return tmp_path
+
+
+@pytest.fixture
+def runtime(project):
+    orchestrator = MagicMock()
+    orchestrator.route_request = AsyncMock(return_value=MagicMock(content="answer"))
+    orchestrator.shutdown = AsyncMock()
+    factory = MagicMock(return_value=orchestrator)
+    return ToolRuntime(
+        max_workers=2,
+        sheriff_cache_dir=project / ".sheriff_cache",
+        orchestrator_factory=factory,
+    )
+
+
+@pytest.mark.asyncio
+async def test_orchestrator_is_shared_across_calls(runtime):
+    for _ in range(3):
+        result = await handle_tool_call("ask_orchestrator", {"prompt": "hi"}, runtime=runtime)
+        assert result[0].text == "answer"
+
+    runtime._orchestrator_factory.assert_called_once()
+    assert runtime.orchestrator.route_request.await_count == 3
+    await runtime.shutdown()
+
+
+@pytest.mark.asyncio
+async def test_validate_code_reuses_warm_sheriff_cache(runtime, project):
+    first = await handle_tool_call("validate_code", {"path": "."}, runtime=runtime)
+
+    with patch("lattice_lock.sheriff.sheriff.validate_file_with_audit") as validate:
+        second = await handle_tool_call("validate_code", {"path": "."}, runtime=runtime)
+
+    validate.assert_not_called()
+    assert json.loads(first[0].text) == json.loads(second[0].text)
+    assert json.loads(second[0].text)["files_checked"] == 1
+    await runtime.shutdown()
+
+
+@pytest.mark.asyncio
+async def test_shutdown_closes_orchestrator_and_persists_cache(runtime, project):
+    await handle_tool_call("ask_orchestrator", {"prompt": "hi"}, runtime=runtime)
+    await handle_tool_call("validate_code", {"path": "."}, runtime=runtime)
+    orchestrator = runtime.orchestrator
+
+    await runtime.shutdown()
+
+    orchestrator.shutdown.assert_awaited_once()
+    assert list((project / ".sheriff_cache").glob("sheriff_cache_*.json"))
+    with pytest.raises(RuntimeError):
+        _ = runtime.orchestrator
+
+
+def test_run_sheriff_ignores_cache_for_other_config(project):
+    cache = SheriffCache(cache_dir=project / ".cache", config_hash="other")
+
+    result = run_sheriff("bad.py", cache=cache)
+
+    assert result.files_checked == 1
+    assert cache._cache == {}
+
+
+def test_run_sheriff_cached_result_matches_uncached(project):
+    cache = SheriffCache(cache_dir=project / ".cache", config_hash=get_config_hash(SheriffConfig()))
+
+    uncached = run_sheriff("bad.py").to_dict()
+    cold = run_sheriff("bad.py", cache=cache).to_dict()
+    warm = run_sheriff("bad.py", cache=cache).to_dict()
+
+    assert uncached == cold == warm
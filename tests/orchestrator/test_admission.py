@@ -0,0 +1,118 @@
+"""
+Tests for admission control and load shedding.
+"""
+
+import asyncio
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from lattice_lock.orchestrator.core import ModelOrchestrator
+from lattice_lock.orchestrator.exceptions import APIClientError, OverloadedError
+from lattice_lock.orchestrator.execution import (
+    AdmissionController,
+    FairScheduler,
+    RequestClass,
+)
+from lattice_lock.orchestrator.types import ModelProvider, TaskRequirements, TaskType
+
+
+def _overloaded_controller(**kwargs) -> AdmissionController:
+    controller = AdmissionController(target_delay_ms=50, interval_ms=0, **kwargs)
+    controller.record_delay(500)
+    controller.record_delay(500)
+    assert controller.overloaded
+    return controller
+
+
+def test_not_overloaded_until_delay_persists_for_interval():
+    controller = AdmissionController(target_delay_ms=50, interval_ms=60_000)
+    controller.record_delay(500)
+    controller.record_delay(500)
+    assert not controller.overloaded
+
+    with controller.admit(RequestClass.BATCH):
+        pass
+    assert controller.stats()["admitted"] == 1
+
+
+def test_batch_shed_first_and_interactive_rate_limited():
+    controller = _overloaded_controller()
+    controller.in_flight = 1  # an earlier request is still queued, so overload persists
+
+    with pytest.raises(OverloadedError) as exc_info:
+        with controller.admit(RequestClass.BATCH):
+            pass
+    assert exc_info.value.retry_after > 0
+    assert exc_info.value.status_code == 503
+    assert isinstance(exc_info.value, APIClientError)
+
+    # The first interactive request is shed, the next ones pass until the
+    # control law schedules another drop
+    with pytest.raises(OverloadedError):
+        with controller.admit(RequestClass.INTERACTIVE):
+            pass
+    controller._drop_next = float("inf")
+    with controller.admit(RequestClass.INTERACTIVE):
+        pass
+
+    assert controller.stats()["shed"] == {"interactive": 1, "batch": 1}
+
+
+def test_recovers_when_delay_falls_under_target():
+    controller = _overloaded_controller()
+    controller.record_delay(1)
+    assert not controller.overloaded
+    with controller.admit(RequestClass.BATCH):
+        pass
+
+
+def test_max_in_flight_rejects_everything():
+    controller = AdmissionController(max_in_flight=1)
+    with controller.admit():
+        with pytest.raises(OverloadedError):
+            with controller.admit(RequestClass.INTERACTIVE):
+                pass
+    assert controller.in_flight == 0
+
+
+@pytest.mark.asyncio
+async def test_scheduler_waits_drive_overload_detection():
+    controller = AdmissionController(target_delay_ms=5, interval_ms=0)
+    scheduler = FairScheduler(provider_concurrency={"openai": 1}, on_wait=controller.record_delay)
+
+    async def call():
+        with controller.admit():
+            async with scheduler.slot("openai"):
+                await asyncio.sleep(0.02)
+
+    await asyncio.gather(*(call() for _ in range(3)))
+
+    assert controller.stats()["queue_delay_ms"] >= 5
+    # The queue drained, so the controller no longer considers itself overloaded
+    assert not controller.overloaded
+
+
+@pytest.mark.asyncio
+async def test_route_request_sheds_batch_when_overloaded():
+    with (
+        patch("lattice_lock.orchestrator.core.ModelRegistry") as registry_cls,
+        patch("lattice_lock.orchestrator.core.ClientPool"),
+        patch("lattice_lock.orchestrator.core.ConversationExecutor") as executor_cls,
+        patch("lattice_lock.orchestrator.core.ModelSelector"),
+        patch("lattice_lock.orchestrator.core.TaskAnalyzer") as analyzer_cls,
+    ):
+        registry_cls.return_value.get_model.return_value = MagicMock(provider=ModelProvider.OPENAI)
+        analyzer_cls.return_value.analyze_async = AsyncMock(
+            return_value=TaskRequirements(task_type=TaskType.GENERAL)
+        )
+        executor_cls.return_value.execute = AsyncMock(return_value=MagicMock(error=None))
+        orchestrator = ModelOrchestrator()
+        orchestrator.admission = _overloaded_controller()
+        orchestrator.admission.in_flight = 1  # an earlier request is still queued
+
+        with pytest.raises(OverloadedError):
+            await orchestrator.route_request("hi", model_id="gpt", request_class="batch")
+
+    executor_cls.return_value.execute.assert_not_awaited()
+    assert orchestrator.admission.stats()["shed"]["batch"] == 1
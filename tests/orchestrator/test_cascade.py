@@ -0,0 +1,195 @@
+"""
+Tests for cheap-first cascade routing.
+"""
+
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from lattice_lock.orchestrator.core import ModelOrchestrator
+from lattice_lock.orchestrator.execution.cascade import (
+    AcceptanceCheck,
+    CascadeExecutor,
+    CascadeStats,
+    JSONFormatCheck,
+    RegexFormatCheck,
+    SelfReportedConfidenceCheck,
+    VerifierCheck,
+)
+from lattice_lock.orchestrator.types import (
+    APIResponse,
+    ModelCapabilities,
+    ModelProvider,
+    TaskRequirements,
+    TaskType,
+    TokenUsage,
+)
+
+
+def _model(name, cost, quality):
+    return ModelCapabilities(
+        name=name,
+        api_name=name,
+        provider=ModelProvider.OPENAI,
+        context_window=128000,
+        input_cost=cost,
+        output_cost=cost,
+        reasoning_score=quality,
+        coding_score=quality,
+        speed_rating=8,
+    )
+
+
+MODELS = {
+    "small": _model("small", 0.1, 50),
+    "medium": _model("medium", 1.0, 70),
+    "large": _model("large", 10.0, 95),
+}
+
+
+@pytest.fixture
+def registry():
+    registry = MagicMock()
+    registry.get_model.side_effect = MODELS.get
+    return registry
+
+
+def _router(answers: dict[str, str]):
+    async def route(prompt, model_id=None, **kwargs):
+        return APIResponse(
+            content=answers[model_id],
+            model=model_id,
+            provider="openai",
+            usage=TokenUsage(1000, 1000, 2000),
+            latency_ms=1,
+        )
+
+    return AsyncMock(side_effect=route)
+
+
+@pytest.mark.asyncio
+async def test_cheap_answer_accepted_without_escalation(registry):
+    route = _router({"small": "ok\nCONFIDENCE: 0.9", "large": "unused"})
+    executor = CascadeExecutor(route, registry)
+
+    response = await executor.execute(
+        "q", ["small", "large"], SelfReportedConfidenceCheck(), task_type=TaskType.GENERAL
+    )
+
+    assert response.content == "ok"
+    assert route.await_count == 1
+    assert "CONFIDENCE" in route.call_args.args[0]
+    stats = executor.stats.by_task["GENERAL"]
+    assert (stats.requests, stats.escalations, stats.accepted_by_tier) == (1, 0, {0: 1})
+    # small costs 0.1/M vs large 10/M for the same 2000 tokens
+    assert stats.cost_saved == pytest.approx((2000 * 10.0 - 2000 * 0.1) / 1_000_000)
+
+
+@pytest.mark.asyncio
+async def test_escalates_until_check_passes(registry):
+    route = _router({"small": "not json", "medium": '{"a": 1}', "large": '{"a": 1, "b": 2}'})
+    executor = CascadeExecutor(route, registry)
+
+    response = await executor.execute(
+        "q", ["small", "medium", "large"], JSONFormatCheck(["a", "b"]), task_type=TaskType.TESTING
+    )
+
+    assert response.model == "large"
+    attempts = response.raw_response["cascade"]["attempts"]
+    assert [a["accepted"] for a in attempts] == [False, False, True]
+    assert "missing keys: b" in attempts[1]["reason"]
+    assert response.usage.total_tokens == 6000
+    stats = executor.stats.to_dict()["TESTING"]
+    assert stats["escalation_rate"] == 1.0
+    assert stats["cost_saved"] < 0
+
+
+@pytest.mark.asyncio
+async def test_unaccepted_returns_strongest_answer_and_counts_it(registry):
+    route = _router({"small": "nope", "large": "still nope"})
+    executor = CascadeExecutor(route, registry, CascadeStats())
+
+    response = await executor.execute("q", ["small", "large"], RegexFormatCheck(r"^\d+$"))
+
+    assert response.content == "still nope"
+    assert response.raw_response["cascade"]["accepted_tier"] is None
+    assert executor.stats.by_task["GENERAL"].unaccepted == 1
+
+
+@pytest.mark.asyncio
+async def test_provider_failure_escalates(registry):
+    async def route(prompt, model_id=None, **kwargs):
+        if model_id == "small":
+            raise RuntimeError("provider down")
+        return APIResponse("42", model_id, "openai", TokenUsage(1, 1, 2), 1)
+
+    executor = CascadeExecutor(AsyncMock(side_effect=route), registry)
+
+    response = await executor.execute("q", ["small", "large"], RegexFormatCheck(r"\d+"))
+
+    assert response.model == "large"
+    assert response.raw_response["cascade"]["attempts"][0]["reason"] == "provider down"
+
+
+@pytest.mark.asyncio
+async def test_verifier_check_uses_verifier_model():
+    verify = AsyncMock(return_value=APIResponse("REJECT\nwrong unit", "v", "openai", None, 1))
+    check = VerifierCheck(verify, verifier_model="small")
+
+    result = await check.evaluate("q", APIResponse("5 m", "m", "openai", None, 1))
+
+    assert not result.accepted
+    assert result.reason == "wrong unit"
+    assert verify.call_args.kwargs["model_id"] == "small"
+
+
+@pytest.mark.asyncio
+async def test_low_confidence_is_rejected():
+    response = APIResponse("maybe\n**Confidence:** 0.4", "m", "openai", None, 1)
+    result = await SelfReportedConfidenceCheck(threshold=0.7).evaluate("q", response)
+    assert (result.accepted, result.confidence, response.content) == (False, 0.4, "maybe")
+
+
+def test_acceptance_check_requires_evaluate():
+    class IncompleteCheck(AcceptanceCheck):
+        pass
+
+    with pytest.raises(TypeError):
+        IncompleteCheck()
+
+
+@pytest.mark.asyncio
+async def test_route_cascade_builds_ladder_cheapest_first():
+    with (
+        patch("lattice_lock.orchestrator.core.ModelRegistry"),
+        patch("lattice_lock.orchestrator.core.ModelSelector"),
+        patch("lattice_lock.orchestrator.core.TaskAnalyzer"),
+        patch("lattice_lock.orchestrator.core.ClientPool"),
+        patch("lattice_lock.orchestrator.core.ConversationExecutor"),
+    ):
+        orchestrator = ModelOrchestrator()
+    orchestrator.analyzer.analyze_async = AsyncMock(
+        return_value=TaskRequirements(task_type=TaskType.DEBUGGING)
+    )
+    # "cheap-but-worse" is skipped because it is no stronger than "small"
+    models = {**MODELS, "cheap-but-worse": _model("cheap-but-worse", 0.5, 40)}
+    orchestrator.registry.get_model.side_effect = models.get
+    orchestrator.selector.rank_by_cost.return_value = [
+        "small",
+        "cheap-but-worse",
+        "medium",
+        "large",
+    ]
+    orchestrator.selector.select_best_model.return_value = "large"
+    orchestrator.route_request = _router({"small": "x", "medium": "x", "large": "42"})
+
+    response = await orchestrator.route_cascade("q", check=RegexFormatCheck(r"\d+"))
+
+    assert [c.kwargs["model_id"] for c in orchestrator.route_request.call_args_list] == [
+        "small",
+        "medium",
+        "large",
+    ]
+    assert orchestrator.route_request.call_args.kwargs["task_type"] == TaskType.DEBUGGING
+    assert response.content == "42"
+    assert orchestrator.cascade_stats.by_task["DEBUGGING"].escalations == 1
@@ -1,4 +1,5 @@
-from unittest.mock import MagicMock, mock_open, patch
+import asyncio
+from unittest.mock import AsyncMock, MagicMock, mock_open, patch
 
 import pytest
 
@@ -81,3 +82,156 @@ steps:
     assert pipeline.steps[0].name == "S1"
     assert pipeline.steps[1].model_id == "m2"
     assert pipeline.steps[1].output_key == "ok2"
+
+
+def _delayed_router(delays: dict[str, float], log: list[str]):
+    """route_request stub that sleeps per prompt and records start/end order."""
+
+    async def route(prompt, model_id=None, **kwargs):
+        log.append(f"start:{prompt}")
+        await asyncio.sleep(delays.get(prompt, 0))
+        log.append(f"end:{prompt}")
+        return APIResponse(
+            content=f"<{prompt}>",
+            model=model_id or "m",
+            provider="p",
+            usage=TokenUsage(0, 0, 0, 0.0),
+            latency_ms=1,
+        )
+
+    return AsyncMock(side_effect=route)
+
+
+def test_dependencies_inferred_from_template_variables():
+    pipeline = Pipeline(
+        "DAG",
+        [
+            PipelineStep("A", "{{ topic }}", output_key="a"),
+            PipelineStep("B", "{{ topic }}", output_key="b"),
+            PipelineStep("C", "{% for x in [a, b] %}{{ x }}{% endfor %}", output_key="c"),
+            PipelineStep("D", "{{ topic }}", output_key="d", depends_on=["C"]),
+            PipelineStep("E", "{{ a }}", output_key="e", depends_on=["d"]),
+        ],
+    )
+
+    assert pipeline.dependencies == {
+        "A": set(),
+        "B": set(),
+        "C": {"A", "B"},
+        "D": {"C"},
+        "E": {"A", "D"},
+    }
+
+
+@pytest.mark.parametrize(
+    "depends_on, message",
+    [(["B"], "runs after it"), (["missing"], "unknown step")],
+)
+def test_invalid_depends_on_is_rejected(depends_on, message):
+    with pytest.raises(ValueError, match=message):
+        Pipeline(
+            "Bad",
+            [PipelineStep("A", "x", depends_on=depends_on), PipelineStep("B", "y")],
+        )
+
+
+@pytest.mark.asyncio
+async def test_independent_steps_run_concurrently(chain_orch, mock_orchestrator):
+    log: list[str] = []
+    mock_orchestrator.route_request = _delayed_router({"one": 0.05, "two": 0.01}, log)
+    pipeline = Pipeline(
+        "Fan-in",
+        [
+            PipelineStep("A", "one", output_key="a"),
+            PipelineStep("B", "two", output_key="b"),
+            PipelineStep("C", "{{ a }}+{{ b }}", output_key="c"),
+        ],
+    )
+
+    result = await chain_orch.run_pipeline(pipeline, {})
+
+    assert log[:2] == ["start:one", "start:two"]
+    assert result["final_context"]["c"] == "<<one>+<two>>"
+    assert list(result["step_results"]) == ["A", "B", "C"]
+    timing = result["timing"]
+    assert timing["critical_path"] == ["A", "C"]
+    assert timing["critical_path_ms"] < timing["sequential_ms"]
+
+
+@pytest.mark.asyncio
+async def test_concurrency_cap_is_respected(chain_orch, mock_orchestrator):
+    in_flight = peak = 0
+
+    async def route(prompt, model_id=None, **kwargs):
+        nonlocal in_flight, peak
+        in_flight += 1
+        peak = max(peak, in_flight)
+        await asyncio.sleep(0.01)
+        in_flight -= 1
+        return APIResponse(content=prompt, model="m", provider="p", usage=None, latency_ms=1)
+
+    mock_orchestrator.route_request = AsyncMock(side_effect=route)
+    pipeline = Pipeline("Wide", [PipelineStep(f"S{i}", str(i)) for i in range(6)])
+
+    result = await chain_orch.run_pipeline(pipeline, {}, max_concurrency=2)
+
+    assert peak == 2
+    assert result["timing"]["max_concurrency"] == 2
+
+
+@pytest.mark.asyncio
+async def test_later_output_does_not_leak_into_earlier_reader(chain_orch, mock_orchestrator):
+    log: list[str] = []
+    mock_orchestrator.route_request = _delayed_router({"seed": 0.02}, log)
+    pipeline = Pipeline(
+        "Shadow",
+        [
+            PipelineStep("Slow", "seed", output_key="unused"),
+            PipelineStep("Reader", "{{ x }}", output_key="r"),
+            PipelineStep("Writer", "new", output_key="x"),
+        ],
+    )
+
+    result = await chain_orch.run_pipeline(pipeline, {"x": "initial"})
+
+    assert result["final_context"]["r"] == "<initial>"
+    assert result["final_context"]["x"] == "<new>"
+
+
+@pytest.mark.asyncio
+async def test_failure_cancels_running_steps(chain_orch, mock_orchestrator):
+    cancelled = asyncio.Event()
+
+    async def route(prompt, model_id=None, **kwargs):
+        if prompt == "boom":
+            raise ValueError("provider down")
+        try:
+            await asyncio.sleep(10)
+        except asyncio.CancelledError:
+            cancelled.set()
+            raise
+
+    mock_orchestrator.route_request = AsyncMock(side_effect=route)
+    pipeline = Pipeline("Fail", [PipelineStep("Slow", "wait"), PipelineStep("Bad", "boom")])
+
+    with pytest.raises(RuntimeError, match="failed at step Bad: provider down"):
+        await chain_orch.run_pipeline(pipeline, {})
+    assert cancelled.is_set()
+
+
+def test_from_yaml_reads_depends_on_and_concurrency(chain_orch):
+    yaml_content = """
+name: "DAG"
+max_concurrency: 3
+steps:
+  - name: "S1"
+    prompt: "P1"
+  - name: "S2"
+    prompt: "P2"
+    depends_on: "S1"
+"""
+    with patch("builtins.open", mock_open(read_data=yaml_content)):
+        pipeline = chain_orch.from_yaml("fake.yaml")
+
+    assert pipeline.max_concurrency == 3
+    assert pipeline.dependencies["S2"] == {"S1"}
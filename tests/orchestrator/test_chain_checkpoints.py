@@ -0,0 +1,188 @@
+"""
+Tests for durable chain pipeline checkpoints and memoized resume.
+"""
+
+from datetime import timedelta
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+from click.testing import CliRunner
+
+from lattice_lock.cli.commands.chain import chain_group
+from lattice_lock.orchestrator.chain import ChainOrchestrator, Pipeline, PipelineStep
+from lattice_lock.orchestrator.checkpoints import CheckpointStore, step_cache_key
+from lattice_lock.orchestrator.types import APIResponse, TokenUsage
+
+
+@pytest.fixture
+def store(tmp_path):
+    return CheckpointStore(tmp_path / "checkpoints.db")
+
+
+@pytest.fixture
+def model():
+    orch = MagicMock()
+
+    async def route(prompt, model_id=None, **kwargs):
+        if prompt in orch.failing:
+            raise RuntimeError("provider down")
+        return APIResponse(
+            content=f"<{prompt}>",
+            model=model_id or "m1",
+            provider="openai",
+            usage=TokenUsage(1, 2, 3, 0.25),
+            latency_ms=5,
+        )
+
+    orch.failing = set()
+    orch.route_request = AsyncMock(side_effect=route)
+    return orch
+
+
+def _pipeline():
+    return Pipeline(
+        "Research",
+        [
+            PipelineStep("Outline", "outline {{ topic }}", output_key="outline"),
+            PipelineStep("Draft", "draft {{ outline }}", output_key="draft"),
+            PipelineStep("Title", "title {{ topic }}", output_key="title", params={"t": 0}),
+        ],
+    )
+
+
+def _prompts(model):
+    return [c.kwargs["prompt"] for c in model.route_request.call_args_list]
+
+
+@pytest.mark.asyncio
+async def test_rerun_reuses_unchanged_steps(store, model):
+    chain = ChainOrchestrator(orchestrator=model, checkpoint_store=store)
+
+    first = await chain.run_pipeline(_pipeline(), {"topic": "bees"})
+    second = await chain.run_pipeline(_pipeline(), {"topic": "bees"})
+
+    assert model.route_request.await_count == 3
+    assert second["final_context"] == first["final_context"]
+    assert all(r["cached"] for r in second["step_results"].values())
+    assert second["step_results"]["Draft"]["usage"] == TokenUsage(1, 2, 3, 0.25)
+
+
+@pytest.mark.asyncio
+async def test_changed_input_reruns_only_affected_steps(store, model):
+    chain = ChainOrchestrator(orchestrator=model, checkpoint_store=store)
+    await chain.run_pipeline(_pipeline(), {"topic": "bees"})
+    pipeline = _pipeline()
+    pipeline.steps[2] = PipelineStep("Title", "title {{ topic }}", output_key="title")
+    model.route_request.reset_mock()
+
+    result = await chain.run_pipeline(Pipeline("Research", pipeline.steps), {"topic": "bees"})
+
+    # Dropping the step's params changes its key; the other steps are reused
+    assert _prompts(model) == ["title bees"]
+    assert not result["step_results"]["Title"]["cached"]
+
+
+@pytest.mark.asyncio
+async def test_failed_run_resumes_without_repaying(store, model):
+    chain = ChainOrchestrator(orchestrator=model, checkpoint_store=store)
+    model.failing = {"draft <outline bees>"}
+
+    with pytest.raises(RuntimeError, match="failed at step Draft"):
+        await chain.run_pipeline(_pipeline(), {"topic": "bees"}, pipeline_id="run-1")
+    assert store.get_run("run-1").status == "failed"
+
+    model.failing = set()
+    model.route_request.reset_mock()
+    result = await chain.run_pipeline(_pipeline(), {"topic": "bees"}, pipeline_id="run-1")
+
+    assert _prompts(model) == ["draft <outline bees>"]
+    assert result["final_context"]["draft"] == "<draft <outline bees>>"
+    run = store.get_run("run-1")
+    assert run.status == "completed"
+    assert set(run.steps) == {"Outline", "Draft", "Title"}
+
+
+@pytest.mark.asyncio
+async def test_start_from_step_falls_back_to_initial_inputs(store, model):
+    chain = ChainOrchestrator(orchestrator=model, checkpoint_store=store)
+
+    result = await chain.run_pipeline(
+        _pipeline(), {"topic": "bees", "outline": "manual"}, start_from_step="Draft"
+    )
+
+    assert _prompts(model) == ["draft manual", "title bees"]
+    assert list(result["step_results"]) == ["Draft", "Title"]
+
+
+@pytest.mark.asyncio
+async def test_start_from_step_uses_run_checkpoints(store, model):
+    chain = ChainOrchestrator(orchestrator=model, checkpoint_store=store)
+    await chain.run_pipeline(_pipeline(), {"topic": "bees"}, pipeline_id="run-3")
+
+    result = await chain.run_pipeline(
+        _pipeline(), {"topic": "wasps"}, start_from_step="Draft", pipeline_id="run-3"
+    )
+
+    assert result["final_context"]["outline"] == "<outline bees>"
+    assert result["step_results"]["Draft"]["cached"]
+    assert not result["step_results"]["Title"]["cached"]
+
+
+def test_cache_key_covers_prompt_model_and_params():
+    base = step_cache_key("p", "m", {"temperature": 0})
+    assert base == step_cache_key("p", "m", {"temperature": 0})
+    assert base != step_cache_key("p2", "m", {"temperature": 0})
+    assert base != step_cache_key("p", "m2", {"temperature": 0})
+    assert base != step_cache_key("p", "m", {"temperature": 1})
+
+
+def test_prune_by_age_and_pipeline(store):
+    response = APIResponse("c", "m", "openai", TokenUsage(0, 0, 0), 1)
+    store.put("k1", "A", "s", response)
+    store.put("k2", "B", "s", response)
+
+    assert store.prune(older_than=timedelta(days=1)) == 0
+    assert store.prune(pipeline_name="A") == 1
+    assert [c.key for c in store.list_checkpoints()] == ["k2"]
+
+
+def test_checkpoints_cli_lists_and_prunes(store, monkeypatch):
+    monkeypatch.setenv("LATTICE_CHECKPOINT_DB", str(store.db_path))
+    store.put("abc123", "Research", "Outline", APIResponse("c", "m", "p", None, 1))
+    runner = CliRunner()
+
+    listed = runner.invoke(chain_group, ["checkpoints", "list"])
+    assert listed.exit_code == 0
+    assert "1 step outputs" in listed.output
+    assert "Research" in listed.output
+
+    refused = runner.invoke(chain_group, ["checkpoints", "prune"])
+    assert refused.exit_code != 0
+
+    pruned = runner.invoke(chain_group, ["checkpoints", "prune", "--all"])
+    assert pruned.exit_code == 0
+    assert "Deleted 1" in pruned.output
+    assert store.stats()["checkpoints"] == 0
+
+
+@pytest.mark.asyncio
+async def test_store_calls_run_off_the_event_loop(store, model, monkeypatch):
+    import threading
+
+    loop_thread = threading.get_ident()
+    threads = []
+    for name in ("get", "put", "start_run", "record_step", "finish_run", "load_run_outputs"):
+        method = getattr(store, name)
+
+        def tracked(*args, _method=method, **kwargs):
+            threads.append(threading.get_ident())
+            return _method(*args, **kwargs)
+
+        monkeypatch.setattr(store, name, tracked)
+
+    await ChainOrchestrator(orchestrator=model, checkpoint_store=store).run_pipeline(
+        _pipeline(), {"topic": "bees"}
+    )
+
+    assert threads
+    assert loop_thread not in threads
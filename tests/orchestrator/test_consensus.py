@@ -1,8 +1,9 @@
+import asyncio
 from unittest.mock import MagicMock
 
 import pytest
 
-from lattice_lock.orchestrator.consensus import ConsensusOrchestrator
+from lattice_lock.orchestrator.consensus import ConsensusEngine, ConsensusOrchestrator
 from lattice_lock.orchestrator.types import APIResponse, TaskType, TokenUsage
 
 
@@ -53,3 +54,97 @@ async def test_run_consensus_basic(consensus_orch, mock_orchestrator):
     assert result["synthesizer_model"] == "synth"
     assert len(result["individual_responses"]) == 2
     assert result["total_cost"] == pytest.approx(0.3)  # 0.1 * 3
+
+
+def _voter(plan: dict[str, tuple[float, str]], cancelled: list[str]):
+    """Build a route_request stub: model_id -> (delay seconds, vote or 'error')."""
+
+    async def route(prompt, model_id=None, task_type=None, **kwargs):
+        delay, vote = plan[model_id]
+        try:
+            await asyncio.sleep(delay)
+        except asyncio.CancelledError:
+            cancelled.append(model_id)
+            raise
+        if vote == "error":
+            raise RuntimeError("provider down")
+        return APIResponse(
+            content=vote,
+            model=model_id,
+            provider="openai",
+            usage=TokenUsage(0, 0, 0, 0.0),
+            latency_ms=int(delay * 1000),
+        )
+
+    return route
+
+
+@pytest.mark.asyncio
+async def test_quorum_vote_stops_when_outcome_is_decided(mock_orchestrator):
+    cancelled: list[str] = []
+    mock_orchestrator.route_request.side_effect = _voter(
+        {
+            "a": (0.0, "Approved"),
+            "b": (0.01, "Approved"),
+            "c": (0.02, "Approved"),
+            "slow1": (5, "Rejected"),
+            "slow2": (5, "Rejected"),
+        },
+        cancelled,
+    )
+    engine = ConsensusEngine(orchestrator=mock_orchestrator)
+
+    result = await engine.execute_quorum_voting("Ship it?", ["a", "b", "c", "slow1", "slow2"])
+
+    assert result.decision == "Approved"
+    assert result.confidence == 1.0
+    assert result.early_terminated
+    assert sorted(result.skipped) == ["slow1", "slow2"]
+    assert sorted(cancelled) == ["slow1", "slow2"]
+    assert result.elapsed_ms < 1000
+
+
+@pytest.mark.asyncio
+async def test_quorum_vote_waits_while_outcome_can_change(mock_orchestrator):
+    mock_orchestrator.route_request.side_effect = _voter(
+        {"a": (0.0, "Approved"), "b": (0.01, "Rejected"), "c": (0.02, "Rejected")}, []
+    )
+    engine = ConsensusEngine(orchestrator=mock_orchestrator)
+
+    result = await engine.execute_quorum_voting("Ship it?", ["a", "b", "c"])
+
+    assert result.decision == "Rejected"
+    assert result.confidence == pytest.approx(2 / 3)
+    assert not result.early_terminated
+    assert result.skipped == []
+
+
+@pytest.mark.asyncio
+async def test_quorum_threshold_and_failures(mock_orchestrator):
+    mock_orchestrator.route_request.side_effect = _voter(
+        {"a": (0.0, "error"), "b": (0.01, "Approved"), "c": (0.02, "Approved"), "d": (5, "x")},
+        [],
+    )
+    engine = ConsensusEngine(orchestrator=mock_orchestrator)
+
+    result = await engine.execute_quorum_voting("Ship it?", ["a", "b", "c", "d"], quorum=2)
+
+    assert result.decision == "Approved"
+    assert result.failed == ["a"]
+    assert result.skipped == ["d"]
+
+
+@pytest.mark.asyncio
+async def test_quorum_vote_deadline_tallies_received_votes(mock_orchestrator):
+    cancelled: list[str] = []
+    mock_orchestrator.route_request.side_effect = _voter(
+        {"a": (0.0, "Rejected"), "b": (5, "Approved"), "c": (5, "Approved")}, cancelled
+    )
+    engine = ConsensusEngine(orchestrator=mock_orchestrator)
+
+    result = await engine.execute_quorum_voting("Ship it?", ["a", "b", "c"], timeout=0.05)
+
+    assert result.decision == "Rejected"
+    assert result.deadline_exceeded
+    assert sorted(result.skipped) == ["b", "c"]
+    assert sorted(cancelled) == ["b", "c"]
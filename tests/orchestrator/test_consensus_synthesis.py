@@ -0,0 +1,86 @@
+"""
+Tests for hierarchical (map-reduce) consensus synthesis.
+"""
+
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from consensus import ConsensusEngine, ConsensusRequest, VoteStrategy
+from consensus.engine import estimate_tokens
+from lattice_lock.orchestrator.types import APIResponse, TokenUsage
+
+
+@pytest.fixture
+def orchestrator():
+    orch = MagicMock()
+    orch.registry.get_model.return_value = MagicMock(context_window=2000)
+    prompts: list[str] = []
+
+    async def route(prompt, model_id=None, **kwargs):
+        prompts.append(prompt)
+        return APIResponse(
+            content=f"merged-{len(prompts)}",
+            model=model_id or "synth",
+            provider="openai",
+            usage=TokenUsage(0, 0, 0, 0.5),
+            latency_ms=1,
+        )
+
+    orch.route_request = AsyncMock(side_effect=route)
+    orch.prompts = prompts
+    return orch
+
+
+@pytest.mark.asyncio
+async def test_hierarchical_levels_respect_fan_in(orchestrator):
+    engine = ConsensusEngine(orchestrator=orchestrator)
+    request = ConsensusRequest(
+        task="Summarize",
+        candidates=[f"answer {i}" for i in range(10)],
+        strategy=VoteStrategy.HIERARCHICAL,
+        fan_in=3,
+    )
+
+    result = await engine.consolidate_hierarchical(request)
+
+    # 10 -> 4 groups -> 2 groups -> final synthesis
+    assert [(lvl.inputs, lvl.groups) for lvl in result.levels] == [(10, 4), (4, 2), (2, 1)]
+    assert result.total_cost == pytest.approx(0.5 * 7)
+    assert orchestrator.route_request.await_count == 7
+    assert result.content == "merged-7"
+
+
+@pytest.mark.asyncio
+async def test_groups_fit_synthesizer_context_window(orchestrator):
+    engine = ConsensusEngine(orchestrator=orchestrator)
+    request = ConsensusRequest(
+        task="Summarize",
+        candidates=["x" * 2000 for _ in range(12)],
+        synthesizer_model="small-model",
+        fan_in=50,
+    )
+
+    content = await engine.consolidate(request)
+
+    assert content.startswith("merged-")
+    assert orchestrator.route_request.await_count > 1
+    assert all(estimate_tokens(p) <= 2000 for p in orchestrator.prompts)
+    orchestrator.registry.get_model.assert_called_with("small-model")
+
+
+@pytest.mark.asyncio
+async def test_small_candidate_sets_use_single_synthesis(orchestrator):
+    engine = ConsensusEngine(orchestrator=orchestrator)
+    request = ConsensusRequest(task="Summarize", candidates=["a", "b", "c"])
+
+    content = await engine.consolidate(request)
+
+    assert content == "merged-1"
+    assert orchestrator.route_request.await_count == 1
+
+
+def test_oversized_candidates_are_truncated_so_levels_shrink():
+    groups = ConsensusEngine._group_candidates(["y" * 10_000] * 5, budget=500, fan_in=8)
+    assert len(groups) < 5
+    assert all(sum(estimate_tokens(c) for c in g) <= 500 for g in groups)
@@ -0,0 +1,191 @@
+"""
+Tests for request deadline propagation through routing, fallback and HTTP calls.
+"""
+
+import asyncio
+from typing import Any
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from lattice_lock.orchestrator.core import ModelOrchestrator
+from lattice_lock.orchestrator.exceptions import DeadlineExceededError, ServerError
+from lattice_lock.orchestrator.execution import ConversationExecutor
+from lattice_lock.orchestrator.providers.base import BaseAPIClient
+from lattice_lock.orchestrator.types import (
+    APIResponse,
+    ModelCapabilities,
+    ModelProvider,
+    TaskRequirements,
+    TaskType,
+)
+from lattice_lock.tracing import (
+    deadline_scope,
+    get_deadline,
+    get_performance_metrics,
+    get_remaining_time,
+    reset_performance_metrics,
+)
+
+
+class _StubClient(BaseAPIClient):
+    def _validate_config(self) -> None:
+        pass
+
+    async def health_check(self) -> bool:
+        return True
+
+    async def chat_completion(self, model: str, messages: list[dict[str, Any]], **kwargs) -> Any:
+        raise NotImplementedError
+
+
+def _model(name: str) -> ModelCapabilities:
+    return ModelCapabilities(
+        name=name,
+        api_name=name,
+        provider=ModelProvider.OPENAI,
+        context_window=8000,
+        input_cost=1.0,
+        output_cost=2.0,
+        reasoning_score=80.0,
+        coding_score=80.0,
+        speed_rating=8.0,
+    )
+
+
+@pytest.fixture(autouse=True)
+def _fresh_metrics():
+    reset_performance_metrics()
+    yield
+    reset_performance_metrics()
+
+
+@pytest.fixture
+def orchestrator():
+    with (
+        patch("lattice_lock.orchestrator.core.ModelRegistry") as registry_cls,
+        patch("lattice_lock.orchestrator.core.ClientPool"),
+        patch("lattice_lock.orchestrator.core.ConversationExecutor") as executor_cls,
+        patch("lattice_lock.orchestrator.core.ModelSelector") as selector_cls,
+        patch("lattice_lock.orchestrator.core.TaskAnalyzer") as analyzer_cls,
+    ):
+        registry_cls.return_value.get_model.side_effect = _model
+        analyzer_cls.return_value.analyze_async = AsyncMock(
+            return_value=TaskRequirements(task_type=TaskType.GENERAL)
+        )
+        selector = selector_cls.return_value
+        selector.select_best_model.return_value = "primary"
+        selector.get_fallback_chain.return_value = ["fallback-1", "fallback-2"]
+        orch = ModelOrchestrator()
+        orch.executor = executor_cls.return_value
+        yield orch
+
+
+def test_deadline_scope_nests_to_the_earliest_deadline():
+    assert get_deadline() is None
+    with deadline_scope(10.0) as outer:
+        with deadline_scope(60.0) as inner:
+            assert inner == outer
+        with deadline_scope(1.0) as inner:
+            assert inner < outer
+            assert 0 < get_remaining_time() <= 1.0
+        with deadline_scope(None) as inner:
+            assert inner == outer
+    assert get_deadline() is None
+
+
+@pytest.mark.asyncio
+async def test_make_request_uses_remaining_budget_as_timeout():
+    client = _StubClient(MagicMock())
+    response = MagicMock(status_code=200)
+    response.json.return_value = {"ok": True}
+    session = MagicMock(is_closed=False, request=AsyncMock(return_value=response))
+    client._session = session
+
+    with deadline_scope(2.0):
+        await client._make_request("POST", "https://example.invalid/v1")
+
+    timeout = session.request.await_args.kwargs["timeout"]
+    assert timeout.read <= 2.0
+
+
+@pytest.mark.asyncio
+async def test_make_request_fails_fast_once_deadline_has_passed():
+    client = _StubClient(MagicMock())
+    client._session = MagicMock(is_closed=False, request=AsyncMock())
+
+    with deadline_scope(0.0):
+        with pytest.raises(DeadlineExceededError):
+            await client._make_request("POST", "https://example.invalid/v1")
+
+    client._session.request.assert_not_awaited()
+
+
+@pytest.mark.asyncio
+async def test_conversation_stops_before_turn_when_deadline_passed():
+    executor = ConversationExecutor(MagicMock(), MagicMock())
+    client = MagicMock(chat_completion=AsyncMock())
+
+    with deadline_scope(0.0):
+        with pytest.raises(DeadlineExceededError):
+            await executor.execute(_model("m"), client, [{"role": "user", "content": "hi"}])
+
+    client.chat_completion.assert_not_awaited()
+
+
+@pytest.mark.asyncio
+async def test_fallback_skipped_when_budget_too_small(orchestrator):
+    async def slow_failure(**_kwargs):
+        await asyncio.sleep(0.05)
+        raise ServerError("primary down")
+
+    orchestrator.executor.execute = AsyncMock(side_effect=slow_failure)
+    orchestrator.min_fallback_budget = 0.5
+
+    with pytest.raises(DeadlineExceededError):
+        await orchestrator.route_request("prompt", timeout=0.2)
+
+    # Only the primary was attempted
+    assert orchestrator.executor.execute.await_count == 1
+    counters = get_performance_metrics().counters
+    assert counters["route_request.fallback_skipped"] == 1
+    assert counters["route_request.deadline_miss"] == 1
+
+
+@pytest.mark.asyncio
+async def test_fallback_runs_within_budget_and_sees_remaining_time(orchestrator):
+    seen: list[float | None] = []
+
+    async def execute(model_cap, **_kwargs):
+        seen.append(get_remaining_time())
+        if model_cap.name == "primary":
+            raise ServerError("primary down")
+        return APIResponse(
+            content="ok", model=model_cap.name, provider="openai", usage=None, latency_ms=1
+        )
+
+    orchestrator.executor.execute = AsyncMock(side_effect=execute)
+
+    response = await orchestrator.route_request("prompt", timeout=30.0)
+
+    assert response.model == "fallback-1"
+    assert len(seen) == 2
+    assert all(r is not None and 0 < r <= 30.0 for r in seen)
+    assert seen[1] < seen[0]
+    assert get_deadline() is None
+    assert "route_request.deadline_miss" not in get_performance_metrics().counters
+
+
+@pytest.mark.asyncio
+async def test_timeout_is_not_forwarded_to_provider(orchestrator):
+    orchestrator.executor.execute = AsyncMock(
+        return_value=APIResponse(
+            content="ok", model="primary", provider="openai", usage=None, latency_ms=1
+        )
+    )
+
+    await orchestrator.route_request("prompt", timeout=5.0, temperature=0.1)
+
+    kwargs = orchestrator.executor.execute.await_args.kwargs
+    assert "timeout" not in kwargs
+    assert kwargs["temperature"] == 0.1
@@ -0,0 +1,223 @@
+"""
+Tests for provider endpoint pools.
+"""
+
+import asyncio
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from lattice_lock.metrics import get_metrics_registry
+from lattice_lock.orchestrator.exceptions import ServerError
+from lattice_lock.orchestrator.execution import ClientPool, EndpointPool
+from lattice_lock.orchestrator.execution import endpoint_pool as ep
+from lattice_lock.orchestrator.types import APIResponse
+
+
+class FakeEndpointClient:
+    def __init__(self, url: str):
+        self.url = url
+        self.calls = 0
+        self.delay = 0.0
+        self.fail = False
+        self.healthy = True
+
+    async def chat_completion(self, model, messages, **kwargs):
+        self.calls += 1
+        await asyncio.sleep(self.delay)
+        if self.fail:
+            raise ServerError(f"{self.url} down")
+        return APIResponse(
+            content=self.url, model=model, provider="ollama", usage=None, latency_ms=1
+        )
+
+    async def health_check(self):
+        if not self.healthy:
+            raise ConnectionError("unreachable")
+        return True
+
+
+def _pool(urls, max_concurrency=2):
+    clients: dict[str, FakeEndpointClient] = {}
+
+    def factory(url):
+        clients[url] = FakeEndpointClient(url)
+        return clients[url]
+
+    pool = EndpointPool(MagicMock(), "ollama", urls, factory, max_concurrency=max_concurrency)
+    return pool, clients
+
+
+@pytest.mark.asyncio
+async def test_least_outstanding_spreads_concurrent_calls():
+    pool, clients = _pool(["http://a", "http://b", "http://c"])
+    for client in clients.values():
+        client.delay = 0.02
+
+    await asyncio.gather(*(pool.chat_completion("m", []) for _ in range(6)))
+
+    assert [c.calls for c in clients.values()] == [2, 2, 2]
+    assert pool.capacity == 6
+
+
+@pytest.mark.asyncio
+async def test_calls_wait_for_capacity_when_all_endpoints_are_full():
+    pool, clients = _pool(["http://a", "http://b"], max_concurrency=1)
+    clients["http://a"].delay = clients["http://b"].delay = 0.01
+    peak = 0
+
+    async def call():
+        nonlocal peak
+        task = asyncio.ensure_future(pool.chat_completion("m", []))
+        await asyncio.sleep(0)
+        peak = max(peak, sum(e.outstanding for e in pool.endpoints))
+        return await task
+
+    await asyncio.gather(*(call() for _ in range(5)))
+
+    assert peak <= 2
+    assert sum(c.calls for c in clients.values()) == 5
+    assert all(e.outstanding == 0 for e in pool.endpoints)
+
+
+@pytest.mark.asyncio
+async def test_failing_endpoint_is_ejected():
+    pool, clients = _pool(["http://a", "http://b"])
+    clients["http://a"].fail = True
+
+    for _ in range(ep.MAX_CONSECUTIVE_FAILURES):
+        with pytest.raises(ServerError):
+            await pool.chat_completion("m", [])
+
+    assert pool.endpoints[0].ejected
+    responses = [await pool.chat_completion("m", []) for _ in range(3)]
+    assert {r.content for r in responses} == {"http://b"}
+
+
+@pytest.mark.asyncio
+async def test_slow_endpoint_is_ejected_relative_to_peers():
+    pool, _clients = _pool(["http://a", "http://b", "http://c"])
+    for _ in range(ep.MIN_LATENCY_SAMPLES):
+        pool._record_success(pool.endpoints[0], 10)
+        pool._record_success(pool.endpoints[1], 12)
+    for _ in range(ep.MIN_LATENCY_SAMPLES):
+        pool._record_success(pool.endpoints[2], 500)
+
+    assert pool.endpoints[2].ejected
+    assert not pool.endpoints[0].ejected
+    assert pool.capacity == 4
+
+
+def test_at_most_half_of_endpoints_are_ejected():
+    pool, _clients = _pool(["http://a", "http://b"])
+    pool._eject(pool.endpoints[0], "test")
+    pool._eject(pool.endpoints[1], "test")
+
+    assert [e.ejected for e in pool.endpoints] == [True, False]
+
+
+@pytest.mark.asyncio
+async def test_health_check_marks_unreachable_endpoints():
+    pool, clients = _pool(["http://a", "http://b"])
+    clients["http://b"].healthy = False
+
+    assert await pool.health_check() is True
+    assert [e.healthy for e in pool.endpoints] == [True, False]
+    responses = [await pool.chat_completion("m", []) for _ in range(3)]
+    assert {r.content for r in responses} == {"http://a"}
+
+
+def test_client_pool_builds_endpoint_pool_from_env(monkeypatch):
+    monkeypatch.setenv("CUSTOM_API_URLS", "http://gpu-1:8000/v1, http://gpu-2:8000/v1")
+    created = []
+
+    def fake_get_api_client(provider, check_availability=True, **kwargs):
+        created.append((provider, kwargs))
+        return FakeEndpointClient(kwargs.get("base_url", "single"))
+
+    with (
+        patch(
+            "lattice_lock.orchestrator.execution.client_pool.get_api_client", fake_get_api_client
+        ),
+        patch("lattice_lock.orchestrator.execution.client_pool.get_config", MagicMock()),
+    ):
+        pool = ClientPool()
+        client = pool.get_client("ollama")
+        single = pool.get_client("openai")
+
+    assert isinstance(client, EndpointPool)
+    assert [e.url for e in client.endpoints] == ["http://gpu-1:8000/v1", "http://gpu-2:8000/v1"]
+    assert created[:2] == [
+        ("ollama", {"base_url": "http://gpu-1:8000/v1"}),
+        ("ollama", {"base_url": "http://gpu-2:8000/v1"}),
+    ]
+    assert not isinstance(single, EndpointPool)
+
+
+def test_register_endpoints_rejects_unsupported_provider():
+    with pytest.raises(ValueError):
+        ClientPool().register_endpoints("anthropic", ["http://a", "http://b"])
+
+
+def _client_series(provider):
+    return [
+        line
+        for line in get_metrics_registry().render().splitlines()
+        if line.startswith(f'lattice_client_pool_clients{{provider="{provider}"}}')
+    ]
+
+
+@pytest.mark.asyncio
+async def test_client_pools_share_one_metrics_series_per_provider():
+    pools = [ClientPool(), ClientPool()]
+    for pool in pools:
+        pool.register_client("metrics-test", FakeEndpointClient("single"))
+
+    assert _client_series("metrics-test") == [
+        'lattice_client_pool_clients{provider="metrics-test"} 2'
+    ]
+    await pools[0].close_all()
+    assert _client_series("metrics-test") == [
+        'lattice_client_pool_clients{provider="metrics-test"} 1'
+    ]
+
+
+@pytest.mark.asyncio
+async def test_client_pool_health_checks_eject_and_readmit_endpoints(monkeypatch):
+    monkeypatch.setenv("LATTICE_ENDPOINT_HEALTH_INTERVAL", "0.01")
+    clients: dict[str, FakeEndpointClient] = {}
+
+    def fake_get_api_client(provider, check_availability=True, **kwargs):
+        clients[kwargs["base_url"]] = FakeEndpointClient(kwargs["base_url"])
+        return clients[kwargs["base_url"]]
+
+    async def wait_for(condition):
+        for _ in range(100):
+            if condition():
+                return
+            await asyncio.sleep(0.01)
+        raise AssertionError("condition not reached")
+
+    with (
+        patch(
+            "lattice_lock.orchestrator.execution.client_pool.get_api_client", fake_get_api_client
+        ),
+        patch("lattice_lock.orchestrator.execution.client_pool.get_config", MagicMock()),
+    ):
+        pool = ClientPool()
+        pool.register_endpoints("ollama", ["http://a", "http://b"])
+        client = pool.get_client("ollama")
+
+    task = client._health_task
+    assert task is not None
+    clients["http://b"].healthy = False
+    await wait_for(lambda: not client.endpoints[1].available)
+    responses = [await client.chat_completion("m", []) for _ in range(3)]
+    assert {r.content for r in responses} == {"http://a"}
+
+    clients["http://b"].healthy = True
+    await wait_for(lambda: client.endpoints[1].available)
+
+    await pool.close_all()
+    await asyncio.sleep(0)
+    assert task.cancelled()
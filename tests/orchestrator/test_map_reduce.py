@@ -0,0 +1,173 @@
+"""
+Tests for chunked map-reduce execution of oversized prompts.
+"""
+
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from lattice_lock.orchestrator.core import ModelOrchestrator
+from lattice_lock.orchestrator.execution.map_reduce import (
+    MapReduceExecutor,
+    chunk_token_budget,
+    estimate_tokens,
+    split_text,
+)
+from lattice_lock.orchestrator.selection import ModelSelector
+from lattice_lock.orchestrator.types import (
+    APIResponse,
+    ModelCapabilities,
+    ModelProvider,
+    TaskRequirements,
+    TaskType,
+    TokenUsage,
+)
+
+
+def _router(prompts: list[tuple[str, str | None]]):
+    async def route(prompt, model_id=None, **kwargs):
+        prompts.append((prompt, model_id))
+        return APIResponse(
+            content=f"answer-{len(prompts)}",
+            model=model_id or "routed",
+            provider="openai",
+            usage=TokenUsage(10, 5, 15, 0.01),
+            latency_ms=1,
+        )
+
+    return AsyncMock(side_effect=route)
+
+
+def test_split_text_prefers_natural_boundaries_and_is_lossless():
+    paragraphs = [f"Paragraph {i}. " + "word " * 40 for i in range(10)]
+    text = "\n\n".join(paragraphs)
+
+    chunks = split_text(text, max_tokens=120)
+
+    assert "".join(chunks) == text
+    assert all(estimate_tokens(c) <= 121 for c in chunks)
+    # Every chunk but the last ends on a paragraph break
+    assert all(c.endswith("\n\n") for c in chunks[:-1])
+
+
+def test_split_text_falls_back_to_hard_splits():
+    text = "x" * 1000
+    chunks = split_text(text, max_tokens=50)
+    assert "".join(chunks) == text
+    assert [len(c) for c in chunks] == [200] * 5
+
+
+def test_chunk_budget_is_capped_and_scales_with_context_window():
+    assert chunk_token_budget(8000, "Summarize") < chunk_token_budget(32000, "Summarize")
+    assert chunk_token_budget(1_000_000, "Summarize", max_chunk_tokens=4000) == 4000
+
+
+@pytest.mark.asyncio
+async def test_small_input_uses_a_single_call():
+    prompts: list[tuple[str, str | None]] = []
+    executor = MapReduceExecutor(_router(prompts))
+
+    response = await executor.execute("short log", "Find errors", "fast", chunk_tokens=1000)
+
+    assert prompts == [("Find errors\n\nshort log", "fast")]
+    assert response.raw_response["map_reduce"] == {"chunks": 1, "reduce_rounds": 0, "calls": 1}
+
+
+@pytest.mark.asyncio
+async def test_chunks_map_in_parallel_then_reduce():
+    prompts: list[tuple[str, str | None]] = []
+    route = _router(prompts)
+    executor = MapReduceExecutor(route, max_parallel=3)
+    content = "\n".join(f"line {i} " + "y" * 90 for i in range(40))
+
+    response = await executor.execute(
+        content, "Find errors", "fast", chunk_tokens=300, reduce_model="strong"
+    )
+
+    map_calls = [p for p, m in prompts if m == "fast"]
+    reduce_calls = [p for p, m in prompts if m == "strong"]
+    assert len(map_calls) == response.raw_response["map_reduce"]["chunks"] > 1
+    assert all("--- Input part" in p for p in map_calls)
+    assert reduce_calls and "Partial answer" in reduce_calls[-1]
+    assert response.model == "strong"
+    assert response.usage.total_tokens == 15 * len(prompts)
+    assert response.usage.cost == pytest.approx(0.01 * len(prompts))
+
+
+@pytest.mark.asyncio
+async def test_reduce_runs_in_rounds_when_partials_overflow():
+    prompts: list[tuple[str, str | None]] = []
+
+    async def route(prompt, model_id=None, **kwargs):
+        prompts.append((prompt, model_id))
+        return APIResponse("z" * 400, model_id or "m", "openai", None, 1)
+
+    executor = MapReduceExecutor(AsyncMock(side_effect=route))
+    content = "\n\n".join("para " + "w" * 300 for _ in range(20))
+
+    response = await executor.execute(content, "Summarize", "fast", chunk_tokens=300)
+
+    assert response.raw_response["map_reduce"]["reduce_rounds"] > 1
+    assert all(estimate_tokens(p) < 600 for p, _ in prompts)
+
+
+def _model(name, cost, speed, context=128000):
+    return ModelCapabilities(
+        name=name,
+        api_name=name,
+        provider=ModelProvider.OPENAI,
+        context_window=context,
+        input_cost=cost,
+        output_cost=cost,
+        reasoning_score=80,
+        coding_score=80,
+        speed_rating=speed,
+    )
+
+
+def test_rank_by_cost_orders_cheapest_first_and_filters_slow_models():
+    registry = MagicMock()
+    registry.get_all_models.return_value = [
+        _model("pricey", 30.0, 9),
+        _model("cheap-slow", 0.1, 3),
+        _model("cheap-fast", 0.5, 9),
+        _model("tiny-window", 0.01, 9, context=2000),
+    ]
+    scorer = MagicMock()
+    scorer.score.side_effect = lambda m, r: 0.0 if m.context_window < r.min_context else 1.0
+    guide = MagicMock()
+    guide.is_model_blocked.return_value = False
+    selector = ModelSelector(registry, scorer, guide)
+    requirements = TaskRequirements(task_type=TaskType.GENERAL, min_context=16000)
+
+    with patch.object(ModelSelector, "_is_provider_available", return_value=True):
+        assert selector.rank_by_cost(requirements) == ["cheap-slow", "cheap-fast", "pricey"]
+        assert selector.rank_by_cost(requirements, min_speed=7) == ["cheap-fast", "pricey"]
+
+
+@pytest.mark.asyncio
+async def test_route_map_reduce_sizes_chunks_from_registry():
+    with (
+        patch("lattice_lock.orchestrator.core.ModelRegistry"),
+        patch("lattice_lock.orchestrator.core.ModelSelector"),
+        patch("lattice_lock.orchestrator.core.TaskAnalyzer"),
+        patch("lattice_lock.orchestrator.core.ClientPool"),
+        patch("lattice_lock.orchestrator.core.ConversationExecutor"),
+    ):
+        orchestrator = ModelOrchestrator()
+    orchestrator.selector.rank_by_cost.return_value = ["cheap-fast"]
+    orchestrator.registry.get_model.return_value = _model("cheap-fast", 0.5, 9, context=4000)
+    prompts: list[tuple[str, str | None]] = []
+    orchestrator.route_request = _router(prompts)
+
+    response = await orchestrator.route_map_reduce(
+        "log line\n" * 3000, "Find errors", task_type=TaskType.DEBUGGING
+    )
+
+    assert response.raw_response["map_reduce"]["chunks"] > 1
+    assert all(estimate_tokens(p) <= 4000 for p, _ in prompts)
+    assert {m for _, m in prompts} == {"cheap-fast", None}
+    assert all(
+        c.kwargs["task_type"] == TaskType.DEBUGGING
+        for c in orchestrator.route_request.call_args_list
+    )
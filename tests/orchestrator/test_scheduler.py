@@ -0,0 +1,173 @@
+"""
+Tests for the weighted fair-queuing scheduler.
+"""
+
+import asyncio
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from lattice_lock.orchestrator.core import ModelOrchestrator
+from lattice_lock.orchestrator.exceptions import DeadlineExceededError
+from lattice_lock.orchestrator.execution import FairScheduler, RequestClass
+from lattice_lock.orchestrator.execution.scheduler import WaitTimeHistogram
+from lattice_lock.orchestrator.types import ModelProvider, TaskRequirements, TaskType
+from lattice_lock.tracing import deadline_scope
+
+
+async def _dispatch_order(scheduler: FairScheduler, requests: list[tuple[str, RequestClass]]):
+    """Queue ``requests`` behind a held slot and return the tenants in dispatch order."""
+    order: list[str] = []
+    release = asyncio.Event()
+
+    async def blocker():
+        async with scheduler.slot("openai", "blocker"):
+            await release.wait()
+
+    async def request(tenant, request_class):
+        async with scheduler.slot("openai", tenant, request_class):
+            order.append(tenant)
+
+    blocking = asyncio.create_task(blocker())
+    await asyncio.sleep(0)
+    tasks = []
+    for tenant, request_class in requests:
+        tasks.append(asyncio.create_task(request(tenant, request_class)))
+        await asyncio.sleep(0)
+    release.set()
+    await asyncio.gather(blocking, *tasks)
+    return order
+
+
+@pytest.mark.asyncio
+async def test_batch_flood_does_not_starve_interactive_tenant():
+    scheduler = FairScheduler(provider_concurrency={"openai": 1})
+    requests = [("bulk", RequestClass.BATCH)] * 8 + [("web", RequestClass.INTERACTIVE)] * 2
+
+    order = await _dispatch_order(scheduler, requests)
+
+    # Both interactive requests overtake most of the earlier batch backlog
+    assert order.index("web") <= 1
+    assert len(order) - 1 - order[::-1].index("web") <= 3
+
+
+@pytest.mark.asyncio
+async def test_weights_split_slots_proportionally():
+    scheduler = FairScheduler(provider_concurrency={"openai": 1})
+    scheduler.configure_tenant("gold", weight=3.0)
+    requests = [("gold", RequestClass.BATCH)] * 9 + [("free", RequestClass.BATCH)] * 3
+
+    order = await _dispatch_order(scheduler, requests)
+
+    # While both are backlogged, gold gets roughly three slots per free slot
+    assert order[:8].count("gold") == 6
+    assert order[:8].count("free") == 2
+
+
+@pytest.mark.asyncio
+async def test_higher_priority_tenant_is_dispatched_first():
+    scheduler = FairScheduler(provider_concurrency={"openai": 1})
+    scheduler.configure_tenant("oncall", priority=10)
+    requests = [("team", RequestClass.INTERACTIVE)] * 3 + [("oncall", RequestClass.BATCH)] * 2
+
+    order = await _dispatch_order(scheduler, requests)
+
+    assert order[:2] == ["oncall", "oncall"]
+
+
+@pytest.mark.asyncio
+async def test_deadline_bounds_queue_wait():
+    scheduler = FairScheduler(provider_concurrency={"openai": 1})
+    release = asyncio.Event()
+
+    async def blocker():
+        async with scheduler.slot("openai", "a"):
+            await release.wait()
+
+    blocking = asyncio.create_task(blocker())
+    await asyncio.sleep(0)
+
+    with deadline_scope(0.05):
+        with pytest.raises(DeadlineExceededError):
+            async with scheduler.slot("openai", "b"):
+                pass
+
+    release.set()
+    await blocking
+    stats = scheduler.stats()
+    assert stats["tenants"]["b"]["queue_depth"] == 0
+    assert stats["providers"]["openai"] == {"capacity": 1, "in_use": 0, "queue_depth": 0}
+
+    # The slot is usable again after the timed-out waiter gave up
+    assert await scheduler.run("openai", lambda: asyncio.sleep(0, result="ok"), "b") == "ok"
+
+
+@pytest.mark.asyncio
+async def test_stats_report_depth_in_flight_and_wait_histogram():
+    scheduler = FairScheduler(provider_concurrency={"openai": 1})
+    release = asyncio.Event()
+
+    async def hold():
+        async with scheduler.slot("openai", "a"):
+            await release.wait()
+
+    tasks = [asyncio.create_task(hold()) for _ in range(3)]
+    await asyncio.sleep(0.01)
+
+    stats = scheduler.stats()["tenants"]["a"]
+    assert stats["in_flight"] == 1
+    assert stats["queue_depth"] == 2
+
+    release.set()
+    await asyncio.gather(*tasks)
+    wait = scheduler.stats()["tenants"]["a"]["wait_ms"]
+    assert wait["count"] == 3
+    assert sum(wait["buckets"].values()) == 3
+
+
+def test_histogram_buckets():
+    histogram = WaitTimeHistogram(bounds=(10, 100))
+    for value in (5, 10, 50, 500):
+        histogram.record(value)
+
+    assert histogram.to_dict()["buckets"] == {"le_10": 2, "le_100": 1, "le_inf": 1}
+    assert histogram.avg_ms == pytest.approx(141.25)
+
+
+def test_invalid_configuration_is_rejected():
+    scheduler = FairScheduler()
+    with pytest.raises(ValueError):
+        scheduler.configure_tenant("a", weight=0)
+    with pytest.raises(ValueError):
+        scheduler.set_provider_concurrency("openai", 0)
+
+
+@pytest.mark.asyncio
+async def test_route_request_runs_in_tenant_slot():
+    with (
+        patch("lattice_lock.orchestrator.core.ModelRegistry") as registry_cls,
+        patch("lattice_lock.orchestrator.core.ClientPool"),
+        patch("lattice_lock.orchestrator.core.ConversationExecutor") as executor_cls,
+        patch("lattice_lock.orchestrator.core.ModelSelector"),
+        patch("lattice_lock.orchestrator.core.TaskAnalyzer") as analyzer_cls,
+    ):
+        registry_cls.return_value.get_model.return_value = MagicMock(provider=ModelProvider.OPENAI)
+        analyzer_cls.return_value.analyze_async = AsyncMock(
+            return_value=TaskRequirements(task_type=TaskType.GENERAL)
+        )
+        orchestrator = ModelOrchestrator()
+        in_flight = []
+
+        async def execute(**_kwargs):
+            in_flight.append(orchestrator.scheduler.stats()["tenants"]["proj-1"]["in_flight"])
+            return MagicMock(error=None)
+
+        executor_cls.return_value.execute = AsyncMock(side_effect=execute)
+
+        await orchestrator.route_request(
+            "hi", model_id="gpt", tenant="proj-1", request_class="batch"
+        )
+
+    assert in_flight == [1]
+    assert "tenant" not in executor_cls.return_value.execute.await_args.kwargs
+    assert orchestrator.scheduler.stats()["tenants"]["proj-1"]["dispatched"] == 1
@@ -0,0 +1,143 @@
+"""Tests for streaming quantile sketches."""
+
+import json
+import random
+
+import pytest
+
+from lattice_lock.utils.quantiles import QuantileSketch, WindowedQuantileSketch
+
+
+def _exact(values: list[float], q: float) -> float:
+    ordered = sorted(values)
+    return ordered[int(q * (len(ordered) - 1))]
+
+
+class TestQuantileSketch:
+    """Tests for QuantileSketch."""
+
+    def test_empty_sketch(self):
+        sketch = QuantileSketch()
+        assert sketch.quantile(0.5) is None
+        assert sketch.count == 0
+        assert sketch.mean == 0.0
+
+    @pytest.mark.parametrize("q", [0.0, 0.5, 0.9, 0.95, 0.99, 1.0])
+    def test_relative_accuracy(self, q):
+        rng = random.Random(7)
+        values = [rng.lognormvariate(-2, 1.5) for _ in range(20000)]
+        sketch = QuantileSketch(relative_accuracy=0.01)
+        for value in values:
+            sketch.add(value)
+
+        exact = _exact(values, q)
+        assert sketch.quantile(q) == pytest.approx(exact, rel=0.0101)
+
+    def test_bucket_count_bounded_by_range_not_samples(self):
+        sketch = QuantileSketch()
+        for i in range(50000):
+            sketch.add(0.001 + (i % 1000) * 0.001)
+        assert sketch.count == 50000
+        assert len(sketch.buckets) < 400
+
+    def test_zero_and_negative_values(self):
+        sketch = QuantileSketch()
+        for value in (0.0, -1.0, 0.0, 5.0):
+            sketch.add(value)
+        assert sketch.zero_count == 3
+        assert sketch.quantile(0.5) == 0.0
+        assert sketch.quantile(1.0) == 5.0
+
+    def test_mean_is_exact(self):
+        sketch = QuantileSketch()
+        for value in (0.1, 0.2, 0.3):
+            sketch.add(value)
+        assert sketch.mean == pytest.approx(0.2)
+
+    def test_merge_matches_single_sketch(self):
+        rng = random.Random(3)
+        values = [rng.expovariate(10) for _ in range(5000)]
+        whole, left, right = QuantileSketch(), QuantileSketch(), QuantileSketch()
+        for i, value in enumerate(values):
+            whole.add(value)
+            (left if i % 2 else right).add(value)
+
+        left.merge(right)
+        assert left.count == whole.count
+        assert left.buckets == whole.buckets
+        assert left.quantile(0.99) == whole.quantile(0.99)
+
+    def test_merge_rejects_different_accuracy(self):
+        with pytest.raises(ValueError):
+            QuantileSketch(0.01).merge(QuantileSketch(0.05))
+
+    def test_collapse_keeps_high_quantiles(self):
+        sketch = QuantileSketch(max_buckets=50)
+        values = [10 ** (i / 100) for i in range(-600, 300)]
+        for value in values:
+            sketch.add(value)
+        assert len(sketch.buckets) <= 50
+        assert sketch.count == len(values)
+        assert sketch.quantile(0.99) == pytest.approx(_exact(values, 0.99), rel=0.0101)
+
+    def test_round_trip(self):
+        sketch = QuantileSketch()
+        for value in (0.0, 0.01, 0.5, 2.0):
+            sketch.add(value)
+        restored = QuantileSketch.from_dict(json.loads(json.dumps(sketch.to_dict())))
+        assert restored.buckets == sketch.buckets
+        assert restored.quantile(0.75) == sketch.quantile(0.75)
+        assert (restored.min, restored.max, restored.count) == (0.0, 2.0, 4)
+
+    def test_invalid_quantile(self):
+        with pytest.raises(ValueError):
+            QuantileSketch().quantile(1.5)
+
+
+class TestWindowedQuantileSketch:
+    """Tests for WindowedQuantileSketch."""
+
+    def test_window_selects_recent_intervals(self):
+        windowed = WindowedQuantileSketch(interval_seconds=60, retention_intervals=10)
+        windowed.add(5.0, timestamp=0)
+        windowed.add(1.0, timestamp=600)
+
+        assert windowed.merged().count == 2
+        recent = windowed.merged(window_seconds=60, now=610)
+        assert recent.count == 1
+        assert recent.max == 1.0
+
+    def test_retention_drops_oldest_intervals(self):
+        windowed = WindowedQuantileSketch(interval_seconds=10, retention_intervals=3)
+        for t in range(0, 50, 10):
+            windowed.add(float(t), timestamp=t)
+        assert windowed.merged().count == 3
+        assert windowed.merged().min == 20.0
+
+        # Too old to be retained
+        windowed.add(1.0, timestamp=5)
+        assert windowed.merged().count == 3
+
+    def test_late_samples_join_their_interval(self):
+        windowed = WindowedQuantileSketch(interval_seconds=10, retention_intervals=5)
+        windowed.add(1.0, timestamp=0)
+        windowed.add(2.0, timestamp=25)
+        windowed.add(3.0, timestamp=12)
+        windowed.add(4.0, timestamp=3)
+
+        starts = [start for start, _ in windowed._intervals]
+        assert starts == [0, 10, 20]
+        assert windowed.merged().count == 4
+
+    def test_merge_interleaved_workers(self):
+        a = WindowedQuantileSketch(interval_seconds=10)
+        b = WindowedQuantileSketch(interval_seconds=10)
+        a.add(1.0, timestamp=0)
+        a.add(1.0, timestamp=20)
+        b.add(2.0, timestamp=10)
+        b.add(2.0, timestamp=20)
+
+        a.merge(WindowedQuantileSketch.from_dict(json.loads(json.dumps(b.to_dict()))))
+        assert [start for start, _ in a._intervals] == [0, 10, 20]
+        assert a.merged().count == 4
+        assert a.merged(window_seconds=5, now=25).count == 2